@@ -3,6 +3,8 @@
 -- ## stg_*:        the typed staging tables (all the rows tagged with `run_id`).
 -- ## reject_rows:  collected bad rows over this run.
 -- ## dq_results:   stored data quality checks per run
+-- stg_* and reject_rows are list partitioned by `run_id`, `create_run` adds each run's
+-- partitions (see 013_run_partitions.sql).
 
 
 -- Run_ledger (Has 1 row per run)
@@ -35,7 +37,7 @@ CREATE TABLE IF NOT EXISTS stg_customers (
     company             text,
     created_at          timestamptz NOT NULL DEFAULT now(),
     PRIMARY KEY (run_id, customer_id)
-);
+) PARTITION BY LIST (run_id);
 
 
 
@@ -54,7 +56,7 @@ CREATE TABLE IF NOT EXISTS stg_products (
     stock           integer,
     created_at      timestamptz NOT NULL DEFAULT now(),
     PRIMARY KEY (run_id, product_id)
-);
+) PARTITION BY LIST (run_id);
 
 
 
@@ -73,7 +75,7 @@ CREATE TABLE IF NOT EXISTS stg_orders (
     total_quantity  integer,
     created_at      timestamptz NOT NULL DEFAULT now(),
     PRIMARY KEY (run_id, order_id)
-);
+) PARTITION BY LIST (run_id);
 
 
 
@@ -92,22 +94,23 @@ CREATE TABLE IF NOT EXISTS stg_order_items (
     created_at      timestamptz NOT NULL DEFAULT now(),
     net_usd         numeric(12,2),                      -- after discounted
     PRIMARY KEY (run_id, order_id, line_id)
-);
+) PARTITION BY LIST (run_id);
 
 
 
 -- reject_rows
 -- Grain is one row per rejected row (all table fields non-null)
 CREATE TABLE IF NOT EXISTS reject_rows (
-    reject_id       bigserial PRIMARY KEY,
+    reject_id       bigserial,
     run_id          uuid NOT NULL REFERENCES run_ledger(run_id) ON DELETE CASCADE,
     table_name      text NOT NULL,              -- which stg_* this reject was collected from
     source_ref      integer NOT NULL,           -- where it came from, -- e.g. `'users[12]'`, `'carts[4].products[2]'`, .
     raw_payload     jsonb NOT NULL,             -- storing `{"raw": {...}, "canonical": {...}}` or `{"raw": {...}}` from ingestion,
     reason_code     text NOT NULL,              -- or the JSON object for JSONL
     reason_detail   text NOT NULL,
-    rejected_at     timestamptz NOT NULL DEFAULT now()
-);
+    rejected_at     timestamptz NOT NULL DEFAULT now(),
+    PRIMARY KEY (reject_id, run_id)             -- a partitioned table's key must hold `run_id`
+) PARTITION BY LIST (run_id);
 
 
 
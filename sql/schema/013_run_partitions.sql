@@ -0,0 +1,25 @@
+-- Run partitions for stg_* and reject_rows.
+-- Each run gets its own partition, named `<table>_r<run_id hex>`, created by `create_run`
+-- and dropped whole by `pipeline db retain`. Rows for a run without one (e.g. written
+-- straight after inserting a `run_ledger` row by hand) land in `<table>_default`.
+-- Tables created before partitioning stay plain, and are skipped here and by both.
+
+DO $$
+DECLARE
+    parent text;
+BEGIN
+    FOREACH parent IN ARRAY ARRAY[
+        'stg_customers', 'stg_products', 'stg_orders', 'stg_order_items', 'reject_rows'
+    ] LOOP
+        IF EXISTS (
+            SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(parent)
+        ) THEN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I DEFAULT',
+                parent || '_default',
+                parent
+            );
+        END IF;
+    END LOOP;
+END
+$$;
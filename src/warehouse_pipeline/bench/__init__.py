@@ -0,0 +1,15 @@
+from warehouse_pipeline.bench.extract_bench import ExtractBenchResult, run_extract_benchmark
+from warehouse_pipeline.bench.fake_dummyjson import FakeDummyJsonServer, FaultProfile
+from warehouse_pipeline.bench.load_bench import WorkLoadBenchResult, run_work_load_benchmark
+from warehouse_pipeline.bench.stage_bench import CartsMapBenchResult, run_carts_map_benchmark
+
+__all__ = [
+    "CartsMapBenchResult",
+    "ExtractBenchResult",
+    "FakeDummyJsonServer",
+    "FaultProfile",
+    "WorkLoadBenchResult",
+    "run_carts_map_benchmark",
+    "run_extract_benchmark",
+    "run_work_load_benchmark",
+]
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import math
+import threading
+from dataclasses import asdict, dataclass, field
+from time import perf_counter
+from typing import Any
+
+import httpx
+
+from warehouse_pipeline.extract.bundles import fetch_live_bundle
+from warehouse_pipeline.extract.dummyjson_client import DEFAULT_HEADERS, DummyJsonClient
+from warehouse_pipeline.extract.rate_limiter import TokenBucketRateLimiter
+from warehouse_pipeline.extract.resilience import CircuitBreaker, HedgePolicy
+
+
+@dataclass(frozen=True)
+class ExtractBenchResult:
+    """One benchmark pass over `fetch_live_bundle`."""
+
+    wall_s: float
+    requests: int
+    requests_per_s: float
+    items: int
+    items_per_s: float
+    latency_p50_s: float
+    latency_p99_s: float
+    retries: int
+    retry_wait_s: float
+    retry_overhead_pct: float  # retried requests as a share of all requests
+    page_size: int
+    concurrency: int
+    client_stats: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-friendly view for the CLI."""
+        return asdict(self)
+
+
+class _TimedTransport(httpx.BaseTransport):
+    """Times every HTTP exchange, body included, retried attempts too."""
+
+    def __init__(self, inner: httpx.BaseTransport) -> None:
+        self._inner = inner
+        self._lock = threading.Lock()
+        self.latencies_s: list[float] = []
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        t0 = perf_counter()
+        response = self._inner.handle_request(request)
+        response.read()  # count a slow body as part of the latency
+        elapsed = perf_counter() - t0
+        with self._lock:
+            self.latencies_s.append(elapsed)
+        return response
+
+    def close(self) -> None:
+        self._inner.close()
+
+
+def run_extract_benchmark(
+    *,
+    base_url: str,
+    page_size: int = 100,
+    concurrency: int = 1,
+    rate_limit_per_s: float | None = None,
+    max_attempts: int = 4,
+    initial_backoff_s: float = 0.05,
+    hedge: bool = False,
+    circuit_breaker: bool = False,
+) -> ExtractBenchResult:
+    """
+    Drive one full `fetch_live_bundle` against `base_url` and measure it.
+
+    Meant for the local fake server, pointing it at upstream works but
+    is rate limited there. Latencies are per HTTP exchange, so hedged
+    duplicates show up in them, the tail win shows in `wall_s`.
+    """
+    transport = _TimedTransport(httpx.HTTPTransport())
+    http_client = httpx.Client(
+        base_url=base_url.rstrip("/"),
+        transport=transport,
+        headers=DEFAULT_HEADERS,
+        timeout=30.0,
+    )
+    client = DummyJsonClient(
+        client=http_client,
+        max_attempts=max_attempts,
+        initial_backoff_s=initial_backoff_s,
+        rate_limiter=TokenBucketRateLimiter(rate_per_s=rate_limit_per_s, burst=max(concurrency, 1)),
+        hedge=HedgePolicy() if hedge else None,
+        circuit_breaker=CircuitBreaker() if circuit_breaker else None,
+    )
+
+    try:
+        t0 = perf_counter()
+        bundle = fetch_live_bundle(page_size=page_size, client=client, concurrency=concurrency)
+        wall_s = perf_counter() - t0
+    finally:
+        client.close()
+        http_client.close()
+
+    stats = bundle.client_stats
+    requests = int(stats.get("requests", 0))
+    items = len(bundle.users) + len(bundle.products) + len(bundle.carts)
+    latencies = sorted(transport.latencies_s)
+
+    return ExtractBenchResult(
+        wall_s=round(wall_s, 6),
+        requests=requests,
+        requests_per_s=round(requests / wall_s, 3) if wall_s > 0 else 0.0,
+        items=items,
+        items_per_s=round(items / wall_s, 3) if wall_s > 0 else 0.0,
+        latency_p50_s=round(_percentile(latencies, 50), 6),
+        latency_p99_s=round(_percentile(latencies, 99), 6),
+        retries=int(stats.get("retries", 0)),
+        retry_wait_s=float(stats.get("retry_wait_s", 0.0)),
+        retry_overhead_pct=round(100 * int(stats.get("retries", 0)) / max(requests, 1), 2),
+        page_size=page_size,
+        concurrency=concurrency,
+        client_stats=dict(stats),
+    )
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile, `0.0` when there is nothing to rank."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
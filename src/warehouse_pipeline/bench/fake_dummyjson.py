@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from warehouse_pipeline.extract.snapshot_store import SnapshotStore
+from warehouse_pipeline.extract.synthetic import synthetic_payloads
+
+RESOURCES = ("users", "products", "carts")
+
+
+@dataclass(frozen=True)
+class FaultProfile:
+    """What the fake server does to requests, all off by default."""
+
+    latency_s: float = 0.0  # added before every response
+    latency_jitter_s: float = 0.0  # plus up to this much, uniformly
+    throttle_rate: float = 0.0  # share of requests answered `429`
+    retry_after_s: float = 0.0  # `Retry-After` sent with each `429`
+    error_rate: float = 0.0  # chance a request starts a `5xx` burst
+    error_burst: int = 1  # consecutive `503`s once a burst starts
+    slow_body_s: float = 0.0  # spread each body over this long
+    seed: int = 0
+
+
+class FakeDummyJsonServer:
+    """
+    Local stand-in for `DummyJSON` serving `/users`, `/products` and `/carts`.
+
+    Honors `limit`, `skip` and `select` like upstream, answers `If-None-Match`
+    with `304`, and injects faults from a `FaultProfile`. Runs on a background
+    thread, use as a context manager and point a client at `.url`.
+    """
+
+    def __init__(
+        self,
+        payloads: Mapping[str, Mapping[str, Any]],
+        *,
+        faults: FaultProfile | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        missing = [r for r in RESOURCES if r not in payloads]
+        if missing:
+            raise ValueError(f"fake server is missing resources: {missing}")
+
+        self._rows = {r: list(payloads[r][r]) for r in RESOURCES}
+        self._faults = faults or FaultProfile()
+        self._rng = random.Random(self._faults.seed)
+        self._lock = threading.Lock()
+        self._burst_left = 0
+        self._address = (host, port)
+        self._httpd: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+        # counters
+        self._counts = {
+            "requests": 0,
+            "ok": 0,
+            "not_modified": 0,
+            "throttled": 0,
+            "server_errors": 0,
+            "bytes_sent": 0,
+        }
+
+    @classmethod
+    def from_snapshot(cls, root: Path, **kwargs: Any) -> FakeDummyJsonServer:
+        """Serve a pinned snapshot directory."""
+        store = SnapshotStore(root)
+        return cls({r: store.read_page(r) for r in RESOURCES}, **kwargs)
+
+    @classmethod
+    def synthetic(
+        cls,
+        *,
+        users: int = 1000,
+        products: int = 1000,
+        carts: int = 300,
+        seed: int = 0,
+        **kwargs: Any,
+    ) -> FakeDummyJsonServer:
+        """Serve generated data of any size."""
+        return cls(
+            synthetic_payloads(users=users, products=products, carts=carts, seed=seed),
+            **kwargs,
+        )
+
+    @property
+    def url(self) -> str:
+        """Base URL once started."""
+        if self._httpd is None:
+            raise RuntimeError("fake server is not started")
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def __enter__(self) -> FakeDummyJsonServer:
+        """Start serving."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """Stop serving."""
+        self.stop()
+
+    def start(self) -> None:
+        """Bind and serve on a daemon thread."""
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            """Hands every `GET` to the owning fake server."""
+
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True  # headers and body go out as separate writes
+
+            def do_GET(self) -> None:
+                status, headers, body = server.respond(self.path, dict(self.headers))
+                server._send(self, status, headers, body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                """Quiet, benchmarks print their own summary."""
+
+        self._httpd = ThreadingHTTPServer(self._address, _Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="fake-dummyjson", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Shut down and release the port."""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def stats(self) -> dict[str, int]:
+        """What was served, by outcome."""
+        with self._lock:
+            return dict(self._counts)
+
+    def respond(
+        self, raw_path: str, headers: Mapping[str, str]
+    ) -> tuple[int, dict[str, str], bytes]:
+        """
+        Build one response: status, headers and body.
+        Faults are decided here, latency and slow bodies are applied while sending.
+        """
+        with self._lock:
+            self._counts["requests"] += 1
+            fault = self._pick_fault()
+
+        if fault == "throttle":
+            self._count("throttled")
+            return 429, {"Retry-After": f"{self._faults.retry_after_s:g}"}, b""
+        if fault == "error":
+            self._count("server_errors")
+            return 503, {}, b'{"message": "injected failure"}'
+
+        parts = urlsplit(raw_path)
+        resource = parts.path.strip("/")
+        if resource not in self._rows:
+            return 404, {}, b'{"message": "not found"}'
+
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        body = json.dumps(self._page(resource, query), separators=(",", ":")).encode("utf-8")
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+
+        if headers.get("If-None-Match") == etag or headers.get("if-none-match") == etag:
+            self._count("not_modified")
+            return 304, {"ETag": etag}, b""
+
+        self._count("ok")
+        return 200, {"ETag": etag, "Content-Type": "application/json"}, body
+
+    def _page(self, resource: str, query: Mapping[str, str]) -> dict[str, Any]:
+        """Slice and project one page, `limit=0` returns everything like upstream."""
+        rows = self._rows[resource]
+        skip = max(int(query.get("skip", 0)), 0)
+        limit = max(int(query.get("limit", 30)), 0)
+        items = rows[skip:] if limit == 0 else rows[skip : skip + limit]
+
+        select = [f for f in query.get("select", "").split(",") if f]
+        if select:
+            items = [{"id": row["id"], **{f: row[f] for f in select if f in row}} for row in items]
+
+        return {
+            resource: items,
+            "total": len(rows),
+            "skip": skip,
+            "limit": len(items) or max(limit, 1),
+        }
+
+    def _pick_fault(self) -> str | None:
+        """`throttle`, `error` or `None` for this request. Caller holds the lock."""
+        if self._burst_left > 0:
+            self._burst_left -= 1
+            return "error"
+        if self._faults.throttle_rate and self._rng.random() < self._faults.throttle_rate:
+            return "throttle"
+        if self._faults.error_rate and self._rng.random() < self._faults.error_rate:
+            self._burst_left = max(self._faults.error_burst, 1) - 1
+            return "error"
+        return None
+
+    def _count(self, name: str) -> None:
+        """Bump one outcome counter."""
+        with self._lock:
+            self._counts[name] += 1
+
+    def _send(
+        self,
+        handler: BaseHTTPRequestHandler,
+        status: int,
+        headers: Mapping[str, str],
+        body: bytes,
+    ) -> None:
+        """Write the response, applying latency and a slow body if configured."""
+        faults = self._faults
+        delay_s = faults.latency_s
+        if faults.latency_jitter_s:
+            with self._lock:
+                delay_s += self._rng.uniform(0, faults.latency_jitter_s)
+        if delay_s > 0:
+            time.sleep(delay_s)
+
+        handler.send_response(status)
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+
+        if faults.slow_body_s > 0 and body:
+            chunks = 8
+            step = -(-len(body) // chunks)  # ceil
+            for i in range(0, len(body), step):
+                handler.wfile.write(body[i : i + step])
+                handler.wfile.flush()
+                time.sleep(faults.slow_body_s / chunks)
+        else:
+            handler.wfile.write(body)
+
+        with self._lock:
+            self._counts["bytes_sent"] += len(body)
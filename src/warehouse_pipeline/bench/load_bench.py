@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
+from time import perf_counter
+from typing import Any
+from uuid import uuid4
+
+from psycopg import Connection, sql
+
+from warehouse_pipeline.db.work_tables import (
+    WorkLoadMethod,
+    WorkRow,
+    insert_work_rows,
+    prepare_work_table,
+)
+from warehouse_pipeline.db.writers.staging import get_staging_spec
+from warehouse_pipeline.extract.models import (
+    parse_carts_page,
+    parse_products_page,
+    parse_users_page,
+)
+from warehouse_pipeline.stage import StageRow
+from warehouse_pipeline.stage.map_carts import map_carts
+from warehouse_pipeline.stage.map_products import map_products
+from warehouse_pipeline.stage.map_users import map_users
+
+
+@dataclass(frozen=True)
+class WorkLoadBenchResult:
+    """Work table loads, `executemany` vs binary `COPY`, over all four staging tables."""
+
+    rows: int
+    executemany_s: float  # best of `repeat`, summed over the tables
+    copy_s: float
+    executemany_rows_per_s: float
+    copy_rows_per_s: float
+    speedup: float
+    identical: bool  # both methods left the same work table contents
+    repeat: int
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-friendly view for the CLI."""
+        return asdict(self)
+
+
+def run_work_load_benchmark(
+    conn: Connection,
+    payloads: Mapping[str, Mapping[str, Any]],
+    *,
+    repeat: int = 3,
+) -> WorkLoadBenchResult:
+    """
+    Map snapshot-shaped `payloads` once, then time `insert_work_rows` with each method.
+
+    Needs an initialized database, since work tables copy the `stg_*` layout. Only
+    session temp tables are written and everything is rolled back at the end.
+    """
+    users = map_users(parse_users_page(payloads["users"]).users)
+    products = map_products(parse_products_page(payloads["products"]).products)
+    carts = map_carts(
+        parse_carts_page(payloads["carts"]).carts,
+        product_lookup=products.product_lookup,
+        user_lookup=users.user_lookup,
+    )
+    tables = [users.rows, products.rows, carts.order_rows, carts.order_item_rows]
+    work_rows = {rows[0].table_name: _as_work_rows(rows) for rows in tables if rows}
+    run_id = uuid4()
+
+    timings: dict[WorkLoadMethod, float] = {}
+    digests: dict[WorkLoadMethod, dict[str, str]] = {}
+    try:
+        for method in ("executemany", "copy"):
+            timings[method] = 0.0
+            digests[method] = {}
+            for table_name, rows in work_rows.items():
+                best = float("inf")
+                for _ in range(max(repeat, 1)):
+                    prepare_work_table(conn, table_name=table_name)
+                    t0 = perf_counter()
+                    insert_work_rows(
+                        conn, table_name=table_name, run_id=run_id, rows=rows, method=method
+                    )
+                    best = min(best, perf_counter() - t0)
+                timings[method] += best
+                digests[method][table_name] = _work_table_digest(conn, table_name)
+    finally:
+        conn.rollback()
+
+    rows = sum(len(rows) for rows in work_rows.values())
+    executemany_s, copy_s = timings["executemany"], timings["copy"]
+    return WorkLoadBenchResult(
+        rows=rows,
+        executemany_s=round(executemany_s, 6),
+        copy_s=round(copy_s, 6),
+        executemany_rows_per_s=round(rows / executemany_s, 1) if executemany_s > 0 else 0.0,
+        copy_rows_per_s=round(rows / copy_s, 1) if copy_s > 0 else 0.0,
+        speedup=round(executemany_s / copy_s, 3) if copy_s > 0 else 0.0,
+        identical=digests["executemany"] == digests["copy"],
+        repeat=repeat,
+    )
+
+
+def _as_work_rows(rows: list[StageRow]) -> list[WorkRow]:
+    """Stage rows as the work table loader takes them."""
+    return [
+        WorkRow(source_ref=row.source_ref, raw_payload=row.raw_payload, values=row.values)
+        for row in rows
+    ]
+
+
+def _work_table_digest(conn: Connection, table_name: str) -> str:
+    """md5 over the work table's rows in `source_ref` order."""
+    work = sql.Identifier(get_staging_spec(table_name).work_table_name)
+    query = sql.SQL(
+        "SELECT md5(string_agg(w::text, '|' ORDER BY w.source_ref)) FROM {work} AS w"
+    ).format(work=work)
+    row = conn.execute(query).fetchone()
+    return str(row[0]) if row else ""
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Mapping
+from dataclasses import asdict, dataclass
+from time import perf_counter
+from typing import Any
+
+from warehouse_pipeline.extract.json_codec import loads
+from warehouse_pipeline.extract.models import (
+    parse_carts_page,
+    parse_products_page,
+    parse_users_page,
+)
+from warehouse_pipeline.stage import MappedCarts, ProductLookup, UserLookup
+from warehouse_pipeline.stage.map_carts import map_carts
+from warehouse_pipeline.stage.map_carts_fused import map_raw_carts
+from warehouse_pipeline.stage.map_products import map_products
+from warehouse_pipeline.stage.map_users import map_users
+
+
+@dataclass(frozen=True)
+class CartsMapBenchResult:
+    """Carts from raw JSON bytes to stage rows, current path vs the fused one."""
+
+    carts: int
+    rows: int  # order rows + order item rows + rejects
+    pydantic_s: float  # best of `repeat`
+    fused_s: float
+    pydantic_rows_per_s: float
+    fused_rows_per_s: float
+    speedup: float
+    identical: bool
+    repeat: int
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-friendly view for the CLI."""
+        return asdict(self)
+
+
+def run_carts_map_benchmark(
+    payloads: Mapping[str, Mapping[str, Any]],
+    *,
+    repeat: int = 3,
+) -> CartsMapBenchResult:
+    """
+    Time `parse_carts_page` + `map_carts` against `map_raw_carts` on the same bytes.
+    `payloads` are snapshot-shaped `users`/`products`/`carts` pages, the lookups
+    are built once and left out of the timings.
+    """
+    users = map_users(parse_users_page(payloads["users"]).users)
+    products = map_products(parse_products_page(payloads["products"]).products)
+    body = json.dumps(payloads["carts"]).encode("utf-8")
+    lookups = {"product_lookup": products.product_lookup, "user_lookup": users.user_lookup}
+
+    pydantic_s, current = _best_of(repeat, lambda: _pydantic_path(body, **lookups))
+    fused_s, fused = _best_of(repeat, lambda: _fused_path(body, **lookups))
+
+    rows = len(current.order_rows) + len(current.order_item_rows) + len(current.rejects)
+    return CartsMapBenchResult(
+        carts=len(current.order_rows),
+        rows=rows,
+        pydantic_s=round(pydantic_s, 6),
+        fused_s=round(fused_s, 6),
+        pydantic_rows_per_s=round(rows / pydantic_s, 1) if pydantic_s > 0 else 0.0,
+        fused_rows_per_s=round(rows / fused_s, 1) if fused_s > 0 else 0.0,
+        speedup=round(pydantic_s / fused_s, 3) if fused_s > 0 else 0.0,
+        identical=current == fused,
+        repeat=repeat,
+    )
+
+
+def _pydantic_path(
+    body: bytes, *, product_lookup: ProductLookup, user_lookup: UserLookup
+) -> MappedCarts:
+    """What snapshot runs do by default."""
+    page = parse_carts_page(body)
+    return map_carts(page.carts, product_lookup=product_lookup, user_lookup=user_lookup)
+
+
+def _fused_path(
+    body: bytes, *, product_lookup: ProductLookup, user_lookup: UserLookup
+) -> MappedCarts:
+    """What `--fused-carts` does."""
+    return map_raw_carts(
+        loads(body)["carts"], product_lookup=product_lookup, user_lookup=user_lookup
+    )
+
+
+def _best_of(repeat: int, fn: Callable[[], MappedCarts]) -> tuple[float, MappedCarts]:
+    """Fastest wall time of `repeat` calls, and the last result."""
+    best = float("inf")
+    result = MappedCarts()
+    for _ in range(max(repeat, 1)):
+        t0 = perf_counter()
+        result = fn()
+        best = min(best, perf_counter() - t0)
+    return best, result
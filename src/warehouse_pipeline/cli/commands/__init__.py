@@ -1,7 +1,9 @@
+from warehouse_pipeline.cli.commands.bench import register_bench_commands
 from warehouse_pipeline.cli.commands.db import register_db_commands
 from warehouse_pipeline.cli.commands.run import register_run_commands
 
 __all__ = [
+    "register_bench_commands",
     "register_db_commands",
     "register_run_commands",
 ]
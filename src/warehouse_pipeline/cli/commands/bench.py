@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import argparse
+import json
+
+from warehouse_pipeline.bench import (
+    FakeDummyJsonServer,
+    FaultProfile,
+    run_carts_map_benchmark,
+    run_extract_benchmark,
+    run_work_load_benchmark,
+)
+from warehouse_pipeline.db.connect import connect
+from warehouse_pipeline.extract.bundles import snapshot_root_for_key
+from warehouse_pipeline.extract.snapshot_store import SnapshotStore
+from warehouse_pipeline.extract.synthetic import synthetic_payloads
+
+
+def register_bench_commands(subparsers: argparse._SubParsersAction) -> None:
+    """Initalize argparse parsers for CLI `bench` commands."""
+    bench = subparsers.add_parser("bench", help="Offline performance benchmarks.")
+    bench_sub = bench.add_subparsers(dest="bench_cmd", required=True)
+
+    ex = bench_sub.add_parser(
+        "extract",
+        help="Live extraction against a local fake DummyJSON server.",
+    )
+    ex.add_argument(
+        "--snapshot",
+        dest="snapshot_key",
+        default=None,
+        help="Serve this pinned snapshot (e.g. v1). Default: synthetic data.",
+    )
+    ex.add_argument("--users", type=int, default=1000, help="Synthetic users.")
+    ex.add_argument("--products", type=int, default=1000, help="Synthetic products.")
+    ex.add_argument("--carts", type=int, default=300, help="Synthetic carts.")
+    ex.add_argument("--seed", type=int, default=0, help="Seed for data and faults.")
+
+    ex.add_argument("--latency-ms", type=float, default=0.0, help="Added to every response.")
+    ex.add_argument("--jitter-ms", type=float, default=0.0, help="Random extra latency.")
+    ex.add_argument("--throttle-rate", type=float, default=0.0, help="Share answered 429.")
+    ex.add_argument("--retry-after", type=float, default=0.0, help="Retry-After on 429s (s).")
+    ex.add_argument("--error-rate", type=float, default=0.0, help="Chance of a 5xx burst.")
+    ex.add_argument("--error-burst", type=int, default=1, help="503s per burst.")
+    ex.add_argument("--slow-body-ms", type=float, default=0.0, help="Drip each body this long.")
+
+    ex.add_argument("--page-size", type=int, default=100)
+    ex.add_argument("--concurrency", type=int, default=1)
+    ex.add_argument(
+        "--rate-limit",
+        type=float,
+        default=0.0,
+        help="Client request budget in req/s. Default 0 = unpaced.",
+    )
+    ex.add_argument("--max-attempts", type=int, default=4)
+    ex.add_argument("--hedge", action="store_true", help="Hedge requests past the p95.")
+    ex.add_argument(
+        "--circuit-breaker", action="store_true", help="Fail fast on error-rate spikes."
+    )
+    ex.set_defaults(handler=handle_bench_extract)
+
+    carts = bench_sub.add_parser(
+        "carts",
+        help="Carts validate+map: pydantic path vs the fused mapper.",
+    )
+    carts.add_argument(
+        "--snapshot",
+        dest="snapshot_key",
+        default=None,
+        help="Use this pinned snapshot (e.g. v1). Default: synthetic data.",
+    )
+    carts.add_argument("--users", type=int, default=1000, help="Synthetic users.")
+    carts.add_argument("--products", type=int, default=1000, help="Synthetic products.")
+    carts.add_argument("--carts", type=int, default=5000, help="Synthetic carts.")
+    carts.add_argument("--seed", type=int, default=0, help="Seed for synthetic data.")
+    carts.add_argument("--repeat", type=int, default=3, help="Best of this many passes.")
+    carts.set_defaults(handler=handle_bench_carts)
+
+    load = bench_sub.add_parser(
+        "load",
+        help="Work table loads: executemany vs binary COPY (needs the database).",
+    )
+    load.add_argument(
+        "--snapshot",
+        dest="snapshot_key",
+        default=None,
+        help="Use this pinned snapshot (e.g. v1). Default: synthetic data.",
+    )
+    load.add_argument("--users", type=int, default=1000, help="Synthetic users.")
+    load.add_argument("--products", type=int, default=1000, help="Synthetic products.")
+    load.add_argument("--carts", type=int, default=5000, help="Synthetic carts.")
+    load.add_argument("--seed", type=int, default=0, help="Seed for synthetic data.")
+    load.add_argument("--repeat", type=int, default=3, help="Best of this many passes.")
+    load.set_defaults(handler=handle_bench_load)
+
+
+def handle_bench_extract(args: argparse.Namespace) -> int:
+    """Start the fake server, run one extract pass and print the numbers as JSON."""
+    faults = FaultProfile(
+        latency_s=args.latency_ms / 1000,
+        latency_jitter_s=args.jitter_ms / 1000,
+        throttle_rate=args.throttle_rate,
+        retry_after_s=args.retry_after,
+        error_rate=args.error_rate,
+        error_burst=args.error_burst,
+        slow_body_s=args.slow_body_ms / 1000,
+        seed=args.seed,
+    )
+    if args.snapshot_key:
+        server = FakeDummyJsonServer.from_snapshot(
+            snapshot_root_for_key(args.snapshot_key), faults=faults
+        )
+    else:
+        server = FakeDummyJsonServer.synthetic(
+            users=args.users,
+            products=args.products,
+            carts=args.carts,
+            seed=args.seed,
+            faults=faults,
+        )
+
+    with server:
+        result = run_extract_benchmark(
+            base_url=server.url,
+            page_size=args.page_size,
+            concurrency=args.concurrency,
+            rate_limit_per_s=args.rate_limit if args.rate_limit > 0 else None,
+            max_attempts=args.max_attempts,
+            hedge=args.hedge,
+            circuit_breaker=args.circuit_breaker,
+        )
+        served = server.stats()
+
+    print(json.dumps({"extract": result.to_dict(), "server": served}, indent=2, sort_keys=True))
+    return 0
+
+
+def handle_bench_carts(args: argparse.Namespace) -> int:
+    """Time both carts mapping paths on the same payloads and print the numbers as JSON."""
+    if args.snapshot_key:
+        store = SnapshotStore(snapshot_root_for_key(args.snapshot_key))
+        payloads = {r: store.read_page(r) for r in ("users", "products", "carts")}
+    else:
+        payloads = synthetic_payloads(
+            users=args.users, products=args.products, carts=args.carts, seed=args.seed
+        )
+
+    result = run_carts_map_benchmark(payloads, repeat=args.repeat)
+    print(json.dumps({"carts_map": result.to_dict()}, indent=2, sort_keys=True))
+    return 0 if result.identical else 1
+
+
+def handle_bench_load(args: argparse.Namespace) -> int:
+    """Time both work table load paths on the same rows and print the numbers as JSON."""
+    if args.snapshot_key:
+        store = SnapshotStore(snapshot_root_for_key(args.snapshot_key))
+        payloads = {r: store.read_page(r) for r in ("users", "products", "carts")}
+    else:
+        payloads = synthetic_payloads(
+            users=args.users, products=args.products, carts=args.carts, seed=args.seed
+        )
+
+    with connect() as conn:
+        result = run_work_load_benchmark(conn, payloads, repeat=args.repeat)
+    print(json.dumps({"work_load": result.to_dict()}, indent=2, sort_keys=True))
+    return 0 if result.identical else 1
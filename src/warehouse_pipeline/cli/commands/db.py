@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import argparse
+import json
 from pathlib import Path
 
+from warehouse_pipeline.db.connect import connect
 from warehouse_pipeline.db.initialize import initialize_database
+from warehouse_pipeline.db.partitions import retain_runs
+from warehouse_pipeline.stage.load import recover_prepared_loads
 
 
 def register_db_commands(subparsers: argparse._SubParsersAction) -> None:
@@ -19,9 +23,33 @@ def register_db_commands(subparsers: argparse._SubParsersAction) -> None:
     )
     init_p.set_defaults(handler=handle_db_init)
 
+    retain_p = db_sub.add_parser(
+        "retain",
+        help="Drop the stg_*/reject_rows partitions of all but the newest runs.",
+    )
+    retain_p.add_argument("--keep", type=int, required=True, help="Newest runs to keep.")
+    retain_p.add_argument(
+        "--dry-run", action="store_true", help="Only list the partitions that would go."
+    )
+    retain_p.set_defaults(handler=handle_db_retain)
+
 
 def handle_db_init(args: argparse.Namespace) -> int:
     """Handler for re-initalizing the `db` from CLI."""
     initialize_database(sql_path=Path(args.sql))
     print(f"Initialized schema from {args.sql}")
     return 0
+
+
+def handle_db_retain(args: argparse.Namespace) -> int:
+    """
+    Handler for partition retention from CLI, prints what was dropped as JSON. Parallel
+    loads a crash left prepared are finished first, their locks would block the drops.
+    """
+    with connect() as conn:
+        recovered = None if args.dry_run else recover_prepared_loads(conn)
+        result = retain_runs(conn, keep=args.keep, dry_run=args.dry_run)
+        conn.commit()
+    report = {**result.to_dict(), "recovered_loads": recovered.to_dict() if recovered else None}
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
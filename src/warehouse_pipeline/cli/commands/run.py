@@ -5,6 +5,9 @@ import re
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from warehouse_pipeline.db.bulk import DEFAULT_COPY_THRESHOLD
+from warehouse_pipeline.db.direct_load import DEFAULT_DIRECT_LOAD_MAX_ROWS
+from warehouse_pipeline.extract.http_cache import DEFAULT_HTTP_CACHE_TTL_S
 from warehouse_pipeline.orchestration import RunSpec, run_pipeline
 from warehouse_pipeline.orchestration.contract import DEFAULT_INCREMENTAL_OVERLAP_WINDOW
 
@@ -26,7 +29,7 @@ def register_run_commands(subparsers: argparse._SubParsersAction) -> None:
         "--snapshot",
         dest="snapshot_key",
         default="v1",
-        help="Snapshot key under data/snapshots/dummyjson/ (snapshot mode only).",
+        help="Snapshot key under data/snapshots/dummyjson/ (snapshot mode, or --replay-snapshot).",
     )
     run.add_argument(
         "--runs-root",
@@ -39,6 +42,132 @@ def register_run_commands(subparsers: argparse._SubParsersAction) -> None:
         default=100,
         help="HTTP page size for live mode.",
     )
+    run.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Concurrent page fetches per resource for live/incremental mode (1 = sequential).",
+    )
+    run.add_argument(
+        "--async-extract",
+        action="store_true",
+        help="Fetch users, products and carts at the same time over one async HTTP client.",
+    )
+    run.add_argument(
+        "--rate-limit",
+        type=float,
+        default=4.0,
+        help="Shared live request budget in requests/sec, adapts down on 429s (0 = unpaced).",
+    )
+    run.add_argument(
+        "--burst",
+        type=int,
+        default=1,
+        help="Requests allowed back-to-back before the rate limit applies.",
+    )
+    run.add_argument(
+        "--stream",
+        dest="stream_extract",
+        action="store_true",
+        help="Live/incremental only: map pages into stage rows as they arrive.",
+    )
+    run.add_argument(
+        "--http-cache",
+        action="store_true",
+        help="Cache live responses under <runs-root>/_http_cache and revalidate them (ETag).",
+    )
+    run.add_argument(
+        "--http-cache-ttl",
+        dest="http_cache_ttl_s",
+        type=float,
+        default=DEFAULT_HTTP_CACHE_TTL_S,
+        help="Seconds a cached response may be revalidated before it is dropped.",
+    )
+    run.add_argument(
+        "--hedge",
+        action="store_true",
+        help="Live/incremental: send a duplicate request when a page is slower than "
+        "the recent p95 and keep whichever answers first.",
+    )
+    run.add_argument(
+        "--circuit-breaker",
+        action="store_true",
+        help="Live/incremental: stop sending requests for a while once most recent "
+        "ones failed, instead of retrying into an outage.",
+    )
+    run.add_argument(
+        "--autotune",
+        action="store_true",
+        help="Live/incremental: tune page size and concurrency per resource during the run, "
+        "starting from the last autotuned run's choice.",
+    )
+    run.add_argument(
+        "--autotune-error-budget",
+        type=float,
+        default=0.05,
+        help="Share of retried requests a fetch wave may have before concurrency is cut.",
+    )
+    run.add_argument(
+        "--fused-carts",
+        action="store_true",
+        help="Snapshot only: validate and map carts in one pass over the raw JSON.",
+    )
+    run.add_argument(
+        "--compact-bundle",
+        action="store_true",
+        help="Hold extracted records as per-field arrays instead of pydantic models.",
+    )
+    run.add_argument(
+        "--snapshot-cache",
+        action="store_true",
+        help="Reuse the validated snapshot bundle cached next to the snapshot files.",
+    )
+    run.add_argument(
+        "--snapshot-workers",
+        type=int,
+        default=1,
+        help="Processes that read and validate a sharded snapshot's parts.",
+    )
+    run.add_argument(
+        "--replay-snapshot",
+        action="store_true",
+        help="Incremental mode: read the window's carts out of --snapshot instead of the API.",
+    )
+    run.add_argument(
+        "--copy-threshold",
+        type=int,
+        default=DEFAULT_COPY_THRESHOLD,
+        help=(
+            "Rejects or DQ rows in one write from which it uses COPY instead of "
+            f"executemany. Default: {DEFAULT_COPY_THRESHOLD}."
+        ),
+    )
+    run.add_argument(
+        "--stage-workers",
+        type=int,
+        default=1,
+        help=(
+            "Load independent staging tables at once on this many connections, "
+            "committed together. Default 1 = one after another on the run's connection."
+        ),
+    )
+    run.add_argument(
+        "--direct-load-max-rows",
+        type=int,
+        default=DEFAULT_DIRECT_LOAD_MAX_ROWS,
+        help=(
+            "Staging tables with up to this many rows are deduped in memory and copied "
+            "straight into stg_*, skipping the work table. 0 always uses the work table. "
+            f"Default: {DEFAULT_DIRECT_LOAD_MAX_ROWS}."
+        ),
+    )
+    run.add_argument(
+        "--resume",
+        dest="resume_run_id",
+        default=None,
+        metavar="RUN_ID",
+        help="Live/incremental: reuse the pages an earlier (failed) run already downloaded.",
+    )
 
     ## -- incremental options only
     run.add_argument(
@@ -93,9 +222,31 @@ def handle_run(args: argparse.Namespace) -> int:
     ## -- init `RunSpec`` to hand to pipeline
     spec = RunSpec(
         mode=args.mode,
-        snapshot_key=args.snapshot_key if args.mode == "snapshot" else None,
+        snapshot_key=(
+            args.snapshot_key if args.mode == "snapshot" or args.replay_snapshot else None
+        ),
         runs_root=Path(args.runs_root),
         page_size=args.page_size,
+        concurrency=args.concurrency,
+        async_extract=args.async_extract,
+        rate_limit_per_s=args.rate_limit if args.rate_limit > 0 else None,
+        burst=args.burst,
+        stream_extract=args.stream_extract,
+        http_cache=args.http_cache,
+        http_cache_ttl_s=args.http_cache_ttl_s,
+        hedge=args.hedge,
+        circuit_breaker=args.circuit_breaker,
+        autotune=args.autotune,
+        autotune_error_budget=args.autotune_error_budget,
+        resume_run_id=args.resume_run_id,
+        fused_carts=args.fused_carts,
+        compact_bundle=args.compact_bundle,
+        snapshot_cache=args.snapshot_cache,
+        snapshot_workers=args.snapshot_workers,
+        replay_snapshot=args.replay_snapshot,
+        copy_threshold=args.copy_threshold,
+        stage_workers=args.stage_workers,
+        direct_load_max_rows=args.direct_load_max_rows,
         watermark_column=args.watermark_column,
         since=args.since,
         until=args.until,
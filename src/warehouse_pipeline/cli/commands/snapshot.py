@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+from warehouse_pipeline.extract.bundles import snapshot_root_for_key
+from warehouse_pipeline.extract.snapshot_generator import GeneratorConfig, generate_snapshot
+from warehouse_pipeline.extract.snapshot_store import DEFAULT_SHARD_SIZE
+
+
+def register_snapshot_commands(subparsers: argparse._SubParsersAction) -> None:
+    """Initalize argparse parsers for CLI `snapshot` commands."""
+    snapshot = subparsers.add_parser("snapshot", help="Snapshot utilities.")
+    snapshot_sub = snapshot.add_subparsers(dest="snapshot_cmd", required=True)
+
+    gen = snapshot_sub.add_parser(
+        "generate",
+        help="Write a deterministic synthetic snapshot of any size.",
+    )
+    target = gen.add_mutually_exclusive_group(required=True)
+    target.add_argument(
+        "--key",
+        dest="snapshot_key",
+        default=None,
+        help="Write under the pinned snapshot root for this key (e.g. scale-1m).",
+    )
+    target.add_argument("--out", default=None, help="Write into this directory instead.")
+
+    gen.add_argument("--users", type=int, default=1000, help="Distinct users.")
+    gen.add_argument("--products", type=int, default=1000, help="Distinct products.")
+    gen.add_argument("--carts", type=int, default=1000, help="Distinct carts.")
+    gen.add_argument("--seed", type=int, default=0, help="Same seed, same bytes.")
+    gen.add_argument(
+        "--format",
+        dest="snapshot_format",
+        choices=("json", "ndjson", "sharded", "chunked"),
+        default="ndjson",
+        help="On-disk snapshot format. Default: ndjson.",
+    )
+    gen.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE)
+    gen.add_argument("--mean-lines", type=float, default=3.0, help="Mean lines per cart.")
+    gen.add_argument("--max-lines", type=int, default=8, help="Most lines in one cart.")
+    gen.add_argument(
+        "--duplicate-rate", type=float, default=0.0, help="Share of records re-sent, changed."
+    )
+    gen.add_argument(
+        "--reject-rate", type=float, default=0.0, help="Share of cart lines with quantity 0."
+    )
+    gen.add_argument(
+        "--unknown-product-rate",
+        type=float,
+        default=0.0,
+        help="Share of cart lines naming a product outside the catalog.",
+    )
+    gen.set_defaults(handler=handle_snapshot_generate)
+
+
+def handle_snapshot_generate(args: argparse.Namespace) -> int:
+    """Generate the snapshot and print what was written as JSON."""
+    config = GeneratorConfig(
+        users=args.users,
+        products=args.products,
+        carts=args.carts,
+        seed=args.seed,
+        mean_lines=args.mean_lines,
+        max_lines=args.max_lines,
+        duplicate_rate=args.duplicate_rate,
+        reject_rate=args.reject_rate,
+        unknown_product_rate=args.unknown_product_rate,
+    )
+    root = Path(args.out) if args.out else snapshot_root_for_key(args.snapshot_key)
+    result = generate_snapshot(
+        root, config, snapshot_format=args.snapshot_format, shard_size=args.shard_size
+    )
+    print(json.dumps(result.to_dict(), indent=2, sort_keys=True))
+    return 0
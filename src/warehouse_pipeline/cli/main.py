@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import argparse
 
+from warehouse_pipeline.cli.commands.bench import register_bench_commands
 from warehouse_pipeline.cli.commands.db import register_db_commands
 from warehouse_pipeline.cli.commands.run import register_run_commands
+from warehouse_pipeline.cli.commands.snapshot import register_snapshot_commands
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -13,6 +15,8 @@ def build_parser() -> argparse.ArgumentParser:
 
     register_db_commands(subparsers)
     register_run_commands(subparsers)
+    register_bench_commands(subparsers)
+    register_snapshot_commands(subparsers)
 
     return parser
 
@@ -24,6 +28,8 @@ def main(argv: list[str] | None = None) -> int:
     Supported commands are:
     - `run`,    exercises the pipeline.
     - `db`,     database interactions.
+    - `bench`,  offline performance benchmarks.
+    - `snapshot`, snapshot utilities.
 
     A results summary will print in the terminal upon completion of a command.
 
@@ -33,6 +39,9 @@ def main(argv: list[str] | None = None) -> int:
     #### initalize the database to yourself locally.
     `pipeline db init`
 
+    #### drop staging/reject partitions of all but the 20 newest runs.
+    `pipeline db retain --keep 20`
+
     #### run the pipeline on a saved snapshot of pre-extracted DummyJson.
     `pipeline run --mode snapshot --snapshot v1`
 
@@ -45,6 +54,13 @@ def main(argv: list[str] | None = None) -> int:
     #### run an incremental run on live data
     `pipeline run --mode incremental --since 2024-01-01T00:00:00+00:00 \
     --until 2025-01-01T00:00:00+00:00 --page-size 100`
+
+    #### benchmark extraction offline against a fake DummyJson with injected faults.
+    `pipeline bench extract --latency-ms 20 --throttle-rate 0.05 --concurrency 4`
+
+    #### generate a deterministic 1M-cart snapshot and run the pipeline on it.
+    `pipeline snapshot generate --key scale-1m --users 100000 --products 5000 --carts 1000000`
+    `pipeline run --mode snapshot --snapshot scale-1m`
     """
 
     parser = build_parser()
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from typing import Literal
+
+BulkWriteMethod = Literal["copy", "executemany"]
+
+# below this many rows a parameterized `executemany` is cheaper than setting up a `COPY`
+DEFAULT_COPY_THRESHOLD = 1_000
+
+
+def bulk_write_method(row_count: int, *, copy_threshold: int) -> BulkWriteMethod:
+    """`copy` once a write reaches `copy_threshold` rows, `executemany` below it."""
+    return "copy" if row_count >= copy_threshold else "executemany"
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from typing import Any
+from uuid import UUID
+
+from psycopg import Connection, sql
+
+# list partitioned by `run_id` in new schemas, one partition per run
+RUN_PARTITIONED_TABLES = (
+    "stg_customers",
+    "stg_products",
+    "stg_orders",
+    "stg_order_items",
+    "reject_rows",
+)
+
+
+@dataclass(frozen=True)
+class RetentionResult:
+    """What `retain_runs` kept and dropped."""
+
+    kept_run_ids: list[str] = field(default_factory=list)
+    dropped_partitions: list[str] = field(default_factory=list)
+    unpartitioned_tables: list[str] = field(default_factory=list)  # left alone
+    dry_run: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-friendly view for the CLI."""
+        return asdict(self)
+
+
+def partition_name(table_name: str, run_id: UUID) -> str:
+    """`<table>_r<run_id hex>`, at most 49 characters (`stg_order_items`), under Postgres' 63."""
+    return f"{table_name}_r{run_id.hex}"
+
+
+def partitioned_tables(conn: Connection) -> list[str]:
+    """The `RUN_PARTITIONED_TABLES` that actually are partitioned in this database."""
+    rows = conn.execute(
+        """
+        SELECT t
+        FROM unnest(%s::text[]) AS t
+        WHERE to_regclass(t) IN (SELECT partrelid FROM pg_partitioned_table)
+        """,
+        (list(RUN_PARTITIONED_TABLES),),
+    ).fetchall()
+    found = {row[0] for row in rows}
+    return [table_name for table_name in RUN_PARTITIONED_TABLES if table_name in found]
+
+
+def create_run_partitions(conn: Connection, *, run_id: UUID) -> list[str]:
+    """
+    Create `run_id`'s partition of every partitioned table, returns their names.
+    Plain (pre-partitioning) tables are skipped, so this is a no-op on old schemas.
+    """
+    created: list[str] = []
+    for table_name in partitioned_tables(conn):
+        name = partition_name(table_name, run_id)
+        conn.execute(
+            sql.SQL(
+                "CREATE TABLE IF NOT EXISTS {part} PARTITION OF {parent} FOR VALUES IN ({run})"
+            ).format(
+                part=sql.Identifier(name),
+                parent=sql.Identifier(table_name),
+                run=sql.Literal(str(run_id)),
+            )
+        )
+        created.append(name)
+    return created
+
+
+def retain_runs(conn: Connection, *, keep: int, dry_run: bool = False) -> RetentionResult:
+    """
+    Detach and drop the run partitions of all but the newest `keep` runs.
+
+    The latest succeeded run (what the warehouse is built from) and running runs are
+    always kept. `run_ledger` and `dq_results` rows stay, as do rows that landed in a
+    `<table>_default` partition. Does not commit.
+
+    Each `DETACH PARTITION` takes an `ACCESS EXCLUSIVE` lock on the parent until the
+    caller commits, so loads into that table wait for it. `DETACH ... CONCURRENTLY`
+    isn't an option while the table has a default partition.
+    """
+    if keep < 1:
+        raise ValueError("`keep` must be >= 1")
+
+    kept = _run_ids_to_keep(conn, keep=keep)
+    tables = partitioned_tables(conn)
+    dropped: list[str] = []
+
+    for table_name in tables:
+        prefix = f"{table_name}_r"
+        children = conn.execute(
+            """
+            SELECT c.relname
+            FROM pg_inherits AS i
+            JOIN pg_class AS c ON c.oid = i.inhrelid
+            WHERE i.inhparent = to_regclass(%s)
+            ORDER BY c.relname
+            """,
+            (table_name,),
+        ).fetchall()
+
+        for (child,) in children:
+            run_id = _partition_run_id(child, prefix=prefix)
+            if run_id is None or run_id in kept:
+                continue
+            if not dry_run:
+                conn.execute(
+                    sql.SQL("ALTER TABLE {parent} DETACH PARTITION {part}").format(
+                        parent=sql.Identifier(table_name), part=sql.Identifier(child)
+                    )
+                )
+                conn.execute(sql.SQL("DROP TABLE {part}").format(part=sql.Identifier(child)))
+            dropped.append(child)
+
+    return RetentionResult(
+        kept_run_ids=sorted(str(run_id) for run_id in kept),
+        dropped_partitions=dropped,
+        unpartitioned_tables=[t for t in RUN_PARTITIONED_TABLES if t not in tables],
+        dry_run=dry_run,
+    )
+
+
+def _run_ids_to_keep(conn: Connection, *, keep: int) -> set[UUID]:
+    """The newest `keep` runs, the latest succeeded one, and any still running."""
+    rows = conn.execute(
+        """
+        (SELECT run_id FROM run_ledger ORDER BY started_at DESC LIMIT %s)
+        UNION
+        (SELECT run_id FROM run_ledger
+         WHERE status = 'succeeded'
+         ORDER BY finished_at DESC NULLS LAST, started_at DESC
+         LIMIT 1)
+        UNION
+        (SELECT run_id FROM run_ledger WHERE status = 'running')
+        """,
+        (keep,),
+    ).fetchall()
+    return {row[0] for row in rows}
+
+
+def _partition_run_id(name: str, *, prefix: str) -> UUID | None:
+    """The run a `<table>_r<hex>` partition belongs to, `None` for any other child."""
+    if not name.startswith(prefix):
+        return None
+    try:
+        return UUID(hex=name[len(prefix) :])
+    except ValueError:
+        return None
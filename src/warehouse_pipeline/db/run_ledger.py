@@ -9,6 +9,8 @@ from uuid import UUID
 from psycopg import Connection
 from psycopg.types.json import Jsonb
 
+from warehouse_pipeline.db.partitions import create_run_partitions
+
 RunStatus = Literal["running", "succeeded", "failed"]  # injected in
 RunMode = Literal["snapshot", "live", "incremental"]
 
@@ -29,6 +31,7 @@ class RunStart:
 def create_run(conn: Connection, *, entry: RunStart) -> UUID:
     """
     Inserts a new `run_ledger` row and return its `run_id`.
+    Also creates the run's `stg_*`/`reject_rows` partitions, committed with the row.
     """
     row = conn.execute(  # inject in dc
         """
@@ -53,6 +56,7 @@ def create_run(conn: Connection, *, entry: RunStart) -> UUID:
     ).fetchone()
 
     assert row is not None  # fix this assert
+    create_run_partitions(conn, run_id=row[0])
     return row[0]  # return only `run_id`
 
 
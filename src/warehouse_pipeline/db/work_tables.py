@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Literal
 from uuid import UUID
 
 from psycopg import Connection, sql
@@ -10,6 +10,8 @@ from psycopg.types.json import Jsonb
 
 from warehouse_pipeline.db.writers.staging import StagingTableSpec, get_staging_spec
 
+WorkLoadMethod = Literal["copy", "executemany"]
+
 
 @dataclass(frozen=True)
 class WorkRow:
@@ -25,16 +27,24 @@ class WorkRow:
     values: Mapping[str, Any]
 
 
-def prepare_work_table(conn: Connection, *, table_name: str) -> None:
+def run_work_table_name(table_name: str, run_id: UUID) -> str:
+    """`_work_<table>_r<run_id hex>`, a work table only one run's load uses."""
+    return f"{get_staging_spec(table_name).work_table_name}_r{run_id.hex}"
+
+
+def prepare_work_table(conn: Connection, *, table_name: str, work_table: str | None = None) -> None:
     """
     Create a temporary work table mirroring the target staging table.
     Also includes injected in `source_ref` and `raw_payload`.
 
-    This temp table is scoped to the DB session only.
+    This temp table is scoped to the DB session only. With `work_table` (see
+    `run_work_table_name`) it is a plain unlogged table instead, which a transaction
+    can still `PREPARE` after touching; `drop_work_table` removes it in that transaction.
     """
     spec = get_staging_spec(table_name)
-    work = sql.Identifier(spec.work_table_name)
+    work = sql.Identifier(work_table or spec.work_table_name)
     staging = sql.Identifier(spec.table_name)
+    kind = sql.SQL("UNLOGGED TABLE" if work_table else "TEMP TABLE")
 
     with conn.cursor() as cur:
         # Drop previous table and recreate every run so there's previous temp table.
@@ -45,7 +55,8 @@ def prepare_work_table(conn: Connection, *, table_name: str) -> None:
         )
         # has all the same cols as real
         cur.execute(
-            sql.SQL("CREATE TEMP TABLE {work} (LIKE {staging} INCLUDING DEFAULTS)").format(
+            sql.SQL("CREATE {kind} {work} (LIKE {staging} INCLUDING DEFAULTS)").format(
+                kind=kind,
                 work=work,
                 staging=staging,
             )
@@ -68,29 +79,90 @@ def prepare_work_table(conn: Connection, *, table_name: str) -> None:
         )
 
 
+def drop_work_table(conn: Connection, *, work_table: str) -> None:
+    """Drop a `run_work_table_name` table once its rows are flushed."""
+    conn.execute(sql.SQL("DROP TABLE IF EXISTS {work}").format(work=sql.Identifier(work_table)))
+
+
 def insert_work_rows(
     conn: Connection,
     *,
     table_name: str,
     run_id: UUID,
     rows: Sequence[WorkRow],
+    method: WorkLoadMethod = "copy",
+    work_table: str | None = None,
 ) -> int:
     """
     Inserts parsed rows accepted for staging into the work table.
 
     Never raises on duplicate business keys because the work table has no uniqueness constraints.
-    Returns a count of its total params used.
+    Loads through binary `COPY` by default, or `executemany` when asked or when the
+    spec has no `column_types`. Returns a count of the rows written.
     """
     if not rows:
         return 0
 
     spec = get_staging_spec(table_name)  # all table specs to be fetched from this wrap only
+    work = work_table or spec.work_table_name
+    if method == "copy" and spec.column_types:
+        return _copy_work_rows(conn, spec=spec, work=work, run_id=run_id, rows=rows)
+    return _executemany_work_rows(conn, spec=spec, work=work, run_id=run_id, rows=rows)
+
+
+def _copy_work_rows(
+    conn: Connection,
+    *,
+    spec: StagingTableSpec,
+    work: str,
+    run_id: UUID,
+    rows: Sequence[WorkRow],
+) -> int:
+    """
+    `COPY ... FROM STDIN (FORMAT BINARY)` into the work table.
+
+    `set_types` picks one binary dumper per column up front: `numeric` for `Decimal`,
+    `timestamptz` for datetimes and `jsonb` straight from the payload dict, so no
+    value is wrapped or type-dispatched per row. psycopg sends the formatted rows in
+    ~32 KiB chunks as they are written, the whole load is never built in memory.
+    """
+    cols = ("run_id",) + spec.columns + ("source_ref", "raw_payload")
+    types = ("uuid",) + spec.column_types + ("integer", "jsonb")
+    query = sql.SQL("COPY {work} ({cols}) FROM STDIN (FORMAT BINARY)").format(
+        work=sql.Identifier(work),
+        cols=sql.SQL(", ").join(sql.Identifier(c) for c in cols),
+    )
+
+    with conn.cursor() as cur, cur.copy(query) as copy:
+        copy.set_types(list(types))
+        for r in rows:
+            copy.write_row(
+                (
+                    run_id,
+                    *(r.values.get(c) for c in spec.columns),
+                    r.source_ref,
+                    dict(r.raw_payload),
+                )
+            )
+
+    return len(rows)
+
+
+def _executemany_work_rows(
+    conn: Connection,
+    *,
+    spec: StagingTableSpec,
+    work: str,
+    run_id: UUID,
+    rows: Sequence[WorkRow],
+) -> int:
+    """One parameterized `INSERT` per row, the fallback for `_copy_work_rows`."""
     # all cols only acceptable if derived from spec
     cols = ("run_id",) + spec.columns + ("source_ref", "raw_payload")
 
     # interpolating table and fields in now only after derivation from ok spec
     query = sql.SQL("INSERT INTO {work} ({cols}) VALUES ({vals})").format(
-        work=sql.Identifier(spec.work_table_name),
+        work=sql.Identifier(work),
         cols=sql.SQL(", ").join(sql.Identifier(c) for c in cols),
         vals=sql.SQL(", ").join(sql.Placeholder() for _ in cols),
     )
@@ -118,7 +190,9 @@ def insert_work_rows(
     return len(params)
 
 
-def flush_work_table(conn: Connection, *, table_name: str, run_id: UUID) -> tuple[int, int]:
+def flush_work_table(
+    conn: Connection, *, table_name: str, run_id: UUID, work_table: str | None = None
+) -> tuple[int, int]:
     """
     Deduplicate the work table into staging and emit duplicate rejects.
 
@@ -194,7 +268,7 @@ def flush_work_table(conn: Connection, *, table_name: str, run_id: UUID) -> tupl
         """
     ).format(
         key_partition=key_partition,
-        work=sql.Identifier(spec.work_table_name),
+        work=sql.Identifier(work_table or spec.work_table_name),
         staging=sql.Identifier(spec.table_name),
         insert_staging_cols=insert_staging_cols,
         select_staging_cols=select_staging_cols,
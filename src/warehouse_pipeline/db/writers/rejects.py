@@ -8,6 +8,8 @@ from uuid import UUID
 from psycopg import Connection, sql
 from psycopg.types.json import Jsonb
 
+from warehouse_pipeline.db.bulk import DEFAULT_COPY_THRESHOLD, bulk_write_method
+
 
 @dataclass(frozen=True)
 class RejectInsert:
@@ -20,25 +22,37 @@ class RejectInsert:
     reason_detail: str
 
 
-def insert_reject_rows(conn: Connection, *, run_id: UUID, rejects: Sequence[RejectInsert]) -> int:
+# fixed cols in `reject_rows`, and their types for binary `COPY`:
+_REJECT_COLS = ("run_id", "table_name", "source_ref", "raw_payload", "reason_code", "reason_detail")
+_REJECT_TYPES = ("uuid", "text", "integer", "jsonb", "text", "text")
+
+
+def insert_reject_rows(
+    conn: Connection,
+    *,
+    run_id: UUID,
+    rejects: Sequence[RejectInsert],
+    copy_threshold: int = DEFAULT_COPY_THRESHOLD,
+) -> int:
     """
     Insert `rejects` into the DB's `reject_rows`.
 
     Table and column identifiers are fixed derived constants.
-    Values are parameterized directly.
+    Values are parameterized directly, or streamed with binary `COPY` once there are
+    `copy_threshold` of them.
     """
     if not rejects:
         return 0
 
-    # fixed cols in `reject_rows`:
-    cols = ("run_id", "table_name", "source_ref", "raw_payload", "reason_code", "reason_detail")
+    if bulk_write_method(len(rejects), copy_threshold=copy_threshold) == "copy":
+        return _copy_reject_rows(conn, run_id=run_id, rejects=rejects)
 
     # paramaterize in the values per col.
     query = sql.SQL("INSERT INTO {tbl} ({cols}) VALUES ({vals})").format(
         tbl=sql.Identifier("reject_rows"),
-        cols=sql.SQL(", ").join(sql.Identifier(c) for c in cols),
+        cols=sql.SQL(", ").join(sql.Identifier(c) for c in _REJECT_COLS),
         vals=sql.SQL(", ").join(
-            sql.Placeholder() for _ in cols
+            sql.Placeholder() for _ in _REJECT_COLS
         ),  # does not include user-provided fields, safe to inject
     )
 
@@ -61,3 +75,25 @@ def insert_reject_rows(conn: Connection, *, run_id: UUID, rejects: Sequence[Reje
             cur.executemany(query, params)  # sequential batch processing
 
     return len(params)
+
+
+def _copy_reject_rows(conn: Connection, *, run_id: UUID, rejects: Sequence[RejectInsert]) -> int:
+    """`COPY reject_rows ... FROM STDIN (FORMAT BINARY)`, payload dicts dumped as `jsonb`."""
+    query = sql.SQL("COPY {tbl} ({cols}) FROM STDIN (FORMAT BINARY)").format(
+        tbl=sql.Identifier("reject_rows"),
+        cols=sql.SQL(", ").join(sql.Identifier(c) for c in _REJECT_COLS),
+    )
+    with conn.cursor() as cur, cur.copy(query) as copy:
+        copy.set_types(list(_REJECT_TYPES))
+        for r in rejects:
+            copy.write_row(
+                (
+                    run_id,
+                    r.table_name,
+                    r.source_ref,
+                    dict(r.raw_payload),
+                    r.reason_code,
+                    r.reason_detail,
+                )
+            )
+    return len(rejects)
@@ -15,12 +15,19 @@ class StagingTableSpec:
     - `key_cols` are the per-run key columns (excluding `run_id`).
     They match this staging PK shape:
     `PRIMARY KEY (run_id, *key_cols)`.
+    - `column_types` are the Postgres types of `columns`, in order, for binary `COPY`.
+    Left empty, the table loads through `executemany` instead.
     """
 
     table_name: str
     columns: tuple[str, ...]
     key_cols: tuple[str, ...]
     json_cols: frozenset[str] = field(default_factory=frozenset)
+    column_types: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        if self.column_types and len(self.column_types) != len(self.columns):
+            raise ValueError(f"{self.table_name}.column_types must match its columns")
 
     @property
     def work_table_name(self) -> str:
@@ -44,6 +51,7 @@ TABLE_SPECS: dict[str, StagingTableSpec] = {
             "company",
         ),
         key_cols=("customer_id",),
+        column_types=("bigint",) + ("text",) * 8,
     ),
     "stg_products": StagingTableSpec(
         table_name="stg_products",
@@ -59,6 +67,17 @@ TABLE_SPECS: dict[str, StagingTableSpec] = {
             "stock",
         ),
         key_cols=("product_id",),
+        column_types=(
+            "bigint",
+            "text",
+            "text",
+            "text",
+            "text",
+            "numeric",
+            "numeric",
+            "numeric",
+            "integer",
+        ),
     ),
     "stg_orders": StagingTableSpec(
         table_name="stg_orders",
@@ -73,6 +92,16 @@ TABLE_SPECS: dict[str, StagingTableSpec] = {
             "total_quantity",
         ),
         key_cols=("order_id",),
+        column_types=(
+            "bigint",
+            "bigint",
+            "timestamptz",
+            "text",
+            "text",
+            "numeric",
+            "integer",
+            "integer",
+        ),
     ),
     "stg_order_items": StagingTableSpec(
         table_name="stg_order_items",
@@ -88,6 +117,17 @@ TABLE_SPECS: dict[str, StagingTableSpec] = {
             "net_usd",
         ),
         key_cols=("order_id", "line_id"),
+        column_types=(
+            "bigint",
+            "integer",
+            "bigint",
+            "text",
+            "integer",
+            "numeric",
+            "numeric",
+            "numeric",
+            "numeric",
+        ),
     ),
 }
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from decimal import ROUND_HALF_UP, Decimal
+from time import perf_counter
 from uuid import UUID
 
 from psycopg import Connection, sql
@@ -23,6 +24,7 @@ class DQRunSummary:
     metrics_written: int
     failed_metrics: int
     passed: bool  # for gating later
+    write_s: float = 0.0
 
 
 def _q6(value: Decimal | int | str) -> Decimal:
@@ -404,7 +406,9 @@ def run_table_dq(conn: Connection, *, run_id: UUID, table_name: str) -> DQRunSum
 
     # Idempotentcy per table, replaces previous metric set for that table.
     delete_dq_results(conn, run_id=run_id, table_name=table_name)
+    t0 = perf_counter()
     inserted = upsert_dq_results(conn, rows=metric_rows)
+    write_s = perf_counter() - t0
 
     failed_metrics = sum(1 for row in metric_rows if not row.passed)
 
@@ -414,6 +418,7 @@ def run_table_dq(conn: Connection, *, run_id: UUID, table_name: str) -> DQRunSum
         metrics_written=inserted,
         failed_metrics=failed_metrics,
         passed=(failed_metrics == 0),
+        write_s=round(write_s, 6),
     )
 
 
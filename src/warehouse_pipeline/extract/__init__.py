@@ -5,11 +5,16 @@ from pathlib import Path
 from warehouse_pipeline.extract.bundles import (
     ExtractBundle,
     fetch_live_bundle,
+    fetch_live_bundle_async,
+    fetch_live_compact_bundle,
+    fetch_live_compact_bundle_async,
+    read_compact_snapshot_bundle,
     read_snapshot_bundle,
     snapshot_root_for_key,
     write_snapshot_bundle,
 )
-from warehouse_pipeline.extract.dummyjson_client import DummyJsonClient
+from warehouse_pipeline.extract.dummyjson_client import AsyncDummyJsonClient, DummyJsonClient
+from warehouse_pipeline.extract.snapshot_store import SnapshotFormat
 
 
 def extract_dummyjson_snapshots(
@@ -17,6 +22,8 @@ def extract_dummyjson_snapshots(
     snapshot_root: Path,
     page_size: int = 100,
     client: DummyJsonClient | None = None,
+    concurrency: int = 1,
+    snapshot_format: SnapshotFormat = "json",
 ) -> dict[str, Path]:
     """
     Fetch all `DummyJSON` resources in live mode, and write pinned snapshots.
@@ -27,17 +34,25 @@ def extract_dummyjson_snapshots(
             "products": Path(.../products.json),
             "carts": Path(.../carts.json),
         }`
-    For use as snapshots further down the line.
+    For use as snapshots further down the line, `snapshot_format="ndjson"` writes
+    `.ndjson.gz` files instead.
     """
-    bundle = fetch_live_bundle(page_size=page_size, client=client)
-    return write_snapshot_bundle(bundle, snapshot_root=snapshot_root)
+    bundle = fetch_live_bundle(page_size=page_size, client=client, concurrency=concurrency)
+    return write_snapshot_bundle(
+        bundle, snapshot_root=snapshot_root, snapshot_format=snapshot_format
+    )
 
 
 __all__ = [
+    "AsyncDummyJsonClient",
     "DummyJsonClient",
     "ExtractBundle",
     "extract_dummyjson_snapshots",
     "fetch_live_bundle",
+    "fetch_live_bundle_async",
+    "fetch_live_compact_bundle",
+    "fetch_live_compact_bundle_async",
+    "read_compact_snapshot_bundle",
     "read_snapshot_bundle",
     "snapshot_root_for_key",
     "write_snapshot_bundle",
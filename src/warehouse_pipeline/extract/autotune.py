@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+Knob = Literal["page_size", "concurrency"]
+
+
+@dataclass(frozen=True)
+class AutotuneConfig:
+    """
+    Bounds and starting points for live page-size/concurrency tuning.
+
+    `seeds` maps a resource to the `page_size`/`concurrency` a previous run settled on,
+    otherwise `page_size` and `concurrency` are the starting point.
+    """
+
+    page_size: int = 100
+    concurrency: int = 1
+    min_page_size: int = 10
+    max_page_size: int = 500
+    max_concurrency: int = 8
+    error_budget: float = 0.05  # share of requests in one wave allowed to need a retry
+    seeds: Mapping[str, Mapping[str, int]] = field(default_factory=dict)
+    seeded_from: str | None = None  # run id the seeds were read from
+
+    def tuner_for(
+        self,
+        resource: str,
+        *,
+        probe: Callable[[], tuple[int, int]] | None = None,
+    ) -> PageTuner:
+        """A fresh tuner for one resource, starting from its seed if there is one."""
+        seed = self.seeds.get(resource, {})
+        return PageTuner(
+            page_size=int(seed.get("page_size", self.page_size)),
+            concurrency=int(seed.get("concurrency", self.concurrency)),
+            min_page_size=self.min_page_size,
+            max_page_size=self.max_page_size,
+            max_concurrency=self.max_concurrency,
+            error_budget=self.error_budget,
+            probe=probe,
+        )
+
+
+class PageTuner:
+    """
+    Hill climbing over page size and concurrency, one fetch wave at a time.
+
+    After each wave it keeps stepping the current knob (page size x2 or /2,
+    concurrency +1 or -1) while items/s improves. When it stops improving the
+    best settings are restored and the other knob is tried. More retried requests
+    than `error_budget` allows halves concurrency instead.
+
+    `probe` returns cumulative `(bytes_received, retries)` of the client doing
+    the fetching, used for bytes per page and the error budget.
+    """
+
+    def __init__(
+        self,
+        *,
+        page_size: int,
+        concurrency: int = 1,
+        min_page_size: int = 10,
+        max_page_size: int = 500,
+        max_concurrency: int = 8,
+        error_budget: float = 0.05,
+        tolerance: float = 0.05,
+        probe: Callable[[], tuple[int, int]] | None = None,
+    ) -> None:
+        # sanity
+        if not 0 < min_page_size <= max_page_size:
+            raise ValueError("need 0 < min_page_size <= max_page_size")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        if error_budget < 0:
+            raise ValueError("error_budget must be >= 0")
+
+        self._min_page_size = min_page_size
+        self._max_page_size = max_page_size
+        self._max_concurrency = max_concurrency
+        self._error_budget = error_budget
+        self._tolerance = tolerance
+        self._probe = probe
+
+        self._page_size = self._clamp_page_size(page_size)
+        self._concurrency = min(max(concurrency, 1), max_concurrency)
+        self._knob: Knob = "page_size"
+        self._direction: dict[Knob, int] = {"page_size": 1, "concurrency": 1}
+
+        self._best_items_per_s = 0.0
+        self._best = (self._page_size, self._concurrency)
+        self._stale_waves = 0
+        self._wave_start = (0, 0)
+        self.trace: list[dict[str, Any]] = []
+
+    @property
+    def page_size(self) -> int:
+        """Page size for the next wave."""
+        return self._page_size
+
+    @property
+    def concurrency(self) -> int:
+        """Pages fetched at once in the next wave."""
+        return self._concurrency
+
+    @property
+    def max_concurrency(self) -> int:
+        """Upper bound, to size a worker pool once."""
+        return self._max_concurrency
+
+    @property
+    def converged(self) -> bool:
+        """Both directions of both knobs tried without a gain."""
+        return self._stale_waves >= 4
+
+    def cap_page_size(self, served: int) -> None:
+        """The server clamped `limit`, never ask for more than it serves."""
+        self._max_page_size = max(min(self._max_page_size, served), 1)
+        self._min_page_size = min(self._min_page_size, self._max_page_size)
+        self._page_size = self._clamp_page_size(self._page_size)
+        self._best = (self._clamp_page_size(self._best[0]), self._best[1])
+
+    def start_wave(self) -> None:
+        """Mark the client counters before a wave."""
+        self._wave_start = self._probe() if self._probe is not None else (0, 0)
+
+    def observe(self, *, items: int, elapsed_s: float, page_latencies_s: list[float]) -> None:
+        """Record one finished wave and pick the settings for the next."""
+        requests = len(page_latencies_s)
+        end = self._probe() if self._probe is not None else (0, 0)
+        nbytes = end[0] - self._wave_start[0]
+        retries = end[1] - self._wave_start[1]
+
+        items_per_s = items / elapsed_s if elapsed_s > 0 else 0.0
+        error_rate = retries / max(requests + retries, 1)
+        entry: dict[str, Any] = {
+            "page_size": self._page_size,
+            "concurrency": self._concurrency,
+            "requests": requests,
+            "items": items,
+            "elapsed_s": round(elapsed_s, 6),
+            "latency_s_per_page": round(sum(page_latencies_s) / max(requests, 1), 6),
+            "bytes_per_page": nbytes // max(requests, 1),
+            "items_per_s": round(items_per_s, 3),
+            "error_rate": round(error_rate, 4),
+        }
+
+        if error_rate > self._error_budget:
+            # over budget, shed parallelism and start measuring again from here
+            entry["action"] = "backoff"
+            self._concurrency = max(1, self._concurrency // 2)
+            self._best_items_per_s = 0.0
+            self._best = (self._page_size, self._concurrency)
+        elif items_per_s > self._best_items_per_s * (1 + self._tolerance):
+            entry["action"] = "improve"
+            self._best_items_per_s = items_per_s
+            self._best = (self._page_size, self._concurrency)
+            self._stale_waves = 0
+            self._step(self._knob)
+        else:
+            entry["action"] = "revert"
+            self._stale_waves += 1
+            self._page_size, self._concurrency = self._best
+            self._direction[self._knob] *= -1
+            self._knob = "concurrency" if self._knob == "page_size" else "page_size"
+            self._step(self._knob)
+
+        entry["next_page_size"] = self._page_size
+        entry["next_concurrency"] = self._concurrency
+        self.trace.append(entry)
+
+    def report(self) -> dict[str, Any]:
+        """Chosen settings plus the convergence trace, for the run manifest."""
+        page_size, concurrency = self._best
+        return {
+            "page_size": page_size,
+            "concurrency": concurrency,
+            "best_items_per_s": round(self._best_items_per_s, 3),
+            "converged": self.converged,
+            "waves": len(self.trace),
+            "trace": list(self.trace),
+        }
+
+    def _step(self, knob: Knob) -> None:
+        """Move one knob one step in its current direction, within bounds."""
+        if knob == "page_size":
+            factor = 2.0 if self._direction["page_size"] > 0 else 0.5
+            self._page_size = self._clamp_page_size(int(self._page_size * factor))
+        else:
+            self._concurrency = min(
+                max(self._concurrency + self._direction["concurrency"], 1),
+                self._max_concurrency,
+            )
+
+    def _clamp_page_size(self, page_size: int) -> int:
+        """Keep a page size within bounds."""
+        return min(max(page_size, self._min_page_size), self._max_page_size)
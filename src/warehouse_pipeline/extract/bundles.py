@@ -1,23 +1,70 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import asyncio
+from collections.abc import Awaitable, Callable, Iterator, Mapping
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal, TypeVar
 
-from warehouse_pipeline.extract.dummyjson_client import DummyJsonClient
+from warehouse_pipeline.extract.autotune import AutotuneConfig
+from warehouse_pipeline.extract.checkpoint import PageCheckpoint
+from warehouse_pipeline.extract.compact import ColumnarRecords, CompactBundle, RowsPage, dump_rows
+from warehouse_pipeline.extract.dummyjson_client import AsyncDummyJsonClient, DummyJsonClient
+from warehouse_pipeline.extract.http_cache import ResponseCache
+from warehouse_pipeline.extract.json_codec import loads
 from warehouse_pipeline.extract.models import (
+    CartsPage,
     DummyCart,
     DummyProduct,
     DummyUser,
+    ExtractModel,
+    PageEnvelope,
+    ProductsPage,
+    UsersPage,
     parse_carts_page,
     parse_products_page,
     parse_users_page,
 )
-from warehouse_pipeline.extract.paginator import PaginationResult, fetch_all_pages
-from warehouse_pipeline.extract.snapshot_store import SnapshotStore
+from warehouse_pipeline.extract.paginator import (
+    PaginationResult,
+    fetch_all_pages,
+    fetch_all_pages_async,
+    iter_pages,
+    iter_prefetched,
+)
+from warehouse_pipeline.extract.rate_limiter import RateLimiter
+from warehouse_pipeline.extract.resilience import CircuitBreaker, HedgePolicy
+from warehouse_pipeline.extract.shard_reader import (
+    columnar_shard,
+    decode_shard,
+    map_shards,
+    read_shards,
+    validate_shard,
+)
+from warehouse_pipeline.extract.snapshot_cache import SnapshotBundleCache
+from warehouse_pipeline.extract.snapshot_store import (
+    DEFAULT_SHARD_SIZE,
+    SnapshotFormat,
+    SnapshotStore,
+)
+from warehouse_pipeline.stage.derive_fields import derive_order_ts
 
 DEFAULT_SNAPSHOT_BASE_DIR = Path(__file__).resolve().parents[3] / "data" / "snapshots" / "dummyjson"
 
+LiveResource = Literal["users", "products", "carts"]
+LivePage = UsersPage | ProductsPage | CartsPage
+PageT = TypeVar("PageT", UsersPage, ProductsPage, CartsPage)
+RecordT = TypeVar("RecordT", DummyUser, DummyProduct, DummyCart)
+
+SNAPSHOT_RESOURCES: tuple[LiveResource, ...] = ("users", "products", "carts")
+LIVE_MODELS: dict[LiveResource, type[ExtractModel]] = {
+    "users": DummyUser,
+    "products": DummyProduct,
+    "carts": DummyCart,
+}
+
 
 @dataclass(frozen=True)
 class ExtractBundle:
@@ -36,6 +83,16 @@ class ExtractBundle:
     totals: dict[str, int] = field(default_factory=dict)
     pages_fetched: dict[str, int] = field(default_factory=dict)
     page_size: int | None = None
+    # HTTP request/retry/throttle counters, live pulls only.
+    client_stats: dict[str, Any] = field(default_factory=dict)
+    # per resource chosen page size/concurrency and trace, autotuned live pulls only.
+    autotune: dict[str, Any] = field(default_factory=dict)
+    # decoded cart JSON for the fused carts mapper, `carts` is empty when these are set.
+    raw_carts: tuple[dict[str, Any], ...] = ()
+    # hit/miss and content key of the validated-snapshot cache, cached reads only.
+    snapshot_cache: dict[str, Any] = field(default_factory=dict)
+    # how a window-filtered snapshot read found its carts, `carts_between` reads only.
+    window_read: dict[str, Any] = field(default_factory=dict)
 
 
 def snapshot_root_for_key(snapshot_key: str, *, base_dir: Path | None = None) -> Path:
@@ -50,139 +107,758 @@ def read_snapshot_bundle(
     *,
     snapshot_root: Path,
     snapshot_key: str | None = None,
+    fused_carts: bool = False,
+    use_cache: bool = False,
+    workers: int = 1,
+    carts_between: tuple[datetime, datetime] | None = None,
 ) -> ExtractBundle:
     """
     Reads pinned snapshot files and validates them into some typed extract models.
+
+    With `fused_carts`, carts are only decoded and land in `raw_carts`, they are
+    validated while mapping by `map_raw_carts`. With `use_cache`, the validated bundle
+    is pickled next to the snapshot and reused while the files' content hash matches.
+    `workers` processes decode fused sharded carts. Validated shards only come back
+    from a pool as columns, so parallel validation is `read_compact_snapshot_bundle`'s.
+
+    `carts_between=(low, high)` keeps only carts whose derived `order_ts` is in
+    `[low, high)`, read through the carts' sidecar index when there is a fresh one.
+    With `use_cache` the whole snapshot is cached instead and the window cut after,
+    so replays of different windows over the same bytes all hit.
+    """
+    bundle = _read_snapshot(
+        snapshot_root,
+        snapshot_key=snapshot_key,
+        fused_carts=fused_carts,
+        use_cache=use_cache,
+        workers=workers,
+        carts_between=carts_between,
+        compact=False,
+    )
+    assert isinstance(bundle, ExtractBundle)
+    return bundle
+
+
+def read_compact_snapshot_bundle(
+    *,
+    snapshot_root: Path,
+    snapshot_key: str | None = None,
+    fused_carts: bool = False,
+    use_cache: bool = False,
+    workers: int = 1,
+    carts_between: tuple[datetime, datetime] | None = None,
+) -> CompactBundle:
     """
+    `read_snapshot_bundle`, but each record is dumped into columns as soon as it is
+    validated. At most one shard's models exist at a time, never the whole snapshot's.
+    Sharded resources are validated by up to `workers` processes, each sending its
+    shard back as columns, which pickle an order of magnitude faster than models.
+    """
+    bundle = _read_snapshot(
+        snapshot_root,
+        snapshot_key=snapshot_key,
+        fused_carts=fused_carts,
+        use_cache=use_cache,
+        workers=workers,
+        carts_between=carts_between,
+        compact=True,
+    )
+    assert isinstance(bundle, CompactBundle)
+    return bundle
+
+
+def _read_snapshot(
+    snapshot_root: Path,
+    *,
+    snapshot_key: str | None,
+    fused_carts: bool,
+    use_cache: bool,
+    workers: int,
+    carts_between: tuple[datetime, datetime] | None,
+    compact: bool,
+) -> ExtractBundle | CompactBundle:
+    """Both snapshot readers, through the validated-bundle cache when asked to."""
     root = snapshot_root.resolve()
     store = SnapshotStore(root)
+    source_paths = {name: str(store.existing_path(name)) for name in SNAPSHOT_RESOURCES}
+    read = partial(
+        _validate_snapshot,
+        store,
+        snapshot_key=snapshot_key,
+        fused_carts=fused_carts,
+        workers=workers,
+        compact=compact,
+    )
 
-    users_payload = store.read_json("users")
-    products_payload = store.read_json("products")
-    carts_payload = store.read_json("carts")
+    if not use_cache:
+        return read(carts_between=carts_between)
 
-    users_page = parse_users_page(users_payload)
-    products_page = parse_products_page(products_payload)
-    carts_page = parse_carts_page(carts_payload)
+    cache = SnapshotBundleCache(root)
+    files = {
+        f"{name}/{i:06d}": path
+        for name in SNAPSHOT_RESOURCES
+        for i, path in enumerate(store.files_for(name))
+    }
+    variant = "fused" if fused_carts else "models"
+    if compact:
+        variant += ":compact"
+    # the whole snapshot is cached, so every replay window shares one entry
+    key = cache.key_for(files, variant=variant)
+    cached = cache.load(key)
+    if isinstance(cached, CompactBundle if compact else ExtractBundle):
+        # same bytes, so only what describes this read can differ
+        bundle = replace(
+            cached,
+            snapshot_key=snapshot_key,
+            source_paths=source_paths,
+            snapshot_cache={"hit": True, "key": key},
+        )
+    else:
+        bundle = read()
+        stored = cache.store(key, bundle)
+        bundle = replace(bundle, snapshot_cache={"hit": False, "key": key, "stored": stored})
+    return bundle if carts_between is None else _window_of(bundle, carts_between)
 
-    return ExtractBundle(
-        mode="snapshot",
-        snapshot_key=snapshot_key,
-        users=tuple(users_page.users),
-        products=tuple(products_page.products),
-        carts=tuple(carts_page.carts),
-        source_paths={
-            "users": str(store.path_for("users")),
-            "products": str(store.path_for("products")),
-            "carts": str(store.path_for("carts")),
-        },
+
+def _validate_snapshot(
+    store: SnapshotStore,
+    *,
+    snapshot_key: str | None,
+    fused_carts: bool,
+    workers: int,
+    carts_between: tuple[datetime, datetime] | None = None,
+    compact: bool = False,
+) -> ExtractBundle | CompactBundle:
+    """The uncached half of the snapshot readers, each resource in its own format."""
+    read = partial(_read_snapshot_columns if compact else _read_snapshot_resource, store)
+    users, users_total = read("users", DummyUser, parse_users_page, workers=workers)
+    products, products_total = read("products", DummyProduct, parse_products_page, workers=workers)
+    totals = {"users": users_total, "products": products_total}
+    window_read: dict[str, Any] = {}
+    carts: tuple[DummyCart, ...] | ColumnarRecords = (
+        ColumnarRecords.empty(DummyCart) if compact else ()
+    )
+    raw_carts: tuple[dict[str, Any], ...] = ()
+
+    low, high = (ts.timestamp() for ts in carts_between) if carts_between else (0.0, 0.0)
+    indexed = store.read_window_lines("carts", low=low, high=high) if carts_between else None
+    if indexed is not None:
+        # only the gzip members holding window carts were read, nothing left to filter
+        if fused_carts:
+            raw_carts = tuple(loads(line) for line in indexed.lines)
+        else:
+            validated = (DummyCart.model_validate_json(line) for line in indexed.lines)
+            carts = (
+                ColumnarRecords.from_models(DummyCart, validated) if compact else tuple(validated)
+            )
+        totals["carts_pre_filter"] = indexed.indexed
+        window_read = {"strategy": "index", "bytes_read": indexed.bytes_read}
+    else:
+        if fused_carts:
+            raw_carts, totals["carts"] = _read_raw_carts(store, workers=workers)
+        else:
+            carts, totals["carts"] = read("carts", DummyCart, parse_carts_page, workers=workers)
+    if indexed is not None:
+        totals["carts"] = len(carts) + len(raw_carts)  # like `filter_bundle_to_window`
+
+    described: dict[str, Any] = {
+        "mode": "snapshot",
+        "snapshot_key": snapshot_key,
+        "raw_carts": raw_carts,
+        "source_paths": {name: str(store.existing_path(name)) for name in SNAPSHOT_RESOURCES},
+        "totals": totals,
+        "pages_fetched": {"users": 1, "products": 1, "carts": 1},
+        "page_size": None,
+        "window_read": window_read,
+    }
+    bundle: ExtractBundle | CompactBundle
+    if isinstance(users, ColumnarRecords):
+        assert isinstance(products, ColumnarRecords) and isinstance(carts, ColumnarRecords)
+        bundle = CompactBundle(users=users, products=products, carts=carts, **described)
+    else:
+        assert not isinstance(products, ColumnarRecords)
+        assert not isinstance(carts, ColumnarRecords)
+        bundle = ExtractBundle(users=users, products=products, carts=carts, **described)
+    if carts_between and indexed is None:
+        return _window_of(bundle, carts_between)
+    return bundle
+
+
+def _window_of(
+    bundle: ExtractBundle | CompactBundle, carts_between: tuple[datetime, datetime]
+) -> ExtractBundle | CompactBundle:
+    """A whole snapshot bundle cut down to the carts whose `order_ts` is in the window."""
+    low, high = (ts.timestamp() for ts in carts_between)
+    carts = _carts_between(bundle.carts, low, high)
+    raw_carts = tuple(c for c in bundle.raw_carts if _raw_cart_in(c, low, high))
+    return replace(
+        bundle,
+        carts=carts,
+        raw_carts=raw_carts,
         totals={
-            "users": users_page.total,
-            "products": products_page.total,
-            "carts": carts_page.total,
-        },
-        pages_fetched={
-            "users": 1,
-            "products": 1,
-            "carts": 1,
+            **bundle.totals,
+            "carts_pre_filter": len(bundle.carts) + len(bundle.raw_carts),
+            "carts": len(carts) + len(raw_carts),  # like `filter_bundle_to_window`
         },
-        page_size=None,
+        window_read={"strategy": "scan"},
     )
 
 
+def cart_index_key(cart: Mapping[str, Any]) -> tuple[int, int]:
+    """Sidecar index key of a dumped cart: its id and derived `order_ts` in epoch seconds."""
+    return cart["id"], _cart_epoch(cart["id"], cart["userId"])
+
+
+def _cart_epoch(cart_id: int, user_id: int) -> int:
+    """Derived `order_ts` as whole epoch seconds, what the index stores."""
+    return int(derive_order_ts(cart_id=cart_id, user_id=user_id).timestamp())
+
+
+def _raw_cart_in(cart: Mapping[str, Any], low: float, high: float) -> bool:
+    """Window check on undecoded cart JSON, a cart with no usable ids has no `order_ts`."""
+    cart_id, user_id = cart.get("id"), cart.get("userId")
+    if type(cart_id) is not int or type(user_id) is not int:
+        return False
+    return low <= _cart_epoch(cart_id, user_id) < high
+
+
+def _carts_between(
+    carts: tuple[DummyCart, ...] | ColumnarRecords, low: float, high: float
+) -> tuple[DummyCart, ...] | ColumnarRecords:
+    """Validated carts, as models or columns, whose `order_ts` is in `[low, high)`."""
+    if isinstance(carts, ColumnarRecords):
+        return carts.where(lambda c: low <= _cart_epoch(c["id"], c["userId"]) < high)
+    return tuple(c for c in carts if low <= _cart_epoch(c.id, c.userId) < high)
+
+
+def _read_snapshot_resource(
+    store: SnapshotStore,
+    name: LiveResource,
+    model: type[RecordT],
+    parse_page: Callable[[bytes], LivePage],
+    *,
+    workers: int,
+) -> tuple[tuple[RecordT, ...], int]:
+    """
+    One resource's validated records and envelope `total`. Model shards are always read
+    in process, `workers` is unused: pickling models back from a pool costs the parent
+    more than validating them (`_read_snapshot_columns` ships columns instead).
+    """
+    snapshot_format = store.format_for(name)
+    if snapshot_format == "sharded":
+        envelope = PageEnvelope.model_validate(store.read_manifest(name))
+        shards = store.shard_paths(name)
+        return tuple(read_shards(shards, partial(validate_shard, model))), envelope.total
+    if snapshot_format != "json":
+        # record by record, the decompressed file is never held whole
+        envelope = PageEnvelope.model_validate(store.read_envelope(name))
+        records = tuple(model.model_validate_json(line) for line in store.iter_record_lines(name))
+        return records, envelope.total
+    # raw bytes, validated by pydantic-core without building dicts first
+    page = parse_page(store.read_bytes(name))
+    return tuple(getattr(page, name)), page.total
+
+
+def _read_snapshot_columns(
+    store: SnapshotStore,
+    name: LiveResource,
+    model: type[RecordT],
+    parse_page: Callable[[bytes], LivePage],
+    *,
+    workers: int,
+) -> tuple[ColumnarRecords, int]:
+    """
+    `_read_snapshot_resource` into columns, each model dumped and dropped as soon as
+    it is validated. `parse_page` is unused, a whole page of models is what this avoids.
+    """
+    snapshot_format = store.format_for(name)
+    if snapshot_format == "sharded":
+        envelope = PageEnvelope.model_validate(store.read_manifest(name))
+        parts = map_shards(store.shard_paths(name), partial(columnar_shard, model), workers=workers)
+        return ColumnarRecords.concat(model, parts), envelope.total
+    if snapshot_format != "json":
+        envelope = PageEnvelope.model_validate(store.read_envelope(name))
+        lines = store.iter_record_lines(name)
+        records = (model.model_validate_json(line) for line in lines)
+        return ColumnarRecords.from_models(model, records), envelope.total
+    payload = store.read_json(name)
+    envelope = PageEnvelope.model_validate(payload)  # ignores the records
+    raw = payload.get(name)
+    if not isinstance(raw, list):
+        raise ValueError(f"Snapshot {store.path_for(name)} has no `{name}` list")
+    records = (model.model_validate(item) for item in _drained(raw))
+    return ColumnarRecords.from_models(model, records), envelope.total
+
+
+def _drained(items: list[Any]) -> Iterator[Any]:
+    """Each item, its slot cleared once handed out so the decoded JSON goes as we go."""
+    for i, item in enumerate(items):
+        items[i] = None
+        yield item
+
+
+def _read_raw_carts(
+    store: SnapshotStore, *, workers: int
+) -> tuple[tuple[dict[str, Any], ...], int]:
+    """Decoded carts for the fused mapper, only the envelope is validated here."""
+    snapshot_format = store.format_for("carts")
+    if snapshot_format == "sharded":
+        envelope = PageEnvelope.model_validate(store.read_manifest("carts"))
+        shards = store.shard_paths("carts")
+        return tuple(read_shards(shards, decode_shard, workers=workers)), envelope.total
+    if snapshot_format != "json":
+        envelope = PageEnvelope.model_validate(store.read_envelope("carts"))
+        return tuple(loads(line) for line in store.iter_record_lines("carts")), envelope.total
+    carts_payload = store.read_json("carts")
+    envelope = PageEnvelope.model_validate(carts_payload)  # ignores the carts
+    raw_carts = carts_payload.get("carts")
+    if not isinstance(raw_carts, list):
+        raise ValueError(f"Snapshot {store.path_for('carts')} has no `carts` list")
+    return tuple(raw_carts), envelope.total
+
+
 def fetch_live_bundle(
     *,
     page_size: int = 100,
     client: DummyJsonClient | None = None,
+    concurrency: int = 1,
+    rate_limiter: RateLimiter | None = None,
+    response_cache: ResponseCache | None = None,
+    hedge: HedgePolicy | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    autotune: AutotuneConfig | None = None,
+    checkpoint: PageCheckpoint | None = None,
 ) -> ExtractBundle:
     """
     Extract all `DummyJSON` resources at once, for live mode and return one validated bundle.
+
+    `concurrency > 1` fans each resource's remaining pages out over a worker pool.
+    `rate_limiter` paces and `response_cache` revalidates the client built here,
+    `hedge` and `circuit_breaker` guard its tail latency and error spikes,
+    all ignored when a `client` is passed in.
+    `autotune` lets each resource tune its own page size and concurrency as it goes.
+    `checkpoint` persists every page as it arrives and serves already completed ones.
+    """
+    bundle = _pull_live(
+        page_size=page_size,
+        client=client,
+        concurrency=concurrency,
+        rate_limiter=rate_limiter,
+        response_cache=response_cache,
+        hedge=hedge,
+        circuit_breaker=circuit_breaker,
+        autotune=autotune,
+        checkpoint=checkpoint,
+        compact=False,
+    )
+    assert isinstance(bundle, ExtractBundle)
+    return bundle
+
+
+def fetch_live_compact_bundle(
+    *,
+    page_size: int = 100,
+    client: DummyJsonClient | None = None,
+    concurrency: int = 1,
+    rate_limiter: RateLimiter | None = None,
+    response_cache: ResponseCache | None = None,
+    hedge: HedgePolicy | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    autotune: AutotuneConfig | None = None,
+    checkpoint: PageCheckpoint | None = None,
+) -> CompactBundle:
     """
+    `fetch_live_bundle`, but every page's models are dumped into rows as soon as the
+    page is validated, in the worker that fetched it. No resource's models are ever
+    all alive at once.
+    """
+    bundle = _pull_live(
+        page_size=page_size,
+        client=client,
+        concurrency=concurrency,
+        rate_limiter=rate_limiter,
+        response_cache=response_cache,
+        hedge=hedge,
+        circuit_breaker=circuit_breaker,
+        autotune=autotune,
+        checkpoint=checkpoint,
+        compact=True,
+    )
+    assert isinstance(bundle, CompactBundle)
+    return bundle
+
+
+def _pull_live(
+    *,
+    page_size: int,
+    client: DummyJsonClient | None,
+    concurrency: int,
+    rate_limiter: RateLimiter | None,
+    response_cache: ResponseCache | None,
+    hedge: HedgePolicy | None,
+    circuit_breaker: CircuitBreaker | None,
+    autotune: AutotuneConfig | None,
+    checkpoint: PageCheckpoint | None,
+    compact: bool,
+) -> ExtractBundle | CompactBundle:
+    """Both sync live extracts, one paginated pull per resource."""
     owns_client = client is None
-    live_client = client or DummyJsonClient()
+    live_client = client or DummyJsonClient(
+        rate_limiter=rate_limiter,
+        response_cache=response_cache,
+        hedge=hedge,
+        circuit_breaker=circuit_breaker,
+        pool_size=autotune.max_concurrency if autotune is not None else concurrency,
+    )
+
+    tuners = (
+        {
+            resource: autotune.tuner_for(resource, probe=live_client.transfer_counters)
+            for resource in SNAPSHOT_RESOURCES
+        }
+        if autotune is not None
+        else {}
+    )
 
     try:
-        users: PaginationResult[DummyUser] = fetch_all_pages(
-            fetch_page=live_client.get_users_page,
-            get_items=lambda page: page.users,
-            get_total=lambda page: page.total,
-            get_skip=lambda page: page.skip,
-            get_limit=lambda page: page.limit,
-            page_size=page_size,
-        )
-        products: PaginationResult[DummyProduct] = fetch_all_pages(
-            fetch_page=live_client.get_products_page,
-            get_items=lambda page: page.products,
-            get_total=lambda page: page.total,
-            get_skip=lambda page: page.skip,
-            get_limit=lambda page: page.limit,
+        results: dict[LiveResource, PaginationResult[Any]] = {}
+        for resource, fetch_page in _live_fetchers(live_client, checkpoint).items():
+            results[resource] = fetch_all_pages(
+                fetch_page=_as_rows(resource, fetch_page) if compact else fetch_page,
+                get_items=_items_of(resource, compact=compact),
+                get_total=lambda page: page.total,
+                get_skip=lambda page: page.skip,
+                get_limit=lambda page: page.limit,
+                page_size=page_size,
+                concurrency=concurrency,
+                tuner=tuners.get(resource),
+            )
+
+        return _live_bundle(
+            results,
             page_size=page_size,
+            client_stats=live_client.stats(),
+            autotune={resource: tuner.report() for resource, tuner in tuners.items()},
+            compact=compact,
         )
-        carts: PaginationResult[DummyCart] = fetch_all_pages(
-            fetch_page=live_client.get_carts_page,
-            get_items=lambda page: page.carts,
-            get_total=lambda page: page.total,
-            get_skip=lambda page: page.skip,
-            get_limit=lambda page: page.limit,
-            page_size=page_size,
+    finally:
+        if owns_client:
+            # make sure close connect to live
+            live_client.close()
+
+
+async def fetch_live_bundle_async(
+    *,
+    page_size: int = 100,
+    client: AsyncDummyJsonClient | None = None,
+    concurrency: int = 1,
+    rate_limiter: RateLimiter | None = None,
+    response_cache: ResponseCache | None = None,
+    hedge: HedgePolicy | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    checkpoint: PageCheckpoint | None = None,
+) -> ExtractBundle:
+    """
+    Extract users, products and carts at the same time over one async client.
+
+    All three share the client's rate limit, so wall time tracks the slowest resource
+    rather than the sum. Returns the same bundle as `fetch_live_bundle`.
+    """
+    bundle = await _pull_live_async(
+        page_size=page_size,
+        client=client,
+        concurrency=concurrency,
+        rate_limiter=rate_limiter,
+        response_cache=response_cache,
+        hedge=hedge,
+        circuit_breaker=circuit_breaker,
+        checkpoint=checkpoint,
+        compact=False,
+    )
+    assert isinstance(bundle, ExtractBundle)
+    return bundle
+
+
+async def fetch_live_compact_bundle_async(
+    *,
+    page_size: int = 100,
+    client: AsyncDummyJsonClient | None = None,
+    concurrency: int = 1,
+    rate_limiter: RateLimiter | None = None,
+    response_cache: ResponseCache | None = None,
+    hedge: HedgePolicy | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    checkpoint: PageCheckpoint | None = None,
+) -> CompactBundle:
+    """Async twin of `fetch_live_compact_bundle`."""
+    bundle = await _pull_live_async(
+        page_size=page_size,
+        client=client,
+        concurrency=concurrency,
+        rate_limiter=rate_limiter,
+        response_cache=response_cache,
+        hedge=hedge,
+        circuit_breaker=circuit_breaker,
+        checkpoint=checkpoint,
+        compact=True,
+    )
+    assert isinstance(bundle, CompactBundle)
+    return bundle
+
+
+async def _pull_live_async(
+    *,
+    page_size: int,
+    client: AsyncDummyJsonClient | None,
+    concurrency: int,
+    rate_limiter: RateLimiter | None,
+    response_cache: ResponseCache | None,
+    hedge: HedgePolicy | None,
+    circuit_breaker: CircuitBreaker | None,
+    checkpoint: PageCheckpoint | None,
+    compact: bool,
+) -> ExtractBundle | CompactBundle:
+    """Both async live extracts, the three resources' pulls gathered together."""
+    owns_client = client is None
+    live_client = client or AsyncDummyJsonClient(
+        rate_limiter=rate_limiter,
+        response_cache=response_cache,
+        hedge=hedge,
+        circuit_breaker=circuit_breaker,
+        pool_size=3 * concurrency,  # all three resources are in flight together
+    )
+
+    try:
+        fetchers = _live_fetchers_async(live_client, checkpoint)
+        pulled = await asyncio.gather(
+            *(
+                fetch_all_pages_async(
+                    fetch_page=_as_rows_async(resource, fetch_page) if compact else fetch_page,
+                    get_items=_items_of(resource, compact=compact),
+                    get_total=lambda page: page.total,
+                    get_skip=lambda page: page.skip,
+                    get_limit=lambda page: page.limit,
+                    page_size=page_size,
+                    concurrency=concurrency,
+                )
+                for resource, fetch_page in fetchers.items()
+            )
         )
 
-        return ExtractBundle(
-            mode="live",
-            users=tuple(users.items),
-            products=tuple(products.items),
-            carts=tuple(carts.items),
-            totals={
-                "users": users.total,
-                "products": products.total,
-                "carts": carts.total,
-            },
-            pages_fetched={
-                "users": users.pages_fetched,
-                "products": products.pages_fetched,
-                "carts": carts.pages_fetched,
-            },
+        return _live_bundle(
+            dict(zip(fetchers, pulled, strict=True)),
             page_size=page_size,
+            client_stats=live_client.stats(),
+            compact=compact,
         )
     finally:
         if owns_client:
-            # make sure close connect to live
-            live_client.close()
+            await live_client.aclose()
+
+
+def iter_live_pages(
+    resource: LiveResource,
+    *,
+    client: DummyJsonClient,
+    page_size: int = 100,
+    prefetch: int = 1,
+    checkpoint: PageCheckpoint | None = None,
+) -> Iterator[LivePage]:
+    """
+    Yield one live resource's validated pages as they arrive.
+
+    With `prefetch > 0` the next page is already downloading while the caller
+    works on the current one.
+    """
+    pages = iter_pages(
+        fetch_page=_live_fetchers(client, checkpoint)[resource],
+        get_items=lambda page: live_page_items(resource, page),
+        get_total=lambda page: page.total,
+        get_skip=lambda page: page.skip,
+        get_limit=lambda page: page.limit,
+        page_size=page_size,
+    )
+    return iter_prefetched(pages, depth=prefetch)
+
+
+def _live_fetchers(
+    client: DummyJsonClient, checkpoint: PageCheckpoint | None
+) -> dict[LiveResource, Callable[[int, int], LivePage]]:
+    """Each resource's page fetch, in `SNAPSHOT_RESOURCES` order."""
+    return {
+        "users": _checkpointed(checkpoint, "users", client.get_users_page, parse_users_page),
+        "products": _checkpointed(
+            checkpoint, "products", client.get_products_page, parse_products_page
+        ),
+        "carts": _checkpointed(checkpoint, "carts", client.get_carts_page, parse_carts_page),
+    }
+
+
+def _live_fetchers_async(
+    client: AsyncDummyJsonClient, checkpoint: PageCheckpoint | None
+) -> dict[LiveResource, Callable[[int, int], Awaitable[LivePage]]]:
+    """Async twin of `_live_fetchers`."""
+    return {
+        "users": _checkpointed_async(checkpoint, "users", client.get_users_page, parse_users_page),
+        "products": _checkpointed_async(
+            checkpoint, "products", client.get_products_page, parse_products_page
+        ),
+        "carts": _checkpointed_async(checkpoint, "carts", client.get_carts_page, parse_carts_page),
+    }
+
+
+def _as_rows(
+    resource: LiveResource, fetch_page: Callable[[int, int], LivePage]
+) -> Callable[[int, int], RowsPage]:
+    """`fetch_page` with the page's models dumped to rows before it is handed back."""
+    fields = tuple(LIVE_MODELS[resource].model_fields)
+
+    def fetch_rows(limit: int, skip: int) -> RowsPage:
+        page = fetch_page(limit, skip)
+        rows = dump_rows(fields, live_page_items(resource, page))
+        return RowsPage(rows=rows, total=page.total, skip=page.skip, limit=page.limit)
+
+    return fetch_rows
+
+
+def _as_rows_async(
+    resource: LiveResource, fetch_page: Callable[[int, int], Awaitable[LivePage]]
+) -> Callable[[int, int], Awaitable[RowsPage]]:
+    """Async twin of `_as_rows`."""
+    fields = tuple(LIVE_MODELS[resource].model_fields)
+
+    async def fetch_rows(limit: int, skip: int) -> RowsPage:
+        page = await fetch_page(limit, skip)
+        rows = dump_rows(fields, live_page_items(resource, page))
+        return RowsPage(rows=rows, total=page.total, skip=page.skip, limit=page.limit)
+
+    return fetch_rows
+
+
+def _items_of(resource: LiveResource, *, compact: bool) -> Callable[[Any], list[Any]]:
+    """What the paginator collects from each page, rows when `_as_rows` made them."""
+    if compact:
+        return lambda page: page.rows
+    return partial(live_page_items, resource)
+
+
+def _checkpointed(
+    checkpoint: PageCheckpoint | None,
+    resource: LiveResource,
+    fetch_page: Callable[[int, int], PageT],
+    parse: Callable[[Mapping[str, Any]], PageT],
+) -> Callable[[int, int], PageT]:
+    """`fetch_page` as is, or going through the checkpoint when there is one."""
+    return fetch_page if checkpoint is None else checkpoint.wrap(resource, fetch_page, parse)
+
+
+def _checkpointed_async(
+    checkpoint: PageCheckpoint | None,
+    resource: LiveResource,
+    fetch_page: Callable[[int, int], Awaitable[PageT]],
+    parse: Callable[[Mapping[str, Any]], PageT],
+) -> Callable[[int, int], Awaitable[PageT]]:
+    """Async twin of `_checkpointed`."""
+    return fetch_page if checkpoint is None else checkpoint.wrap_async(resource, fetch_page, parse)
+
+
+def live_page_items(resource: LiveResource, page: LivePage) -> list:
+    """The record list of one live page, envelope keys match the resource name."""
+    return getattr(page, resource)
+
+
+def _live_bundle(
+    results: dict[LiveResource, PaginationResult[Any]],
+    *,
+    page_size: int,
+    client_stats: dict[str, Any],
+    autotune: dict[str, Any] | None = None,
+    compact: bool = False,
+) -> ExtractBundle | CompactBundle:
+    """Assemble one live bundle from the three paginated resources."""
+    users, products, carts = (results[resource] for resource in SNAPSHOT_RESOURCES)
+    described: dict[str, Any] = {
+        "mode": "live",
+        "totals": {resource: result.total for resource, result in results.items()},
+        "pages_fetched": {resource: result.pages_fetched for resource, result in results.items()},
+        "page_size": page_size,
+        "client_stats": client_stats,
+        "autotune": autotune or {},
+    }
+    if compact:
+        return CompactBundle(
+            users=_live_columns("users", users),
+            products=_live_columns("products", products),
+            carts=_live_columns("carts", carts),
+            **described,
+        )
+    return ExtractBundle(
+        users=tuple(users.items),
+        products=tuple(products.items),
+        carts=tuple(carts.items),
+        **described,
+    )
+
+
+def _live_columns(resource: LiveResource, result: PaginationResult[Any]) -> ColumnarRecords:
+    """A resource's pulled rows as columns, the row list emptied behind them."""
+    columns = ColumnarRecords.from_rows(LIVE_MODELS[resource], result.items)
+    result.items.clear()
+    return columns
 
 
 # idea for a `scripts/fetch_dummyjson_snapshot.py` later.
-def write_snapshot_bundle(bundle: ExtractBundle, *, snapshot_root: Path) -> dict[str, Path]:
+def write_snapshot_bundle(
+    bundle: ExtractBundle,
+    *,
+    snapshot_root: Path,
+    snapshot_format: SnapshotFormat = "json",
+    shard_size: int = DEFAULT_SHARD_SIZE,
+) -> dict[str, Path]:
     """
     Writes and persists an extract bundle to the standard snapshot layout.
+
+    `snapshot_format="ndjson"` streams each resource into `<name>.ndjson.gz` instead,
+    one record dumped at a time, `"sharded"` into `shard_size`-record parts, and
+    `"chunked"` into content-addressed chunks shared with the source's other snapshots.
     """
     store = SnapshotStore(snapshot_root.resolve())
+    resources: dict[LiveResource, tuple[ExtractModel, ...]] = {
+        "users": bundle.users,
+        "products": bundle.products,
+        "carts": bundle.carts,
+    }
 
     out: dict[str, Path] = {}
-    out["users"] = store.write_json(
-        "users",
-        {
-            "users": [x.model_dump(mode="json") for x in bundle.users],
-            "total": len(bundle.users),
+    for name, records in resources.items():
+        envelope = {
+            "total": len(records),
             "skip": 0,
-            "limit": bundle.page_size or max(len(bundle.users), 1),
-        },
-    )
-    out["products"] = store.write_json(
-        "products",
-        {
-            "products": [x.model_dump(mode="json") for x in bundle.products],
-            "total": len(bundle.products),
-            "skip": 0,
-            "limit": bundle.page_size or max(len(bundle.products), 1),
-        },
-    )
-    out["carts"] = store.write_json(
-        "carts",
-        {
-            "carts": [x.model_dump(mode="json") for x in bundle.carts],
-            "total": len(bundle.carts),
-            "skip": 0,
-            "limit": bundle.page_size or max(len(bundle.carts), 1),
-        },
-    )
+            "limit": bundle.page_size or max(len(records), 1),
+        }
+        # carts get a sidecar index, for window-filtered replays
+        index_key = cart_index_key if name == "carts" else None
+        if snapshot_format == "chunked":
+            out[name] = store.write_chunked(
+                name, (x.model_dump(mode="json") for x in records), envelope=envelope
+            )
+        elif snapshot_format == "sharded":
+            out[name] = store.write_sharded(
+                name,
+                (x.model_dump(mode="json") for x in records),
+                envelope=envelope,
+                shard_size=shard_size,
+                index_key=index_key,
+            )
+        elif snapshot_format == "ndjson":
+            out[name] = store.write_ndjson(
+                name,
+                (x.model_dump(mode="json") for x in records),
+                envelope=envelope,
+                index_key=index_key,
+            )
+        else:
+            out[name] = store.write_json(
+                name, {name: [x.model_dump(mode="json") for x in records], **envelope}
+            )
     return out
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import threading
+from collections.abc import Awaitable, Callable, Mapping
+from pathlib import Path
+from typing import Any, Protocol, TypeVar
+
+from warehouse_pipeline.extract.json_codec import loads
+
+
+class _DumpablePage(Protocol):
+    """Any validated page model, dumped back to its JSON payload to persist it."""
+
+    def model_dump(self, *, mode: str = ...) -> dict[str, Any]: ...
+
+
+PageT = TypeVar("PageT", bound=_DumpablePage)
+
+CHECKPOINT_FILE = "checkpoint.json"
+COMPLETED_LOG = "completed.jsonl"
+
+
+class PageCheckpoint:
+    """
+    Live pages persisted under one run directory as they arrive.
+
+    Layout:
+    - `<root>/pages/<resource>/<skip>-<limit>.json`, one validated page payload each
+    - `<root>/checkpoint.json`, the page size
+    - `<root>/completed.jsonl`, one `{resource, skip, limit}` line appended per saved
+      page, so saving stays O(1) however many pages came before
+
+    A resumed pull asks for the same offsets and gets completed ones from disk
+    instead of the network. Safe to share between threads.
+    """
+
+    def __init__(
+        self, root: Path, *, page_size: int | None = None, resumed_from: str | None = None
+    ) -> None:
+        self._root = root
+        self._page_size = page_size
+        self._resumed_from = resumed_from
+        self._lock = threading.Lock()
+        self._header_written = (root / CHECKPOINT_FILE).is_file()
+
+        # counters
+        self._pages_saved = 0
+        self._pages_reused = 0
+
+        _, self._completed = _read_checkpoint(self._root)
+
+    @classmethod
+    def resume(
+        cls, root: Path, *, from_root: Path, resumed_from: str, page_size: int | None = None
+    ) -> PageCheckpoint:
+        """
+        Seed `root` with every completed page of an earlier run's checkpoint.
+        Pages are keyed by `(skip, limit)`, so a different `page_size` is refused
+        rather than silently refetching everything.
+        """
+        if not (from_root / CHECKPOINT_FILE).is_file():
+            raise FileNotFoundError(f"No extract checkpoint to resume at {from_root}")
+        recorded, _ = _read_checkpoint(from_root)
+        if recorded is not None and page_size is not None and recorded != page_size:
+            raise ValueError(
+                f"Run {resumed_from} was checkpointed with page_size={recorded}, "
+                f"resume it with the same page size instead of {page_size}"
+            )
+        if from_root.resolve() != root.resolve():
+            shutil.copytree(from_root, root, dirs_exist_ok=True)
+        return cls(root, page_size=page_size or recorded, resumed_from=resumed_from)
+
+    @property
+    def root(self) -> Path:
+        """Directory holding pages and the checkpoint file."""
+        return self._root
+
+    def wrap(
+        self,
+        resource: str,
+        fetch_page: Callable[[int, int], PageT],
+        parse: Callable[[Mapping[str, Any]], PageT],
+    ) -> Callable[[int, int], PageT]:
+        """A `fetch_page` that serves completed offsets from disk and saves new ones."""
+
+        def fetch(limit: int, skip: int) -> PageT:
+            """Disk first, then the network."""
+            stored = self.load_page(resource, skip=skip, limit=limit)
+            if stored is not None:
+                return parse(stored)
+            page = fetch_page(limit, skip)
+            self.save_page(resource, skip=skip, limit=limit, payload=page.model_dump(mode="json"))
+            return page
+
+        return fetch
+
+    def wrap_async(
+        self,
+        resource: str,
+        fetch_page: Callable[[int, int], Awaitable[PageT]],
+        parse: Callable[[Mapping[str, Any]], PageT],
+    ) -> Callable[[int, int], Awaitable[PageT]]:
+        """Same as `wrap`, for the async client."""
+
+        async def fetch(limit: int, skip: int) -> PageT:
+            """Disk first, then the network."""
+            stored = self.load_page(resource, skip=skip, limit=limit)
+            if stored is not None:
+                return parse(stored)
+            page = await fetch_page(limit, skip)
+            self.save_page(resource, skip=skip, limit=limit, payload=page.model_dump(mode="json"))
+            return page
+
+        return fetch
+
+    def load_page(self, resource: str, *, skip: int, limit: int) -> dict[str, Any] | None:
+        """A completed page's payload, or `None` if this offset was never finished."""
+        with self._lock:
+            if (skip, limit) not in self._completed.get(resource, set()):
+                return None
+        try:
+            payload = loads(self._page_path(resource, skip, limit).read_bytes())
+        except (OSError, ValueError):
+            return None  # listed but unreadable, fetch it again
+        with self._lock:
+            self._pages_reused += 1
+        return payload
+
+    def save_page(
+        self, resource: str, *, skip: int, limit: int, payload: Mapping[str, Any]
+    ) -> None:
+        """Persist one page, then mark its offset completed."""
+        path = self._page_path(resource, skip, limit)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write_text(path, json.dumps(payload, separators=(",", ":")))
+
+        entry = json.dumps({"resource": resource, "skip": skip, "limit": limit})
+        with self._lock:
+            if not self._header_written:
+                _atomic_write_text(
+                    self._root / CHECKPOINT_FILE,
+                    json.dumps({"page_size": self._page_size}, indent=2, sort_keys=True),
+                )
+                self._header_written = True
+            # under the lock so concurrent writers can't interleave lines
+            with (self._root / COMPLETED_LOG).open("a", encoding="utf-8") as log:
+                log.write(entry + "\n")
+            self._completed.setdefault(resource, set()).add((skip, limit))
+            self._pages_saved += 1
+
+    def discard_pages(self) -> None:
+        """Drop the stored pages once they can't be needed again (the run succeeded)."""
+        shutil.rmtree(self._root / "pages", ignore_errors=True)
+
+    def stats(self) -> dict[str, Any]:
+        """Counters and location for the run manifest."""
+        with self._lock:
+            return {
+                "dir": str(self._root),
+                "resumed_from": self._resumed_from,
+                "page_size": self._page_size,
+                "pages_saved": self._pages_saved,
+                "pages_reused": self._pages_reused,
+                "completed": {r: len(o) for r, o in sorted(self._completed.items())},
+            }
+
+    def _page_path(self, resource: str, skip: int, limit: int) -> Path:
+        """Where one page lives."""
+        return self._root / "pages" / resource / f"{skip}-{limit}.json"
+
+
+def _read_checkpoint(root: Path) -> tuple[int | None, dict[str, set[tuple[int, int]]]]:
+    """Page size and completed offsets already on disk, `(None, {})` for a fresh directory."""
+    try:
+        data = json.loads((root / CHECKPOINT_FILE).read_text("utf-8"))
+    except (OSError, ValueError):
+        return None, {}
+    page_size = data.get("page_size") if isinstance(data, dict) else None
+
+    completed: dict[str, set[tuple[int, int]]] = {}
+    try:
+        lines = (root / COMPLETED_LOG).read_text("utf-8").splitlines()
+    except OSError:
+        lines = []
+    for line in lines:
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue  # a crash mid-append tears the last line, its page gets refetched
+        completed.setdefault(entry["resource"], set()).add(
+            (int(entry["skip"]), int(entry["limit"]))
+        )
+    return page_size, completed
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    """Write via a temp file and rename, a crash never leaves half a file."""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal
+
+from warehouse_pipeline.extract.models import DummyCart, DummyProduct, DummyUser, ExtractModel
+
+if TYPE_CHECKING:
+    from warehouse_pipeline.extract.bundles import ExtractBundle
+
+
+@dataclass(slots=True)
+class ColumnarRecords:
+    """
+    Validated records kept as per-field arrays, one list per top-level model field.
+
+    No per-record object survives, iterating rebuilds each record's `model_dump`
+    dict on the fly (nested values are stored already dumped). `release()` drops
+    the arrays once a mapper has consumed them.
+    """
+
+    fields: tuple[str, ...]
+    columns: tuple[list[Any], ...]
+
+    @classmethod
+    def empty(cls, model: type[ExtractModel]) -> ColumnarRecords:
+        """No records yet, columns for `model`'s fields."""
+        fields = tuple(model.model_fields)
+        return cls(fields=fields, columns=tuple([] for _ in fields))
+
+    @classmethod
+    def from_models(
+        cls, model: type[ExtractModel], records: Iterable[ExtractModel]
+    ) -> ColumnarRecords:
+        """Dump validated models column by column, each model can go once appended."""
+        out = cls.empty(model)
+        out.append_models(records)
+        return out
+
+    @classmethod
+    def from_rows(
+        cls, model: type[ExtractModel], rows: Sequence[tuple[Any, ...]]
+    ) -> ColumnarRecords:
+        """Transpose `dump_rows` output into columns."""
+        out = cls.empty(model)
+        for column, values in zip(out.columns, zip(*rows, strict=True), strict=False):
+            column.extend(values)
+        return out
+
+    @classmethod
+    def concat(cls, model: type[ExtractModel], parts: Iterable[ColumnarRecords]) -> ColumnarRecords:
+        """Parts (e.g. one per shard) joined in order, each part is emptied as it goes."""
+        out = cls.empty(model)
+        for part in parts:
+            for column, values in zip(out.columns, part.columns, strict=True):
+                column.extend(values)
+            part.release()
+        return out
+
+    def append_models(self, records: Iterable[ExtractModel]) -> None:
+        """Dump and append records one at a time, in order."""
+        for record in records:
+            dumped = record.model_dump(mode="python")
+            for name, column in zip(self.fields, self.columns, strict=True):
+                column.append(dumped[name])
+
+    def where(self, keep: Callable[[dict[str, Any]], bool]) -> ColumnarRecords:
+        """The records `keep` accepts, as new columns."""
+        out = ColumnarRecords(fields=self.fields, columns=tuple([] for _ in self.fields))
+        for values in zip(*self.columns, strict=True):
+            if keep(dict(zip(self.fields, values, strict=True))):
+                for column, value in zip(out.columns, values, strict=True):
+                    column.append(value)
+        return out
+
+    def __len__(self) -> int:
+        return len(self.columns[0]) if self.columns else 0
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Each record in its `model_dump` shape, in extraction order."""
+        fields = self.fields
+        for values in zip(*self.columns, strict=True):
+            yield dict(zip(fields, values, strict=True))
+
+    def release(self) -> None:
+        """Empty every column so the values can be garbage collected."""
+        for column in self.columns:
+            column.clear()
+
+
+@dataclass(frozen=True, slots=True)
+class RowsPage:
+    """
+    One live page with its records already dumped into row tuples, so the page's
+    models are gone before the paginator holds on to it.
+    """
+
+    rows: list[tuple[Any, ...]]
+    total: int
+    skip: int
+    limit: int
+
+
+def dump_rows(fields: tuple[str, ...], records: Iterable[ExtractModel]) -> list[tuple[Any, ...]]:
+    """Each record's `model_dump` values in `fields` order."""
+    rows = []
+    for record in records:
+        dumped = record.model_dump(mode="python")
+        rows.append(tuple(dumped[name] for name in fields))
+    return rows
+
+
+@dataclass(frozen=True)
+class CompactBundle:
+    """
+    `ExtractBundle` with its records in columnar form, fed to the `map_*_payloads` mappers.
+
+    Carts already held as decoded JSON for the fused mapper stay in `raw_carts`.
+    """
+
+    mode: Literal["snapshot", "live"]
+    users: ColumnarRecords
+    products: ColumnarRecords
+    carts: ColumnarRecords
+    raw_carts: tuple[dict[str, Any], ...] = ()
+    snapshot_key: str | None = None
+    source_paths: dict[str, str] = field(default_factory=dict)
+    totals: dict[str, int] = field(default_factory=dict)
+    pages_fetched: dict[str, int] = field(default_factory=dict)
+    page_size: int | None = None
+    client_stats: dict[str, Any] = field(default_factory=dict)
+    autotune: dict[str, Any] = field(default_factory=dict)
+    snapshot_cache: dict[str, Any] = field(default_factory=dict)
+    window_read: dict[str, Any] = field(default_factory=dict)
+
+    def release(self) -> None:
+        """Drop every record, mapping is done with them."""
+        self.users.release()
+        self.products.release()
+        self.carts.release()
+
+
+def compact_bundle(bundle: ExtractBundle) -> CompactBundle:
+    """
+    Convert an already built bundle's models to columns, the caller drops `bundle`
+    afterwards. `read_compact_snapshot_bundle` and `fetch_live_compact_bundle` build
+    one directly, page by page, without ever holding every model.
+    """
+    return CompactBundle(
+        mode=bundle.mode,
+        users=ColumnarRecords.from_models(DummyUser, bundle.users),
+        products=ColumnarRecords.from_models(DummyProduct, bundle.products),
+        carts=ColumnarRecords.from_models(DummyCart, bundle.carts),
+        raw_carts=bundle.raw_carts,
+        snapshot_key=bundle.snapshot_key,
+        source_paths=dict(bundle.source_paths),
+        totals=dict(bundle.totals),
+        pages_fetched=dict(bundle.pages_fetched),
+        page_size=bundle.page_size,
+        client_stats=dict(bundle.client_stats),
+        autotune=dict(bundle.autotune),
+        snapshot_cache=dict(bundle.snapshot_cache),
+        window_read=dict(bundle.window_read),
+    )
@@ -1,35 +1,271 @@
 from __future__ import annotations
 
+import asyncio
 import random
+import threading
 import time
-from collections.abc import Callable, Mapping
-from typing import Any
+from collections.abc import Awaitable, Callable, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, TypeVar
 
 import httpx
+from pydantic import ValidationError
 
+from warehouse_pipeline.extract.http_cache import CachedResponse, ResponseCache
 from warehouse_pipeline.extract.models import (
+    SELECT_FIELDS,
     CartsPage,
+    PageEnvelope,
     ProductsPage,
     UsersPage,
     parse_carts_page,
     parse_products_page,
     parse_users_page,
 )
+from warehouse_pipeline.extract.rate_limiter import RateLimiter, TokenBucketRateLimiter
+from warehouse_pipeline.extract.resilience import CircuitBreaker, HedgePolicy
+from warehouse_pipeline.extract.transport import (
+    TransportCounters,
+    accept_encoding,
+    async_transport,
+    shared_transport,
+)
+
+PageT = TypeVar("PageT", bound=PageEnvelope)
 
 RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
 ## -- only continue to attempt to retrive on these!
 
+DEFAULT_HEADERS = {
+    "Accept": "application/json",
+    "User-Agent": "warehouse-pipeline/0.4.0",
+}
+
 
 class DummyJsonClientError(RuntimeError):
     """Raised if live `DummyJSON` extraction fails."""
 
 
-class DummyJsonClient:
+class CircuitOpenError(DummyJsonClientError):
+    """Raised instead of sending a request while the circuit breaker is open."""
+
+
+class _DummyJsonRetryPolicy:
+    """
+    Retry, backoff and payload rules shared by the sync and async `DummyJSON` clients.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int,
+        initial_backoff_s: float,
+        max_backoff_s: float,
+        min_interval_s: float,
+        rate_limiter: RateLimiter | None,
+        default_limiter: Callable[[], RateLimiter],
+        response_cache: ResponseCache | None = None,
+        select_fields: bool = True,
+        hedge: HedgePolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+    ) -> None:
+        # sanity
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be >= 1")
+        if min_interval_s < 0:
+            raise ValueError("min_interval_s must be >= 0")
+
+        self._max_attempts = max_attempts
+        self._initial_backoff_s = initial_backoff_s
+        self._max_backoff_s = max_backoff_s
+        # a shared limiter wins, otherwise pace this client alone by `min_interval_s`
+        self._limiter = rate_limiter if rate_limiter is not None else default_limiter()
+        self._cache = response_cache
+        self._select = SELECT_FIELDS if select_fields else {}
+        self._hedge = hedge
+        self._breaker = circuit_breaker
+        self._transport: TransportCounters | None = None  # set when the client built its own
+
+        # counters, bumped from fan-out threads and hedge workers alike
+        self._counter_lock = threading.Lock()
+        self._requests = 0
+        self._bytes_received = 0
+        self._retries = 0
+        self._retry_wait_s = 0.0
+        self._retry_statuses: dict[str, int] = {}
+
+    def stats(self) -> dict[str, Any]:
+        """Request, retry, throttle and cache counters for the run manifest."""
+        stats: dict[str, Any] = {
+            "requests": self._requests,
+            "bytes_received": self._bytes_received,
+            "retries": self._retries,
+            "retry_wait_s": round(self._retry_wait_s, 6),
+            "retry_statuses": dict(self._retry_statuses),
+            "rate_limiter": self._limiter.stats(),
+        }
+        if self._cache is not None:
+            stats["http_cache"] = self._cache.stats()
+        if self._hedge is not None:
+            stats["hedge"] = self._hedge.stats()
+        if self._breaker is not None:
+            stats["circuit_breaker"] = self._breaker.stats()
+        if self._transport is not None:
+            stats["transport"] = self._transport.stats()
+        return stats
+
+    def transfer_counters(self) -> tuple[int, int]:
+        """Cumulative `(bytes_received, retries)`, cheap enough to poll per page wave."""
+        return self._bytes_received, self._retries
+
+    def _page_params(self, resource: str, limit: int, skip: int) -> dict[str, Any]:
+        """`limit`/`skip`, plus a `select=` projection when the resource has one."""
+        params: dict[str, Any] = {"limit": limit, "skip": skip}
+        fields = self._select.get(resource)
+        if fields:
+            params["select"] = ",".join(fields)
+        return params
+
+    def _cached_entry(
+        self, path: str, params: Mapping[str, Any] | None
+    ) -> tuple[CachedResponse | None, dict[str, str]]:
+        """Stored response for this request if any, and the headers to revalidate it."""
+        if self._cache is None:
+            return None, {}
+        cached = self._cache.lookup(path, params)
+        return cached, cached.conditional_headers() if cached is not None else {}
+
+    def _cached_page(
+        self, path: str, cached: CachedResponse, parse: Callable[[bytes], PageT]
+    ) -> PageT:
+        """Serve a `304 Not Modified` from the response cache."""
+        assert self._cache is not None
+        return self._page_or_raise(path, self._cache.note_hit(cached), parse, what="cached body")
+
+    def _store_response(
+        self, path: str, params: Mapping[str, Any] | None, response: httpx.Response
+    ) -> None:
+        """Keep a fresh `200` for conditional requests on later runs."""
+        if self._cache is not None:
+            self._cache.store(path, params, response)
+
+    def _breaker_gate(self, path: str) -> None:
+        """Fail fast while the breaker is open."""
+        if self._breaker is not None and not self._breaker.allow_request():
+            raise CircuitOpenError(f"GET {path} refused: circuit breaker is open")
+
+    def _note_outcome(self, status_code: int | None) -> None:
+        """Feed one attempt to the breaker, `None` for a transport error."""
+        if self._breaker is None:
+            return
+        if status_code == 429:
+            self._breaker.release_probe()  # throttling is the rate limiter's business
+            return
+        if status_code is None or status_code in RETRYABLE_STATUS_CODES:
+            self._breaker.record_failure()
+        else:
+            self._breaker.record_success()
+
+    def _release_probe(self) -> None:
+        """An attempt raised before the breaker heard how it went."""
+        if self._breaker is not None:
+            self._breaker.release_probe()
+
+    def _note_request(self) -> None:
+        """Count one request sent, duplicates included."""
+        with self._counter_lock:
+            self._requests += 1
+
+    def _note_received(self, response: httpx.Response) -> None:
+        """Count the body bytes of one response."""
+        with self._counter_lock:
+            self._bytes_received += len(response.content)
+
+    def _note_retry(self, reason: str, delay_s: float) -> None:
+        """Count one retry and the backoff it is about to sleep."""
+        with self._counter_lock:
+            self._retries += 1
+            self._retry_wait_s += delay_s
+            self._retry_statuses[reason] = self._retry_statuses.get(reason, 0) + 1
+
+    def _note_throttle(self, response: httpx.Response) -> None:
+        """Tell the shared limiter about a `429` so every client slows down."""
+        if response.status_code != 429:
+            return
+        retry_after = response.headers.get("Retry-After")
+        try:
+            retry_after_s = float(retry_after) if retry_after is not None else None
+        except ValueError:
+            retry_after_s = None
+        self._limiter.on_throttle(retry_after_s=retry_after_s)
+
+    def _page_or_raise(
+        self,
+        path: str,
+        body: bytes,
+        parse: Callable[[bytes], PageT],
+        *,
+        what: str = "response",
+    ) -> PageT:
+        """
+        Validate a page straight from its raw bytes, no intermediate dict.
+        Bodies that aren't a JSON object are a client error, bad fields stay a `ValidationError`.
+        """
+        try:
+            return parse(body)
+        except ValidationError as exc:
+            # whole-payload errors carry an empty `loc`
+            kinds = {error["type"] for error in exc.errors() if not error["loc"]}
+            if "json_invalid" in kinds:
+                raise DummyJsonClientError(f"GET {path} {what} is non-JSON content") from exc
+            if "model_type" in kinds:
+                raise DummyJsonClientError(
+                    f"GET {path} {what} is JSON, but not an object payload"
+                ) from exc
+            raise
+
+    def _retry_delay_s(self, response: httpx.Response, attempt: int) -> float:
+        """If `Retry-After` encountered, respect it."""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return max(float(retry_after), 0.0)
+            except ValueError:
+                # ignore malformed `Retry-After` and simply continue
+                pass
+
+        return self._compute_backoff_s(attempt)
+
+    def _compute_backoff_s(self, attempt: int) -> float:
+        """
+        Exponential backoff with light jitter timing.
+
+        Attempt 1: ~0.5s,
+        Attempt 2: ~1.0s,
+        Attempt 3: ~2.0s,
+        ...
+        """
+        base = min(
+            self._initial_backoff_s * (2 ** (attempt - 1)),
+            self._max_backoff_s,
+        )
+        jitter = random.uniform(0.0, base * 0.25)
+        return base + jitter  # always add
+
+
+class DummyJsonClient(_DummyJsonRetryPolicy):
     """
     HTTP client for `DummyJSON`.
 
     One persistent HTTP session with a timeout on every request.
     - retries only retryable failures and honors `Retry-After` msg for `429s`.
+    - paces request starts through a `RateLimiter`, which may be shared with other clients.
+    - with a `ResponseCache`, revalidates stored pages and serves `304s` from disk.
+    - asks only for the fields the extract models read (`select=`), unless `select_fields=False`.
+    - with a `HedgePolicy`, races a duplicate `GET` against requests in the latency tail.
+    - with a `CircuitBreaker`, stops sending once upstream keeps failing.
+    - its own session rides the process-wide connection pool for `pool_size`
+      (HTTP/2 and brotli/zstd when installed), so connections outlive the client.
     """
 
     def __init__(
@@ -41,34 +277,53 @@ class DummyJsonClient:
         initial_backoff_s: float = 0.5,
         max_backoff_s: float = 8.0,
         min_interval_s: float = 0.25,
+        rate_limiter: RateLimiter | None = None,
+        response_cache: ResponseCache | None = None,
+        select_fields: bool = True,
+        hedge: HedgePolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        pool_size: int = 1,
         client: httpx.Client | None = None,
         sleeper: Callable[[float], None] = time.sleep,
         clock: Callable[[], float] = time.monotonic,
     ) -> None:
-        # sanity
-        if max_attempts < 1:
-            raise ValueError("max_attempts must be >= 1")
-        if min_interval_s < 0:
-            raise ValueError("min_interval_s must be >= 0")
-
-        self._max_attempts = max_attempts
-        self._initial_backoff_s = initial_backoff_s
-        self._max_backoff_s = max_backoff_s
-        self._min_interval_s = min_interval_s
+        super().__init__(
+            max_attempts=max_attempts,
+            initial_backoff_s=initial_backoff_s,
+            max_backoff_s=max_backoff_s,
+            min_interval_s=min_interval_s,
+            rate_limiter=rate_limiter,
+            response_cache=response_cache,
+            select_fields=select_fields,
+            hedge=hedge,
+            circuit_breaker=circuit_breaker,
+            default_limiter=lambda: TokenBucketRateLimiter.from_min_interval(
+                min_interval_s, clock=clock, sleeper=sleeper
+            ),
+        )
         self._sleep = sleeper
-        self._clock = clock
-        self._next_allowed_at = 0.0
+        # hedged requests run here so the caller can wait on the first to answer
+        self._hedge_pool = (
+            # a primary and its duplicate for every request `pool_size` keeps in flight
+            ThreadPoolExecutor(
+                max_workers=2 * max(pool_size, 1), thread_name_prefix="dummyjson-hedge"
+            )
+            if hedge is not None
+            else None
+        )
 
         self._owns_client = client is None
         # optionally accept other custom client
-        self._client = client or httpx.Client(  # default: `httpx.Client` pre-initalized here.
-            base_url=base_url.rstrip("/"),
-            timeout=timeout_s,
-            headers={
-                "Accept": "application/json",
-                "User-Agent": "warehouse-pipeline/0.3.0",
-            },
-        )
+        if client is None:  # default: `httpx.Client` on the shared pool, pre-initalized here.
+            transport = shared_transport(pool_size=pool_size)
+            self._transport = transport.counters
+            client = httpx.Client(
+                base_url=base_url.rstrip("/"),
+                timeout=timeout_s,
+                headers={**DEFAULT_HEADERS, "Accept-Encoding": accept_encoding()},
+                transport=transport,
+            )
+        self._client = client
 
     def __enter__(self) -> DummyJsonClient:
         """Enter session."""
@@ -80,57 +335,73 @@ class DummyJsonClient:
 
     def close(self) -> None:
         """Close the client."""
+        if self._hedge_pool is not None:
+            self._hedge_pool.shutdown(wait=False, cancel_futures=True)
         if self._owns_client:
             self._client.close()
 
     def get_users_page(self, limit: int, skip: int) -> UsersPage:
         """Request json from `DummyJSON`'s `/users` page. Return parsed `UsersPage`."""
-        payload = self._request_json("/users", params={"limit": limit, "skip": skip})
-        return parse_users_page(payload)
+        params = self._page_params("users", limit, skip)
+        return self._request_page("/users", params=params, parse=parse_users_page)
 
     def get_products_page(self, limit: int, skip: int) -> ProductsPage:
         """Request json from `DummyJSON`'s `/products` page. Return parsed `ProductsPage`."""
-        payload = self._request_json("/products", params={"limit": limit, "skip": skip})
-        return parse_products_page(payload)
+        params = self._page_params("products", limit, skip)
+        return self._request_page("/products", params=params, parse=parse_products_page)
 
     def get_carts_page(self, limit: int, skip: int) -> CartsPage:
         """Request json from `DummyJSON`'s `/carts` page. Return parsed `CartsPage`."""
-        payload = self._request_json("/carts", params={"limit": limit, "skip": skip})
-        return parse_carts_page(payload)
+        params = self._page_params("carts", limit, skip)
+        return self._request_page("/carts", params=params, parse=parse_carts_page)
 
-    def _request_json(
+    def _request_page(
         self,
         path: str,
         *,
         params: Mapping[str, Any] | None = None,  # limit, skip
-    ) -> dict[str, Any]:
-        """Request to fetch json from `DummyJSON`."""
+        parse: Callable[[bytes], PageT],
+    ) -> PageT:
+        """Request to fetch one page from `DummyJSON`, validated from the raw body."""
 
         last_error: Exception | None = None
+        cached, cache_headers = self._cached_entry(path, params)
 
         for attempt in range(1, self._max_attempts + 1):  # always attempt once.
-            self._wait_for_turn()  # wait
-
+            self._breaker_gate(path)
             try:
-                response = self._client.get(path, params=params)
+                self._limiter.acquire()  # wait for a token
+                self._note_request()
+                response = self._send(path, params, cache_headers)
             except httpx.RequestError as exc:
+                self._note_outcome(None)
                 last_error = exc
                 if attempt == self._max_attempts:
                     raise DummyJsonClientError(
                         f"GET {path} failed after {attempt} attempts: {exc}"
                     ) from exc
 
-                self._sleep(self._compute_backoff_s(attempt))
+                delay_s = self._compute_backoff_s(attempt)
+                self._note_retry(type(exc).__name__, delay_s)
+                self._sleep(delay_s)
                 continue
+            except BaseException:
+                self._release_probe()  # a half-open breaker would wait on it forever
+                raise
 
+            self._note_received(response)
+            self._note_outcome(response.status_code)
             if response.status_code in RETRYABLE_STATUS_CODES:
+                self._note_throttle(response)
                 if attempt == self._max_attempts:
                     raise DummyJsonClientError(
                         f"GET {path} failed after {attempt} attempts "
                         f"with status={response.status_code} body={response.text[:200]!r}"
                     )
 
-                self._sleep(self._retry_delay_s(response, attempt))
+                delay_s = self._retry_delay_s(response, attempt)
+                self._note_retry(str(response.status_code), delay_s)
+                self._sleep(delay_s)
                 continue
 
             if response.status_code >= 400:
@@ -140,56 +411,260 @@ class DummyJsonClient:
                     # and we backoff
                 )
 
-            # must have fetched valid json
-            try:
-                payload = response.json()
-            except ValueError as exc:
-                raise DummyJsonClientError(f"GET {path} returned non-JSON content") from exc
-
-            if not isinstance(payload, dict):
-                raise DummyJsonClientError(f"GET {path} returned JSON, but not an object payload")
-
-            return payload
+            self._limiter.on_success()
+            if response.status_code == 304 and cached is not None:
+                return self._cached_page(path, cached, parse)
+            page = self._page_or_raise(path, response.content, parse)
+            self._store_response(path, params, response)  # only bodies that validated
+            return page
 
         # the request loop should never deplete before a return or raise.
         raise DummyJsonClientError("request loop exhausted unexpectedly") from last_error
 
-    def _wait_for_turn(self) -> None:
-        """
-        Ensures minimum gap between request starts.
-        """
-        now = self._clock()
-        if now < self._next_allowed_at:
-            self._sleep(self._next_allowed_at - now)
-            now = self._clock()
+    def _send(
+        self, path: str, params: Mapping[str, Any] | None, headers: Mapping[str, str]
+    ) -> httpx.Response:
+        """One `GET`, raced against a duplicate once it runs into the latency tail."""
+        delay_s = self._hedge.delay_s() if self._hedge is not None else None
+        if delay_s is None or self._hedge_pool is None:
+            return self._timed_get(path, params, headers)
+
+        primary = self._hedge_pool.submit(self._timed_get, path, params, headers)
+        done, _ = wait([primary], timeout=delay_s)
+        if done:
+            return primary.result()
+
+        assert self._hedge is not None
+        # the duplicate spends request budget too, but never waits for it: by the
+        # time a token came free the primary may have answered
+        if primary.done() or not self._limiter.try_acquire():
+            if not primary.done():
+                self._hedge.note_skipped()
+            return primary.result()
+        self._note_request()
+        self._hedge.note_fired()
+        backup = self._hedge_pool.submit(self._timed_get, path, params, headers)
+        return self._first_response(primary, backup)
+
+    def _first_response(
+        self, primary: Future[httpx.Response], backup: Future[httpx.Response]
+    ) -> httpx.Response:
+        """Whichever request answers first, the loser finishes in the background."""
+        pending: set[Future[httpx.Response]] = {primary, backup}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is backup and self._hedge is not None:
+                        self._hedge.note_won()
+                    return future.result()
+        return primary.result()  # both failed, raise the original error
+
+    def _timed_get(
+        self, path: str, params: Mapping[str, Any] | None, headers: Mapping[str, str]
+    ) -> httpx.Response:
+        """Plain `GET`, its latency feeds the hedge delay."""
+        started = time.perf_counter()
+        response = self._client.get(path, params=params, headers=headers)
+        if self._hedge is not None:
+            self._hedge.observe(time.perf_counter() - started)
+        return response
+
+
+class AsyncDummyJsonClient(_DummyJsonRetryPolicy):
+    """
+    Asyncio `DummyJSON` client on one `httpx.AsyncClient`.
 
-        self._next_allowed_at = now + self._min_interval_s
-        # `_request_json` itself will wait.
+    Same retry rules as `DummyJsonClient`. Every coroutine using one instance shares
+    its rate limiter, so resources fetched at the same time share one rate limit.
+    Its connection pool is its own, async connections can't outlive their event loop.
+    """
 
-    def _retry_delay_s(self, response: httpx.Response, attempt: int) -> float:
-        """If `Retry-After` encountered, respect it."""
-        retry_after = response.headers.get("Retry-After")
-        if retry_after is not None:
+    def __init__(
+        self,
+        *,
+        base_url: str = "https://dummyjson.com",
+        timeout_s: float = 10.0,
+        max_attempts: int = 4,
+        initial_backoff_s: float = 0.5,
+        max_backoff_s: float = 8.0,
+        min_interval_s: float = 0.25,
+        rate_limiter: RateLimiter | None = None,
+        response_cache: ResponseCache | None = None,
+        select_fields: bool = True,
+        hedge: HedgePolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        pool_size: int = 1,
+        client: httpx.AsyncClient | None = None,
+        sleeper: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(
+            max_attempts=max_attempts,
+            initial_backoff_s=initial_backoff_s,
+            max_backoff_s=max_backoff_s,
+            min_interval_s=min_interval_s,
+            rate_limiter=rate_limiter,
+            response_cache=response_cache,
+            select_fields=select_fields,
+            hedge=hedge,
+            circuit_breaker=circuit_breaker,
+            default_limiter=lambda: TokenBucketRateLimiter.from_min_interval(
+                min_interval_s, clock=clock, async_sleeper=sleeper
+            ),
+        )
+        self._sleep = sleeper
+
+        self._owns_client = client is None
+        if client is None:
+            transport = async_transport(pool_size=pool_size)
+            self._transport = transport.counters
+            client = httpx.AsyncClient(
+                base_url=base_url.rstrip("/"),
+                timeout=timeout_s,
+                headers={**DEFAULT_HEADERS, "Accept-Encoding": accept_encoding()},
+                transport=transport,
+            )
+        self._client = client
+
+    async def __aenter__(self) -> AsyncDummyJsonClient:
+        """Enter session."""
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Close session."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the client."""
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def get_users_page(self, limit: int, skip: int) -> UsersPage:
+        """Request json from `DummyJSON`'s `/users` page. Return parsed `UsersPage`."""
+        params = self._page_params("users", limit, skip)
+        return await self._request_page("/users", params=params, parse=parse_users_page)
+
+    async def get_products_page(self, limit: int, skip: int) -> ProductsPage:
+        """Request json from `DummyJSON`'s `/products` page. Return parsed `ProductsPage`."""
+        params = self._page_params("products", limit, skip)
+        return await self._request_page("/products", params=params, parse=parse_products_page)
+
+    async def get_carts_page(self, limit: int, skip: int) -> CartsPage:
+        """Request json from `DummyJSON`'s `/carts` page. Return parsed `CartsPage`."""
+        params = self._page_params("carts", limit, skip)
+        return await self._request_page("/carts", params=params, parse=parse_carts_page)
+
+    async def _request_page(
+        self,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        parse: Callable[[bytes], PageT],
+    ) -> PageT:
+        """Request to fetch one page from `DummyJSON`, awaiting instead of blocking."""
+
+        last_error: Exception | None = None
+        cached, cache_headers = self._cached_entry(path, params)
+
+        for attempt in range(1, self._max_attempts + 1):
+            self._breaker_gate(path)
             try:
-                return max(float(retry_after), 0.0)
-            except ValueError:
-                # ignore malformed `Retry-After` and simply continue
-                pass
+                await self._limiter.acquire_async()
+                self._note_request()
+                response = await self._send(path, params, cache_headers)
+            except httpx.RequestError as exc:
+                self._note_outcome(None)
+                last_error = exc
+                if attempt == self._max_attempts:
+                    raise DummyJsonClientError(
+                        f"GET {path} failed after {attempt} attempts: {exc}"
+                    ) from exc
 
-        return self._compute_backoff_s(attempt)
+                delay_s = self._compute_backoff_s(attempt)
+                self._note_retry(type(exc).__name__, delay_s)
+                await self._sleep(delay_s)
+                continue
+            except BaseException:
+                self._release_probe()  # a half-open breaker would wait on it forever
+                raise
 
-    def _compute_backoff_s(self, attempt: int) -> float:
-        """
-        Exponential backoff with light jitter timing.
+            self._note_received(response)
+            self._note_outcome(response.status_code)
+            if response.status_code in RETRYABLE_STATUS_CODES:
+                self._note_throttle(response)
+                if attempt == self._max_attempts:
+                    raise DummyJsonClientError(
+                        f"GET {path} failed after {attempt} attempts "
+                        f"with status={response.status_code} body={response.text[:200]!r}"
+                    )
 
-        Attempt 1: ~0.5s,
-        Attempt 2: ~1.0s,
-        Attempt 3: ~2.0s,
-        ...
-        """
-        base = min(
-            self._initial_backoff_s * (2 ** (attempt - 1)),
-            self._max_backoff_s,
-        )
-        jitter = random.uniform(0.0, base * 0.25)
-        return base + jitter  # always add
+                delay_s = self._retry_delay_s(response, attempt)
+                self._note_retry(str(response.status_code), delay_s)
+                await self._sleep(delay_s)
+                continue
+
+            if response.status_code >= 400:
+                raise DummyJsonClientError(
+                    f"GET {path} failed permanently with "
+                    f"status={response.status_code} body={response.text[:200]!r}"
+                )
+
+            self._limiter.on_success()
+            if response.status_code == 304 and cached is not None:
+                return self._cached_page(path, cached, parse)
+            page = self._page_or_raise(path, response.content, parse)
+            self._store_response(path, params, response)  # only bodies that validated
+            return page
+
+        raise DummyJsonClientError("request loop exhausted unexpectedly") from last_error
+
+    async def _send(
+        self, path: str, params: Mapping[str, Any] | None, headers: Mapping[str, str]
+    ) -> httpx.Response:
+        """One `GET`, raced against a duplicate once it runs into the latency tail."""
+        delay_s = self._hedge.delay_s() if self._hedge is not None else None
+        if delay_s is None:
+            return await self._timed_get(path, params, headers)
+
+        primary = asyncio.ensure_future(self._timed_get(path, params, headers))
+        done, _ = await asyncio.wait({primary}, timeout=delay_s)
+        if done:
+            return primary.result()
+
+        assert self._hedge is not None
+        backup: asyncio.Future[httpx.Response] | None = None
+        try:
+            # same as the sync client, no waiting on the limiter for a duplicate
+            if primary.done() or not self._limiter.try_acquire():
+                if not primary.done():
+                    self._hedge.note_skipped()
+                return await primary
+            self._note_request()
+            self._hedge.note_fired()
+            backup = asyncio.ensure_future(self._timed_get(path, params, headers))
+
+            pending: set[asyncio.Future[httpx.Response]] = {primary, backup}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is backup:
+                            self._hedge.note_won()
+                        return task.result()
+            return primary.result()  # both failed, raise the original error
+        finally:
+            # unlike threads, the slower request can actually be cancelled
+            for task in (primary, backup):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    async def _timed_get(
+        self, path: str, params: Mapping[str, Any] | None, headers: Mapping[str, str]
+    ) -> httpx.Response:
+        """Plain `GET`, its latency feeds the hedge delay."""
+        started = time.perf_counter()
+        response = await self._client.get(path, params=params, headers=headers)
+        if self._hedge is not None:
+            self._hedge.observe(time.perf_counter() - started)
+        return response
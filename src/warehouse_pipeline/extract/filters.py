@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import replace
 from datetime import datetime
 from typing import TypeVar
 
 from warehouse_pipeline.extract.bundles import ExtractBundle
+from warehouse_pipeline.extract.compact import ColumnarRecords, CompactBundle
 from warehouse_pipeline.orchestration.extraction_window import ExtractionWindow
 
 T = TypeVar("T")
@@ -22,14 +24,15 @@ def _filter_items(
 
 
 def filter_bundle_to_window(
-    bundle: ExtractBundle,
+    bundle: ExtractBundle | CompactBundle,
     *,
     window: ExtractionWindow,
     cart_ts_func: Callable | None = None,
-) -> tuple[ExtractBundle, int]:
+) -> tuple[ExtractBundle | CompactBundle, int]:
     """
     Return a new bundle containing only `orders/order_items`
-    inside the extraction window.
+    inside the extraction window. A compact bundle's carts reach
+    `cart_ts_func` as their dumped dicts.
 
     Returns `(filtered_bundle, total_source_rows)`.
     """
@@ -39,28 +42,30 @@ def filter_bundle_to_window(
 
     total_source_carts = len(bundle.carts)
 
-    filtered_carts = _filter_items(
-        bundle.carts,
-        get_ts=cart_ts_func,
-        low=window.low,
-        high=window.high,
-    )
+    filtered_carts: tuple | ColumnarRecords
+    if isinstance(bundle.carts, ColumnarRecords):
+        low, high = window.low, window.high
+        filtered_carts = bundle.carts.where(
+            lambda cart: (ts := cart_ts_func(cart)) is not None and low <= ts < high
+        )
+    else:
+        filtered_carts = _filter_items(
+            bundle.carts,
+            get_ts=cart_ts_func,
+            low=window.low,
+            high=window.high,
+        )
 
     return (
-        ExtractBundle(
-            mode=bundle.mode,
-            users=bundle.users,
-            products=bundle.products,
+        # `replace` carries every other bundle field over untouched.
+        replace(
+            bundle,
             carts=filtered_carts,
-            snapshot_key=bundle.snapshot_key,
-            source_paths=bundle.source_paths,
             totals={
                 **bundle.totals,
                 "carts_pre_filter": total_source_carts,
                 "carts": len(filtered_carts),
             },
-            pages_fetched=bundle.pages_fetched,
-            page_size=bundle.page_size,
         ),
         total_source_carts,
     )
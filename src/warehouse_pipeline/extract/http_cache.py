@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+DEFAULT_HTTP_CACHE_TTL_S = 24 * 60 * 60
+DEFAULT_HTTP_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """One stored response body plus the validators to revalidate it with."""
+
+    key: str
+    body: bytes
+    etag: str | None
+    last_modified: str | None
+    stored_at: float
+
+    def conditional_headers(self) -> dict[str, str]:
+        """`If-None-Match` / `If-Modified-Since` for a revalidating request."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    On-disk cache of `GET` response bodies, keyed by path and params.
+
+    Entries are always revalidated with a conditional request, a `304` is
+    served from disk. Entries older than `ttl_s` are dropped instead of revalidated,
+    and the least recently used are evicted once the cache grows past `max_bytes`.
+    Only responses carrying an `ETag` or `Last-Modified` are stored.
+
+    Safe to share between threads and between the clients of one pull.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        ttl_s: float = DEFAULT_HTTP_CACHE_TTL_S,
+        max_bytes: int = DEFAULT_HTTP_CACHE_MAX_BYTES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        # sanity
+        if ttl_s <= 0:
+            raise ValueError("ttl_s must be > 0")
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be >= 0")
+
+        self._root = root
+        self._ttl_s = ttl_s
+        self._max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        # counters
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._bytes_saved = 0
+        self._expired = 0
+        self._evicted = 0
+
+    @property
+    def root(self) -> Path:
+        """Directory holding the cache entries."""
+        return self._root
+
+    def key_for(self, path: str, params: Mapping[str, Any] | None = None) -> str:
+        """Stable key for one request, param order does not matter."""
+        canonical = json.dumps(
+            {"path": path, "params": {k: str(v) for k, v in (params or {}).items()}},
+            sort_keys=True,
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def lookup(self, path: str, params: Mapping[str, Any] | None = None) -> CachedResponse | None:
+        """Return a usable entry, or `None` when missing or expired (expired ones are removed)."""
+        key = self.key_for(path, params)
+        meta_path, body_path = self._paths(key)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+
+        stored_at = float(meta.get("stored_at", 0.0))
+        if self._clock() - stored_at > self._ttl_s:
+            with self._lock:
+                self._expired += 1
+            self._remove(key)
+            return None
+
+        return CachedResponse(
+            key=key,
+            body=body,
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+            stored_at=stored_at,
+        )
+
+    def note_hit(self, entry: CachedResponse) -> bytes:
+        """Count a `304` served from disk and mark the entry recently used. Returns its body."""
+        with self._lock:
+            self._hits += 1
+            self._bytes_saved += len(entry.body)
+        meta_path, body_path = self._paths(entry.key)
+        for p in (meta_path, body_path):
+            try:
+                os.utime(p)
+            except OSError:
+                pass
+        return entry.body
+
+    def store(
+        self,
+        path: str,
+        params: Mapping[str, Any] | None,
+        response: httpx.Response,
+    ) -> None:
+        """Count a miss and keep the body if the response can be revalidated later."""
+        with self._lock:
+            self._misses += 1
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        body = response.content
+        if len(body) > self._max_bytes:
+            return
+
+        key = self.key_for(path, params)
+        meta = {
+            "path": path,
+            "params": {k: str(v) for k, v in (params or {}).items()},
+            "etag": etag,
+            "last_modified": last_modified,
+            "stored_at": self._clock(),
+            "size_bytes": len(body),
+        }
+        meta_path, body_path = self._paths(key)
+        self._root.mkdir(parents=True, exist_ok=True)
+        # body first, the meta file is what marks an entry as present
+        _atomic_write(body_path, body)
+        _atomic_write(meta_path, json.dumps(meta, sort_keys=True).encode("utf-8"))
+
+        with self._lock:
+            self._stores += 1
+        self._evict_to_size(keep=key)
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for the run manifest."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "stores": self._stores,
+                "bytes_saved": self._bytes_saved,
+                "expired": self._expired,
+                "evicted": self._evicted,
+            }
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        """Meta and body file for one key."""
+        return self._root / f"{key}.json", self._root / f"{key}.body"
+
+    def _remove(self, key: str) -> None:
+        """Drop both files of an entry, quietly."""
+        for p in self._paths(key):
+            try:
+                p.unlink()
+            except OSError:
+                pass
+
+    def _evict_to_size(self, *, keep: str) -> None:
+        """Drop least recently used entries (never `keep`) until the cache fits in `max_bytes`."""
+        entries: list[tuple[float, int, str]] = []
+        total = 0
+        for body_path in self._root.glob("*.body"):
+            try:
+                st = body_path.stat()
+            except OSError:
+                continue
+            total += st.st_size
+            if body_path.stem != keep:
+                entries.append((st.st_mtime, st.st_size, body_path.stem))
+
+        if total <= self._max_bytes:
+            return
+
+        for _, size, key in sorted(entries):
+            if total <= self._max_bytes:
+                break
+            self._remove(key)
+            total -= size
+            with self._lock:
+                self._evicted += 1
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write via a temp file and rename, so readers never see half a file."""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import json
+from typing import Any
+
+# `orjson` decodes plain dicts several times faster, used when installed (`[fast-json]` extra)
+_orjson: Any = importlib.import_module("orjson") if importlib.util.find_spec("orjson") else None
+ORJSON_AVAILABLE = _orjson is not None
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON into plain Python objects, with `orjson` if it is installed."""
+    if _orjson is not None:
+        return _orjson.loads(data)  # its errors subclass `json.JSONDecodeError`
+    return json.loads(data)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from typing import Any
+from typing import Any, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
@@ -125,16 +125,44 @@ class CartsPage(PageEnvelope):
     carts: list[DummyCart]
 
 
-def parse_users_page(payload: Mapping[str, Any]) -> UsersPage:
+def model_select_fields(model: type[ExtractModel]) -> tuple[str, ...]:
+    """Top level upstream field names a model reads, in declaration order."""
+    return tuple(field.alias or name for name, field in model.model_fields.items())
+
+
+# `select=` projection per resource, so pages only carry what the models keep.
+# Carts are left out, their bulk is the nested `products` which `select` can't trim.
+SELECT_FIELDS: dict[str, tuple[str, ...]] = {
+    "users": model_select_fields(DummyUser),
+    "products": model_select_fields(DummyProduct),
+}
+
+
+# a decoded page, or its raw JSON text straight off the wire or disk
+PagePayload = Mapping[str, Any] | bytes | str
+PageModelT = TypeVar("PageModelT", bound=PageEnvelope)
+
+
+def parse_users_page(payload: PagePayload) -> UsersPage:
     """Parse the users page."""
-    return UsersPage.model_validate(payload)
+    return _parse_page(UsersPage, payload)
 
 
-def parse_products_page(payload: Mapping[str, Any]) -> ProductsPage:
+def parse_products_page(payload: PagePayload) -> ProductsPage:
     """Parse the products page."""
-    return ProductsPage.model_validate(payload)
+    return _parse_page(ProductsPage, payload)
 
 
-def parse_carts_page(payload: Mapping[str, Any]) -> CartsPage:
+def parse_carts_page(payload: PagePayload) -> CartsPage:
     """Parse the carts page."""
-    return CartsPage.model_validate(payload)
+    return _parse_page(CartsPage, payload)
+
+
+def _parse_page(model: type[PageModelT], payload: PagePayload) -> PageModelT:
+    """
+    Raw JSON goes to the pydantic-core parser directly, no intermediate dict.
+    Invalid JSON surfaces as a `ValidationError` of type `json_invalid`.
+    """
+    if isinstance(payload, bytes | str):
+        return model.model_validate_json(payload)
+    return model.model_validate(payload)
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import zlib
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+OBJECTS_DIR_NAME = "_objects"
+OBJECT_SUFFIX = ".ndjson.gz"
+
+# content-defined chunk boundaries, cut after a record whose CRC has these low bits clear
+CHUNK_MASK = 0xFF  # ~256 records per chunk
+CHUNK_MIN_RECORDS = 64
+CHUNK_MAX_RECORDS = 4096
+
+
+class ObjectStore:
+    """
+    Chunks of NDJSON record lines stored once by the sha256 of their bytes.
+
+    Snapshot keys of one source share a store, so a chunk of users that didn't change
+    between two daily captures exists on disk exactly once.
+    """
+
+    def __init__(self, root: Path) -> None:
+        """Hand class the root."""
+        self.root = root
+
+    def path_for(self, digest: str) -> Path:
+        """`<root>/ab/abcdef....ndjson.gz`, fanned out by the first two hex digits."""
+        return self.root / digest[:2] / f"{digest}{OBJECT_SUFFIX}"
+
+    def put(self, lines: list[bytes]) -> tuple[str, bool]:
+        """Store one chunk, returns its digest and whether it had to be written."""
+        body = b"".join(lines)
+        digest = hashlib.sha256(body).hexdigest()
+        path = self.path_for(digest)
+        if path.exists():
+            return digest, False
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(path.name + ".tmp")
+        temp_path.write_bytes(gzip.compress(body, compresslevel=6, mtime=0))
+        temp_path.replace(path)
+        return digest, True
+
+    def read_lines(self, digest: str) -> list[bytes]:
+        """One chunk's record lines, checked against its digest."""
+        path = self.path_for(digest)
+        body = gzip.decompress(path.read_bytes())
+        if hashlib.sha256(body).hexdigest() != digest:
+            raise ValueError(f"Snapshot object {path} does not match its digest")
+        return body.splitlines(keepends=True)
+
+
+def chunk_lines(lines: Iterable[bytes]) -> Iterator[list[bytes]]:
+    """
+    Split record lines into chunks at content-defined boundaries.
+
+    Where a chunk ends depends only on the records themselves, so one inserted or
+    changed record alters its own chunk and the chunks after it line up again.
+    """
+    chunk: list[bytes] = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= CHUNK_MAX_RECORDS or (
+            len(chunk) >= CHUNK_MIN_RECORDS and zlib.crc32(line) & CHUNK_MASK == 0
+        ):
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
-from collections.abc import Callable
-from dataclasses import dataclass
-from typing import Generic, TypeVar
+import asyncio
+import queue
+import threading
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Generic, TypeVar, cast
+
+from warehouse_pipeline.extract.autotune import PageTuner
 
 PageT = TypeVar("PageT")
 ItemT = TypeVar("ItemT")
+T = TypeVar("T")
 
 
 @dataclass(frozen=True)
@@ -16,6 +24,8 @@ class PaginationResult(Generic[ItemT]):
     total: int
     pages_fetched: int
     page_size: int
+    # requested `skip` -> seconds spent fetching that page, in offset order.
+    page_timings_s: dict[int, float] = field(default_factory=dict)
 
 
 def fetch_all_pages(
@@ -27,21 +37,110 @@ def fetch_all_pages(
     get_limit: Callable[[PageT], int],
     page_size: int = 100,
     max_pages: int = 1000,
+    concurrency: int = 1,
+    tuner: PageTuner | None = None,
 ) -> PaginationResult[ItemT]:
     """
     An offset/limit paginator.
 
     Request pages in order, aggregates all items.
     Stops when total is reached and protect against repeated offsets or infinite loops.
+
+    With `concurrency > 1` the first page is fetched alone to learn `total`, then every
+    remaining `skip` offset is fetched through a bounded worker pool. Items are still
+    returned in offset order.
+
+    With a `tuner`, pages are fetched in waves and the tuner picks page size and
+    concurrency for each next wave, `page_size`/`concurrency` are then ignored.
     """
     # sanity
     if page_size <= 0:
         raise ValueError("`page_size` must be > 0")
     if max_pages <= 0:
         raise ValueError("`max_pages` must be > 0")
+    if concurrency <= 0:
+        raise ValueError("`concurrency` must be > 0")
+
+    if tuner is not None:
+        return _fetch_all_pages_tuned(
+            fetch_page=fetch_page,
+            get_items=get_items,
+            get_total=get_total,
+            get_skip=get_skip,
+            get_limit=get_limit,
+            max_pages=max_pages,
+            tuner=tuner,
+        )
+
+    if concurrency > 1:
+        return _fetch_all_pages_concurrent(
+            fetch_page=fetch_page,
+            get_items=get_items,
+            get_total=get_total,
+            get_skip=get_skip,
+            get_limit=get_limit,
+            page_size=page_size,
+            max_pages=max_pages,
+            concurrency=concurrency,
+        )
 
     all_items: list[ItemT] = []
+    page_timings_s: dict[int, float] = {}
+    pages_fetched = 0
+    stable_total: int | None = None
+
+    for page in iter_pages(
+        fetch_page=fetch_page,
+        get_items=get_items,
+        get_total=get_total,
+        get_skip=get_skip,
+        get_limit=get_limit,
+        page_size=page_size,
+        max_pages=max_pages,
+        page_timings_s=page_timings_s,
+    ):
+        all_items.extend(get_items(page))  # add all items
+        pages_fetched += 1
+        stable_total = int(get_total(page))
+
+    total = stable_total if stable_total is not None else len(all_items)
+
+    # Trim in case an API returns too much.
+    return PaginationResult(
+        items=all_items[:total],
+        total=total,
+        pages_fetched=pages_fetched,
+        page_size=page_size,
+        page_timings_s=page_timings_s,
+    )
+
+
+def iter_pages(
+    *,
+    fetch_page: Callable[[int, int], PageT],
+    get_items: Callable[[PageT], list[ItemT]],
+    get_total: Callable[[PageT], int],
+    get_skip: Callable[[PageT], int],
+    get_limit: Callable[[PageT], int],
+    page_size: int = 100,
+    max_pages: int = 1000,
+    page_timings_s: dict[int, float] | None = None,
+) -> Iterator[PageT]:
+    """
+    Yield validated pages in offset order as they arrive.
+
+    Same stop rules and repeated-offset/total checks as `fetch_all_pages`,
+    but only one page is held at a time. Per-page timings are written into
+    `page_timings_s` when a dict is given.
+    """
+    # sanity
+    if page_size <= 0:
+        raise ValueError("`page_size` must be > 0")
+    if max_pages <= 0:
+        raise ValueError("`max_pages` must be > 0")
+
     seen_skips: set[int] = set()
+    items_seen = 0
     pages_fetched = 0
     next_skip = 0
     stable_total: int | None = None
@@ -54,11 +153,13 @@ def fetch_all_pages(
 
         seen_skips.add(next_skip)  # set method. watch it in memory.
 
+        t0 = perf_counter()
         page = fetch_page(page_size, next_skip)
-        page_items = list(get_items(page))
+        if page_timings_s is not None:
+            page_timings_s[next_skip] = perf_counter() - t0
+
+        page_item_count = len(get_items(page))
         page_total = int(get_total(page))
-        page_skip = int(get_skip(page))
-        page_limit = int(get_limit(page))
 
         # page total should be sane.
         if stable_total is None:
@@ -66,23 +167,412 @@ def fetch_all_pages(
         elif page_total != stable_total:
             raise RuntimeError(f"Total changed across pages: {stable_total} to {page_total}")
 
-        all_items.extend(page_items)  # add all items
+        items_seen += page_item_count
         pages_fetched += 1
+        yield page
 
         # breaks
-        if not page_items:
+        if page_item_count == 0:
             break
-        if len(all_items) >= stable_total:
+        if items_seen >= stable_total:
             break
 
-        next_skip = page_skip + page_limit
+        next_skip = int(get_skip(page)) + int(get_limit(page))
 
-    total = stable_total if stable_total is not None else len(all_items)
+
+def iter_items(
+    *,
+    fetch_page: Callable[[int, int], PageT],
+    get_items: Callable[[PageT], list[ItemT]],
+    get_total: Callable[[PageT], int],
+    get_skip: Callable[[PageT], int],
+    get_limit: Callable[[PageT], int],
+    page_size: int = 100,
+    max_pages: int = 1000,
+) -> Iterator[ItemT]:
+    """Yield items page by page, capped at the reported `total` like `fetch_all_pages`."""
+    yielded = 0
+    for page in iter_pages(
+        fetch_page=fetch_page,
+        get_items=get_items,
+        get_total=get_total,
+        get_skip=get_skip,
+        get_limit=get_limit,
+        page_size=page_size,
+        max_pages=max_pages,
+    ):
+        remaining = int(get_total(page)) - yielded
+        page_items = list(get_items(page))[: max(remaining, 0)]
+        yielded += len(page_items)
+        yield from page_items
+
+
+def iter_prefetched(source: Iterable[T], *, depth: int = 1) -> Iterator[T]:
+    """
+    Pull up to `depth` values of `source` ahead on a background thread.
+
+    Lets the consumer (e.g. a stage mapper) work on one page while the next
+    one is still on the network. Errors from `source` are re-raised to the consumer.
+    """
+    if depth <= 0:
+        yield from source
+        return
+
+    buffer: queue.Queue[tuple[bool, object]] = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    done = object()
+
+    def put(entry: tuple[bool, object]) -> bool:
+        """Block until there is room, unless the consumer has gone away."""
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        """Fill the buffer from `source` on the worker thread."""
+        try:
+            for value in source:
+                if not put((True, value)):
+                    return
+            put((True, done))
+        except BaseException as exc:  # handed to the consumer
+            put((False, exc))
+
+    threading.Thread(target=produce, name="page-prefetch", daemon=True).start()
+    try:
+        while True:
+            ok, value = buffer.get()
+            if not ok:
+                raise cast(BaseException, value)
+            if value is done:
+                return
+            yield cast(T, value)
+    finally:
+        stop.set()
+
+
+def _fetch_all_pages_concurrent(
+    *,
+    fetch_page: Callable[[int, int], PageT],
+    get_items: Callable[[PageT], list[ItemT]],
+    get_total: Callable[[PageT], int],
+    get_skip: Callable[[PageT], int],
+    get_limit: Callable[[PageT], int],
+    page_size: int,
+    max_pages: int,
+    concurrency: int,
+) -> PaginationResult[ItemT]:
+    """
+    Offset fan-out once the first page reveals `total`.
+
+    Keeps the same repeated-skip and total-stability checks as the sequential loop,
+    just applied after the pool returns.
+    """
+
+    def timed_fetch(skip: int) -> tuple[PageT, float]:
+        """Fetch one page and time it."""
+        t0 = perf_counter()
+        page = fetch_page(page_size, skip)
+        return page, perf_counter() - t0
+
+    first_page, first_elapsed = timed_fetch(0)
+    offsets = _fanout_offsets(
+        first_page,
+        get_items=get_items,
+        get_total=get_total,
+        get_skip=get_skip,
+        get_limit=get_limit,
+        max_pages=max_pages,
+    )
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        # `map` yields in submission order, so offset order is kept for free.
+        fetched = list(pool.map(timed_fetch, offsets))
+
+    return _merge_fanout_pages(
+        (first_page, first_elapsed),
+        offsets=offsets,
+        fetched=fetched,
+        get_items=get_items,
+        get_total=get_total,
+        get_skip=get_skip,
+        page_size=page_size,
+    )
+
+
+def _fetch_all_pages_tuned(
+    *,
+    fetch_page: Callable[[int, int], PageT],
+    get_items: Callable[[PageT], list[ItemT]],
+    get_total: Callable[[PageT], int],
+    get_skip: Callable[[PageT], int],
+    get_limit: Callable[[PageT], int],
+    max_pages: int,
+    tuner: PageTuner,
+) -> PaginationResult[ItemT]:
+    """
+    Fetch in waves of `tuner.concurrency` pages of `tuner.page_size` each,
+    reporting every wave back to the tuner so it can adjust the next one.
+    """
+    page_timings_s: dict[int, float] = {}
+
+    def timed_fetch(limit: int, skip: int) -> PageT:
+        """Fetch one page and time it."""
+        t0 = perf_counter()
+        page = fetch_page(limit, skip)
+        page_timings_s[skip] = perf_counter() - t0
+        return page
+
+    first_page = timed_fetch(tuner.page_size, 0)
+    stable_total = int(get_total(first_page))
+    all_items: list[ItemT] = list(get_items(first_page))
+    pages_fetched = 1
+    served = int(get_limit(first_page))
+    if served <= 0:
+        raise RuntimeError(f"Paginator got non-positive limit={served} on the first page")
+    if served < tuner.page_size and served < stable_total:
+        tuner.cap_page_size(served)
+    next_skip = int(get_skip(first_page)) + len(all_items)
+
+    with ThreadPoolExecutor(max_workers=tuner.max_concurrency) as pool:
+        while all_items and len(all_items) < stable_total:
+            size = tuner.page_size
+            offsets = [
+                skip
+                for skip in range(next_skip, next_skip + size * tuner.concurrency, size)
+                if skip < stable_total
+            ]
+            if pages_fetched + len(offsets) > max_pages:
+                raise RuntimeError(f"Pagination exceeded max_pages={max_pages}")
+
+            tuner.start_wave()
+            t0 = perf_counter()
+            pages = list(pool.map(timed_fetch, [size] * len(offsets), offsets))
+            elapsed_s = perf_counter() - t0
+
+            wave_items = 0
+            kept: list[int] = []
+            for requested_skip, page in zip(offsets, pages, strict=True):
+                if int(get_skip(page)) != requested_skip:
+                    raise RuntimeError(f"Paginator saw repeated skip={get_skip(page)}")
+                page_total = int(get_total(page))
+                if page_total != stable_total:
+                    raise RuntimeError(
+                        f"Total changed across pages: {stable_total} to {page_total}"
+                    )
+
+                page_items = list(get_items(page))
+                all_items.extend(page_items)
+                wave_items += len(page_items)
+                kept.append(requested_skip)
+                # step by what came back, a clamped page must not skip the items it left out
+                next_skip = requested_skip + len(page_items)
+                if len(page_items) < size and next_skip < stable_total:
+                    # server clamped `limit`, drop the rest of this wave (they left gaps)
+                    tuner.cap_page_size(len(page_items))
+                    break
+
+            for dropped in offsets[len(kept) :]:
+                del page_timings_s[dropped]
+            pages_fetched += len(kept)
+            tuner.observe(
+                items=wave_items,
+                elapsed_s=elapsed_s,
+                page_latencies_s=[page_timings_s[skip] for skip in kept],
+            )
+            if wave_items == 0:
+                break
+
+    if all_items and len(all_items) < stable_total:
+        raise RuntimeError(
+            f"Paginator got {len(all_items)} of total={stable_total} items, a page came back empty"
+        )
+
+    # Trim in case an API returns too much.
+    return PaginationResult(
+        items=all_items[:stable_total],
+        total=stable_total,
+        pages_fetched=pages_fetched,
+        page_size=tuner.report()["page_size"],
+        page_timings_s=dict(sorted(page_timings_s.items())),
+    )
+
+
+def _fanout_offsets(
+    first_page: PageT,
+    *,
+    get_items: Callable[[PageT], list[ItemT]],
+    get_total: Callable[[PageT], int],
+    get_skip: Callable[[PageT], int],
+    get_limit: Callable[[PageT], int],
+    max_pages: int,
+) -> list[int]:
+    """Every remaining `skip` offset implied by the first page's `total` and `limit`."""
+    # the server may clamp `limit`, so step by what it actually served.
+    step = int(get_limit(first_page))
+    if step <= 0:
+        raise RuntimeError(f"Paginator got non-positive limit={step} on the first page")
+
+    if not get_items(first_page):
+        return []  # same early stop as the sequential loop
+
+    offsets = list(range(int(get_skip(first_page)) + step, int(get_total(first_page)), step))
+    if 1 + len(offsets) > max_pages:
+        raise RuntimeError(f"Pagination exceeded max_pages={max_pages}")
+    return offsets
+
+
+def _merge_fanout_pages(
+    first: tuple[PageT, float],
+    *,
+    offsets: list[int],
+    fetched: list[tuple[PageT, float]],
+    get_items: Callable[[PageT], list[ItemT]],
+    get_total: Callable[[PageT], int],
+    get_skip: Callable[[PageT], int],
+    page_size: int,
+) -> PaginationResult[ItemT]:
+    """
+    Check fan-out pages for repeated skips, a moving total or missing items, and merge
+    in offset order.
+    """
+    first_page, first_elapsed = first
+    stable_total = int(get_total(first_page))
+
+    all_items: list[ItemT] = list(get_items(first_page))
+    seen_skips: set[int] = {int(get_skip(first_page))}
+    page_timings_s: dict[int, float] = {0: first_elapsed}
+
+    for requested_skip, (page, elapsed) in zip(offsets, fetched, strict=True):
+        page_skip = int(get_skip(page))
+        if page_skip != requested_skip or page_skip in seen_skips:
+            raise RuntimeError(f"Paginator saw repeated skip={page_skip}")
+        seen_skips.add(page_skip)
+
+        page_total = int(get_total(page))
+        if page_total != stable_total:
+            raise RuntimeError(f"Total changed across pages: {stable_total} to {page_total}")
+
+        all_items.extend(get_items(page))
+        page_timings_s[requested_skip] = elapsed
+
+    # offsets were fixed up front, so a short page leaves a gap nothing refetches
+    # (an empty first page is the sequential loop's early stop, not a gap)
+    if all_items and len(all_items) < stable_total:
+        raise RuntimeError(
+            f"Paginator got {len(all_items)} of total={stable_total} items, a page came back short"
+        )
 
     # Trim in case an API returns too much.
+    return PaginationResult(
+        items=all_items[:stable_total],
+        total=stable_total,
+        pages_fetched=1 + len(offsets),
+        page_size=page_size,
+        page_timings_s=page_timings_s,
+    )
+
+
+async def fetch_all_pages_async(
+    *,
+    fetch_page: Callable[[int, int], Awaitable[PageT]],
+    get_items: Callable[[PageT], list[ItemT]],
+    get_total: Callable[[PageT], int],
+    get_skip: Callable[[PageT], int],
+    get_limit: Callable[[PageT], int],
+    page_size: int = 100,
+    max_pages: int = 1000,
+    concurrency: int = 1,
+) -> PaginationResult[ItemT]:
+    """
+    Asyncio twin of `fetch_all_pages`, same checks and the same result.
+
+    `concurrency` bounds in-flight page requests for this one resource.
+    """
+    # sanity
+    if page_size <= 0:
+        raise ValueError("`page_size` must be > 0")
+    if max_pages <= 0:
+        raise ValueError("`max_pages` must be > 0")
+    if concurrency <= 0:
+        raise ValueError("`concurrency` must be > 0")
+
+    async def timed_fetch(skip: int) -> tuple[PageT, float]:
+        """Fetch one page and time it."""
+        t0 = perf_counter()
+        page = await fetch_page(page_size, skip)
+        return page, perf_counter() - t0
+
+    if concurrency > 1:
+        first_page, first_elapsed = await timed_fetch(0)
+        offsets = _fanout_offsets(
+            first_page,
+            get_items=get_items,
+            get_total=get_total,
+            get_skip=get_skip,
+            get_limit=get_limit,
+            max_pages=max_pages,
+        )
+        gate = asyncio.Semaphore(concurrency)
+
+        async def bounded_fetch(skip: int) -> tuple[PageT, float]:
+            """Hold a slot for the whole request."""
+            async with gate:
+                return await timed_fetch(skip)
+
+        # `gather` returns in argument order, so offset order is kept.
+        fetched = list(await asyncio.gather(*(bounded_fetch(skip) for skip in offsets)))
+        return _merge_fanout_pages(
+            (first_page, first_elapsed),
+            offsets=offsets,
+            fetched=fetched,
+            get_items=get_items,
+            get_total=get_total,
+            get_skip=get_skip,
+            page_size=page_size,
+        )
+
+    all_items: list[ItemT] = []
+    seen_skips: set[int] = set()
+    page_timings_s: dict[int, float] = {}
+    pages_fetched = 0
+    next_skip = 0
+    stable_total: int | None = None
+
+    while True:
+        if pages_fetched >= max_pages:
+            raise RuntimeError(f"Pagination exceeded max_pages={max_pages}")
+        if next_skip in seen_skips:
+            raise RuntimeError(f"Paginator saw repeated skip={next_skip}")
+        seen_skips.add(next_skip)
+
+        page, page_timings_s[next_skip] = await timed_fetch(next_skip)
+        page_items = list(get_items(page))
+        page_total = int(get_total(page))
+
+        if stable_total is None:
+            stable_total = page_total
+        elif page_total != stable_total:
+            raise RuntimeError(f"Total changed across pages: {stable_total} to {page_total}")
+
+        all_items.extend(page_items)
+        pages_fetched += 1
+
+        if not page_items or len(all_items) >= stable_total:
+            break
+
+        next_skip = int(get_skip(page)) + int(get_limit(page))
+
+    total = stable_total if stable_total is not None else len(all_items)
+
     return PaginationResult(
         items=all_items[:total],
         total=total,
         pages_fetched=pages_fetched,
         page_size=page_size,
+        page_timings_s=page_timings_s,
     )
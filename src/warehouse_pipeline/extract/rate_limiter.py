@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, Protocol
+
+
+class RateLimiter(Protocol):
+    """
+    Contract for request pacing shared by extract clients.
+
+    One instance may be shared by several clients, threads and asyncio tasks.
+    """
+
+    def acquire(self) -> float:
+        """Block until one request may start. Returns seconds waited."""
+        ...
+
+    async def acquire_async(self) -> float:
+        """Await until one request may start. Returns seconds waited."""
+        ...
+
+    def try_acquire(self) -> bool:
+        """Take one token only if a request may start right now, never waits."""
+        ...
+
+    def on_success(self) -> None:
+        """Report a successful response."""
+        ...
+
+    def on_throttle(self, *, retry_after_s: float | None = None) -> None:
+        """Report a throttled response (`429`), with its `Retry-After` if any."""
+        ...
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for the run manifest."""
+        ...
+
+
+class TokenBucketRateLimiter:
+    """
+    Token bucket with burst capacity and AIMD-style adaptive rate.
+
+    - `rate_per_s` tokens refill per second, up to `burst` tokens banked.
+    - on a throttle the rate is multiplied by `decrease_factor` (never below
+      `min_rate_per_s`) and every caller pauses for `Retry-After`.
+    - after `success_streak` successes in a row the rate steps back up by
+      `increase_step_per_s`, capped at the starting rate.
+
+    `rate_per_s=None` disables pacing, only `Retry-After` pauses still apply.
+    Callers reserve tokens under a `threading.Lock` and wait outside of it,
+    so it is safe across threads and across tasks on an event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate_per_s: float | None = 4.0,
+        burst: int = 1,
+        min_rate_per_s: float = 0.25,
+        decrease_factor: float = 0.5,
+        increase_step_per_s: float | None = None,
+        success_streak: int = 20,
+        clock: Callable[[], float] = time.monotonic,
+        sleeper: Callable[[float], None] = time.sleep,
+        async_sleeper: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        # sanity
+        if rate_per_s is not None and rate_per_s <= 0:
+            raise ValueError("rate_per_s must be > 0 (or None for no limit)")
+        if burst < 1:
+            raise ValueError("burst must be >= 1")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be in (0, 1)")
+        if success_streak < 1:
+            raise ValueError("success_streak must be >= 1")
+
+        self._max_rate_per_s = rate_per_s
+        self._rate_per_s = rate_per_s
+        self._min_rate_per_s = min(min_rate_per_s, rate_per_s or min_rate_per_s)
+        self._burst = burst
+        self._decrease_factor = decrease_factor
+        self._increase_step_per_s = (
+            increase_step_per_s
+            if increase_step_per_s is not None
+            else (rate_per_s / 10 if rate_per_s is not None else 0.0)
+        )
+        self._success_streak = success_streak
+        self._clock = clock
+        self._sleep = sleeper
+        self._async_sleep = async_sleeper
+
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._last_refill = clock()
+        self._paused_until = 0.0
+        self._streak = 0
+
+        # counters
+        self._acquired = 0
+        self._throttle_waits = 0
+        self._throttle_wait_s = 0.0
+        self._throttled_responses = 0
+        self._rate_decreases = 0
+        self._rate_increases = 0
+
+    @classmethod
+    def from_min_interval(
+        cls,
+        min_interval_s: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleeper: Callable[[float], None] = time.sleep,
+        async_sleeper: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> TokenBucketRateLimiter:
+        """Same pacing as the old fixed gap between request starts (`0` = no limit)."""
+        return cls(
+            rate_per_s=(1.0 / min_interval_s) if min_interval_s > 0 else None,
+            burst=1,
+            clock=clock,
+            sleeper=sleeper,
+            async_sleeper=async_sleeper,
+        )
+
+    def acquire(self) -> float:
+        """Block until one request may start. Returns seconds waited."""
+        wait_s = self._reserve()
+        if wait_s > 0:
+            self._sleep(wait_s)
+        return wait_s
+
+    async def acquire_async(self) -> float:
+        """Await until one request may start. Returns seconds waited."""
+        wait_s = self._reserve()
+        if wait_s > 0:
+            await self._async_sleep(wait_s)
+        return wait_s
+
+    def try_acquire(self) -> bool:
+        """Take one token only if a request may start right now, never waits."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            if now < self._paused_until:
+                return False
+            if self._rate_per_s is not None:
+                if self._tokens < 1.0:
+                    return False
+                self._tokens -= 1.0
+            self._acquired += 1
+            return True
+
+    def on_success(self) -> None:
+        """Relax the rate again after a streak of successes."""
+        with self._lock:
+            self._streak += 1
+            if self._streak < self._success_streak:
+                return
+            self._streak = 0
+
+            if self._rate_per_s is None or self._max_rate_per_s is None:
+                return
+            if self._rate_per_s < self._max_rate_per_s:
+                self._rate_per_s = min(
+                    self._max_rate_per_s, self._rate_per_s + self._increase_step_per_s
+                )
+                self._rate_increases += 1
+
+    def on_throttle(self, *, retry_after_s: float | None = None) -> None:
+        """Tighten the rate, and pause every caller for `Retry-After` if one was sent."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._streak = 0
+            self._throttled_responses += 1
+
+            if retry_after_s is not None and retry_after_s > 0:
+                self._paused_until = max(self._paused_until, now + retry_after_s)
+
+            if self._rate_per_s is not None:
+                self._rate_per_s = max(
+                    self._min_rate_per_s, self._rate_per_s * self._decrease_factor
+                )
+                self._rate_decreases += 1
+                # spend banked burst so the lower rate takes effect at once
+                self._tokens = min(self._tokens, 0.0)
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for the run manifest."""
+        with self._lock:
+            return {
+                "acquired": self._acquired,
+                "throttle_waits": self._throttle_waits,
+                "throttle_wait_s": round(self._throttle_wait_s, 6),
+                "throttled_responses": self._throttled_responses,
+                "rate_decreases": self._rate_decreases,
+                "rate_increases": self._rate_increases,
+                "rate_per_s": self._rate_per_s,
+                "burst": self._burst,
+            }
+
+    def _refill(self, now: float) -> None:
+        """Bank tokens earned since the last refill. Caller holds the lock."""
+        if self._rate_per_s is not None:
+            elapsed = max(now - self._last_refill, 0.0)
+            self._tokens = min(float(self._burst), self._tokens + elapsed * self._rate_per_s)
+        self._last_refill = now
+
+    def _reserve(self) -> float:
+        """
+        Take one token, going into debt if needed. Returns seconds to wait.
+
+        Debt makes concurrent callers queue in arrival order without
+        holding the lock while they wait.
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._acquired += 1
+
+            wait_s = 0.0
+            if self._rate_per_s is not None:
+                self._tokens -= 1.0
+                if self._tokens < 0:
+                    wait_s = -self._tokens / self._rate_per_s
+
+            wait_s = max(wait_s, self._paused_until - now)
+            if wait_s > 0:
+                self._throttle_waits += 1
+                self._throttle_wait_s += wait_s
+            return wait_s
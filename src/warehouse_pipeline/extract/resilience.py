@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any, Literal
+
+BreakerState = Literal["closed", "open", "half_open"]
+
+
+class HedgePolicy:
+    """
+    When to fire a duplicate request for a slow page.
+
+    The hedge delay is the `percentile` of recent response latencies, so only the
+    tail gets hedged. No hedging until `min_samples` latencies are known, and
+    never more than `max_hedge_ratio` of requests get a duplicate.
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float = 95.0,
+        min_samples: int = 20,
+        window: int = 200,
+        min_delay_s: float = 0.01,
+        max_hedge_ratio: float = 0.1,
+    ) -> None:
+        # sanity
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be in (0, 100)")
+        if min_samples < 1 or window < min_samples:
+            raise ValueError("need 1 <= min_samples <= window")
+        if not 0 <= max_hedge_ratio <= 1:
+            raise ValueError("max_hedge_ratio must be in [0, 1]")
+
+        self._percentile = percentile
+        self._min_samples = min_samples
+        self._min_delay_s = min_delay_s
+        self._max_hedge_ratio = max_hedge_ratio
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+        # counters
+        self._requests = 0
+        self._hedges_fired = 0
+        self._hedges_won = 0
+        self._hedges_skipped = 0
+
+    def delay_s(self) -> float | None:
+        """Seconds to wait before hedging the next request, `None` to not hedge it."""
+        with self._lock:
+            self._requests += 1
+            if len(self._latencies) < self._min_samples:
+                return None
+            if self._hedges_fired >= self._max_hedge_ratio * self._requests:
+                return None
+            ranked = sorted(self._latencies)
+            rank = max(math.ceil(self._percentile / 100 * len(ranked)), 1)
+            return max(ranked[rank - 1], self._min_delay_s)
+
+    def observe(self, latency_s: float) -> None:
+        """Record one finished response."""
+        with self._lock:
+            self._latencies.append(latency_s)
+
+    def note_fired(self) -> None:
+        """A duplicate went out."""
+        with self._lock:
+            self._hedges_fired += 1
+
+    def note_won(self) -> None:
+        """The duplicate answered first."""
+        with self._lock:
+            self._hedges_won += 1
+
+    def note_skipped(self) -> None:
+        """Count a duplicate that was due but had no rate limiter token to spend."""
+        with self._lock:
+            self._hedges_skipped += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for the run manifest."""
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "hedges_fired": self._hedges_fired,
+                "hedges_won": self._hedges_won,
+                "hedges_skipped": self._hedges_skipped,
+                "samples": len(self._latencies),
+                "percentile": self._percentile,
+            }
+
+
+class CircuitBreaker:
+    """
+    Fails fast once upstream keeps failing.
+
+    - `closed`: requests flow, outcomes go into a rolling window of `window` results.
+      At least `min_requests` results with a failure share of `failure_threshold`
+      or more opens the breaker.
+    - `open`: every request is refused until `open_for_s` has passed.
+    - `half_open`: one probe request goes through. Success closes the breaker,
+      failure opens it again.
+
+    Throttling (`429`) is not a failure here, the rate limiter deals with that. A probe
+    that is throttled, or whose request raises before answering, settles nothing and
+    `release_probe` lets the next request probe instead.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: float = 0.5,
+        window: int = 20,
+        min_requests: int = 10,
+        open_for_s: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        # sanity
+        if not 0 < failure_threshold <= 1:
+            raise ValueError("failure_threshold must be in (0, 1]")
+        if min_requests < 1 or window < min_requests:
+            raise ValueError("need 1 <= min_requests <= window")
+
+        self._failure_threshold = failure_threshold
+        self._min_requests = min_requests
+        self._open_for_s = open_for_s
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        self._outcomes: deque[bool] = deque(maxlen=window)  # True = failure
+        self._state: BreakerState = "closed"
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+        # counters
+        self._trips = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> BreakerState:
+        """Current state, `open` turns `half_open` lazily on the next request."""
+        with self._lock:
+            return self._state
+
+    def allow_request(self) -> bool:
+        """Whether a request may go out now. Counts the refusals."""
+        with self._lock:
+            if self._state == "open":
+                if self._clock() - self._opened_at < self._open_for_s:
+                    self._rejected += 1
+                    return False
+                self._state = "half_open"
+                self._probe_in_flight = False
+
+            if self._state == "half_open":
+                if self._probe_in_flight:
+                    self._rejected += 1
+                    return False
+                self._probe_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        """Upstream answered."""
+        with self._lock:
+            if self._state == "half_open":
+                self._state = "closed"
+                self._outcomes.clear()
+                self._probe_in_flight = False
+                return
+            self._outcomes.append(False)
+
+    def record_failure(self) -> None:
+        """Upstream errored or timed out."""
+        with self._lock:
+            if self._state == "half_open":
+                self._open()
+                return
+            self._outcomes.append(True)
+            if len(self._outcomes) >= self._min_requests:
+                failures = sum(self._outcomes)
+                if failures / len(self._outcomes) >= self._failure_threshold:
+                    self._open()
+
+    def release_probe(self) -> None:
+        """The half-open probe ended without a verdict, let another request probe."""
+        with self._lock:
+            if self._state == "half_open":
+                self._probe_in_flight = False
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for the run manifest."""
+        with self._lock:
+            return {
+                "state": self._state,
+                "trips": self._trips,
+                "rejected": self._rejected,
+            }
+
+    def _open(self) -> None:
+        """Trip. Caller holds the lock."""
+        self._state = "open"
+        self._opened_at = self._clock()
+        self._probe_in_flight = False
+        self._outcomes.clear()
+        self._trips += 1
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from pathlib import Path
+from typing import Any, TypeVar
+
+from warehouse_pipeline.extract.compact import ColumnarRecords
+from warehouse_pipeline.extract.models import ExtractModel
+from warehouse_pipeline.extract.snapshot_store import SnapshotStore, shard_name
+
+T = TypeVar("T")
+ModelT = TypeVar("ModelT", bound=ExtractModel)
+
+
+def read_shards(
+    paths: Sequence[Path], read_one: Callable[[Path], list[T]], *, workers: int = 1
+) -> Iterator[T]:
+    """
+    `read_one` over every shard, records yielded in shard order whatever finishes first.
+
+    With `workers > 1` shards go to a process pool, so `read_one` must pickle (a
+    module-level function or a `partial` of one). Results come back pickled too, and
+    the parent unpickles them alone: return plain data (dicts, `ColumnarRecords`),
+    pydantic models take longer to unpickle than to validate.
+    """
+    return chain.from_iterable(map_shards(paths, read_one, workers=workers))
+
+
+def map_shards(
+    paths: Sequence[Path], read_one: Callable[[Path], T], *, workers: int = 1
+) -> Iterator[T]:
+    """
+    `read_one`'s result for every shard, in shard order. Lazy when reading in process,
+    with a pool every shard's result is back before the first is yielded.
+    """
+    if workers <= 1 or len(paths) <= 1:
+        return (read_one(path) for path in paths)
+    with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+        # `map` keeps input order, so `source_ref` numbering doesn't depend on timing
+        shards = list(pool.map(read_one, paths))
+    return iter(shards)
+
+
+def validate_shard(model: type[ModelT], path: Path) -> list[ModelT]:
+    """One shard's records validated into `model`."""
+    store = SnapshotStore(path.parent)
+    return [model.model_validate_json(line) for line in store.iter_ndjson_lines(shard_name(path))]
+
+
+def columnar_shard(model: type[ExtractModel], path: Path) -> ColumnarRecords:
+    """One shard's records validated into `model` and dumped into columns one by one."""
+    store = SnapshotStore(path.parent)
+    lines = store.iter_ndjson_lines(shard_name(path))
+    return ColumnarRecords.from_models(model, (model.model_validate_json(line) for line in lines))
+
+
+def decode_shard(path: Path) -> list[dict[str, Any]]:
+    """One shard's records as decoded JSON, for the fused carts mapper."""
+    return list(SnapshotStore(path.parent).iter_ndjson(shard_name(path)))
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import pickle
+from collections.abc import Mapping
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import pydantic
+
+from warehouse_pipeline.extract.models import CartsPage, ProductsPage, UsersPage
+
+CACHE_DIR_NAME = ".bundle_cache"
+# bump when the pickled shape changes in a way the model schemas don't show
+CACHE_FORMAT = 1
+# entries kept per snapshot root, enough for each variant (models/fused, compact) to stay
+MAX_ENTRIES = 4
+_HASH_CHUNK_BYTES = 1 << 20
+
+
+@lru_cache(maxsize=1)
+def models_fingerprint() -> str:
+    """Hash of the page model schemas and pydantic version, a changed model never hits."""
+    schemas = [model.model_json_schema() for model in (UsersPage, ProductsPage, CartsPage)]
+    blob = json.dumps(
+        {"format": CACHE_FORMAT, "pydantic": pydantic.VERSION, "schemas": schemas},
+        sort_keys=True,
+    )
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class SnapshotBundleCache:
+    """
+    Validated snapshot bundles pickled under `<snapshot_root>/.bundle_cache/`.
+
+    Entries are keyed by the snapshot files' content hash, so an edited file is just a
+    miss. The `max_entries` most recently used entries are kept, and an unreadable one
+    counts as a miss too. The cache is only ever an optimisation: a failed write is
+    reported, never raised.
+    """
+
+    def __init__(self, snapshot_root: Path, *, max_entries: int = MAX_ENTRIES) -> None:
+        """Hand class the snapshot root."""
+        self.dir = snapshot_root / CACHE_DIR_NAME
+        self.max_entries = max(max_entries, 1)
+
+    @staticmethod
+    def key_for(files: Mapping[str, Path], *, variant: str) -> str:
+        """Content hash of the snapshot files, salted with `variant` and the models."""
+        digest = hashlib.sha256()
+        digest.update(f"{models_fingerprint()}:{variant}".encode())
+        for name in sorted(files):
+            path = files[name]
+            digest.update(f"\0{name}\0{path.name}\0".encode())
+            with path.open("rb") as handle:
+                while chunk := handle.read(_HASH_CHUNK_BYTES):
+                    digest.update(chunk)
+        return digest.hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        """Where the entry for `key` lives."""
+        return self.dir / f"{key}.pickle"
+
+    def load(self, key: str) -> Any | None:
+        """The cached object for `key`, `None` on a miss."""
+        path = self.path_for(key)
+        try:
+            with path.open("rb") as handle:
+                value = pickle.load(handle)
+        except OSError:
+            return None  # missing or unreadable
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, ValueError):
+            return None  # truncated or from an older codebase, rebuilt by the caller
+        with contextlib.suppress(OSError):
+            os.utime(path)  # most recently used, last to be evicted
+        return value
+
+    def store(self, key: str, value: Any) -> bool:
+        """
+        Write `value` atomically as the entry for `key`, then evict the least recently
+        used entries past `max_entries`. `False` when it could not be written, e.g. a
+        read-only snapshot root or a full disk.
+        """
+        final_path = self.path_for(key)
+        temp_path = final_path.with_suffix(".tmp")
+        try:
+            self.dir.mkdir(parents=True, exist_ok=True)
+            with temp_path.open("wb") as handle:
+                pickle.dump(value, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            temp_path.replace(final_path)
+        except (OSError, pickle.PicklingError):
+            with contextlib.suppress(OSError):
+                temp_path.unlink(missing_ok=True)
+            return False
+        self._evict(keep=final_path)
+        return True
+
+    def _evict(self, *, keep: Path) -> None:
+        """Drop the oldest entries until at most `max_entries` are left, never `keep`."""
+        entries = []
+        for path in self.dir.glob("*.pickle"):
+            with contextlib.suppress(OSError):
+                entries.append((path.stat().st_mtime, path))
+        entries.sort(reverse=True)
+        for _, stale in entries[self.max_entries :]:
+            if stale != keep:
+                with contextlib.suppress(OSError):
+                    stale.unlink(missing_ok=True)
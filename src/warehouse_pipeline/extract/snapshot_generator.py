@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import random
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from warehouse_pipeline.extract.bundles import cart_index_key
+from warehouse_pipeline.extract.snapshot_store import (
+    DEFAULT_SHARD_SIZE,
+    SnapshotFormat,
+    SnapshotStore,
+)
+from warehouse_pipeline.extract.synthetic import synthetic_product, synthetic_user
+
+
+@dataclass(frozen=True)
+class GeneratorConfig:
+    """
+    Shape of a generated snapshot. Every `*_rate` defaults to 0, so the default
+    snapshot stages with no rejects and passes the snapshot-mode gates.
+    """
+
+    users: int = 1000
+    products: int = 1000
+    carts: int = 1000
+    seed: int = 0
+    mean_lines: float = 3.0  # geometric lines per cart, capped at `max_lines`
+    max_lines: int = 8
+    duplicate_rate: float = 0.0  # chance a record is re-emitted, changed, under its key
+    reject_rate: float = 0.0  # chance a cart line has quantity 0 (`invalid_quantity`)
+    unknown_product_rate: float = 0.0  # chance a cart line names a product not in the catalog
+
+    def __post_init__(self) -> None:
+        for name in ("duplicate_rate", "reject_rate", "unknown_product_rate"):
+            if not 0.0 <= getattr(self, name) <= 1.0:
+                raise ValueError(f"`{name}` must be within [0, 1]")
+        if self.mean_lines < 1 or self.max_lines < 1:
+            raise ValueError("`mean_lines` and `max_lines` must be >= 1")
+        if min(self.users, self.products, self.carts) < 1:
+            raise ValueError("`users`, `products` and `carts` must be >= 1")
+
+
+@dataclass
+class GeneratedSnapshot:
+    """What `generate_snapshot` wrote, and the rejects a run over it should report."""
+
+    paths: dict[str, str] = field(default_factory=dict)
+    records: dict[str, int] = field(default_factory=dict)  # duplicates included
+    duplicates: dict[str, int] = field(default_factory=dict)
+    cart_lines: int = 0
+    invalid_quantity_lines: int = 0
+    unknown_product_lines: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-friendly view for the CLI."""
+        return asdict(self)
+
+
+def generate_snapshot(
+    snapshot_root: Path,
+    config: GeneratorConfig,
+    *,
+    snapshot_format: SnapshotFormat = "ndjson",
+    shard_size: int = DEFAULT_SHARD_SIZE,
+) -> GeneratedSnapshot:
+    """
+    Write a deterministic synthetic snapshot of any size under `snapshot_root`.
+
+    Each resource has its own `seed`-derived RNG and is streamed into the store, so
+    the same config gives byte-identical `.ndjson.gz` files and, outside `json`, only
+    the product catalog is held in memory.
+    """
+    store = SnapshotStore(snapshot_root.resolve())
+    result = GeneratedSnapshot()
+
+    products_rng = _rng(config, "products")
+    products = [
+        synthetic_product(products_rng, product_id) for product_id in range(1, config.products + 1)
+    ]
+    resources = {
+        "users": _users(config, result),
+        "products": _with_duplicates(iter(products), config, result, "products"),
+        "carts": _carts(config, products, result),
+    }
+    distinct = {"users": config.users, "products": config.products, "carts": config.carts}
+    # the header is written first, so count what `_with_duplicates` will emit up front
+    totals = {name: _record_count(config, name, n) for name, n in distinct.items()}
+    for name, records in resources.items():
+        envelope = {"total": totals[name], "skip": 0, "limit": totals[name]}
+        # carts get a sidecar index like `write_snapshot_bundle`'s, for window replays
+        index_key = cart_index_key if name == "carts" else None
+        if snapshot_format == "json":
+            path = store.write_json(name, {name: list(records), **envelope})
+        elif snapshot_format == "ndjson":
+            path = store.write_ndjson(name, records, envelope=envelope, index_key=index_key)
+        elif snapshot_format == "sharded":
+            path = store.write_sharded(
+                name, records, envelope=envelope, shard_size=shard_size, index_key=index_key
+            )
+        else:
+            path = store.write_chunked(name, records, envelope=envelope)
+        result.paths[name] = str(path)
+    return result
+
+
+def _rng(config: GeneratorConfig, resource: str) -> random.Random:
+    """One RNG per resource, so resources don't shift each other's draws."""
+    return random.Random(f"{config.seed}:{resource}")
+
+
+def _users(config: GeneratorConfig, result: GeneratedSnapshot) -> Iterator[dict[str, Any]]:
+    """Users `1..N` plus their duplicates."""
+    rng = _rng(config, "users")
+    users = (synthetic_user(rng, user_id) for user_id in range(1, config.users + 1))
+    return _with_duplicates(users, config, result, "users")
+
+
+def _with_duplicates(
+    records: Iterator[dict[str, Any]],
+    config: GeneratorConfig,
+    result: GeneratedSnapshot,
+    resource: str,
+) -> Iterator[dict[str, Any]]:
+    """
+    Each record, sometimes followed by a changed copy under the same id. The copy
+    comes later, so it is the one staging rejects as `duplicate_key`.
+    """
+    rng = _rng(config, f"{resource}:duplicates")
+    result.records[resource] = 0
+    result.duplicates[resource] = 0
+    for record in records:
+        result.records[resource] += 1
+        yield record
+        if config.duplicate_rate and rng.random() < config.duplicate_rate:
+            result.records[resource] += 1
+            result.duplicates[resource] += 1
+            yield _changed_copy(record)
+
+
+def _record_count(config: GeneratorConfig, resource: str, distinct: int) -> int:
+    """
+    Records `_with_duplicates` emits for `distinct` inputs, duplicates included. Replays
+    its RNG, which draws exactly once per input record.
+    """
+    if not config.duplicate_rate:
+        return distinct
+    rng = _rng(config, f"{resource}:duplicates")
+    return distinct + sum(rng.random() < config.duplicate_rate for _ in range(distinct))
+
+
+def _changed_copy(record: dict[str, Any]) -> dict[str, Any]:
+    """Same key, different content, like an upstream re-send after an edit."""
+    copy = dict(record)
+    if "lastName" in copy:
+        copy["lastName"] = f"{copy['lastName']}-dup"
+    elif "title" in copy and "category" in copy:
+        copy["title"] = f"{copy['title']} (dup)"
+    else:
+        copy["discountedTotal"] = round(copy["discountedTotal"] * 0.9, 2)
+    return copy
+
+
+def _carts(
+    config: GeneratorConfig, products: list[dict[str, Any]], result: GeneratedSnapshot
+) -> Iterator[dict[str, Any]]:
+    """Carts `1..K` with skewed line counts and the configured bad lines, then counted."""
+    rng = _rng(config, "carts")
+    catalog_size = len(products)
+    carts = (_cart(rng, cart_id, config, products) for cart_id in range(1, config.carts + 1))
+    for cart in _with_duplicates(carts, config, result, "carts"):
+        # counted as emitted, a duplicate's bad lines are rejected while mapping too,
+        # and a line with both faults is rejected for its quantity first
+        for line in cart["products"]:
+            result.cart_lines += 1
+            if line["quantity"] == 0:
+                result.invalid_quantity_lines += 1
+            elif line["id"] > catalog_size:
+                result.unknown_product_lines += 1
+        yield cart
+
+
+def _cart(
+    rng: random.Random,
+    cart_id: int,
+    config: GeneratorConfig,
+    products: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """One cart, its totals consistent with its lines."""
+    line_count = 1
+    keep_going = 1.0 - 1.0 / config.mean_lines
+    while line_count < config.max_lines and rng.random() < keep_going:
+        line_count += 1
+
+    lines = []
+    for product in rng.sample(products, k=min(line_count, len(products))):
+        product_id, title, price = product["id"], product["title"], product["price"]
+        if config.unknown_product_rate and rng.random() < config.unknown_product_rate:
+            product_id = len(products) + rng.randint(1, len(products))  # past the catalog
+            title = f"Discontinued item {product_id}"
+        quantity = rng.randint(1, 5)
+        if config.reject_rate and rng.random() < config.reject_rate:
+            quantity = 0
+        total = round(price * quantity, 2)
+        discount_pct = product["discountPercentage"]
+        lines.append(
+            {
+                "id": product_id,
+                "title": title,
+                "price": price,
+                "quantity": quantity,
+                "total": total,
+                "discountPercentage": discount_pct,
+                "discountedTotal": round(total * (1 - discount_pct / 100), 2),
+            }
+        )
+
+    return {
+        "id": cart_id,
+        "userId": rng.randint(1, config.users),
+        "products": lines,
+        "total": round(sum(line["total"] for line in lines), 2),
+        "discountedTotal": round(sum(line["discountedTotal"] for line in lines), 2),
+        "totalProducts": len(lines),
+        "totalQuantity": sum(line["quantity"] for line in lines),
+    }
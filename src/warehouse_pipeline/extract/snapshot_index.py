@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import json
+import sys
+import zlib
+from array import array
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from itertools import groupby
+from pathlib import Path
+from typing import BinaryIO
+
+from warehouse_pipeline.extract.json_codec import loads
+
+INDEX_SUFFIX = ".idx"
+INDEX_FORMAT = "index/1"
+_FIELDS = ("id", "ts", "block_offset", "line")
+_READ_CHUNK_BYTES = 64 * 1024
+
+
+@dataclass(frozen=True)
+class SnapshotIndex:
+    """
+    Sidecar index over one `.ndjson.gz` file: per record its id, epoch-second
+    timestamp, the byte offset of the gzip member holding it and its line in there.
+
+    Stored as one JSON header line then little-endian int64s, four per record. The
+    header pins the data file's size and mtime, a rewritten file makes the index stale.
+    """
+
+    ids: array
+    ts: array
+    block_offsets: array
+    lines: array
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def select(self, low: float, high: float) -> list[tuple[int, int]]:
+        """`(block_offset, line)` of records with `low <= ts < high`, in file order."""
+        return [
+            (self.block_offsets[i], self.lines[i])
+            for i, ts in enumerate(self.ts)
+            if low <= ts < high
+        ]
+
+    @staticmethod
+    def write(path: Path, *, source: Path, entries: Sequence[tuple[int, int, int, int]]) -> Path:
+        """Write `entries` (`id, ts, block_offset, line`) for `source` atomically."""
+        stat = source.stat()
+        header = {
+            "format": INDEX_FORMAT,
+            "source": source.name,
+            "source_size": stat.st_size,
+            "source_mtime_ns": stat.st_mtime_ns,
+            "count": len(entries),
+            "fields": list(_FIELDS),
+        }
+        flat = array("q", (value for entry in entries for value in entry))
+        if sys.byteorder != "little":
+            flat.byteswap()
+        temp_path = path.with_name(path.name + ".tmp")
+        with temp_path.open("wb") as handle:
+            handle.write(json.dumps(header, sort_keys=True).encode("utf-8") + b"\n")
+            flat.tofile(handle)
+        temp_path.replace(path)
+        return path
+
+    @classmethod
+    def read(cls, path: Path, *, source: Path) -> SnapshotIndex | None:
+        """The index at `path`, `None` if it is missing or no longer matches `source`."""
+        try:
+            with path.open("rb") as handle:
+                header = loads(handle.readline())
+                body = handle.read()
+            stat = source.stat()
+        except FileNotFoundError:
+            return None
+        if not isinstance(header, dict) or header.get("format") != INDEX_FORMAT:
+            return None
+        if (header.get("source_size"), header.get("source_mtime_ns")) != (
+            stat.st_size,
+            stat.st_mtime_ns,
+        ):
+            return None  # data file rewritten since, fall back to a full read
+
+        flat = array("q")
+        flat.frombytes(body)
+        if sys.byteorder != "little":
+            flat.byteswap()
+        if len(flat) != 4 * header.get("count", -1):
+            return None
+        return cls(ids=flat[0::4], ts=flat[1::4], block_offsets=flat[2::4], lines=flat[3::4])
+
+
+def iter_selected_lines(
+    handle: BinaryIO, selected: Sequence[tuple[int, int]]
+) -> Iterator[tuple[bytes, int]]:
+    """
+    Each selected record's raw line and the compressed bytes read for it (nonzero once
+    per member). Only the gzip members holding a selected record are read.
+    """
+    for block_offset, group in groupby(selected, key=lambda entry: entry[0]):
+        member, consumed = read_member(handle, block_offset)
+        lines = member.split(b"\n")
+        for i, (_, line) in enumerate(group):
+            yield lines[line], consumed if i == 0 else 0
+
+
+def read_member(handle: BinaryIO, offset: int) -> tuple[bytes, int]:
+    """Decompress the one gzip member starting at `offset`, and how many bytes it took."""
+    handle.seek(offset)
+    decompressor = zlib.decompressobj(wbits=31)  # gzip framing, stops at the member end
+    out: list[bytes] = []
+    consumed = 0
+    while not decompressor.eof:
+        chunk = handle.read(_READ_CHUNK_BYTES)
+        if not chunk:
+            raise ValueError(f"gzip member at offset {offset} is truncated")
+        out.append(decompressor.decompress(chunk))
+        consumed += len(chunk) - len(decompressor.unused_data)
+    return b"".join(out), consumed
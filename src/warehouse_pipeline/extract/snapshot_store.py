@@ -1,27 +1,104 @@
 from __future__ import annotations
 
+import gzip
 import json
-from collections.abc import Mapping
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
+
+from warehouse_pipeline.extract.json_codec import loads
+from warehouse_pipeline.extract.object_store import OBJECTS_DIR_NAME, ObjectStore, chunk_lines
+from warehouse_pipeline.extract.snapshot_index import (
+    INDEX_SUFFIX,
+    SnapshotIndex,
+    iter_selected_lines,
+)
+
+SnapshotFormat = Literal["json", "ndjson", "sharded", "chunked"]
+
+NDJSON_SUFFIX = ".ndjson.gz"
+NDJSON_HEADER_FORMAT = "ndjson/1"
+SHARD_MANIFEST = "manifest.json"
+SHARDED_FORMAT = "sharded/1"
+CHUNKS_SUFFIX = ".chunks.json"
+CHUNKED_FORMAT = "chunks/1"
+DEFAULT_SHARD_SIZE = 100_000
+# records per gzip member, the unit an indexed read decompresses
+NDJSON_BLOCK_RECORDS = 1024
+
+IndexKey = Callable[[Mapping[str, Any]], tuple[int, int]]
 
 
 class SnapshotStore:
     """
     Read or write pinned extraction snapshots atomically.
 
+    A resource is either one `<name>.json` page, or `<name>.ndjson.gz`: a header line
+    with the page envelope followed by one record per line, gzip-compressed. Large ones
+    can be sharded, `<name>/part-0000.ndjson.gz`, ... listed in `<name>/manifest.json`.
+    Or chunked: `<name>.chunks.json` lists content-addressed chunks kept in an
+    `ObjectStore` next to the snapshot root, shared with the source's other keys.
+
     No staging logic here
     """
 
-    def __init__(self, root: Path) -> None:
-        """Hand class the root."""
+    def __init__(self, root: Path, *, objects_dir: Path | None = None) -> None:
+        """Hand class the root, chunk objects default to `<root>/../_objects`."""
         self.root = root
+        self.objects = ObjectStore(objects_dir or root.parent / OBJECTS_DIR_NAME)
 
     def path_for(self, name: str) -> Path:
         """Put the `.json` file in its expected place."""
         filename = name if name.endswith(".json") else f"{name}.json"
         return self.root / filename
 
+    def ndjson_path_for(self, name: str) -> Path:
+        """Put the `.ndjson.gz` file in its expected place."""
+        return self.root / f"{name}{NDJSON_SUFFIX}"
+
+    def index_path_for(self, name: str) -> Path:
+        """Put the sidecar index of `<name>.ndjson.gz` in its expected place."""
+        return self.root / f"{name}.ndjson{INDEX_SUFFIX}"
+
+    def chunks_path_for(self, name: str) -> Path:
+        """Put the chunk manifest of a chunked `name` in its expected place."""
+        return self.root / f"{name}{CHUNKS_SUFFIX}"
+
+    def shard_dir_for(self, name: str) -> Path:
+        """Where the shards of a sharded `name` live."""
+        return self.root / name
+
+    def format_for(self, name: str) -> SnapshotFormat:
+        """Which format `name` is stored in, `json` unless a manifest or `.ndjson.gz` exists."""
+        if (self.shard_dir_for(name) / SHARD_MANIFEST).exists():
+            return "sharded"
+        if self.chunks_path_for(name).exists():
+            return "chunked"
+        return "ndjson" if self.ndjson_path_for(name).exists() else "json"
+
+    def existing_path(self, name: str) -> Path:
+        """The file `name` is read from, whatever its format (the manifest when sharded)."""
+        snapshot_format = self.format_for(name)
+        if snapshot_format == "sharded":
+            return self.shard_dir_for(name) / SHARD_MANIFEST
+        if snapshot_format == "chunked":
+            return self.chunks_path_for(name)
+        if snapshot_format == "ndjson":
+            return self.ndjson_path_for(name)
+        return self.path_for(name)
+
+    def files_for(self, name: str) -> list[Path]:
+        """Every file `name` is stored in, in read order."""
+        snapshot_format = self.format_for(name)
+        if snapshot_format == "sharded":
+            return [self.existing_path(name), *self.shard_paths(name)]
+        if snapshot_format == "chunked":
+            chunks = self.read_chunk_manifest(name)["chunks"]
+            return [self.existing_path(name), *(self.objects.path_for(c["hash"]) for c in chunks)]
+        return [self.existing_path(name)]
+
     def write_json(self, name: str, payload: Mapping[str, Any]) -> Path:
         """
         Write a `.json` file automically to an expected path.
@@ -38,12 +115,314 @@ class SnapshotStore:
             encoding="utf-8",
         )
         temp_path.replace(final_path)
+        self._drop_other_formats(name, keep="json")
+        return final_path
+
+    def write_ndjson(
+        self,
+        name: str,
+        records: Iterable[Mapping[str, Any]],
+        *,
+        envelope: Mapping[str, Any],
+        index_key: IndexKey | None = None,
+    ) -> Path:
+        """
+        Stream `records` into `<name>.ndjson.gz` atomically, after a header line
+        holding `envelope` (`total`/`skip`/`limit`) and, at the end, the record count.
+        Returns the path it used as `final_path`.
+
+        Records go in gzip members of `NDJSON_BLOCK_RECORDS`, so with `index_key`
+        (record -> `(id, epoch ts)`) a sidecar index can point a reader at one member.
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        final_path = self.ndjson_path_for(name)
+        temp_path = final_path.with_name(final_path.name + ".tmp")
+        entries: list[tuple[int, int, int, int]] = []
+        count = 0
+        with temp_path.open("wb") as handle:
+            handle.write(_member([_ndjson_line({**envelope, "format": NDJSON_HEADER_FORMAT})]))
+            block: list[bytes] = []
+            for record in records:
+                if index_key is not None:
+                    # the open block is written at the current end of the file
+                    entries.append((*index_key(record), handle.tell(), len(block)))
+                block.append(_ndjson_line(record))
+                count += 1
+                if len(block) == NDJSON_BLOCK_RECORDS:
+                    handle.write(_member(block))
+                    block = []
+            if block:
+                handle.write(_member(block))
+            # trailer, so a reader can tell a complete file from a cut one
+            handle.write(_member([_ndjson_line({"format": NDJSON_HEADER_FORMAT, "count": count})]))
+        temp_path.replace(final_path)
+        self._drop_other_formats(name, keep="ndjson")
+        if index_key is not None:
+            SnapshotIndex.write(self.index_path_for(name), source=final_path, entries=entries)
+        return final_path
+
+    def write_sharded(
+        self,
+        name: str,
+        records: Iterable[Mapping[str, Any]],
+        *,
+        envelope: Mapping[str, Any],
+        shard_size: int = DEFAULT_SHARD_SIZE,
+        index_key: IndexKey | None = None,
+    ) -> Path:
+        """
+        Stream `records` into `<name>/part-NNNN.ndjson.gz` files of `shard_size` records,
+        then write `<name>/manifest.json` listing them. Returns the manifest path.
+        """
+        if shard_size < 1:
+            raise ValueError("`shard_size` must be >= 1")
+        shards = SnapshotStore(self.shard_dir_for(name))
+        records_iter = iter(records)
+        parts: list[dict[str, Any]] = []
+        while True:
+            chunk = list(islice(records_iter, shard_size))  # one shard in memory at a time
+            if not chunk and parts:
+                break
+            part = f"part-{len(parts):04d}"
+            shards.write_ndjson(part, chunk, envelope=envelope, index_key=index_key)
+            parts.append({"name": part, "count": len(chunk)})
+            if len(chunk) < shard_size:
+                break
+
+        # the manifest goes last, a reader never sees half the parts
+        manifest = {
+            **envelope,
+            "format": SHARDED_FORMAT,
+            "count": sum(p["count"] for p in parts),
+            "parts": parts,
+        }
+        final_path = shards.root / SHARD_MANIFEST
+        temp_path = final_path.with_suffix(".json.tmp")
+        temp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+        temp_path.replace(final_path)
+
+        listed = {shards.ndjson_path_for(p["name"]) for p in parts}
+        for stale in shards.root.glob(f"part-*{NDJSON_SUFFIX}"):
+            if stale not in listed:
+                stale.unlink()
+                shards.index_path_for(shard_name(stale)).unlink(missing_ok=True)
+        self._drop_other_formats(name, keep="sharded")
+        return final_path
+
+    def write_chunked(
+        self,
+        name: str,
+        records: Iterable[Mapping[str, Any]],
+        *,
+        envelope: Mapping[str, Any],
+    ) -> Path:
+        """
+        Stream `records` into content-addressed chunks, writing only chunks the object
+        store doesn't have yet, then `<name>.chunks.json` listing them in order.
+        Returns the manifest path.
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        chunks: list[dict[str, Any]] = []
+        for lines in chunk_lines(_ndjson_line(record) for record in records):
+            digest, _ = self.objects.put(lines)
+            chunks.append({"hash": digest, "count": len(lines)})
+
+        manifest = {
+            **envelope,
+            "format": CHUNKED_FORMAT,
+            "count": sum(c["count"] for c in chunks),
+            "chunks": chunks,
+        }
+        final_path = self.chunks_path_for(name)
+        temp_path = final_path.with_name(final_path.name + ".tmp")
+        temp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+        temp_path.replace(final_path)
+        self._drop_other_formats(name, keep="chunked")
         return final_path
 
+    def read_bytes(self, name: str) -> bytes:
+        """Raw `.json` file contents, for validating straight into page models."""
+        return self.path_for(name).read_bytes()
+
     def read_json(self, name: str) -> dict[str, Any]:
         """Read a `.json` file from an expected path. Returns its read `data`."""
         path = self.path_for(name)  # find path
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = loads(self.read_bytes(name))
         if not isinstance(data, dict):
             raise ValueError(f"Snapshot {path} is not a JSON object")
         return data
+
+    def read_ndjson_header(self, name: str) -> dict[str, Any]:
+        """The envelope line of `<name>.ndjson.gz`, without reading any records."""
+        path = self.ndjson_path_for(name)
+        with gzip.open(path, "rb") as handle:
+            return _header(handle.readline(), path=path)
+
+    def iter_ndjson_lines(self, name: str) -> Iterator[bytes]:
+        """
+        Each record of `<name>.ndjson.gz` as its raw JSON line, one at a time.
+        Raises `ValueError` if the file ends before its trailer.
+        """
+        path = self.ndjson_path_for(name)
+        with gzip.open(path, "rb") as handle:
+            _header(handle.readline(), path=path)
+            count = 0
+            pending: bytes | None = None
+            for line in handle:
+                if not line.strip():
+                    continue
+                if pending is not None:
+                    yield pending
+                    count += 1
+                pending = line
+            trailer = loads(pending) if pending is not None else None
+            if not (isinstance(trailer, dict) and trailer.get("format") == NDJSON_HEADER_FORMAT):
+                raise ValueError(f"Snapshot {path} is truncated, no trailer line")
+            if trailer.get("count") != count:
+                raise ValueError(
+                    f"Snapshot {path} has {count} records, its trailer says {trailer.get('count')}"
+                )
+
+    def iter_ndjson(self, name: str) -> Iterator[dict[str, Any]]:
+        """Each record of `<name>.ndjson.gz`, decoded."""
+        for line in self.iter_ndjson_lines(name):
+            yield loads(line)
+
+    def read_manifest(self, name: str) -> dict[str, Any]:
+        """The `manifest.json` of a sharded `name`."""
+        path = self.shard_dir_for(name) / SHARD_MANIFEST
+        manifest = loads(path.read_bytes())
+        if not (isinstance(manifest, dict) and manifest.get("format") == SHARDED_FORMAT):
+            raise ValueError(f"Snapshot {path} is not a {SHARDED_FORMAT} manifest")
+        return manifest
+
+    def read_chunk_manifest(self, name: str) -> dict[str, Any]:
+        """The `<name>.chunks.json` of a chunked `name`."""
+        path = self.chunks_path_for(name)
+        manifest = loads(path.read_bytes())
+        if not (isinstance(manifest, dict) and manifest.get("format") == CHUNKED_FORMAT):
+            raise ValueError(f"Snapshot {path} is not a {CHUNKED_FORMAT} manifest")
+        return manifest
+
+    def read_envelope(self, name: str) -> dict[str, Any]:
+        """`total`/`skip`/`limit` of `name`, read without its records where the format allows."""
+        snapshot_format = self.format_for(name)
+        if snapshot_format == "ndjson":
+            header = self.read_ndjson_header(name)
+        elif snapshot_format == "sharded":
+            header = self.read_manifest(name)
+        elif snapshot_format == "chunked":
+            header = self.read_chunk_manifest(name)
+        else:
+            header = self.read_json(name)
+        return {k: header[k] for k in ("total", "skip", "limit") if k in header}
+
+    def iter_record_lines(self, name: str) -> Iterator[bytes]:
+        """Each record of a line-based (`ndjson`, `sharded`, `chunked`) `name`, raw."""
+        snapshot_format = self.format_for(name)
+        if snapshot_format == "ndjson":
+            yield from self.iter_ndjson_lines(name)
+        elif snapshot_format == "sharded":
+            for path in self.shard_paths(name):
+                yield from SnapshotStore(path.parent).iter_ndjson_lines(shard_name(path))
+        elif snapshot_format == "chunked":
+            for chunk in self.read_chunk_manifest(name)["chunks"]:
+                lines = self.objects.read_lines(chunk["hash"])
+                if len(lines) != chunk["count"]:
+                    raise ValueError(f"Snapshot object {chunk['hash']} has the wrong record count")
+                yield from lines
+        else:
+            raise ValueError(f"Snapshot {self.path_for(name)} is one JSON page, not lines")
+
+    def shard_paths(self, name: str) -> list[Path]:
+        """The shard files of a sharded `name`, in manifest order."""
+        shards = SnapshotStore(self.shard_dir_for(name))
+        return [shards.ndjson_path_for(p["name"]) for p in self.read_manifest(name)["parts"]]
+
+    def read_window_lines(self, name: str, *, low: float, high: float) -> WindowRead | None:
+        """
+        Raw lines of the records indexed with `low <= ts < high`, in file order, read by
+        seeking to just the gzip members that hold them. `None` unless `name` is
+        `.ndjson.gz` (or sharded) with a fresh index for every file.
+        """
+        snapshot_format = self.format_for(name)
+        if snapshot_format in ("json", "chunked"):
+            return None
+        if snapshot_format == "ndjson":
+            files = [(self, name)]
+        else:
+            files = [
+                (SnapshotStore(path.parent), shard_name(path)) for path in self.shard_paths(name)
+            ]
+
+        indexes: list[tuple[Path, SnapshotIndex]] = []
+        for store, file_name in files:
+            data_path = store.ndjson_path_for(file_name)
+            index = SnapshotIndex.read(store.index_path_for(file_name), source=data_path)
+            if index is None:
+                return None
+            indexes.append((data_path, index))
+
+        result = WindowRead()
+        for data_path, index in indexes:
+            result.indexed += len(index)
+            selected = index.select(low, high)
+            if not selected:
+                continue  # a shard outside the window isn't opened at all
+            with data_path.open("rb") as handle:
+                for line, consumed in iter_selected_lines(handle, selected):
+                    result.lines.append(line)
+                    result.bytes_read += consumed
+        return result
+
+    def read_page(self, name: str) -> dict[str, Any]:
+        """`name` as one page-shaped dict (`{name: [...], total, ...}`) in any format."""
+        if self.format_for(name) == "json":
+            return self.read_json(name)
+        records = [loads(line) for line in self.iter_record_lines(name)]
+        return {**self.read_envelope(name), name: records}
+
+    def _drop_other_formats(self, name: str, *, keep: SnapshotFormat) -> None:
+        """One format per resource, so detection never has to pick between two."""
+        if keep != "json":
+            self.path_for(name).unlink(missing_ok=True)
+        if keep != "ndjson":
+            self.ndjson_path_for(name).unlink(missing_ok=True)
+        self.index_path_for(name).unlink(missing_ok=True)  # rewritten by the caller if wanted
+        if keep != "sharded":
+            (self.shard_dir_for(name) / SHARD_MANIFEST).unlink(missing_ok=True)
+        if keep != "chunked":
+            self.chunks_path_for(name).unlink(missing_ok=True)
+
+
+def shard_name(path: Path) -> str:
+    """`part-0000` for `.../part-0000.ndjson.gz`."""
+    return path.name.removesuffix(NDJSON_SUFFIX)
+
+
+@dataclass
+class WindowRead:
+    """What `read_window_lines` found, and how much it had to read."""
+
+    lines: list[bytes] = field(default_factory=list)
+    indexed: int = 0  # records across the indexes, i.e. before the window filter
+    bytes_read: int = 0  # compressed bytes of the members decompressed
+
+
+def _member(lines: list[bytes]) -> bytes:
+    """One gzip member, `mtime=0` so the same records always give the same bytes."""
+    return gzip.compress(b"".join(lines), compresslevel=6, mtime=0)
+
+
+def _ndjson_line(value: Mapping[str, Any]) -> bytes:
+    """One compact JSON line."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _header(line: bytes, *, path: Path) -> dict[str, Any]:
+    """Decode and check an `.ndjson.gz` header line."""
+    header = loads(line) if line.strip() else None
+    if not (isinstance(header, dict) and header.get("format") == NDJSON_HEADER_FORMAT):
+        raise ValueError(f"Snapshot {path} has no {NDJSON_HEADER_FORMAT} header line")
+    return header
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Literal, Protocol
+from typing import Any, Literal, Protocol, runtime_checkable
 
 from warehouse_pipeline.extract.bundles import ExtractBundle
+from warehouse_pipeline.extract.compact import CompactBundle
+from warehouse_pipeline.extract.models import DummyCart, DummyProduct, DummyUser
 from warehouse_pipeline.orchestration.extraction_window import ExtractionWindow
 
 BoundaryMode = Literal["inclusive", "exclusive"]
@@ -16,10 +19,37 @@ class PullResult:
     What one source pull returns to orchestration.
     """
 
-    bundle: ExtractBundle
+    bundle: ExtractBundle | CompactBundle
     meta: dict[str, Any]
 
 
+@dataclass
+class StreamedPull:
+    """
+    A source pull handed to stage mapping as lazy iterators instead of a bundle.
+
+    Only about one page per resource is in memory at a time. The counters
+    fill in as the iterators are consumed, so read them after mapping.
+    """
+
+    users: Iterator[DummyUser]
+    products: Iterator[DummyProduct]
+    carts: Iterator[DummyCart]
+    meta: dict[str, Any] = field(default_factory=dict)
+    counts: dict[str, int] = field(default_factory=dict)
+    totals: dict[str, int] = field(default_factory=dict)
+    pages_fetched: dict[str, int] = field(default_factory=dict)
+    client_stats: dict[str, Any] = field(default_factory=dict)
+    page_size: int | None = None
+    on_close: Callable[[], None] | None = None
+
+    def close(self) -> None:
+        """Release whatever the source holds open (HTTP sessions etc.)."""
+        if self.on_close is not None:
+            self.on_close()
+            self.on_close = None
+
+
 class SourceAdapter(Protocol):
     """
     Contract that every source system implements.
@@ -61,3 +91,27 @@ class SourceAdapter(Protocol):
         Fetch an incremental source pull for incremental mode.
         """
         ...
+
+
+@runtime_checkable
+class StreamingSourceAdapter(SourceAdapter, Protocol):
+    """
+    A source that can also hand its pull over page by page, for `--stream` runs.
+    """
+
+    def stream_full(self, *, page_size: int) -> StreamedPull:
+        """
+        Like `pull_full`, but yields records page by page for streamed staging.
+        """
+        ...
+
+    def stream_incremental(
+        self,
+        *,
+        page_size: int,
+        window: ExtractionWindow,
+    ) -> StreamedPull:
+        """
+        Like `pull_incremental`, but yields records page by page for streamed staging.
+        """
+        ...
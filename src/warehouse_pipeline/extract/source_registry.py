@@ -1,18 +1,58 @@
 from __future__ import annotations
 
+from pathlib import Path
+
+from warehouse_pipeline.extract.autotune import AutotuneConfig
+from warehouse_pipeline.extract.checkpoint import PageCheckpoint
+from warehouse_pipeline.extract.http_cache import DEFAULT_HTTP_CACHE_TTL_S
 from warehouse_pipeline.extract.source_contract import SourceAdapter
 from warehouse_pipeline.extract.sources.dummyjson_source import DummyJsonSource
 
 # later:
 # from warehouse_pipeline.extract.sources.square_orders_source import SquareOrdersSource
 
+# sources whose adapter is a `StreamingSourceAdapter`, i.e. can run with `--stream`
+STREAMING_SOURCE_SYSTEMS = frozenset({"dummyjson"})
+
+
+def supports_streaming(source_system: str) -> bool:
+    """Whether `source_system` can hand its pull over page by page."""
+    return source_system in STREAMING_SOURCE_SYSTEMS
+
 
-def get_source_adapter(source_system: str) -> SourceAdapter:
+def get_source_adapter(
+    source_system: str,
+    *,
+    concurrency: int = 1,
+    async_extract: bool = False,
+    rate_limit_per_s: float | None = 4.0,
+    burst: int = 1,
+    http_cache_dir: Path | None = None,
+    http_cache_ttl_s: float = DEFAULT_HTTP_CACHE_TTL_S,
+    hedge: bool = False,
+    circuit_breaker: bool = False,
+    autotune: AutotuneConfig | None = None,
+    checkpoint: PageCheckpoint | None = None,
+    compact: bool = False,
+) -> SourceAdapter:
     """
     Resolve one source adapter from the `source_system` name.
+    The keyword options tune live extraction where the source supports them.
     """
     if source_system == "dummyjson":
-        return DummyJsonSource()
+        return DummyJsonSource(
+            concurrency=concurrency,
+            async_extract=async_extract,
+            rate_limit_per_s=rate_limit_per_s,
+            burst=burst,
+            http_cache_dir=http_cache_dir,
+            http_cache_ttl_s=http_cache_ttl_s,
+            hedge=hedge,
+            circuit_breaker=circuit_breaker,
+            autotune=autotune,
+            checkpoint=checkpoint,
+            compact=compact,
+        )
 
     # future:
     # if source_system == "square_orders":
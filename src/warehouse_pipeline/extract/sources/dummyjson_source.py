@@ -1,10 +1,33 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterator
+from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
+from typing import Any
 
-from warehouse_pipeline.extract.bundles import fetch_live_bundle
+from warehouse_pipeline.extract.autotune import AutotuneConfig
+from warehouse_pipeline.extract.bundles import (
+    ExtractBundle,
+    LivePage,
+    LiveResource,
+    fetch_live_bundle,
+    fetch_live_bundle_async,
+    fetch_live_compact_bundle,
+    fetch_live_compact_bundle_async,
+    iter_live_pages,
+    live_page_items,
+)
+from warehouse_pipeline.extract.checkpoint import PageCheckpoint
+from warehouse_pipeline.extract.compact import CompactBundle
+from warehouse_pipeline.extract.dummyjson_client import DummyJsonClient
 from warehouse_pipeline.extract.filters import filter_bundle_to_window
-from warehouse_pipeline.extract.source_contract import PullResult
+from warehouse_pipeline.extract.http_cache import DEFAULT_HTTP_CACHE_TTL_S, ResponseCache
+from warehouse_pipeline.extract.models import DummyCart
+from warehouse_pipeline.extract.rate_limiter import TokenBucketRateLimiter
+from warehouse_pipeline.extract.resilience import CircuitBreaker, HedgePolicy
+from warehouse_pipeline.extract.source_contract import PullResult, StreamedPull
 from warehouse_pipeline.orchestration.extraction_window import ExtractionWindow
 from warehouse_pipeline.stage.derive_fields import (
     derive_order_ts,
@@ -12,6 +35,7 @@ from warehouse_pipeline.stage.derive_fields import (
 )
 
 
+@dataclass
 class DummyJsonSource:
     """
     (DummyJson does not expose a real updated_at/create_time cursor for carts.)
@@ -20,7 +44,19 @@ class DummyJsonSource:
     - incremental mode is a full pull with a client-side filter on derived order_ts
     """
 
-    source_system = "dummyjson"
+    concurrency: int = 1  # page fetch workers per resource
+    async_extract: bool = False  # fetch users/products/carts at the same time
+    rate_limit_per_s: float | None = 4.0  # shared request budget, `None` = unpaced
+    burst: int = 1
+    http_cache_dir: Path | None = None  # conditional-request response cache, off when `None`
+    http_cache_ttl_s: float = DEFAULT_HTTP_CACHE_TTL_S
+    hedge: bool = False  # race a duplicate request against pages in the latency tail
+    circuit_breaker: bool = False  # fail fast once upstream keeps erroring
+    autotune: AutotuneConfig | None = None  # tune page size/concurrency per resource
+    checkpoint: PageCheckpoint | None = None  # persist pages as they arrive, for `--resume`
+    compact: bool = False  # dump each page into columns as it arrives, no models kept
+
+    source_system: str = "dummyjson"
 
     def validate_watermark_column(self, watermark_column: str) -> None:
         """Synthetic time derivation means `watermark_colunm` can only be `order_ts`."""
@@ -45,16 +81,196 @@ class DummyJsonSource:
 
     def pull_full(self, *, page_size: int) -> PullResult:
         """Pull all at once for `DummyJson`."""
-        bundle = fetch_live_bundle(page_size=page_size)
+        bundle = self._fetch_bundle(page_size=page_size)
         return PullResult(
             bundle=bundle,
             meta={
                 "source_system": self.source_system,
                 "native_incremental": False,
                 "selection_strategy": "full_pull",
+                "concurrency": self.concurrency,
+                "async_extract": self.async_extract,
+                **self._autotune_meta(),
             },
         )
 
+    def _fetch_bundle(self, *, page_size: int) -> ExtractBundle | CompactBundle:
+        """
+        One full live pull, over the async client when `async_extract` is set.
+        Every request in the pull shares one token bucket.
+        Autotuning always runs on the threaded path, it needs its own fetch waves.
+        With `compact` the bundle comes back as columns, built page by page.
+        """
+        limiter = self._rate_limiter()
+        cache = self._response_cache()
+        if self.async_extract and self.autotune is None:
+            fetch_async = (
+                fetch_live_compact_bundle_async if self.compact else fetch_live_bundle_async
+            )
+            return asyncio.run(
+                fetch_async(
+                    page_size=page_size,
+                    concurrency=self.concurrency,
+                    rate_limiter=limiter,
+                    response_cache=cache,
+                    hedge=self._hedge_policy(),
+                    circuit_breaker=self._circuit_breaker(),
+                    checkpoint=self.checkpoint,
+                )
+            )
+        fetch = fetch_live_compact_bundle if self.compact else fetch_live_bundle
+        return fetch(
+            page_size=page_size,
+            concurrency=self.concurrency,
+            rate_limiter=limiter,
+            response_cache=cache,
+            hedge=self._hedge_policy(),
+            circuit_breaker=self._circuit_breaker(),
+            autotune=self.autotune,
+            checkpoint=self.checkpoint,
+        )
+
+    def _autotune_meta(self) -> dict[str, Any]:
+        """Whether this pull autotuned, and which run seeded it."""
+        if self.autotune is None:
+            return {"autotune": False}
+        return {"autotune": True, "autotune_seeded_from": self.autotune.seeded_from}
+
+    def _rate_limiter(self) -> TokenBucketRateLimiter:
+        """A fresh token bucket shared by every request of one pull."""
+        return TokenBucketRateLimiter(rate_per_s=self.rate_limit_per_s, burst=self.burst)
+
+    def _hedge_policy(self) -> HedgePolicy | None:
+        """Fresh hedging latencies and counters for this pull."""
+        return HedgePolicy() if self.hedge else None
+
+    def _circuit_breaker(self) -> CircuitBreaker | None:
+        """A closed breaker for this pull."""
+        return CircuitBreaker() if self.circuit_breaker else None
+
+    def _response_cache(self) -> ResponseCache | None:
+        """The on-disk response cache, with fresh counters for this pull."""
+        if self.http_cache_dir is None:
+            return None
+        return ResponseCache(self.http_cache_dir, ttl_s=self.http_cache_ttl_s)
+
+    def iter_pages(
+        self,
+        resource: LiveResource,
+        *,
+        page_size: int,
+        client: DummyJsonClient,
+    ) -> Iterator[LivePage]:
+        """Yield one resource's validated pages as they arrive, prefetching the next."""
+        return iter_live_pages(
+            resource,
+            client=client,
+            page_size=page_size,
+            prefetch=1,
+            checkpoint=self.checkpoint,
+        )
+
+    def iter_items(
+        self,
+        resource: LiveResource,
+        *,
+        page_size: int,
+        client: DummyJsonClient,
+        pull: StreamedPull | None = None,
+    ) -> Iterator[Any]:
+        """
+        Yield one resource's validated records page by page, capped at `total`.
+        Page and record counters are kept on `pull` when one is given.
+        """
+        yielded = 0
+        for page in self.iter_pages(resource, page_size=page_size, client=client):
+            remaining = max(page.total - yielded, 0)
+            page_items = live_page_items(resource, page)[:remaining]
+            yielded += len(page_items)
+            if pull is not None:
+                pull.totals[resource] = page.total
+                pull.pages_fetched[resource] = pull.pages_fetched.get(resource, 0) + 1
+                pull.counts[resource] = yielded
+            yield from page_items
+
+    def stream_full(self, *, page_size: int) -> StreamedPull:
+        """Full live pull as page-by-page iterators, sharing one client and token bucket."""
+        return self._stream(
+            page_size=page_size,
+            meta={
+                "source_system": self.source_system,
+                "native_incremental": False,
+                "selection_strategy": "full_pull",
+                "streamed": True,
+            },
+        )
+
+    def stream_incremental(
+        self,
+        *,
+        page_size: int,
+        window: ExtractionWindow,
+    ) -> StreamedPull:
+        """
+        Streamed version of `pull_incremental`, carts are filtered on derived
+        `order_ts` as they stream past.
+        """
+        self.validate_watermark_column(window.watermark_column)
+
+        pull = self._stream(
+            page_size=page_size,
+            meta={
+                "source_system": self.source_system,
+                "native_incremental": False,
+                "selection_strategy": "full_pull_plus_client_side_filter",
+                "streamed": True,
+                **_window_meta(window),
+            },
+        )
+        all_carts = pull.carts
+
+        def carts_in_window() -> Iterator[DummyCart]:
+            """Keep carts where `low <= order_ts < high`, counting both sides."""
+            kept = 0
+            for cart in all_carts:
+                ts = derive_order_ts(cart_id=cart.id, user_id=cart.userId)
+                if window.low <= ts < window.high:
+                    kept += 1
+                    yield cart
+            pull.meta["carts_pre_filter"] = pull.counts.get("carts", 0)
+            pull.meta["carts_post_filter"] = kept
+
+        pull.carts = carts_in_window()
+        return pull
+
+    def _stream(self, *, page_size: int, meta: dict[str, Any]) -> StreamedPull:
+        """Open one client and wire up the three lazy resource iterators."""
+        client = DummyJsonClient(
+            rate_limiter=self._rate_limiter(),
+            response_cache=self._response_cache(),
+            hedge=self._hedge_policy(),
+            circuit_breaker=self._circuit_breaker(),
+            pool_size=2,  # the page being mapped and the one prefetched
+        )
+        pull = StreamedPull(
+            users=iter(()),
+            products=iter(()),
+            carts=iter(()),
+            meta=meta,
+            page_size=page_size,
+        )
+        pull.users = self.iter_items("users", page_size=page_size, client=client, pull=pull)
+        pull.products = self.iter_items("products", page_size=page_size, client=client, pull=pull)
+        pull.carts = self.iter_items("carts", page_size=page_size, client=client, pull=pull)
+
+        def close() -> None:
+            """Keep the final counters, then drop the HTTP session."""
+            pull.client_stats.update(client.stats())
+            client.close()
+
+        pull.on_close = close
+        return pull
+
     def pull_incremental(
         self,
         *,
@@ -67,10 +283,12 @@ class DummyJsonSource:
         """
         self.validate_watermark_column(window.watermark_column)
 
-        full_bundle = fetch_live_bundle(page_size=page_size)
+        full_bundle = self._fetch_bundle(page_size=page_size)
 
         def _cart_ts(cart):
-            """Base it off of parsed carts."""
+            """Base it off of parsed carts, or their dumped columns in a compact bundle."""
+            if isinstance(cart, dict):
+                return derive_order_ts(cart_id=cart["id"], user_id=cart["userId"])
             return derive_order_ts(cart_id=cart.id, user_id=cart.userId)
 
         filtered_bundle, carts_pre_filter = filter_bundle_to_window(
@@ -85,21 +303,29 @@ class DummyJsonSource:
                 "source_system": self.source_system,
                 "native_incremental": False,
                 "selection_strategy": "full_pull_plus_client_side_filter",
-                "watermark_column": window.watermark_column,
-                "low": window.low.isoformat(),
-                "high": window.high.isoformat(),
-                "prior_watermark": (
-                    window.prior_watermark.isoformat()
-                    if window.prior_watermark is not None
-                    else None
-                ),
-                "overlap_applied_s": window.overlap.total_seconds(),
-                "is_first_run": window.is_first_run,
+                "concurrency": self.concurrency,
+                "async_extract": self.async_extract,
+                **self._autotune_meta(),
+                **_window_meta(window),
                 "carts_pre_filter": carts_pre_filter,
                 "carts_post_filter": len(filtered_bundle.carts),
             },
         )
 
 
+def _window_meta(window: ExtractionWindow) -> dict[str, Any]:
+    """The extraction window as it is echoed into pull metadata."""
+    return {
+        "watermark_column": window.watermark_column,
+        "low": window.low.isoformat(),
+        "high": window.high.isoformat(),
+        "prior_watermark": (
+            window.prior_watermark.isoformat() if window.prior_watermark is not None else None
+        ),
+        "overlap_applied_s": window.overlap.total_seconds(),
+        "is_first_run": window.is_first_run,
+    }
+
+
 # this mock only exists for DummyJson.
 # remove once removing DummyJson as a source.
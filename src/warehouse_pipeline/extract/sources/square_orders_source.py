@@ -9,6 +9,7 @@ import httpx
 
 from warehouse_pipeline.extract.bundles import ExtractBundle
 from warehouse_pipeline.extract.source_contract import PullResult
+from warehouse_pipeline.extract.transport import accept_encoding, shared_transport
 from warehouse_pipeline.orchestration.extraction_window import ExtractionWindow
 
 
@@ -72,7 +73,7 @@ class SquareOrdersSource:
     ) -> PullResult:
         self.validate_watermark_column(window.watermark_column)
 
-        orders = self._search_orders_window(
+        orders, client_stats = self._search_orders_window(
             watermark_column=window.watermark_column,
             low=window.low,
             high=window.high,
@@ -96,6 +97,7 @@ class SquareOrdersSource:
             pages_fetched={},
             page_size=page_size,
             source_paths={},
+            client_stats=client_stats,
         )
 
         return PullResult(
@@ -122,11 +124,13 @@ class SquareOrdersSource:
         low: datetime,
         high: datetime,
         page_size: int,
-    ) -> list[dict[str, Any]]:
-        """Search orders window, ."""
+    ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """Search orders window, and the client stats of the requests it took."""
 
         out: list[dict[str, Any]] = []
         cursor: str | None = None
+        requests = 0
+        bytes_received = 0
 
         body = self._base_search_body(
             watermark_column=watermark_column,
@@ -135,10 +139,14 @@ class SquareOrdersSource:
             page_size=page_size,
         )
 
+        # the session is per call, the pooled connections behind it are not
+        transport = shared_transport(pool_size=1)
         with httpx.Client(
             base_url=self.base_url.rstrip("/"),
             timeout=30.0,
+            transport=transport,
             headers={
+                "Accept-Encoding": accept_encoding(),
                 "Authorization": f"Bearer {self.access_token}",
                 "Square-Version": self.square_version,
                 "Content-Type": "application/json",
@@ -152,6 +160,8 @@ class SquareOrdersSource:
                     request_body["cursor"] = cursor
 
                 resp = client.post("/v2/orders/search", json=request_body)
+                requests += 1
+                bytes_received += len(resp.content)
                 resp.raise_for_status()
 
                 payload = resp.json()
@@ -162,7 +172,12 @@ class SquareOrdersSource:
                 if not cursor:
                     break
 
-        return out
+        client_stats = {
+            "requests": requests,
+            "bytes_received": bytes_received,
+            "transport": transport.counters.stats(),
+        }
+        return out, client_stats
 
     def _base_search_body(
         self,
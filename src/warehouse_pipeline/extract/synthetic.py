@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import random
+from typing import Any
+
+_FIRST_NAMES = ("Ada", "Grace", "Alan", "Edsger", "Barbara", "Donald", "Frances", "Ken")
+_LAST_NAMES = ("Lovelace", "Hopper", "Turing", "Dijkstra", "Liskov", "Knuth", "Allen", "Thompson")
+_COUNTRIES = ("United States", "United Kingdom", "Canada", "Germany", "Japan", "Brazil")
+_CATEGORIES = ("groceries", "beauty", "fragrances", "furniture", "laptops", "smartphones")
+
+
+def synthetic_payloads(
+    *,
+    users: int = 200,
+    products: int = 200,
+    carts: int = 50,
+    seed: int = 0,
+) -> dict[str, dict[str, Any]]:
+    """
+    Deterministic `DummyJSON`-shaped payloads, one `{resource, total, skip, limit}` per resource.
+
+    Records carry the same kind of bulk as upstream (images, reviews, bank details)
+    so projection and payload size behave like the real API. Carts only reference
+    users and products that exist, and their totals add up.
+    """
+    rng = random.Random(seed)
+
+    user_rows = [synthetic_user(rng, user_id) for user_id in range(1, users + 1)]
+    product_rows = [synthetic_product(rng, product_id) for product_id in range(1, products + 1)]
+    cart_rows = [
+        _cart(rng, cart_id, user_count=users, products=product_rows)
+        for cart_id in range(1, carts + 1)
+    ]
+
+    return {
+        "users": _envelope("users", user_rows),
+        "products": _envelope("products", product_rows),
+        "carts": _envelope("carts", cart_rows),
+    }
+
+
+def _envelope(resource: str, rows: list[dict[str, Any]]) -> dict[str, Any]:
+    """One whole resource as a single page, the snapshot layout."""
+    return {resource: rows, "total": len(rows), "skip": 0, "limit": len(rows)}
+
+
+def synthetic_user(rng: random.Random, user_id: int) -> dict[str, Any]:
+    """One user, with upstream-style extras the extract model ignores."""
+    first = rng.choice(_FIRST_NAMES)
+    last = rng.choice(_LAST_NAMES)
+    return {
+        "id": user_id,
+        "firstName": first,
+        "lastName": last,
+        "email": f"{first.lower()}.{last.lower()}{user_id}@example.com",
+        "phone": f"+1 555-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+        "birthDate": f"{rng.randint(1950, 2005)}-{rng.randint(1, 12)}-{rng.randint(1, 28)}",
+        "address": {
+            "address": f"{rng.randint(1, 9999)} Main Street",
+            "city": f"City {rng.randint(1, 50)}",
+            "country": rng.choice(_COUNTRIES),
+            "postalCode": f"{rng.randint(10000, 99999)}",
+        },
+        "company": {"name": f"{last} & Co", "title": "Engineer"},
+        "image": f"https://dummyjson.com/icon/user{user_id}/128",
+        "bank": {
+            "cardNumber": "".join(str(rng.randint(0, 9)) for _ in range(16)),
+            "cardType": "Visa",
+            "currency": "USD",
+            "iban": "GB" + "".join(str(rng.randint(0, 9)) for _ in range(20)),
+        },
+        "userAgent": "Mozilla/5.0 (X11; Linux x86_64) synthetic",
+    }
+
+
+def synthetic_product(rng: random.Random, product_id: int) -> dict[str, Any]:
+    """One product, with images and reviews like upstream."""
+    category = rng.choice(_CATEGORIES)
+    return {
+        "id": product_id,
+        "title": f"{category.title()} item {product_id}",
+        "description": "Synthetic product for offline runs. " * 3,
+        "category": category,
+        "price": round(rng.uniform(1, 500), 2),
+        "discountPercentage": round(rng.uniform(0, 25), 2),
+        "rating": round(rng.uniform(1, 5), 2),
+        "stock": rng.randint(0, 250),
+        "brand": f"Brand {rng.randint(1, 40)}",
+        "images": [f"https://cdn.dummyjson.com/p/{product_id}/{i}.webp" for i in range(3)],
+        "thumbnail": f"https://cdn.dummyjson.com/p/{product_id}/thumbnail.webp",
+        "reviews": [
+            {
+                "rating": rng.randint(1, 5),
+                "comment": "Works as described.",
+                "reviewerName": rng.choice(_FIRST_NAMES),
+            }
+            for _ in range(3)
+        ],
+    }
+
+
+def _cart(
+    rng: random.Random,
+    cart_id: int,
+    *,
+    user_count: int,
+    products: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """One cart of known products, its totals consistent with its lines."""
+    lines = []
+    for product in rng.sample(products, k=min(len(products), rng.randint(1, 5))):
+        quantity = rng.randint(1, 5)
+        total = round(product["price"] * quantity, 2)
+        discount_pct = product["discountPercentage"]
+        lines.append(
+            {
+                "id": product["id"],
+                "title": product["title"],
+                "price": product["price"],
+                "quantity": quantity,
+                "total": total,
+                "discountPercentage": discount_pct,
+                "discountedTotal": round(total * (1 - discount_pct / 100), 2),
+                "thumbnail": product["thumbnail"],
+            }
+        )
+
+    return {
+        "id": cart_id,
+        "userId": rng.randint(1, max(user_count, 1)),
+        "products": lines,
+        "total": round(sum(line["total"] for line in lines), 2),
+        "discountedTotal": round(sum(line["discountedTotal"] for line in lines), 2),
+        "totalProducts": len(lines),
+        "totalQuantity": sum(line["quantity"] for line in lines),
+    }
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import importlib.util
+import threading
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+import httpx
+
+# optional extras, `pip install "warehouse-pipeline[http]"`
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+BROTLI_AVAILABLE = (
+    importlib.util.find_spec("brotli") is not None
+    or importlib.util.find_spec("brotlicffi") is not None
+)
+ZSTD_AVAILABLE = importlib.util.find_spec("zstandard") is not None
+
+KEEPALIVE_EXPIRY_S = 30.0
+
+
+def accept_encoding() -> str:
+    """Every body encoding `httpx` can decode here, best first."""
+    encodings = []
+    if ZSTD_AVAILABLE:
+        encodings.append("zstd")
+    if BROTLI_AVAILABLE:
+        encodings.append("br")
+    encodings += ["gzip", "deflate"]
+    return ", ".join(encodings)
+
+
+def pool_limits(pool_size: int) -> httpx.Limits:
+    """
+    Keep-alive pool for `pool_size` requests in flight, with headroom for
+    hedged duplicates and a request or two that outlives its caller.
+    """
+    pool_size = max(pool_size, 1)
+    return httpx.Limits(
+        max_connections=max(2 * pool_size, 4),
+        max_keepalive_connections=max(pool_size, 2),
+        keepalive_expiry=KEEPALIVE_EXPIRY_S,
+    )
+
+
+class TransportCounters:
+    """What one client sent over a pooled transport. Safe to share between threads."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._connections_opened = 0
+        self._bytes_on_wire = 0
+        self._http_versions: dict[str, int] = {}
+
+    def note_request(self) -> None:
+        """Count one request handed to the pool."""
+        with self._lock:
+            self._requests += 1
+
+    def note_event(self, event_name: str) -> None:
+        """`httpcore` trace hook, a finished TCP connect means the pool had nothing idle."""
+        if event_name == "connection.connect_tcp.complete":
+            with self._lock:
+                self._connections_opened += 1
+
+    def note_response(self, response: httpx.Response) -> None:
+        """Count the HTTP version a response came back over."""
+        version = response.extensions.get("http_version", b"HTTP/1.1")
+        name = version.decode("ascii") if isinstance(version, bytes) else str(version)
+        with self._lock:
+            self._http_versions[name] = self._http_versions.get(name, 0) + 1
+
+    def add_bytes(self, n: int) -> None:
+        """Count `n` raw body bytes read off the wire."""
+        with self._lock:
+            self._bytes_on_wire += n
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for the run manifest, `bytes_on_wire` is before decompression."""
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "connections_opened": self._connections_opened,
+                "connections_reused": max(self._requests - self._connections_opened, 0),
+                "bytes_on_wire": self._bytes_on_wire,
+                "http_versions": dict(self._http_versions),
+                "http2_available": HTTP2_AVAILABLE,
+                "accept_encoding": accept_encoding(),
+            }
+
+
+class _CountingStream(httpx.SyncByteStream):
+    """Raw (still encoded) body chunks, counted as they are read."""
+
+    def __init__(self, inner: httpx.SyncByteStream, counters: TransportCounters) -> None:
+        self._inner = inner
+        self._counters = counters
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._inner:
+            self._counters.add_bytes(len(chunk))
+            yield chunk
+
+    def close(self) -> None:
+        self._inner.close()
+
+
+class _AsyncCountingStream(httpx.AsyncByteStream):
+    """Async version of `_CountingStream`."""
+
+    def __init__(self, inner: httpx.AsyncByteStream, counters: TransportCounters) -> None:
+        self._inner = inner
+        self._counters = counters
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._inner:
+            self._counters.add_bytes(len(chunk))
+            yield chunk
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+class SharedTransport(httpx.BaseTransport):
+    """
+    One client's view of a pooled `httpx.HTTPTransport`.
+
+    Counts requests, new connections and wire bytes for this client only.
+    Closing it leaves the pool open for the next client, unless it owns the pool.
+    """
+
+    def __init__(self, pool: httpx.HTTPTransport, *, owns_pool: bool = False) -> None:
+        self._pool = pool
+        self._owns_pool = owns_pool
+        self.counters = TransportCounters()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send through the pool, counting the request, its connection and its body bytes."""
+        counters = self.counters
+        counters.note_request()
+
+        def trace(event_name: str, info: dict[str, Any]) -> None:
+            counters.note_event(event_name)
+
+        request.extensions = {**request.extensions, "trace": trace}
+        response = self._pool.handle_request(request)
+        counters.note_response(response)
+        assert isinstance(response.stream, httpx.SyncByteStream)
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_CountingStream(response.stream, counters),
+            extensions=response.extensions,
+            request=request,
+        )
+
+    def close(self) -> None:
+        if self._owns_pool:
+            self._pool.close()
+
+
+class AsyncSharedTransport(httpx.AsyncBaseTransport):
+    """Async version of `SharedTransport`."""
+
+    def __init__(self, pool: httpx.AsyncHTTPTransport, *, owns_pool: bool = False) -> None:
+        self._pool = pool
+        self._owns_pool = owns_pool
+        self.counters = TransportCounters()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Async version of `SharedTransport.handle_request`."""
+        counters = self.counters
+        counters.note_request()
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            counters.note_event(event_name)
+
+        request.extensions = {**request.extensions, "trace": trace}
+        response = await self._pool.handle_async_request(request)
+        counters.note_response(response)
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_AsyncCountingStream(response.stream, counters),
+            extensions=response.extensions,
+            request=request,
+        )
+
+    async def aclose(self) -> None:
+        if self._owns_pool:
+            await self._pool.aclose()
+
+
+_POOLS: dict[int, httpx.HTTPTransport] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def shared_transport(*, pool_size: int = 1) -> SharedTransport:
+    """
+    A counting view of the process-wide pool for `pool_size`, so connections
+    are kept alive across resources, clients and runs in one process.
+    """
+    with _POOLS_LOCK:
+        pool = _POOLS.get(pool_size)
+        if pool is None:
+            pool = httpx.HTTPTransport(http2=HTTP2_AVAILABLE, limits=pool_limits(pool_size))
+            _POOLS[pool_size] = pool
+    return SharedTransport(pool)
+
+
+def async_transport(*, pool_size: int = 1) -> AsyncSharedTransport:
+    """
+    A pooled async transport for one client.
+    Async connections belong to one event loop, so these are not shared process-wide.
+    """
+    pool = httpx.AsyncHTTPTransport(http2=HTTP2_AVAILABLE, limits=pool_limits(pool_size))
+    return AsyncSharedTransport(pool, owns_pool=True)
+
+
+def close_shared_transports() -> None:
+    """Close every process-wide pool, the next client opens fresh connections."""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
@@ -6,7 +6,10 @@ from pathlib import Path
 from typing import Any, Literal
 from uuid import UUID
 
+from warehouse_pipeline.db.bulk import DEFAULT_COPY_THRESHOLD
+from warehouse_pipeline.db.direct_load import DEFAULT_DIRECT_LOAD_MAX_ROWS
 from warehouse_pipeline.extract.bundles import snapshot_root_for_key
+from warehouse_pipeline.extract.http_cache import DEFAULT_HTTP_CACHE_TTL_S
 from warehouse_pipeline.transform.sql_plan import TransformStep
 
 RunStatus = Literal["succeeded", "failed"]
@@ -29,6 +32,26 @@ class RunSpec:
     snapshot_root: Path | None = None  # where snapshot
     runs_root: Path = Path("runs")  # where runs
     page_size: int = 100
+    concurrency: int = 1  # live page fetch workers per resource
+    async_extract: bool = False  # live resources fetched at the same time over asyncio
+    rate_limit_per_s: float | None = 4.0  # shared live request budget, `None` = unpaced
+    burst: int = 1  # requests allowed back-to-back before pacing kicks in
+    stream_extract: bool = False  # map live pages as they arrive, no full bundle held
+    http_cache: bool = False  # revalidate live pages against `<runs_root>/_http_cache`
+    http_cache_ttl_s: float = DEFAULT_HTTP_CACHE_TTL_S
+    hedge: bool = False  # duplicate live requests stuck in the latency tail
+    circuit_breaker: bool = False  # stop a live pull early when upstream keeps failing
+    autotune: bool = False  # tune live page size/concurrency, seeded from the last run
+    autotune_error_budget: float = 0.05  # share of retried requests a fetch wave may have
+    resume_run_id: str | None = None  # reuse the pages a failed live run checkpointed
+    fused_carts: bool = False  # snapshot carts validated and mapped in one pass
+    compact_bundle: bool = False  # hold extracted records as columns, not pydantic models
+    snapshot_cache: bool = False  # reuse the validated bundle while the snapshot bytes match
+    snapshot_workers: int = 1  # processes validating a sharded snapshot's parts
+    replay_snapshot: bool = False  # incremental runs read their window out of the snapshot
+    copy_threshold: int = DEFAULT_COPY_THRESHOLD  # rejects/dq rows per write that switch to COPY
+    stage_workers: int = 1  # connections loading independent staging tables at once
+    direct_load_max_rows: int = DEFAULT_DIRECT_LOAD_MAX_ROWS  # rows per table deduped in memory
     git_sha: str | None = None
     transform_step: TransformStep = "build_all"  # `build_all` |
     publish_views: bool = True
@@ -40,14 +63,27 @@ class RunSpec:
     until: datetime | None = None  # explicit high-watermark override
     overlap_window: timedelta = field(default_factory=lambda: DEFAULT_INCREMENTAL_OVERLAP_WINDOW)
 
+    def __post_init__(self) -> None:
+        if self.resume_run_id is not None and self.autotune:
+            # autotuned page sizes move, so the checkpointed `(skip, limit)` pages never match
+            raise ValueError("`--resume` needs a fixed `--page-size`, not `--autotune`")
+
+    def resolved_http_cache_dir(self) -> Path | None:
+        """Where live responses are cached, `None` when the cache is off."""
+        if not self.http_cache:
+            return None
+        return self.runs_root.resolve() / "_http_cache"
+
     def resolved_snapshot_root(self) -> Path:
         """If doing `snapshot` mode, its snapshot root."""
-        if self.mode != "snapshot":
-            raise ValueError("`resolved_snapshot_root()` is only valid for snapshot runs")
+        if self.mode != "snapshot" and not self.replay_snapshot:
+            raise ValueError(
+                "`resolved_snapshot_root()` is only valid for snapshot runs and snapshot replays"
+            )
         if self.snapshot_root is not None:
             return self.snapshot_root.resolve()
         if not self.snapshot_key:
-            raise ValueError("`snapshot_key` is required when mode='snapshot'")
+            raise ValueError("`snapshot_key` is required to read a snapshot")
         return snapshot_root_for_key(self.snapshot_key)
 
 
@@ -78,3 +114,5 @@ class RunManifest:
     error_message: str | None = None
 
     extraction_window: dict[str, Any] = field(default_factory=dict)
+    # process high-water RSS (MiB) as each phase finished, `None` where unmeasurable
+    peak_rss_mb: dict[str, float | None] = field(default_factory=dict)
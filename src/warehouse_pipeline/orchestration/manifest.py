@@ -40,6 +40,40 @@ def manifest_to_dict(manifest: RunManifest) -> dict[str, Any]:
     return _jsonable(asdict(manifest))
 
 
+def latest_autotune_seeds(
+    runs_root: Path, *, source_system: str
+) -> tuple[str | None, dict[str, dict[str, int]]]:
+    """
+    Per resource `page_size`/`concurrency` the most recent succeeded autotuned run chose.
+    Returns that run's id (or `None`) and the seeds, empty when no run qualifies.
+    """
+    best: tuple[str, str, dict[str, Any]] | None = None  # finished_at, run_id, autotune
+    for path in runs_root.resolve().glob("*/manifest.json"):
+        try:
+            manifest = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue  # half written or foreign, skip
+
+        autotune = (manifest.get("extract") or {}).get("autotune")
+        if (
+            manifest.get("status") != "succeeded"
+            or manifest.get("source_system") != source_system
+            or not autotune
+        ):
+            continue
+        finished_at = str(manifest.get("finished_at", ""))
+        if best is None or finished_at > best[0]:
+            best = (finished_at, str(manifest.get("run_id")), autotune)
+
+    if best is None:
+        return None, {}
+    seeds = {
+        resource: {"page_size": int(r["page_size"]), "concurrency": int(r["concurrency"])}
+        for resource, r in best[2].items()
+    }
+    return best[1], seeds
+
+
 def write_manifest(*, run_dir: Path, manifest: RunManifest) -> Path:
     """
     Writes `runs/<run_id>/manifest.json` to the provided `run_dir`.
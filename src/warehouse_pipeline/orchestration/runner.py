@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import sys
+from collections.abc import Iterable, Mapping
 from dataclasses import asdict
 from datetime import UTC, datetime
 from pathlib import Path
@@ -21,21 +23,32 @@ from warehouse_pipeline.db.run_ledger import (
 )
 from warehouse_pipeline.dq.gates import GateDecision, evaluate_stage_gates
 from warehouse_pipeline.dq.runner import DQRunSummary, run_stage_dq
-from warehouse_pipeline.extract import read_snapshot_bundle
+from warehouse_pipeline.extract import read_compact_snapshot_bundle, read_snapshot_bundle
+from warehouse_pipeline.extract.autotune import AutotuneConfig
 from warehouse_pipeline.extract.bundles import ExtractBundle
-from warehouse_pipeline.extract.source_registry import get_source_adapter
+from warehouse_pipeline.extract.checkpoint import PageCheckpoint
+from warehouse_pipeline.extract.compact import CompactBundle, compact_bundle
+from warehouse_pipeline.extract.models import DummyCart, DummyProduct, DummyUser
+from warehouse_pipeline.extract.source_contract import (
+    SourceAdapter,
+    StreamedPull,
+    StreamingSourceAdapter,
+)
+from warehouse_pipeline.extract.source_registry import get_source_adapter, supports_streaming
 from warehouse_pipeline.orchestration.contract import RunManifest, RunSpec
 from warehouse_pipeline.orchestration.extraction_window import (
     ExtractionWindow,
     resolve_extraction_window,
 )
 from warehouse_pipeline.orchestration.logging import RunLogger
-from warehouse_pipeline.orchestration.manifest import write_manifest
+from warehouse_pipeline.orchestration.manifest import latest_autotune_seeds, write_manifest
 from warehouse_pipeline.publish.views import PublishResult, apply_views
-from warehouse_pipeline.stage.load import load_mapped_batches
-from warehouse_pipeline.stage.map_carts import map_carts
-from warehouse_pipeline.stage.map_products import map_products
-from warehouse_pipeline.stage.map_users import map_users
+from warehouse_pipeline.stage import MappedCarts, MappedProducts, MappedUsers
+from warehouse_pipeline.stage.load import load_mapped_batches, recover_prepared_loads
+from warehouse_pipeline.stage.map_carts import map_cart_payloads, map_carts
+from warehouse_pipeline.stage.map_carts_fused import map_raw_carts
+from warehouse_pipeline.stage.map_products import map_product_payloads, map_products
+from warehouse_pipeline.stage.map_users import map_user_payloads, map_users
 from warehouse_pipeline.transform.warehouse_build import WarehouseBuildResult, build_warehouse
 
 
@@ -62,12 +75,45 @@ def _run_artifacts_dir(spec: RunSpec, run_id: UUID) -> Path:
     return spec.runs_root.resolve() / str(run_id)
 
 
+def _source_adapter(spec: RunSpec, *, checkpoint: PageCheckpoint | None = None) -> SourceAdapter:
+    """Resolve the source adapter for this run, configured from the `RunSpec`."""
+    return get_source_adapter(
+        spec.source_system,
+        concurrency=spec.concurrency,
+        async_extract=spec.async_extract,
+        rate_limit_per_s=spec.rate_limit_per_s,
+        burst=spec.burst,
+        http_cache_dir=spec.resolved_http_cache_dir(),
+        http_cache_ttl_s=spec.http_cache_ttl_s,
+        hedge=spec.hedge,
+        circuit_breaker=spec.circuit_breaker,
+        autotune=_autotune_config(spec),
+        checkpoint=checkpoint,
+        compact=spec.compact_bundle,
+    )
+
+
+def _autotune_config(spec: RunSpec) -> AutotuneConfig | None:
+    """Autotune bounds for this run, starting from what the last autotuned run chose."""
+    if not spec.autotune:
+        return None
+    seeded_from, seeds = latest_autotune_seeds(spec.runs_root, source_system=spec.source_system)
+    return AutotuneConfig(
+        page_size=spec.page_size,
+        concurrency=spec.concurrency,
+        max_concurrency=max(8, spec.concurrency),
+        error_budget=spec.autotune_error_budget,
+        seeds=seeds,
+        seeded_from=seeded_from,
+    )
+
+
 def _default_incremental_high(spec: RunSpec, *, started_at: datetime) -> datetime | None:
     """
     Pick a sane fallback high watermark when the source does not expose a real
     upstream timestamp cursor (DummyJson does not).
     """
-    adapter = get_source_adapter(spec.source_system)
+    adapter = _source_adapter(spec)
     return adapter.default_high_watermark(
         watermark_column=spec.watermark_column,
         run_started_at=started_at,
@@ -86,7 +132,7 @@ def _resolve_and_record_window(
     Compute the extraction window for an incremental run,
     stamp it onto run_ledger, and log it.
     """
-    adapter = get_source_adapter(spec.source_system)
+    adapter = _source_adapter(spec)
     adapter.validate_watermark_column(spec.watermark_column)
 
     prior = get_last_successful_watermark(
@@ -161,18 +207,23 @@ def _extract_bundle(
     spec: RunSpec,
     *,
     window: ExtractionWindow | None = None,
-) -> tuple[ExtractBundle, dict[str, Any]]:
-    """Extractions of any mode's expectaions."""
-    adapter = get_source_adapter(spec.source_system)
+    checkpoint: PageCheckpoint | None = None,
+) -> tuple[ExtractBundle | CompactBundle, dict[str, Any]]:
+    """Extractions of any mode's expectaions, as columns already with `compact_bundle`."""
+    adapter = _source_adapter(spec, checkpoint=checkpoint)
 
     # snapshot path
     if spec.mode == "snapshot":
         snapshot_root = spec.resolved_snapshot_root()
-        bundle = read_snapshot_bundle(
+        read = read_compact_snapshot_bundle if _columnar_snapshot(spec) else read_snapshot_bundle
+        bundle = read(
             snapshot_root=snapshot_root,
             snapshot_key=spec.snapshot_key,
+            fused_carts=spec.fused_carts,
+            use_cache=spec.snapshot_cache,
+            workers=spec.snapshot_workers,
         )
-        return bundle, {}
+        return bundle, ({"snapshot_cache": bundle.snapshot_cache} if bundle.snapshot_cache else {})
 
     # live mode path
     if spec.mode == "live":
@@ -181,12 +232,151 @@ def _extract_bundle(
 
     # incremental client side filter
     assert window is not None, "incremental mode requires a resolved window"
+    if spec.replay_snapshot:
+        adapter.validate_watermark_column(window.watermark_column)
+        return _replay_snapshot_window(spec, window=window)
     result = adapter.pull_incremental(page_size=spec.page_size, window=window)
     return result.bundle, result.meta
 
 
+def _columnar_snapshot(spec: RunSpec) -> bool:
+    """
+    Snapshot reads build columns with `--compact-bundle`, and with `--snapshot-workers`
+    above 1, the shard pool only hands columns back to the parent.
+    """
+    return spec.compact_bundle or spec.snapshot_workers > 1
+
+
+def _replay_snapshot_window(
+    spec: RunSpec, *, window: ExtractionWindow
+) -> tuple[ExtractBundle | CompactBundle, dict[str, Any]]:
+    """Incremental window read out of the pinned snapshot, seeking via its carts index."""
+    read = read_compact_snapshot_bundle if _columnar_snapshot(spec) else read_snapshot_bundle
+    bundle = read(
+        snapshot_root=spec.resolved_snapshot_root(),
+        snapshot_key=spec.snapshot_key,
+        fused_carts=spec.fused_carts,
+        use_cache=spec.snapshot_cache,
+        workers=spec.snapshot_workers,
+        carts_between=(window.low, window.high),
+    )
+    indexed = bundle.window_read.get("strategy") == "index"
+    return bundle, {
+        "source_system": spec.source_system,
+        "native_incremental": False,
+        "selection_strategy": (
+            "snapshot_sidecar_index" if indexed else "snapshot_scan_plus_client_side_filter"
+        ),
+        **({"bytes_read": bundle.window_read["bytes_read"]} if indexed else {}),
+        "carts_pre_filter": bundle.totals["carts_pre_filter"],
+        "carts_post_filter": bundle.totals["carts"],
+    }
+
+
+def _stream_pull(
+    spec: RunSpec,
+    *,
+    window: ExtractionWindow | None = None,
+    checkpoint: PageCheckpoint | None = None,
+) -> StreamedPull:
+    """Open a streamed live or incremental pull, records arrive page by page."""
+    adapter = _source_adapter(spec, checkpoint=checkpoint)
+    if not isinstance(adapter, StreamingSourceAdapter):
+        raise ValueError(f"source_system={spec.source_system!r} does not support `--stream`")
+    if spec.mode == "live":
+        return adapter.stream_full(page_size=spec.page_size)
+
+    assert window is not None, "incremental mode requires a resolved window"
+    return adapter.stream_incremental(page_size=spec.page_size, window=window)
+
+
+def _map_to_stage(
+    users: Iterable[DummyUser],
+    products: Iterable[DummyProduct],
+    carts: Iterable[DummyCart],
+    *,
+    raw_carts: Iterable[Mapping[str, Any]] = (),
+) -> tuple[MappedUsers, MappedProducts, MappedCarts]:
+    """
+    Map extracted records into stage rows.
+    Users and products go first since carts are enriched from their lookups.
+    Carts still in `raw_carts` go through the fused validator/mapper instead.
+    """
+    mapped_users = map_users(users)
+    mapped_products = map_products(products)
+    if raw_carts:
+        mapped_carts = map_raw_carts(
+            raw_carts,
+            product_lookup=mapped_products.product_lookup,
+            user_lookup=mapped_users.user_lookup,
+        )
+    else:
+        mapped_carts = map_carts(
+            carts,
+            product_lookup=mapped_products.product_lookup,
+            user_lookup=mapped_users.user_lookup,
+        )
+    return mapped_users, mapped_products, mapped_carts
+
+
+def _map_bundle_to_stage(
+    bundle: ExtractBundle | CompactBundle,
+) -> tuple[MappedUsers, MappedProducts, MappedCarts]:
+    """
+    Map a whole bundle. A compact bundle goes through the payload mappers and
+    is emptied as soon as they are done with it.
+    """
+    if isinstance(bundle, ExtractBundle):
+        return _map_to_stage(
+            bundle.users, bundle.products, bundle.carts, raw_carts=bundle.raw_carts
+        )
+
+    mapped_users = map_user_payloads(bundle.users)
+    mapped_products = map_product_payloads(bundle.products)
+    lookups = {
+        "product_lookup": mapped_products.product_lookup,
+        "user_lookup": mapped_users.user_lookup,
+    }
+    if bundle.raw_carts:
+        mapped_carts = map_raw_carts(bundle.raw_carts, **lookups)
+    else:
+        mapped_carts = map_cart_payloads(bundle.carts, **lookups)
+    bundle.release()
+    return mapped_users, mapped_products, mapped_carts
+
+
+def _peak_rss_mb() -> float | None:
+    """Process high-water RSS so far in MiB, `None` where `resource` is missing (Windows)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # KiB on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _open_checkpoint(spec: RunSpec, *, run_dir: Path) -> PageCheckpoint | None:
+    """
+    Page checkpoint for a live or incremental pull, under `<run_dir>/extract`.
+    With `resume_run_id` it starts with that run's completed pages.
+    """
+    if spec.mode == "snapshot":
+        return None
+    root = run_dir / "extract"
+    page_size = None if spec.autotune else spec.page_size  # autotuned pages vary in size
+    if spec.resume_run_id is None:
+        return PageCheckpoint(root, page_size=page_size)
+    return PageCheckpoint.resume(
+        root,
+        from_root=spec.runs_root.resolve() / spec.resume_run_id / "extract",
+        resumed_from=spec.resume_run_id,
+        page_size=page_size,
+    )
+
+
 def _summarize_extract(
-    bundle: ExtractBundle, *, mode_override: str | None = None
+    bundle: ExtractBundle | CompactBundle, *, mode_override: str | None = None
 ) -> dict[str, Any]:
     """Summarizes extraction results and return its `dict`."""
     return {
@@ -195,15 +385,39 @@ def _summarize_extract(
         "counts": {
             "users": len(bundle.users),
             "products": len(bundle.products),
-            "carts": len(bundle.carts),
+            "carts": len(bundle.carts) + len(bundle.raw_carts),
         },
         "totals": dict(bundle.totals),
         "pages_fetched": dict(bundle.pages_fetched),
         "page_size": bundle.page_size,
         "source_paths": dict(bundle.source_paths),
+        "client_stats": dict(bundle.client_stats),
+        **({"autotune": dict(bundle.autotune)} if bundle.autotune else {}),
     }
 
 
+def _summarize_streamed_extract(pull: StreamedPull, *, mode: str) -> dict[str, Any]:
+    """Same shape as `_summarize_extract`, read off a fully consumed `StreamedPull`."""
+    summary: dict[str, Any] = {
+        "mode": mode,
+        "snapshot_key": None,
+        "streamed": True,
+        "counts": {name: pull.counts.get(name, 0) for name in ("users", "products", "carts")},
+        "totals": dict(pull.totals),
+        "pages_fetched": dict(pull.pages_fetched),
+        "page_size": pull.page_size,
+        "source_paths": {},
+        "client_stats": dict(pull.client_stats),
+    }
+    if pull.meta:
+        summary["source"] = dict(pull.meta)
+    if "carts_post_filter" in pull.meta:
+        # filtered in flight, report what made it through like a filtered bundle does
+        summary["counts"]["carts"] = pull.meta["carts_post_filter"]
+        summary["totals"]["carts_pre_filter"] = pull.meta["carts_pre_filter"]
+    return summary
+
+
 def _summarize_extraction_window(window: ExtractionWindow | None) -> dict[str, Any]:
     """Summarize orchestration-owned extraction window metadata."""
     if window is None:
@@ -234,6 +448,7 @@ def _summarize_dq(summaries: tuple[DQRunSummary, ...]) -> dict[str, Any]:
             "metrics_written": summary.metrics_written,
             "failed_metrics": summary.failed_metrics,
             "passed": summary.passed,
+            "write_s": summary.write_s,
         }
         for summary in summaries
     }
@@ -284,9 +499,14 @@ def run_pipeline(spec: RunSpec, *, database_url: str | None = None) -> RunManife
     - mark final `run_ledger` status and commit that
     - end run.
     """
+    # refused before a ledger row exists, rather than failing mid-run
+    if spec.stream_extract and not supports_streaming(spec.source_system):
+        raise ValueError(f"source_system={spec.source_system!r} does not support `--stream`")
+
     started_at = _utcnow()
     finished_at = started_at
     timings_s: dict[str, float] = {}
+    peak_rss_mb: dict[str, float | None] = {}  # high-water mark as each phase ends
 
     # collect summaries
     extract_summary: dict[str, Any] = {}
@@ -299,6 +519,10 @@ def run_pipeline(spec: RunSpec, *, database_url: str | None = None) -> RunManife
     status = "failed"
 
     with connect(database_url) as conn:
+        # a parallel load that a crash left prepared holds locks on its run's partitions
+        # (and on shared tables like `reject_rows`), finish it before this run does anything
+        recovered = recover_prepared_loads(conn)
+
         # Connect to initalize the run ledger before anything else
         # keeps it commited even after rollback if error
         run_id = create_run(
@@ -312,6 +536,26 @@ def run_pipeline(spec: RunSpec, *, database_url: str | None = None) -> RunManife
                     "mode": spec.mode,
                     "snapshot_key": spec.snapshot_key,
                     "page_size": spec.page_size,
+                    "concurrency": spec.concurrency,
+                    "async_extract": spec.async_extract,
+                    "rate_limit_per_s": spec.rate_limit_per_s,
+                    "burst": spec.burst,
+                    "stream_extract": spec.stream_extract,
+                    "http_cache": spec.http_cache,
+                    "http_cache_ttl_s": spec.http_cache_ttl_s,
+                    "hedge": spec.hedge,
+                    "circuit_breaker": spec.circuit_breaker,
+                    "autotune": spec.autotune,
+                    "autotune_error_budget": spec.autotune_error_budget,
+                    "resume_run_id": spec.resume_run_id,
+                    "fused_carts": spec.fused_carts,
+                    "compact_bundle": spec.compact_bundle,
+                    "snapshot_cache": spec.snapshot_cache,
+                    "snapshot_workers": spec.snapshot_workers,
+                    "replay_snapshot": spec.replay_snapshot,
+                    "copy_threshold": spec.copy_threshold,
+                    "stage_workers": spec.stage_workers,
+                    "direct_load_max_rows": spec.direct_load_max_rows,
                     "transform_step": spec.transform_step,
                     **dict(spec.args_json),
                 },
@@ -324,13 +568,18 @@ def run_pipeline(spec: RunSpec, *, database_url: str | None = None) -> RunManife
         logger = RunLogger(run_id=run_id, log_path=run_dir / "logs.jsonl")
 
         logger.event("run_started", mode=spec.mode, source_system=spec.source_system)
+        if recovered.committed or recovered.rolled_back:
+            logger.event("prepared_loads_recovered", **recovered.to_dict())
+        checkpoint: PageCheckpoint | None = None
+        # set before anything in `try` can raise, the failure path reports them
+        window: ExtractionWindow | None = None
+        extraction_window_summary: dict[str, Any] = {}
+        source_meta: dict[str, Any] = {}
 
         try:
-            ## -- extraction window for incremental mode
-            window: ExtractionWindow | None = None
-            extraction_window_summary: dict[str, Any] = {}
-            source_meta: dict[str, Any] = {}
+            checkpoint = _open_checkpoint(spec, run_dir=run_dir)
 
+            ## -- extraction window for incremental mode
             if spec.mode == "incremental":
                 window = _resolve_and_record_window(
                     conn,
@@ -341,39 +590,64 @@ def run_pipeline(spec: RunSpec, *, database_url: str | None = None) -> RunManife
                 )
                 extraction_window_summary = _summarize_extraction_window(window)
 
-            ## -- extraction
-            t0 = perf_counter()
-            logger.phase_started("extract")
-            bundle, source_meta = _extract_bundle(spec, window=window)
-            extract_summary = _summarize_extract(bundle, mode_override=spec.mode)
-            if source_meta:
-                extract_summary["source"] = source_meta
-            timings_s["extract"] = perf_counter() - t0
-            logger.phase_finished(
-                "extract",
-                duration_s=timings_s["extract"],
-                counts=extract_summary["counts"],
-            )
+            if spec.stream_extract and spec.mode != "snapshot" and not spec.replay_snapshot:
+                ## -- streamed extraction, mapped page by page as it arrives
+                t0 = perf_counter()
+                logger.phase_started("extract_map")
+                pull = _stream_pull(spec, window=window, checkpoint=checkpoint)
+                try:
+                    mapped_users, mapped_products, mapped_carts = _map_to_stage(
+                        pull.users, pull.products, pull.carts
+                    )
+                finally:
+                    pull.close()
+                extract_summary = _summarize_streamed_extract(pull, mode=spec.mode)
+                timings_s["extract_map"] = perf_counter() - t0
+                peak_rss_mb["extract_map"] = _peak_rss_mb()
+                logger.phase_finished(
+                    "extract_map",
+                    duration_s=timings_s["extract_map"],
+                    counts=extract_summary["counts"],
+                    customer_rows=len(mapped_users.rows),
+                    product_rows=len(mapped_products.rows),
+                    order_rows=len(mapped_carts.order_rows),
+                    order_item_rows=len(mapped_carts.order_item_rows),
+                )
+            else:
+                ## -- extraction
+                t0 = perf_counter()
+                logger.phase_started("extract")
+                bundle, source_meta = _extract_bundle(spec, window=window, checkpoint=checkpoint)
+                if spec.compact_bundle and isinstance(bundle, ExtractBundle):
+                    # a source that can't build columns as it pulls, convert after
+                    bundle = compact_bundle(bundle)
+                extract_summary = _summarize_extract(bundle, mode_override=spec.mode)
+                extract_summary["compact"] = isinstance(bundle, CompactBundle)
+                if source_meta:
+                    extract_summary["source"] = source_meta
+                timings_s["extract"] = perf_counter() - t0
+                peak_rss_mb["extract"] = _peak_rss_mb()
+                logger.phase_finished(
+                    "extract",
+                    duration_s=timings_s["extract"],
+                    counts=extract_summary["counts"],
+                )
 
-            ## -- map obtained to staging
-            t0 = perf_counter()
-            logger.phase_started("stage_map")
-            mapped_users = map_users(bundle.users)
-            mapped_products = map_products(bundle.products)
-            mapped_carts = map_carts(
-                bundle.carts,
-                product_lookup=mapped_products.product_lookup,
-                user_lookup=mapped_users.user_lookup,
-            )
-            timings_s["stage_map"] = perf_counter() - t0
-            logger.phase_finished(
-                "stage_map",
-                duration_s=timings_s["stage_map"],
-                customer_rows=len(mapped_users.rows),
-                product_rows=len(mapped_products.rows),
-                order_rows=len(mapped_carts.order_rows),
-                order_item_rows=len(mapped_carts.order_item_rows),
-            )
+                ## -- map obtained to staging
+                t0 = perf_counter()
+                logger.phase_started("stage_map")
+                mapped_users, mapped_products, mapped_carts = _map_bundle_to_stage(bundle)
+                del bundle  # nothing downstream reads extract objects
+                timings_s["stage_map"] = perf_counter() - t0
+                peak_rss_mb["stage_map"] = _peak_rss_mb()
+                logger.phase_finished(
+                    "stage_map",
+                    duration_s=timings_s["stage_map"],
+                    customer_rows=len(mapped_users.rows),
+                    product_rows=len(mapped_products.rows),
+                    order_rows=len(mapped_carts.order_rows),
+                    order_item_rows=len(mapped_carts.order_item_rows),
+                )
 
             ## -- staging
             t0 = perf_counter()
@@ -384,10 +658,15 @@ def run_pipeline(spec: RunSpec, *, database_url: str | None = None) -> RunManife
                 users=mapped_users,
                 products=mapped_products,
                 carts=mapped_carts,
+                copy_threshold=spec.copy_threshold,
+                direct_load_max_rows=spec.direct_load_max_rows,
+                workers=spec.stage_workers,
+                database_url=database_url,
             )
-            conn.commit()  # commit staged tables.
+            conn.commit()  # commit staged tables (parallel loads have committed their own).
             stage_summary = _summarize_stage(stage_results)
             timings_s["stage_load"] = perf_counter() - t0
+            peak_rss_mb["stage_load"] = _peak_rss_mb()
             logger.phase_finished(
                 "stage_load", duration_s=timings_s["stage_load"], tables=list(stage_summary)
             )
@@ -467,6 +746,12 @@ def run_pipeline(spec: RunSpec, *, database_url: str | None = None) -> RunManife
             status = "failed"
             logger.event("run_failed")
 
+        if checkpoint is not None:
+            # a failed run keeps its pages so `--resume <run_id>` can pick them up
+            if status == "succeeded":
+                checkpoint.discard_pages()
+            extract_summary["checkpoint"] = checkpoint.stats()
+
         manifest = RunManifest(
             run_id=run_id,
             mode=spec.mode,
@@ -483,6 +768,7 @@ def run_pipeline(spec: RunSpec, *, database_url: str | None = None) -> RunManife
             transform=transform_summary,
             publish=publish_summary,
             timings_s={k: round(v, 6) for k, v in timings_s.items()},
+            peak_rss_mb={**peak_rss_mb, "run": _peak_rss_mb()},
             artifacts={
                 "run_dir": str(run_dir),
                 "manifest": str(run_dir / "manifest.json"),
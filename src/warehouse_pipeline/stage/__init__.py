@@ -90,6 +90,9 @@ class StageTableLoadResult:
     inserted_count: int
     duplicate_reject_count: int
     explicit_reject_count: int
+    reject_write: str | None = None  # `copy` or `executemany`, `None` with no explicit rejects
+    reject_write_s: float = 0.0
+    dedup: str = "sql"  # `memory` when loaded straight into `stg_*`, else the work table
 
 
 __all__ = [
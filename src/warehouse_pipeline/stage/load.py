@@ -2,18 +2,34 @@ from __future__ import annotations
 
 from collections import defaultdict
 from collections.abc import Iterable, Sequence
-from typing import cast
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime, timedelta
+from time import perf_counter
+from typing import Any, cast
 from uuid import UUID
 
+import psycopg
 from psycopg import Connection
 
+from warehouse_pipeline.db.bulk import DEFAULT_COPY_THRESHOLD, bulk_write_method
+from warehouse_pipeline.db.connect import connect
+from warehouse_pipeline.db.direct_load import (
+    DEFAULT_DIRECT_LOAD_MAX_ROWS,
+    load_staging_direct,
+    supports_direct_load,
+)
 from warehouse_pipeline.db.work_tables import (
     WorkRow,
+    drop_work_table,
     flush_work_table,
     insert_work_rows,
     prepare_work_table,
+    run_work_table_name,
 )
 from warehouse_pipeline.db.writers.rejects import RejectInsert, insert_reject_rows
+from warehouse_pipeline.db.writers.staging import get_staging_spec
 from warehouse_pipeline.stage import (
     MappedCarts,
     MappedProducts,
@@ -31,6 +47,18 @@ _TABLE_LOAD_ORDER = (
     "stg_order_items",
 )
 
+# gtrid of every branch of one parallel load, then the run's id
+_LOAD_GTRID_PREFIX = "stage_load:"
+# bqual prefixes, then the branch's first table. The decision branch prepares and commits last.
+_DECISION_BRANCH = "decision:"
+_PART_BRANCH = "part:"
+# a prepared load of a still `running` run younger than this may be mid-commit
+DEFAULT_IN_FLIGHT_GRACE = timedelta(minutes=10)
+
+# tables that must load after, and on the same connection as, the ones listed. The
+# `stg_*` tables have no foreign keys between them, so every table has its own lane.
+_TABLE_DEPENDENCIES: dict[str, tuple[str, ...]] = {}
+
 
 def _as_work_rows(rows: Sequence[StageRow]) -> list[WorkRow]:
     """Valid work row."""
@@ -64,53 +92,328 @@ def load_stage_rows(
     run_id: UUID,
     rows: Iterable[StageRow],
     rejects: Iterable[StageReject] = (),
+    copy_threshold: int = DEFAULT_COPY_THRESHOLD,
+    direct_load_max_rows: int = DEFAULT_DIRECT_LOAD_MAX_ROWS,
 ) -> dict[str, StageTableLoadResult]:
     """
     Load mapped stage rows into Postgres work tables and flush into `stg_*`.
 
+    Each table's explicit rejects are written with it, through `COPY` from
+    `copy_threshold` rejects up, and the method and time land in its result.
+
     This function does not commit, transaction scope stays with the
     orchestration layer.
     """
+    rows_by_table, rejects_by_table = _group_by_table(rows, rejects)
+
+    results: dict[str, StageTableLoadResult] = {}
+    for table_name in _tables_to_load(rows_by_table, rejects_by_table):
+        results[table_name] = _load_table(
+            conn,
+            table_name=table_name,
+            run_id=run_id,
+            table_rows=rows_by_table.get(table_name, []),
+            table_rejects=rejects_by_table.get(table_name, []),
+            copy_threshold=copy_threshold,
+            direct_load_max_rows=direct_load_max_rows,
+        )
+
+    return results
+
+
+def load_stage_rows_parallel(
+    database_url: str | None,
+    *,
+    run_id: UUID,
+    rows: Iterable[StageRow],
+    rejects: Iterable[StageReject] = (),
+    copy_threshold: int = DEFAULT_COPY_THRESHOLD,
+    direct_load_max_rows: int = DEFAULT_DIRECT_LOAD_MAX_ROWS,
+    workers: int = 4,
+    two_phase: bool | None = None,
+) -> dict[str, StageTableLoadResult]:
+    """
+    Same as `load_stage_rows`, with independent tables loading at once on their own
+    connections (up to `workers` of them). Unlike `load_stage_rows` it commits.
+
+    It stays all-or-nothing. With two-phase commit, each connection `PREPARE`s its
+    transaction, and all of them are committed only once every one has prepared.
+    The first connection's branch is the decision: it prepares after every other one
+    and commits after them, so `recover_prepared_loads` can finish a load a crash cut
+    short. `two_phase=None` uses it when the server allows prepared transactions.
+    Without it, each connection waits with its transaction open and all commit once
+    every table has loaded. In that case, a crash between those few commits is the one
+    moment a part can land alone.
+    """
+    rows_by_table, rejects_by_table = _group_by_table(rows, rejects)
+    lanes = _load_lanes(_tables_to_load(rows_by_table, rejects_by_table))
+    if not lanes:
+        return {}
+    slots = min(max(workers, 1), len(lanes))
+    groups = [[t for lane in lanes[i::slots] for t in lane] for i in range(slots)]
+
+    connections: list[Connection] = []
+    committing = False
+    try:
+        for _ in groups:
+            connections.append(connect(database_url))
+        if two_phase is None:
+            two_phase = _allows_prepared_transactions(connections[0])
+        if two_phase:
+            for i, (conn, group) in enumerate(zip(connections, groups, strict=True)):
+                branch = (_DECISION_BRANCH if i == 0 else _PART_BRANCH) + group[0]
+                conn.tpc_begin(conn.xid(0, f"{_LOAD_GTRID_PREFIX}{run_id}", branch))
+
+        def load_group(
+            conn: Connection, group: list[str], *, prepare: bool
+        ) -> dict[str, StageTableLoadResult]:
+            """One connection's tables in load order, prepared at the end if asked to."""
+            results = {
+                table_name: _load_table(
+                    conn,
+                    table_name=table_name,
+                    run_id=run_id,
+                    table_rows=rows_by_table.get(table_name, []),
+                    table_rejects=rejects_by_table.get(table_name, []),
+                    copy_threshold=copy_threshold,
+                    direct_load_max_rows=direct_load_max_rows,
+                    two_phase=bool(two_phase),
+                )
+                for table_name in group
+            }
+            if prepare:
+                conn.tpc_prepare()
+            return results
+
+        with ThreadPoolExecutor(max_workers=slots, thread_name_prefix="stage-load") as pool:
+            futures = [
+                pool.submit(load_group, conn, group, prepare=two_phase and i > 0)
+                for i, (conn, group) in enumerate(zip(connections, groups, strict=True))
+            ]
+            loaded = [future.result() for future in futures]
+
+        if two_phase:
+            # the decision: while this branch is prepared every branch is, and it only
+            # commits once every other one has
+            connections[0].tpc_prepare()
+        # only now does anything commit. A prepared transaction left by a failure past
+        # here is committed by `recover_prepared_loads`, not rolled back.
+        committing = True
+        for conn in [*connections[1:], connections[0]]:
+            if two_phase:
+                conn.tpc_commit()
+            else:
+                conn.commit()
+    except BaseException:
+        if not committing:
+            for conn in connections:
+                _abandon(conn, two_phase=bool(two_phase))
+        raise
+    finally:
+        for conn in connections:
+            conn.close()
+
+    merged = {table_name: result for group in loaded for table_name, result in group.items()}
+    return {t: merged[t] for t in _tables_to_load(rows_by_table, rejects_by_table)}
+
+
+@dataclass(frozen=True)
+class PreparedLoadRecovery:
+    """What `recover_prepared_loads` did with each parallel load's leftover branches."""
+
+    committed: list[str] = field(default_factory=list)  # gtrids
+    rolled_back: list[str] = field(default_factory=list)
+    in_flight: list[str] = field(default_factory=list)  # left alone
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-friendly view for the CLI."""
+        return asdict(self)
+
+
+def recover_prepared_loads(
+    conn: Connection, *, in_flight_grace: timedelta = DEFAULT_IN_FLIGHT_GRACE
+) -> PreparedLoadRecovery:
+    """
+    Finish the `load_stage_rows_parallel` two-phase loads a crash left prepared, in this
+    database. A load whose decision branch is still prepared had every branch prepared
+    and may have committed some, so the rest are committed. Without it, nothing has
+    committed and the rest are rolled back. A run still `running` in the ledger whose
+    branches prepared under `in_flight_grace` ago may be committing right now, it is
+    left alone. Call it outside a transaction.
+    """
+    database = conn.info.dbname
+    by_gtrid: dict[str, list[psycopg.Xid]] = defaultdict(list)
+    for xid in conn.tpc_recover():
+        if xid.database == database and xid.gtrid.startswith(_LOAD_GTRID_PREFIX):
+            by_gtrid[xid.gtrid].append(xid)
+    result = PreparedLoadRecovery()
+    if not by_gtrid:
+        return result
+
+    run_ids = [gtrid.removeprefix(_LOAD_GTRID_PREFIX) for gtrid in by_gtrid]
+    rows = conn.execute(
+        "SELECT run_id::text, status FROM run_ledger WHERE run_id::text = ANY(%s)",
+        (run_ids,),
+    ).fetchall()
+    conn.commit()  # `tpc_commit(xid)` and `tpc_rollback(xid)` refuse an open transaction
+    status = dict(rows)
+
+    cutoff = datetime.now(UTC) - in_flight_grace
+    for gtrid, xids in sorted(by_gtrid.items()):
+        run_status = status.get(gtrid.removeprefix(_LOAD_GTRID_PREFIX))
+        if run_status == "running" and any(x.prepared and x.prepared > cutoff for x in xids):
+            result.in_flight.append(gtrid)
+            continue
+        decided = any(map(_is_decision, xids))
+        # parts before the decision branch, the order the load itself commits in
+        for xid in sorted(xids, key=_is_decision):
+            if decided:
+                conn.tpc_commit(xid)
+            else:
+                conn.tpc_rollback(xid)
+        (result.committed if decided else result.rolled_back).append(gtrid)
+    return result
+
+
+def _is_decision(xid: psycopg.Xid) -> bool:
+    return (xid.bqual or "").startswith(_DECISION_BRANCH)
+
+
+def _group_by_table(
+    rows: Iterable[StageRow], rejects: Iterable[StageReject]
+) -> tuple[dict[str, list[StageRow]], dict[str, list[StageReject]]]:
+    """Rows and rejects, each by their `table_name`."""
     rows_by_table: dict[str, list[StageRow]] = defaultdict(list)
-    reject_list = list(rejects)
+    rejects_by_table: dict[str, list[StageReject]] = defaultdict(list)
 
     for row in rows:
         rows_by_table[row.table_name].append(row)
 
-    explicit_reject_counts: dict[str, int] = defaultdict(int)
-    for reject in reject_list:
-        explicit_reject_counts[reject.table_name] += 1
+    for reject in rejects:
+        rejects_by_table[reject.table_name].append(reject)
 
-    if reject_list:
-        insert_reject_rows(conn, run_id=run_id, rejects=_as_reject_inserts(reject_list))
+    return rows_by_table, rejects_by_table
 
-    results: dict[str, StageTableLoadResult] = {}
-    for table_name in _TABLE_LOAD_ORDER:
-        table_rows = rows_by_table.get(table_name, [])
-        if not table_rows and explicit_reject_counts.get(table_name, 0) == 0:
-            continue
 
-        inserted_count = 0
-        duplicate_reject_count = 0
+def _tables_to_load(
+    rows_by_table: dict[str, list[StageRow]], rejects_by_table: dict[str, list[StageReject]]
+) -> list[str]:
+    """Tables with rows or rejects, in load order."""
+    # tables outside the load order only ever have rejects, written after the rest
+    extra_tables = sorted(set(rejects_by_table) - set(_TABLE_LOAD_ORDER))
+    return [
+        table_name
+        for table_name in (*_TABLE_LOAD_ORDER, *extra_tables)
+        if rows_by_table.get(table_name) or rejects_by_table.get(table_name)
+    ]
+
+
+def _load_lanes(tables: list[str]) -> list[list[str]]:
+    """
+    `tables` split into lanes that can load independently. A table joins the lanes of
+    its `_TABLE_DEPENDENCIES`, since uncommitted rows are only visible on their own
+    connection. Tables within a lane keep the load order.
+    """
+    lanes: list[list[str]] = []
+    for table_name in tables:
+        dependencies = set(_TABLE_DEPENDENCIES.get(table_name, ()))
+        joined = [lane for lane in lanes if dependencies.intersection(lane)]
+        lanes = [lane for lane in lanes if lane not in joined]
+        merged = [t for lane in joined for t in lane] + [table_name]
+        lanes.append(sorted(merged, key=tables.index))
+    return lanes
+
+
+def _load_table(
+    conn: Connection,
+    *,
+    table_name: str,
+    run_id: UUID,
+    table_rows: list[StageRow],
+    table_rejects: list[StageReject],
+    copy_threshold: int,
+    direct_load_max_rows: int,
+    two_phase: bool = False,
+) -> StageTableLoadResult:
+    """
+    Write one table's explicit rejects, then load its rows. Up to `direct_load_max_rows`
+    rows are deduped in memory and copied straight into `stg_*`, more go through the
+    work table and its SQL dedup. Under `two_phase` that work table is a run-scoped
+    plain one, Postgres won't `PREPARE` a transaction that touched a temp table.
+    """
+    reject_write = None
+    reject_write_s = 0.0
+    if table_rejects:
+        reject_write = bulk_write_method(len(table_rejects), copy_threshold=copy_threshold)
+        t0 = perf_counter()
+        insert_reject_rows(
+            conn,
+            run_id=run_id,
+            rejects=_as_reject_inserts(table_rejects),
+            copy_threshold=copy_threshold,
+        )
+        reject_write_s = round(perf_counter() - t0, 6)
 
-        if table_rows:
-            prepare_work_table(conn, table_name=table_name)
-            insert_work_rows(
-                conn, table_name=table_name, run_id=run_id, rows=_as_work_rows(table_rows)
-            )
-            inserted_count, duplicate_reject_count = cast(
-                tuple[int, int],
-                flush_work_table(conn, table_name=table_name, run_id=run_id),
-            )
+    inserted_count = 0
+    duplicate_reject_count = 0
 
-        results[table_name] = StageTableLoadResult(
+    dedup = "sql"
+    if table_rows and _loads_direct(table_name, len(table_rows), direct_load_max_rows):
+        dedup = "memory"
+        inserted_count, duplicate_reject_count = load_staging_direct(
+            conn,
             table_name=table_name,
-            inserted_count=inserted_count,
-            duplicate_reject_count=duplicate_reject_count,
-            explicit_reject_count=explicit_reject_counts.get(table_name, 0),
+            run_id=run_id,
+            rows=_as_work_rows(table_rows),
+            copy_threshold=copy_threshold,
         )
+    elif table_rows:
+        work_table = run_work_table_name(table_name, run_id) if two_phase else None
+        prepare_work_table(conn, table_name=table_name, work_table=work_table)
+        insert_work_rows(
+            conn,
+            table_name=table_name,
+            run_id=run_id,
+            rows=_as_work_rows(table_rows),
+            work_table=work_table,
+        )
+        inserted_count, duplicate_reject_count = cast(
+            tuple[int, int],
+            flush_work_table(conn, table_name=table_name, run_id=run_id, work_table=work_table),
+        )
+        if work_table is not None:
+            drop_work_table(conn, work_table=work_table)
+
+    return StageTableLoadResult(
+        table_name=table_name,
+        inserted_count=inserted_count,
+        duplicate_reject_count=duplicate_reject_count,
+        explicit_reject_count=len(table_rejects),
+        reject_write=reject_write,
+        reject_write_s=reject_write_s,
+        dedup=dedup,
+    )
 
-    return results
+
+def _loads_direct(table_name: str, row_count: int, max_rows: int) -> bool:
+    """Whether a table's rows are small enough, and its key simple enough, to skip SQL dedup."""
+    return row_count <= max_rows and supports_direct_load(get_staging_spec(table_name))
+
+
+def _allows_prepared_transactions(conn: Connection) -> bool:
+    """Whether the server has `max_prepared_transactions` above 0 (its default is 0)."""
+    row = conn.execute("SHOW max_prepared_transactions").fetchone()
+    conn.rollback()  # leave no transaction open before `tpc_begin`
+    return row is not None and int(row[0]) > 0
+
+
+def _abandon(conn: Connection, *, two_phase: bool) -> None:
+    """Roll back a connection's share of a failed load, prepared or not."""
+    with suppress(psycopg.Error):
+        if two_phase:
+            conn.tpc_rollback()
+        else:
+            conn.rollback()
 
 
 def load_mapped_batches(
@@ -120,8 +423,16 @@ def load_mapped_batches(
     users: MappedUsers,
     products: MappedProducts,
     carts: MappedCarts,
+    copy_threshold: int = DEFAULT_COPY_THRESHOLD,
+    direct_load_max_rows: int = DEFAULT_DIRECT_LOAD_MAX_ROWS,
+    workers: int = 1,
+    database_url: str | None = None,
 ) -> dict[str, StageTableLoadResult]:
-    """Convenience wrapper for loading the `DummyJSON` stage batches and `reject_rows`."""
+    """
+    Convenience wrapper for loading the `DummyJSON` stage batches and `reject_rows`.
+    `workers > 1` loads tables in parallel on new connections to `database_url`, and
+    commits them there.
+    """
     all_rows: list[StageRow] = [
         *users.rows,
         *products.rows,
@@ -133,4 +444,21 @@ def load_mapped_batches(
         *products.rejects,
         *carts.rejects,
     ]
-    return load_stage_rows(conn, run_id=run_id, rows=all_rows, rejects=all_rejects)
+    if workers > 1:
+        return load_stage_rows_parallel(
+            database_url,
+            run_id=run_id,
+            rows=all_rows,
+            rejects=all_rejects,
+            copy_threshold=copy_threshold,
+            direct_load_max_rows=direct_load_max_rows,
+            workers=workers,
+        )
+    return load_stage_rows(
+        conn,
+        run_id=run_id,
+        rows=all_rows,
+        rejects=all_rejects,
+        copy_threshold=copy_threshold,
+        direct_load_max_rows=direct_load_max_rows,
+    )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
+from typing import Any
 
 from warehouse_pipeline.extract.models import DummyCart
 from warehouse_pipeline.stage import MappedCarts, ProductLookup, StageReject, StageRow, UserLookup
@@ -28,103 +29,139 @@ def map_carts(
     keeps the pipeline debuggable for now: the order exists, and the missing/bad lines
     are visible in `reject_rows`.
     """
-    order_rows: list[StageRow] = []
-    order_item_rows: list[StageRow] = []
-    rejects: list[StageReject] = []
+    return map_cart_payloads(
+        (cart.model_dump(mode="python") for cart in carts),
+        product_lookup=product_lookup,
+        user_lookup=user_lookup,
+    )
+
+
+def map_cart_payloads(
+    carts: Iterable[Mapping[str, Any]],
+    *,
+    product_lookup: ProductLookup,
+    user_lookup: UserLookup | None = None,
+) -> MappedCarts:
+    """Same as `map_carts`, for carts already dumped to their `model_dump` shape."""
+    mapped = MappedCarts()
     line_source_ref = 0
 
-    for order_source_ref, cart in enumerate(carts, start=1):
-        raw_cart = cart.model_dump(mode="python")
-        user_info = user_lookup.get(cart.userId) if user_lookup is not None else None
+    for order_source_ref, raw_cart in enumerate(carts, start=1):
+        line_source_ref = map_cart_payload(
+            raw_cart,
+            order_source_ref=order_source_ref,
+            line_source_ref=line_source_ref,
+            product_lookup=product_lookup,
+            user_lookup=user_lookup,
+            into=mapped,
+        )
 
-        order_rows.append(
-            StageRow(
-                table_name="stg_orders",
-                source_ref=order_source_ref,
-                raw_payload=raw_cart,
-                values={
-                    "order_id": cart.id,
-                    "customer_id": cart.userId,
-                    "order_ts": derive_order_ts(cart_id=cart.id, user_id=cart.userId),
-                    "country": user_info.country if user_info else None,
-                    "status": derive_order_status(
-                        cart_id=cart.id,
-                        total_products=cart.totalProducts,
-                        total_quantity=cart.totalQuantity,
-                    ),
-                    "total_usd": quantize_money(cart.discountedTotal),
-                    "total_products": cart.totalProducts,
-                    "total_quantity": cart.totalQuantity,
-                },
-            )
+    return mapped
+
+
+def map_cart_payload(
+    raw_cart: Mapping[str, Any],
+    *,
+    order_source_ref: int,
+    line_source_ref: int,
+    product_lookup: ProductLookup,
+    user_lookup: UserLookup | None,
+    into: MappedCarts,
+) -> int:
+    """
+    Map one validated cart, in its `model_dump` shape, appending to `into`.
+    Returns the last line `source_ref` used, the next cart continues from it.
+    """
+    cart_id = raw_cart["id"]
+    user_id = raw_cart["userId"]
+    user_info = user_lookup.get(user_id) if user_lookup is not None else None
+
+    into.order_rows.append(
+        StageRow(
+            table_name="stg_orders",
+            source_ref=order_source_ref,
+            raw_payload=raw_cart,
+            values={
+                "order_id": cart_id,
+                "customer_id": user_id,
+                "order_ts": derive_order_ts(cart_id=cart_id, user_id=user_id),
+                "country": user_info.country if user_info else None,
+                "status": derive_order_status(
+                    cart_id=cart_id,
+                    total_products=raw_cart["totalProducts"],
+                    total_quantity=raw_cart["totalQuantity"],
+                ),
+                "total_usd": quantize_money(raw_cart["discountedTotal"]),
+                "total_products": raw_cart["totalProducts"],
+                "total_quantity": raw_cart["totalQuantity"],
+            },
         )
+    )
 
-        for line_id, item in enumerate(cart.products, start=1):
-            line_source_ref += 1
-            raw_line = {
-                "cart": raw_cart,
-                "line": item.model_dump(mode="python"),
-                "line_id": line_id,
-            }
-
-            if item.quantity <= 0:
-                rejects.append(
-                    StageReject(
-                        table_name="stg_order_items",
-                        source_ref=line_source_ref,
-                        raw_payload=raw_line,
-                        reason_code="invalid_quantity",
-                        reason_detail=f"cart line {line_id} has non-pos qty={item.quantity}",
-                    )
-                )
-                continue
-
-            product = product_lookup.get(item.id)
-            if product is None:
-                rejects.append(
-                    StageReject(
-                        table_name="stg_order_items",
-                        source_ref=line_source_ref,
-                        raw_payload=raw_line,
-                        reason_code="unknown_product",
-                        reason_detail=f"product_id {item.id} was referenced by cart {cart.id} "
-                        "but not found in the product lookup",
-                    )
-                )
-                continue
+    for line_id, item in enumerate(raw_cart["products"], start=1):
+        line_source_ref += 1
+        raw_line = {
+            "cart": raw_cart,
+            "line": item,
+            "line_id": line_id,
+        }
+        product_id = item["id"]
+        quantity = item["quantity"]
 
-            discount_pct = derive_line_discount_pct(
-                line_total=item.total,
-                discounted_line_total=item.discountedTotal,
-            )
-            gross_usd = derive_gross_usd(quantity=item.quantity, unit_price_usd=item.price)
-            net_usd = derive_net_usd(
-                gross_usd=gross_usd,
-                discount_pct=discount_pct,
-                discounted_line_total=item.discountedTotal,
+        if quantity <= 0:
+            into.rejects.append(
+                StageReject(
+                    table_name="stg_order_items",
+                    source_ref=line_source_ref,
+                    raw_payload=raw_line,
+                    reason_code="invalid_quantity",
+                    reason_detail=f"cart line {line_id} has non-pos qty={quantity}",
+                )
             )
+            continue
 
-            order_item_rows.append(
-                StageRow(
+        product = product_lookup.get(product_id)
+        if product is None:
+            into.rejects.append(
+                StageReject(
                     table_name="stg_order_items",
                     source_ref=line_source_ref,
                     raw_payload=raw_line,
-                    values={
-                        "order_id": cart.id,
-                        "line_id": line_id,
-                        "product_id": item.id,
-                        "sku": product.sku,
-                        "qty": item.quantity,
-                        "unit_price_usd": quantize_money(item.price),
-                        "discount_pct": discount_pct,
-                        "gross_usd": gross_usd,
-                        "net_usd": net_usd,
-                    },
+                    reason_code="unknown_product",
+                    reason_detail=f"product_id {product_id} was referenced by cart {cart_id} "
+                    "but not found in the product lookup",
                 )
             )
+            continue
 
-    return MappedCarts(
-        order_rows=order_rows,
-        order_item_rows=order_item_rows,
-        rejects=rejects,
-    )
+        discount_pct = derive_line_discount_pct(
+            line_total=item["total"],
+            discounted_line_total=item["discountedTotal"],
+        )
+        gross_usd = derive_gross_usd(quantity=quantity, unit_price_usd=item["price"])
+        net_usd = derive_net_usd(
+            gross_usd=gross_usd,
+            discount_pct=discount_pct,
+            discounted_line_total=item["discountedTotal"],
+        )
+
+        into.order_item_rows.append(
+            StageRow(
+                table_name="stg_order_items",
+                source_ref=line_source_ref,
+                raw_payload=raw_line,
+                values={
+                    "order_id": cart_id,
+                    "line_id": line_id,
+                    "product_id": product_id,
+                    "sku": product.sku,
+                    "qty": quantity,
+                    "unit_price_usd": quantize_money(item["price"]),
+                    "discount_pct": discount_pct,
+                    "gross_usd": gross_usd,
+                    "net_usd": net_usd,
+                },
+            )
+        )
+
+    return line_source_ref
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from warehouse_pipeline.extract.models import DummyCart
+from warehouse_pipeline.stage import MappedCarts, ProductLookup, UserLookup
+from warehouse_pipeline.stage.map_carts import map_cart_payloads
+
+
+def map_raw_carts(
+    carts: Iterable[Mapping[str, Any]],
+    *,
+    product_lookup: ProductLookup,
+    user_lookup: UserLookup | None = None,
+) -> MappedCarts:
+    """
+    Fused `DummyCart` validation and `map_carts`, straight from decoded cart JSON.
+
+    Each cart is checked and shaped into its `model_dump` dict in one walk, with no
+    pydantic objects in between. Anything the fast check isn't sure about goes
+    through `DummyCart` itself, so coercions and `ValidationError`s match the models.
+    """
+    return map_cart_payloads(
+        (dump_raw_cart(cart) for cart in carts),
+        product_lookup=product_lookup,
+        user_lookup=user_lookup,
+    )
+
+
+def dump_raw_cart(cart: Mapping[str, Any]) -> dict[str, Any]:
+    """What `DummyCart.model_validate(cart).model_dump()` returns, built directly."""
+    try:
+        products = cart["products"]
+        if type(products) is not list:
+            raise _Slow
+        return {
+            "id": _int(cart["id"], gt=0),
+            "userId": _int(cart["userId"], gt=0),
+            "total": _float(cart["total"]),
+            "discountedTotal": _float(cart["discountedTotal"]),
+            "totalProducts": _int(cart["totalProducts"]),
+            "totalQuantity": _int(cart["totalQuantity"]),
+            "products": [_dump_line(line) for line in products],
+        }
+    except (_Slow, KeyError, TypeError, AttributeError):
+        return DummyCart.model_validate(cart).model_dump(mode="python")
+
+
+class _Slow(Exception):
+    """The fast check can't vouch for a value, let pydantic decide."""
+
+
+def _dump_line(line: Any) -> dict[str, Any]:
+    """One `DummyCartProduct`, in `model_dump` shape."""
+    title = line.get("title")
+    if title is not None and type(title) is not str:
+        raise _Slow
+    discount_pct = line.get("discountPercentage")
+    discounted_total = line.get("discountedTotal")
+    return {
+        "id": _int(line["id"], gt=0),
+        "title": title,
+        "quantity": _int(line["quantity"]),
+        "price": _float(line["price"]),
+        "total": _float(line["total"]),
+        "discountPercentage": (None if discount_pct is None else _float(discount_pct, le=100.0)),
+        "discountedTotal": None if discounted_total is None else _float(discounted_total),
+    }
+
+
+def _int(value: Any, *, gt: int = -1) -> int:
+    """A plain JSON integer above `gt` (`ge=0` by default), anything else is slow."""
+    if type(value) is not int or value <= gt:
+        raise _Slow
+    return value
+
+
+def _float(value: Any, *, le: float = math.inf) -> float:
+    """A JSON number in `[0, le]` as a `float`, like pydantic's lax `float`."""
+    if type(value) is not float and type(value) is not int:
+        raise _Slow
+    if not 0 <= value <= le:  # also rejects NaN
+        raise _Slow
+    return float(value)
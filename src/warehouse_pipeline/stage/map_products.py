@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
+from typing import Any
 
 from warehouse_pipeline.extract.models import DummyProduct
 from warehouse_pipeline.stage import MappedProducts, ProductLookupItem, StageReject, StageRow
@@ -17,64 +18,71 @@ def map_products(products: Iterable[DummyProduct]) -> MappedProducts:
     """
     Map validated `DummyJSON` products into `stg_products` rows and a lookup.
     """
-    rows: list[StageRow] = []
-    rejects: list[StageReject] = []
-    product_lookup: dict[int, ProductLookupItem] = {}
+    return map_product_payloads(product.model_dump(mode="python") for product in products)
 
-    for source_ref, product in enumerate(products, start=1):
-        raw_payload = product.model_dump(mode="python")
 
-        title = normalize_text(product.title)
-        category = normalize_text(product.category)
-        if title is None or category is None:
-            rejects.append(
-                StageReject(
-                    table_name="stg_products",
-                    source_ref=source_ref,
-                    raw_payload=raw_payload,
-                    reason_code="missing_product_fields",
-                    reason_detail="product could not be mapped because title or category is blank",
-                )
-            )
-            continue
+def map_product_payloads(products: Iterable[Mapping[str, Any]]) -> MappedProducts:
+    """Same as `map_products`, for products already dumped to their `model_dump` shape."""
+    mapped = MappedProducts()
+    for source_ref, raw_payload in enumerate(products, start=1):
+        map_product_payload(raw_payload, source_ref=source_ref, into=mapped)
+    return mapped
 
-        sku = derive_sku(product_id=product.id, category=category, title=title)
-        price_usd = quantize_money(product.price)
-        discount_pct = derive_product_discount_fraction(product.discountPercentage)
-        brand = normalize_text(product.brand)
-        rating = to_decimal(product.rating) if product.rating is not None else None
 
-        rows.append(
-            StageRow(
+def map_product_payload(
+    raw_payload: Mapping[str, Any], *, source_ref: int, into: MappedProducts
+) -> None:
+    """Map one validated product, appending its row or reject and lookup entry to `into`."""
+    title = normalize_text(raw_payload["title"])
+    category = normalize_text(raw_payload["category"])
+    if title is None or category is None:
+        into.rejects.append(
+            StageReject(
                 table_name="stg_products",
                 source_ref=source_ref,
                 raw_payload=raw_payload,
-                values={
-                    "product_id": product.id,
-                    "sku": sku,
-                    "title": title,
-                    "brand": brand,
-                    "category": category,
-                    "price_usd": price_usd,
-                    "discount_pct": discount_pct,
-                    "rating": rating,
-                    "stock": product.stock,
-                },
+                reason_code="missing_product_fields",
+                reason_detail="product could not be mapped because title or category is blank",
             )
         )
+        return
+
+    product_id = raw_payload["id"]
+    rating = raw_payload["rating"]
+    sku = derive_sku(product_id=product_id, category=category, title=title)
+    price_usd = quantize_money(raw_payload["price"])
+    discount_pct = derive_product_discount_fraction(raw_payload["discountPercentage"])
+    brand = normalize_text(raw_payload["brand"])
 
-        # Keep the first seen value stored so lookup resolution matches the
-        # work table duplicate winner first seen rule.
-        product_lookup.setdefault(
-            product.id,
-            ProductLookupItem(
-                product_id=product.id,
-                sku=sku,
-                title=title,
-                category=category,
-                unit_price_usd=price_usd,
-                discount_pct=discount_pct,
-            ),
+    into.rows.append(
+        StageRow(
+            table_name="stg_products",
+            source_ref=source_ref,
+            raw_payload=raw_payload,
+            values={
+                "product_id": product_id,
+                "sku": sku,
+                "title": title,
+                "brand": brand,
+                "category": category,
+                "price_usd": price_usd,
+                "discount_pct": discount_pct,
+                "rating": to_decimal(rating) if rating is not None else None,
+                "stock": raw_payload["stock"],
+            },
         )
+    )
 
-    return MappedProducts(rows=rows, rejects=rejects, product_lookup=product_lookup)
+    # Keep the first seen value stored so lookup resolution matches the
+    # work table duplicate winner first seen rule.
+    into.product_lookup.setdefault(
+        product_id,
+        ProductLookupItem(
+            product_id=product_id,
+            sku=sku,
+            title=title,
+            category=category,
+            unit_price_usd=price_usd,
+            discount_pct=discount_pct,
+        ),
+    )
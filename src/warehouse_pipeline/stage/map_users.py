@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
+from typing import Any
 
 from warehouse_pipeline.extract.models import DummyUser
 from warehouse_pipeline.stage import MappedUsers, StageReject, StageRow, UserLookupItem
@@ -9,63 +10,71 @@ from warehouse_pipeline.stage.derive_fields import derive_full_name, normalize_e
 
 def map_users(users: Iterable[DummyUser]) -> MappedUsers:
     """Map validated DummyJSON users into `stg_customers` rows and a user lookup."""
-    rows: list[StageRow] = []
-    rejects: list[StageReject] = []
-    user_lookup: dict[int, UserLookupItem] = {}
+    return map_user_payloads(user.model_dump(mode="python") for user in users)
 
-    for source_ref, user in enumerate(users, start=1):
-        raw_payload = user.model_dump(mode="python")
 
-        first_name = normalize_text(user.firstName)
-        last_name = normalize_text(user.lastName)
-        full_name = derive_full_name(first_name, last_name)
+def map_user_payloads(users: Iterable[Mapping[str, Any]]) -> MappedUsers:
+    """Same as `map_users`, for users already dumped to their `model_dump` shape."""
+    mapped = MappedUsers()
+    for source_ref, raw_payload in enumerate(users, start=1):
+        map_user_payload(raw_payload, source_ref=source_ref, into=mapped)
+    return mapped
 
-        if full_name is None:
-            rejects.append(
-                StageReject(
-                    table_name="stg_customers",
-                    source_ref=source_ref,
-                    raw_payload=raw_payload,
-                    reason_code="missing_name",
-                    reason_detail="user could not be mapped, first_name and last_name are blank",
-                )
-            )
-            continue
 
-        email = normalize_email(user.email)
-        city = normalize_text(user.address.city) if user.address else None
-        country = normalize_text(user.address.country) if user.address else None
-        company = normalize_text(user.company.name) if user.company else None
+def map_user_payload(raw_payload: Mapping[str, Any], *, source_ref: int, into: MappedUsers) -> None:
+    """Map one validated user, appending its row or reject and lookup entry to `into`."""
+    first_name = normalize_text(raw_payload["firstName"])
+    last_name = normalize_text(raw_payload["lastName"])
+    full_name = derive_full_name(first_name, last_name)
 
-        rows.append(
-            StageRow(
+    if full_name is None:
+        into.rejects.append(
+            StageReject(
                 table_name="stg_customers",
                 source_ref=source_ref,
                 raw_payload=raw_payload,
-                values={
-                    "customer_id": user.id,
-                    "first_name": first_name,
-                    "last_name": last_name,
-                    "full_name": full_name,
-                    "email": email,
-                    "phone": normalize_text(user.phone),
-                    "city": city,
-                    "country": country,
-                    "company": company,
-                },
+                reason_code="missing_name",
+                reason_detail="user could not be mapped, first_name and last_name are blank",
             )
         )
+        return
+
+    user_id = raw_payload["id"]
+    address = raw_payload["address"]
+    company = raw_payload["company"]
+
+    email = normalize_email(raw_payload["email"])
+    city = normalize_text(address["city"]) if address else None
+    country = normalize_text(address["country"]) if address else None
+    company_name = normalize_text(company["name"]) if company else None
 
-        # Keep the first-seen lookup value.
-        # (lowest `source_ref` wins).
-        user_lookup.setdefault(
-            user.id,
-            UserLookupItem(
-                customer_id=user.id,
-                country=country,
-                city=city,
-                email=email,
-            ),
+    into.rows.append(
+        StageRow(
+            table_name="stg_customers",
+            source_ref=source_ref,
+            raw_payload=raw_payload,
+            values={
+                "customer_id": user_id,
+                "first_name": first_name,
+                "last_name": last_name,
+                "full_name": full_name,
+                "email": email,
+                "phone": normalize_text(raw_payload["phone"]),
+                "city": city,
+                "country": country,
+                "company": company_name,
+            },
         )
+    )
 
-    return MappedUsers(rows=rows, rejects=rejects, user_lookup=user_lookup)
+    # Keep the first-seen lookup value.
+    # (lowest `source_ref` wins).
+    into.user_lookup.setdefault(
+        user_id,
+        UserLookupItem(
+            customer_id=user_id,
+            country=country,
+            city=city,
+            email=email,
+        ),
+    )
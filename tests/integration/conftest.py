@@ -10,6 +10,8 @@ from typing import LiteralString, cast
 import psycopg
 import pytest
 
+from warehouse_pipeline.db.sql_runner import split_sql_statements
+
 
 def _run_sql_file(conn: psycopg.Connection, sql_path: Path) -> None:
     """
@@ -18,8 +20,9 @@ def _run_sql_file(conn: psycopg.Connection, sql_path: Path) -> None:
     sql = sql_path.read_text(encoding="utf-8")
 
     # psycopg can execute multi-statement scripts via `execute` with `conn.execute(sql)`
-    # BUT safest is to split it on semicolons, but only if also surfacing failing statements.
-    statements = [s.strip() for s in sql.split(";") if s.strip()]
+    # BUT safest is to split it into statements, but only if also surfacing failing statements.
+    # (the runtime's splitter, a plain `;` split would cut `DO $$ ... $$` blocks apart)
+    statements = split_sql_statements(sql)
 
     with conn.cursor() as cur:
         for i, stmt in enumerate(statements, 1):
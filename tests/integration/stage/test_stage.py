@@ -8,18 +8,15 @@ from warehouse_pipeline.extract.models import (
     parse_products_page,
     parse_users_page,
 )
-from warehouse_pipeline.stage.load import load_mapped_batches
+from warehouse_pipeline.stage import MappedCarts, MappedProducts, MappedUsers
+from warehouse_pipeline.stage.load import load_mapped_batches, load_stage_rows_parallel
 from warehouse_pipeline.stage.map_carts import map_carts
 from warehouse_pipeline.stage.map_products import map_products
 from warehouse_pipeline.stage.map_users import map_users
 
 
-@pytest.mark.docker_required
-def test_stage_happy_path(conn) -> None:
-    """
-    This is the idea
-    - Parse source payloads -> map to stage rows -> load into Postgres staging tables.
-    """
+def _mapped_smoke_batches() -> tuple[MappedUsers, MappedProducts, MappedCarts]:
+    """One user, one product, one cart of that product, parsed and mapped."""
     users_page = parse_users_page(
         {
             "users": [
@@ -90,6 +87,16 @@ def test_stage_happy_path(conn) -> None:
         product_lookup=mapped_products.product_lookup,
         user_lookup=mapped_users.user_lookup,
     )
+    return mapped_users, mapped_products, mapped_carts
+
+
+@pytest.mark.docker_required
+def test_stage_happy_path(conn) -> None:
+    """
+    This is the idea
+    - Parse source payloads -> map to stage rows -> load into Postgres staging tables.
+    """
+    mapped_users, mapped_products, mapped_carts = _mapped_smoke_batches()
 
     run_id = create_run(conn, entry=RunStart(mode="snapshot", snapshot_key="dummyjson/smoke"))
 
@@ -134,3 +141,43 @@ def test_stage_happy_path(conn) -> None:
     assert order_count == 1
     assert item_count == 1
     assert reject_count == 0  # all rows were ok
+
+
+@pytest.mark.docker_required
+def test_stage_two_phase_parallel_load_through_work_tables(conn, dsn) -> None:
+    """
+    A two-phase parallel load where every table takes the work-table path still
+    prepares and commits (no temp tables under 2PC), and leaves no work tables behind.
+    """
+    if int(conn.execute("SHOW max_prepared_transactions").fetchone()[0]) == 0:
+        pytest.skip("server has max_prepared_transactions = 0")
+    mapped_users, mapped_products, mapped_carts = _mapped_smoke_batches()
+    run_id = create_run(conn, entry=RunStart(mode="snapshot", snapshot_key="dummyjson/smoke"))
+
+    rows = [
+        *mapped_users.rows,
+        *mapped_products.rows,
+        *mapped_carts.order_rows,
+        *mapped_carts.order_item_rows,
+    ]
+    results = load_stage_rows_parallel(
+        dsn, run_id=run_id, rows=rows, workers=4, direct_load_max_rows=0, two_phase=True
+    )
+
+    assert {name: result.inserted_count for name, result in results.items()} == {
+        "stg_customers": 1,
+        "stg_products": 1,
+        "stg_orders": 1,
+        "stg_order_items": 1,
+    }
+    assert conn.execute("SELECT COUNT(*) FROM pg_prepared_xacts").fetchone()[0] == 0
+    leftover = conn.execute(
+        "SELECT COUNT(*) FROM pg_tables WHERE tablename LIKE %s",
+        (f"%_r{run_id.hex}",),
+    ).fetchone()[0]
+    assert leftover == 0
+    item_count = conn.execute(
+        "SELECT COUNT(*) FROM stg_order_items WHERE run_id = %s",
+        (run_id,),
+    ).fetchone()[0]
+    assert item_count == 1
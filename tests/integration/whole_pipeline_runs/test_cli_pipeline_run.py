@@ -9,6 +9,7 @@ from typing import Any, LiteralString
 import psycopg
 import pytest
 
+import warehouse_pipeline.extract.bundles as bundles_mod
 import warehouse_pipeline.orchestration.runner as runner_mod
 from warehouse_pipeline.cli.main import main
 from warehouse_pipeline.extract.bundles import ExtractBundle
@@ -403,7 +404,7 @@ def test_cli_run_pipeline_incremental_default_overlap_reprocesses_recent_rows(
     monkeypatch.setattr(
         runner_mod,
         "get_source_adapter",
-        lambda source_system: fake_source,
+        lambda source_system, **options: fake_source,
     )
 
     # first run: seed watermark explicitly
@@ -667,3 +668,65 @@ def test_cli_run_pipeline_incremental_dummyjson_happy_path(
     assert debug["table_counts"]["fact_orders"] > 0
     assert debug["table_counts"]["fact_order_items"] > 0
     assert debug["table_counts"]["v_fact_orders_latest"] > 0
+
+
+@pytest.mark.docker_required
+@pytest.mark.heavy_integration
+def test_cli_run_pipeline_on_a_generated_snapshot(
+    reinit_schema,
+    dsn: str,
+    run_artifacts_dir,
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    """
+    `snapshot generate` output runs through `pipeline run`. The default, clean snapshot
+    passes the gates. With duplicates, the envelope totals still match what was read and
+    only the zero-reject snapshot rule fails.
+    """
+    monkeypatch.setenv("WAREHOUSE_DSN", dsn)
+    monkeypatch.setattr(bundles_mod, "DEFAULT_SNAPSHOT_BASE_DIR", tmp_path / "snapshots")
+    sizes = ["--users", "40", "--products", "30", "--carts", "60", "--seed", "5"]
+
+    assert main(["snapshot", "generate", "--key", "gen-clean", *sizes]) == 0
+    rc = main(
+        [
+            "run",
+            "--mode",
+            "snapshot",
+            "--snapshot",
+            "gen-clean",
+            "--runs-root",
+            str(run_artifacts_dir),
+        ]
+    )
+    debug = _collect_pipeline_debug(dsn=dsn, run_artifacts_dir=run_artifacts_dir)
+    assert rc == 0, _failure_blob(rc=rc, debug=debug)
+
+    manifest = debug["manifest"]
+    assert manifest["status"] == "succeeded"
+    assert manifest["gate"]["passed"] is True
+    assert manifest["extract"]["counts"] == {"users": 40, "products": 30, "carts": 60}
+    assert debug["table_counts"]["reject_rows"] == 0
+
+    dup = ["--duplicate-rate", "0.1"]
+    assert main(["snapshot", "generate", "--key", "gen-dup", *sizes, *dup]) == 0
+    rc = main(
+        [
+            "run",
+            "--mode",
+            "snapshot",
+            "--snapshot",
+            "gen-dup",
+            "--runs-root",
+            str(run_artifacts_dir),
+        ]
+    )
+    manifest = _collect_pipeline_debug(dsn=dsn, run_artifacts_dir=run_artifacts_dir)["manifest"]
+
+    assert rc != 0
+    extract = manifest["extract"]
+    for resource in ("users", "products", "carts"):
+        assert extract["totals"][resource] == extract["counts"][resource]
+    assert extract["counts"]["users"] > 40
+    assert {f["metric_name"] for f in manifest["gate"]["failures"]} == {"reject_rows.reject_rate"}
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from warehouse_pipeline.bench import FakeDummyJsonServer, FaultProfile, run_extract_benchmark
+
+
+def test_extract_benchmark_against_faulty_fake_server() -> None:
+    """Every record comes back through 429s and 5xx bursts, and retries are reported."""
+    faults = FaultProfile(throttle_rate=0.2, error_rate=0.1, error_burst=2, seed=3)
+
+    with FakeDummyJsonServer.synthetic(
+        users=120, products=80, carts=40, seed=1, faults=faults
+    ) as server:
+        result = run_extract_benchmark(
+            base_url=server.url,
+            page_size=25,
+            concurrency=2,
+            max_attempts=8,
+            initial_backoff_s=0.0,
+        )
+        served = server.stats()
+
+    assert result.items == 120 + 80 + 40
+    assert result.retries > 0
+    assert served["throttled"] + served["server_errors"] == result.retries
+    assert 0 < result.latency_p50_s <= result.latency_p99_s
+    assert result.requests_per_s > 0
@@ -37,6 +37,26 @@ def test_handle_run_snapshot_happy_path(monkeypatch, capsys) -> None:
         snapshot_key="smoke",
         runs_root="tmp-runs",
         page_size=25,
+        concurrency=4,
+        async_extract=False,
+        rate_limit=4.0,
+        burst=1,
+        stream_extract=False,
+        http_cache=False,
+        http_cache_ttl_s=86400.0,
+        hedge=False,
+        circuit_breaker=False,
+        autotune=False,
+        autotune_error_budget=0.05,
+        resume_run_id=None,
+        fused_carts=False,
+        compact_bundle=False,
+        snapshot_cache=False,
+        snapshot_workers=1,
+        replay_snapshot=False,
+        copy_threshold=1000,
+        stage_workers=1,
+        direct_load_max_rows=2_000_000,
         watermark_column="order_ts",
         since=None,
         until=None,
@@ -52,6 +72,7 @@ def test_handle_run_snapshot_happy_path(monkeypatch, capsys) -> None:
     assert seen["spec"].snapshot_key == "smoke"
     assert seen["spec"].runs_root == Path("tmp-runs")
     assert seen["spec"].page_size == 25
+    assert seen["spec"].concurrency == 4
     assert "status=succeeded" in out
     assert "manifest=/tmp/fake-manifest.json" in out
 
@@ -84,6 +105,26 @@ def test_handle_run_live_happy_path(monkeypatch, capsys) -> None:
         snapshot_key="smoke",
         runs_root="tmp-runs",
         page_size=100,
+        concurrency=1,
+        async_extract=False,
+        rate_limit=4.0,
+        burst=1,
+        stream_extract=False,
+        http_cache=False,
+        http_cache_ttl_s=86400.0,
+        hedge=False,
+        circuit_breaker=False,
+        autotune=False,
+        autotune_error_budget=0.05,
+        resume_run_id=None,
+        fused_carts=False,
+        compact_bundle=False,
+        snapshot_cache=False,
+        snapshot_workers=1,
+        replay_snapshot=False,
+        copy_threshold=1000,
+        stage_workers=1,
+        direct_load_max_rows=2_000_000,
         watermark_column="order_ts",
         since=None,
         until=None,
@@ -129,6 +170,26 @@ def test_handle_run_incremental_happy_path(monkeypatch, capsys) -> None:
         snapshot_key="smoke",
         runs_root="tmp-runs",
         page_size=100,
+        concurrency=1,
+        async_extract=False,
+        rate_limit=4.0,
+        burst=1,
+        stream_extract=False,
+        http_cache=False,
+        http_cache_ttl_s=86400.0,
+        hedge=False,
+        circuit_breaker=False,
+        autotune=False,
+        autotune_error_budget=0.05,
+        resume_run_id=None,
+        fused_carts=False,
+        compact_bundle=False,
+        snapshot_cache=False,
+        snapshot_workers=1,
+        replay_snapshot=False,
+        copy_threshold=1000,
+        stage_workers=1,
+        direct_load_max_rows=2_000_000,
         watermark_column="order_ts",
         since=datetime.fromisoformat("2024-01-01T00:00:00+00:00"),
         until=datetime.fromisoformat("2025-01-01T00:00:00+00:00"),
@@ -3,19 +3,29 @@ from __future__ import annotations
 # fake connectors and psycopg integration for unit.
 # could merge with global unit the but we'll see
 from dataclasses import dataclass
+from types import SimpleNamespace
 from typing import Any
 
+from psycopg import postgres
+from psycopg.adapt import PyFormat, Transformer
+from psycopg.pq import Format
+
 
 @dataclass
 class FakeResult:
     """Store and fetch rows as results."""
 
     row: Any = None
+    rows: list[Any] | None = None
 
     def fetchone(self) -> Any:
         """Fetch row."""
         return self.row
 
+    def fetchall(self) -> list[Any]:
+        """Fetch all rows."""
+        return list(self.rows or [])
+
 
 class FakeCursor:
     """Dummy curser mocking `psycopg`'s cursor functionality."""
@@ -40,16 +50,69 @@ class FakeCursor:
         params_list = list(params_seq)
         self.conn.calls.append(("cursor.executemany", query, params_list))
 
+    def copy(self, query: Any) -> FakeCopy:
+        """Mock a binary `COPY ... FROM STDIN`, storing the bytes it would send."""
+        return FakeCopy(self.conn, query)
+
+
+class FakeCopy:
+    """
+    Dummy `COPY` that dumps each row with psycopg's real binary dumpers for the types
+    given to `set_types`, so a value the column type can't take fails here like it would
+    against Postgres. Only public `Transformer` API, `data` is the dumped values back to
+    back rather than the exact `COPY` wire format.
+    """
+
+    def __init__(self, conn: FakeConnection, query: Any) -> None:
+        self.conn = conn
+        self.query = query
+        self.rows: list[tuple[Any, ...]] = []
+        self.types: list[str] = []
+        self.transformer = Transformer()
+        self.data = bytearray()
+
+    def __enter__(self) -> FakeCopy:
+        """Provide calling access."""
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        """Store the finished copy as one call."""
+        self.conn.calls.append(("cursor.copy", self.query, self))
+        return False
+
+    def set_types(self, types: list[str]) -> None:
+        """Resolve each type name to its binary dumper, like psycopg does."""
+        self.types = list(types)
+        oids = [postgres.types.get_oid(name) for name in types]
+        self.transformer.set_dumper_types(oids, Format.BINARY)
+
+    def write_row(self, row: tuple[Any, ...]) -> None:
+        """Dump and keep one row, its width must match `set_types`."""
+        row = tuple(row)
+        if self.types and len(row) != len(self.types):
+            raise ValueError(f"row has {len(row)} values, COPY expects {len(self.types)}")
+        self.rows.append(row)
+        for value in self.transformer.dump_sequence(row, [PyFormat.BINARY] * len(row)):
+            if value is not None:
+                self.data += value
+
 
 class FakeConnection:
     """Mock full `psycopg` connection by storing calls, rows, and call counts."""
 
-    def __init__(self, *, fetchone_rows: list[Any] | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        fetchone_rows: list[Any] | None = None,
+        fetchall_rows: list[list[Any]] | None = None,
+    ) -> None:
         self.calls: list[tuple[str, Any, Any]] = []
         self.fetchone_rows = list(fetchone_rows or [])
+        self.fetchall_rows = list(fetchall_rows or [])
         self.commit_calls = 0
         self.rollback_calls = 0
         self.close_calls = 0
+        self.info = SimpleNamespace(dbname="unit")
 
     def __enter__(self) -> FakeConnection:
         """Provide calling access."""
@@ -70,7 +133,12 @@ class FakeConnection:
         """Mock an execution and return a `FakeResult` row."""
         self.calls.append(("conn.execute", query, params))
         row = self.fetchone_rows.pop(0) if self.fetchone_rows else None
-        return FakeResult(row)
+        rows = self.fetchall_rows.pop(0) if self.fetchall_rows else None
+        return FakeResult(row, rows)
+
+    def tpc_recover(self) -> list[Any]:
+        """No prepared transactions are ever pending."""
+        return []
 
     def commit(self) -> None:
         """Increase `self.commit_calls` by one."""
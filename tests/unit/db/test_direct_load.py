@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import cast
+from uuid import uuid4
+
+import psycopg
+
+from tests.unit.db.mocks import FakeConnection
+from warehouse_pipeline.db.direct_load import load_staging_direct
+from warehouse_pipeline.db.work_tables import WorkRow
+
+
+def _line(source_ref: int, order_id: int, line_id: int, qty: int) -> WorkRow:
+    return WorkRow(
+        source_ref=source_ref,
+        raw_payload={"cart": order_id, "line": line_id},
+        values={
+            "order_id": order_id,
+            "line_id": line_id,
+            "product_id": 5,
+            "sku": "SKU-5",
+            "qty": qty,
+            "unit_price_usd": Decimal("2.50"),
+            "discount_pct": Decimal("0"),
+            "gross_usd": Decimal("2.50") * qty,
+            "net_usd": Decimal("2.50") * qty,
+        },
+    )
+
+
+def test_direct_load_copies_winners_and_rejects_later_duplicates() -> None:
+    """
+    The lowest `source_ref` per key is copied into `stg_order_items`, the other
+    goes to `reject_rows` with the same detail the SQL flush writes.
+    """
+    fake_conn = FakeConnection()
+    conn = cast(psycopg.Connection[tuple], fake_conn)
+
+    inserted, duplicates = load_staging_direct(
+        conn,
+        table_name="stg_order_items",
+        run_id=uuid4(),
+        rows=[_line(3, 7, 2, qty=4), _line(1, 7, 2, qty=1), _line(2, 7, 3, qty=2)],
+    )
+
+    assert (inserted, duplicates) == (2, 1)
+
+    (copy_call,) = [call for call in fake_conn.calls if call[0] == "cursor.copy"]
+    assert [row[1:3] for row in copy_call[2].rows] == [(7, 2), (7, 3)]
+    assert copy_call[2].rows[0][5] == 1  # the `source_ref=1` line won
+
+    (reject_call,) = [call for call in fake_conn.calls if call[0] == "cursor.executemany"]
+    (reject,) = reject_call[2]
+    assert reject[2] == 3
+    assert reject[4:] == ("duplicate_key", "duplicate key: order_id=7, line_id=2")
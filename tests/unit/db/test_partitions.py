@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import cast
+from uuid import uuid4
+
+import psycopg
+
+from tests.unit.db.mocks import FakeConnection
+from warehouse_pipeline.db.partitions import (
+    create_run_partitions,
+    partition_name,
+    retain_runs,
+)
+
+
+def test_partitions_are_created_per_run_and_dropped_past_retention() -> None:
+    """
+    A run gets a partition of each partitioned table, and retention detaches and drops
+    only partitions of runs outside the kept set, leaving other children alone.
+    """
+    run_id = uuid4()
+    fake_conn = FakeConnection(fetchall_rows=[[("stg_orders",), ("reject_rows",)]])
+    conn = cast(psycopg.Connection[tuple], fake_conn)
+
+    created = create_run_partitions(conn, run_id=run_id)
+
+    assert created == [partition_name("stg_orders", run_id), partition_name("reject_rows", run_id)]
+    ddl = [call[1].as_string() for call in fake_conn.calls[1:]]
+    assert all("PARTITION OF" in stmt and str(run_id) in stmt for stmt in ddl)
+
+    old_run = uuid4()
+    fake_conn = FakeConnection(
+        fetchall_rows=[
+            [(run_id,)],  # runs to keep
+            [("stg_orders",)],  # partitioned tables
+            [
+                ("stg_orders_default",),
+                (partition_name("stg_orders", old_run),),
+                (partition_name("stg_orders", run_id),),
+            ],
+        ]
+    )
+    conn = cast(psycopg.Connection[tuple], fake_conn)
+
+    result = retain_runs(conn, keep=1)
+
+    assert result.kept_run_ids == [str(run_id)]
+    assert result.dropped_partitions == [partition_name("stg_orders", old_run)]
+    assert "reject_rows" in result.unpartitioned_tables
+    statements = [call[1].as_string() for call in fake_conn.calls[3:]]
+    assert statements[0].startswith('ALTER TABLE "stg_orders" DETACH PARTITION')
+    assert statements[1] == f'DROP TABLE "{partition_name("stg_orders", old_run)}"'
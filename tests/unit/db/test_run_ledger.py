@@ -37,5 +37,7 @@ def test_run_ledger_happy_path() -> None:
     ]  # no other random call site
     # on creation
     assert "INSERT INTO run_ledger" in str(calls[0][1])
+    # looks up which tables take run partitions (none on this fake)
+    assert "pg_partitioned_table" in str(calls[1][1])
     # on status change
-    assert "UPDATE run_ledger" in str(calls[1][1])
+    assert "UPDATE run_ledger" in str(calls[2][1])
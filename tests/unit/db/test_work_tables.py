@@ -9,6 +9,10 @@ import psycopg
 import warehouse_pipeline.db.work_tables as work_tables_mod
 from tests.unit.db.mocks import FakeConnection
 from warehouse_pipeline.db.writers.staging import StagingTableSpec
+from warehouse_pipeline.extract.bundles import read_snapshot_bundle, snapshot_root_for_key
+from warehouse_pipeline.stage.map_carts import map_carts
+from warehouse_pipeline.stage.map_products import map_products
+from warehouse_pipeline.stage.map_users import map_users
 
 
 def test_work_table_happy_path(monkeypatch) -> None:
@@ -75,3 +79,39 @@ def test_work_table_happy_path(monkeypatch) -> None:
     assert inserted_into_work == 1
     assert inserted == 1
     assert duplicates == 0  # duplicates explicitly recorded.
+
+
+def test_insert_work_rows_copies_snapshot_rows_in_binary() -> None:
+    """
+    Every staging table's mapped snapshot rows go through binary `COPY` with the spec's
+    types, carrying the same values the `executemany` fallback sends.
+    """
+    bundle = read_snapshot_bundle(snapshot_root=snapshot_root_for_key("v1"))
+    users, products = map_users(bundle.users), map_products(bundle.products)
+    carts = map_carts(
+        bundle.carts, product_lookup=products.product_lookup, user_lookup=users.user_lookup
+    )
+    run_id = uuid4()
+
+    for stage_rows in (users.rows, products.rows, carts.order_rows, carts.order_item_rows):
+        table_name = stage_rows[0].table_name
+        rows = [
+            work_tables_mod.WorkRow(
+                source_ref=row.source_ref, raw_payload=row.raw_payload, values=row.values
+            )
+            for row in stage_rows
+        ]
+        fake = FakeConnection()
+        conn = cast(psycopg.Connection[tuple], fake)
+
+        copied = work_tables_mod.insert_work_rows(
+            conn, table_name=table_name, run_id=run_id, rows=rows
+        )
+        inserted = work_tables_mod.insert_work_rows(
+            conn, table_name=table_name, run_id=run_id, rows=rows, method="executemany"
+        )
+
+        (_, _, copy), (_, _, params) = fake.calls
+        assert copied == inserted == len(rows)
+        assert len(copy.data) > len(rows)
+        assert copy.rows == [(*values[:-1], values[-1].obj) for values in params]
@@ -35,3 +35,28 @@ def test_insert_reject_rows_happy_path() -> None:
     calls = [call for call in fake_conn.calls if call[0] == "cursor.executemany"]  # correct call
     assert len(calls) == 1
     assert len(calls[0][2]) == 1
+
+
+def test_insert_reject_rows_copies_from_the_threshold() -> None:
+    """At `copy_threshold` rejects the writer switches to one binary `COPY`."""
+    fake_conn = FakeConnection()
+    conn = cast(psycopg.Connection[tuple], fake_conn)
+    rejects = [
+        RejectInsert(
+            table_name="stg_order_items",
+            source_ref=i,
+            raw_payload={"cart": {"id": i}, "line": {"quantity": 0}},
+            reason_code="invalid_quantity",
+            reason_detail=f"cart line {i} has non-pos qty=0",
+        )
+        for i in range(1, 6)
+    ]
+
+    n = insert_reject_rows(conn, run_id=uuid4(), rejects=rejects, copy_threshold=5)
+
+    assert n == 5
+    ((name, query, copy),) = fake_conn.calls
+    assert name == "cursor.copy"
+    assert "FORMAT BINARY" in query.as_string()
+    assert [row[2] for row in copy.rows] == [1, 2, 3, 4, 5]
+    assert copy.rows[0][3] == {"cart": {"id": 1}, "line": {"quantity": 0}}
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import time
+
+from warehouse_pipeline.extract.autotune import AutotuneConfig
+from warehouse_pipeline.extract.models import UsersPage
+from warehouse_pipeline.extract.paginator import fetch_all_pages
+
+
+def test_autotune_grows_page_size_when_requests_dominate() -> None:
+    """Fixed per-request latency, so bigger pages win. Items stay complete and in order."""
+    users = [
+        {"id": i, "firstName": f"U{i}", "lastName": "Test", "email": f"u{i}@example.com"}
+        for i in range(1, 601)
+    ]
+
+    def fetch_page(limit: int, skip: int) -> UsersPage:
+        time.sleep(0.005)  # every request costs the same, whatever its size
+        return UsersPage.model_validate(
+            {"users": users[skip : skip + limit], "total": 600, "skip": skip, "limit": limit}
+        )
+
+    tuner = AutotuneConfig(page_size=10, max_concurrency=1).tuner_for("users")
+    result = fetch_all_pages(
+        fetch_page=fetch_page,
+        get_items=lambda page: page.users,
+        get_total=lambda page: page.total,
+        get_skip=lambda page: page.skip,
+        get_limit=lambda page: page.limit,
+        tuner=tuner,
+    )
+    report = tuner.report()
+
+    assert [u.id for u in result.items] == list(range(1, 601))
+    assert report["page_size"] > 10
+    assert report["trace"][0]["action"] == "improve"
+    assert {"latency_s_per_page", "bytes_per_page", "items_per_s"} <= set(report["trace"][0])
+
+
+def test_autotune_refetches_what_a_short_page_left_out() -> None:
+    """
+    A server that serves fewer items than the `limit` it echoes still yields every item,
+    and only the pages that were kept count as fetched or feed the tuner.
+    """
+    users = [
+        {"id": i, "firstName": f"U{i}", "lastName": "Test", "email": f"u{i}@example.com"}
+        for i in range(1, 101)
+    ]
+
+    def fetch_page(limit: int, skip: int) -> UsersPage:
+        served = limit if skip == 0 else min(limit, 15)
+        return UsersPage.model_validate(
+            {"users": users[skip : skip + served], "total": 100, "skip": skip, "limit": limit}
+        )
+
+    tuner = AutotuneConfig(page_size=20, max_concurrency=3).tuner_for("users")
+    result = fetch_all_pages(
+        fetch_page=fetch_page,
+        get_items=lambda page: page.users,
+        get_total=lambda page: page.total,
+        get_skip=lambda page: page.skip,
+        get_limit=lambda page: page.limit,
+        tuner=tuner,
+    )
+    trace = tuner.report()["trace"]
+
+    assert [u.id for u in result.items] == list(range(1, 101))
+    assert result.pages_fetched == 1 + sum(wave["requests"] for wave in trace)
+    assert len(result.page_timings_s) == result.pages_fetched
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import httpx
+
+from warehouse_pipeline.extract.bundles import (
+    fetch_live_bundle_async,
+    fetch_live_compact_bundle_async,
+)
+from warehouse_pipeline.extract.dummyjson_client import AsyncDummyJsonClient
+
+
+def test_fetch_live_bundle_async_happy_path() -> None:
+    """
+    All three resources come back in one bundle with the same page metadata as sync,
+    the compact pull holding the same records as columns.
+    """
+    records = {
+        "users": [{"id": i, "firstName": "User", "lastName": str(i)} for i in range(1, 6)],
+        "products": [
+            {"id": i, "title": f"Item {i}", "category": "misc", "price": 1.0, "stock": 1}
+            for i in range(1, 4)
+        ],
+        "carts": [
+            {
+                "id": i,
+                "userId": 1,
+                "total": 1.0,
+                "discountedTotal": 1.0,
+                "totalProducts": 1,
+                "totalQuantity": 1,
+                "products": [{"id": 1, "quantity": 1, "price": 1.0, "total": 1.0}],
+            }
+            for i in range(1, 5)
+        ],
+    }
+    seen_paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        """Serve an offset/limit slice of one resource."""
+        resource = request.url.path.strip("/")
+        seen_paths.append(resource)
+        limit = int(request.url.params["limit"])
+        skip = int(request.url.params["skip"])
+        return httpx.Response(
+            200,
+            json={
+                resource: records[resource][skip : skip + limit],
+                "total": len(records[resource]),
+                "skip": skip,
+                "limit": limit,
+            },
+            request=request,
+        )
+
+    async def no_sleep(_: float) -> None:
+        """Skip real waiting."""
+
+    async def run(fetch: Any) -> Any:
+        """Drive the extraction over a mocked async transport."""
+        http_client = httpx.AsyncClient(
+            base_url="https://dummyjson.com",
+            transport=httpx.MockTransport(handler),
+        )
+        async with http_client:
+            client = AsyncDummyJsonClient(client=http_client, sleeper=no_sleep)
+            return await fetch(page_size=2, client=client, concurrency=2)
+
+    bundle = asyncio.run(run(fetch_live_bundle_async))
+    compact = asyncio.run(run(fetch_live_compact_bundle_async))
+
+    assert [u.id for u in bundle.users] == [1, 2, 3, 4, 5]
+    assert [c.id for c in bundle.carts] == [1, 2, 3, 4]
+    assert bundle.pages_fetched == {"users": 3, "products": 2, "carts": 2}
+    assert set(seen_paths) == {"users", "products", "carts"}
+
+    assert list(compact.carts) == [c.model_dump(mode="python") for c in bundle.carts]
+    assert list(compact.users) == [u.model_dump(mode="python") for u in bundle.users]
+    assert compact.pages_fetched == bundle.pages_fetched
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import httpx
+import pytest
+
+from warehouse_pipeline.extract.bundles import fetch_live_bundle
+from warehouse_pipeline.extract.checkpoint import PageCheckpoint
+from warehouse_pipeline.extract.dummyjson_client import DummyJsonClient, DummyJsonClientError
+from warehouse_pipeline.extract.synthetic import synthetic_payloads
+
+
+def test_resumed_pull_only_fetches_what_the_failed_one_missed(tmp_path: Path) -> None:
+    """A pull dies mid-carts, the resumed one reuses every completed page from disk."""
+    payloads = synthetic_payloads(users=6, products=4, carts=6, seed=2)
+    fail_at = {"carts": 4}  # the 3rd carts page blows up on the first run only
+    fetched: list[tuple[str, int]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        """Offset/limit slices, failing once where `fail_at` says."""
+        resource = request.url.path.strip("/")
+        limit = int(request.url.params["limit"])
+        skip = int(request.url.params["skip"])
+        if fail_at.get(resource) == skip:
+            return httpx.Response(404, request=request)
+        fetched.append((resource, skip))
+        rows = payloads[resource][resource]
+        return httpx.Response(
+            200,
+            json={
+                resource: rows[skip : skip + limit],
+                "total": len(rows),
+                "skip": skip,
+                "limit": limit,
+            },
+            request=request,
+        )
+
+    def pull(checkpoint: PageCheckpoint):
+        client = DummyJsonClient(
+            client=httpx.Client(
+                base_url="https://dummyjson.com", transport=httpx.MockTransport(handler)
+            ),
+            min_interval_s=0.0,
+        )
+        return fetch_live_bundle(page_size=2, client=client, checkpoint=checkpoint)
+
+    first = PageCheckpoint(tmp_path / "run-1" / "extract", page_size=2)
+    with pytest.raises(DummyJsonClientError):
+        pull(first)
+    assert first.stats()["completed"] == {"carts": 2, "products": 2, "users": 3}
+    log = (tmp_path / "run-1" / "extract" / "completed.jsonl").read_text("utf-8")
+    assert len(log.splitlines()) == 7  # one appended line per saved page
+
+    with pytest.raises(ValueError, match="page_size=2"):
+        PageCheckpoint.resume(
+            tmp_path / "run-2" / "extract",
+            from_root=tmp_path / "run-1" / "extract",
+            resumed_from="run-1",
+            page_size=3,
+        )
+
+    fail_at.clear()
+    fetched.clear()
+    resumed = PageCheckpoint.resume(
+        tmp_path / "run-2" / "extract",
+        from_root=tmp_path / "run-1" / "extract",
+        resumed_from="run-1",
+        page_size=2,
+    )
+    bundle = pull(resumed)
+
+    assert fetched == [("carts", 4)]
+    assert [c.id for c in bundle.carts] == [1, 2, 3, 4, 5, 6]
+    assert resumed.stats()["pages_reused"] == 7
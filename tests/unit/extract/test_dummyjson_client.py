@@ -60,3 +60,33 @@ def test_client_retries_429_then_succeeds() -> None:
     assert page.users[0].id == 1
     assert calls["count"] == 2  # one on `Retry-After`, another retry after.
     # no more, no less
+
+    # the retry and the throttle both land in the manifest counters
+    stats = client.stats()
+    assert stats["requests"] == 2
+    assert stats["retries"] == 1
+    assert stats["retry_statuses"] == {"429": 1}
+    assert stats["rate_limiter"]["throttled_responses"] == 1
+
+
+def test_client_projects_pages_to_model_fields() -> None:
+    """`select=` lists the fields `DummyUser` reads, carts are fetched whole."""
+    seen: dict[str, str | None] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        resource = request.url.path.strip("/")
+        seen[resource] = request.url.params.get("select")
+        return httpx.Response(
+            200, json={resource: [], "total": 0, "skip": 0, "limit": 1}, request=request
+        )
+
+    http_client = httpx.Client(
+        base_url="https://dummyjson.com", transport=httpx.MockTransport(handler)
+    )
+    client = DummyJsonClient(client=http_client, min_interval_s=0.0)
+
+    client.get_users_page(limit=1, skip=0)
+    client.get_carts_page(limit=1, skip=0)
+
+    assert seen["users"] == "id,firstName,lastName,email,phone,birthDate,address,company"
+    assert seen["carts"] is None
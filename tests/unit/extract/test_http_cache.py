@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import httpx
+
+from warehouse_pipeline.extract.dummyjson_client import DummyJsonClient
+from warehouse_pipeline.extract.http_cache import ResponseCache
+
+
+def test_second_run_serves_304_from_disk(tmp_path: Path) -> None:
+    """First run stores the page with its `ETag`, the next one revalidates and reuses it."""
+    seen_if_none_match: list[str | None] = []
+    payload = {
+        "users": [
+            {"id": 1, "firstName": "Ada", "lastName": "Lovelace", "email": "ada@example.com"}
+        ],
+        "total": 1,
+        "skip": 0,
+        "limit": 1,
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        """Answer `304` whenever the client already holds the current `ETag`."""
+        seen_if_none_match.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'}, request=request)
+        return httpx.Response(200, json=payload, headers={"ETag": '"v1"'}, request=request)
+
+    def run_once() -> tuple[int, dict]:
+        """One 'run', a fresh client and cache counters over the same directory."""
+        cache = ResponseCache(tmp_path / "_http_cache")
+        http_client = httpx.Client(
+            base_url="https://dummyjson.com", transport=httpx.MockTransport(handler)
+        )
+        with DummyJsonClient(client=http_client, min_interval_s=0.0, response_cache=cache) as c:
+            page = c.get_users_page(limit=1, skip=0)
+            return page.users[0].id, c.stats()["http_cache"]
+
+    first_id, first_stats = run_once()
+    second_id, second_stats = run_once()
+
+    assert first_id == second_id == 1
+    assert seen_if_none_match == [None, '"v1"']
+    assert first_stats["misses"] == 1 and first_stats["stores"] == 1
+    assert second_stats["hits"] == 1 and second_stats["bytes_saved"] > 0
+
+
+def test_expired_and_oversized_entries_are_dropped(tmp_path: Path) -> None:
+    """TTL drops stale entries, `max_bytes` evicts the least recently used."""
+    now = {"t": 1000.0}
+    cache = ResponseCache(tmp_path, ttl_s=60, max_bytes=15, clock=lambda: now["t"])
+
+    def response(body: bytes) -> httpx.Response:
+        return httpx.Response(200, content=body, headers={"ETag": '"x"'})
+
+    cache.store("/users", {"skip": 0}, response(b"0123456789"))
+    cache.store("/users", {"skip": 10}, response(b"abcdefghij"))  # pushes past 15 bytes
+
+    assert cache.stats()["evicted"] == 1
+    assert cache.lookup("/users", {"skip": 10}) is not None
+
+    now["t"] += 61
+    assert cache.lookup("/users", {"skip": 10}) is None
+    assert cache.stats()["expired"] == 1
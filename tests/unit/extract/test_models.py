@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-from warehouse_pipeline.extract.models import parse_users_page
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from warehouse_pipeline.extract.models import parse_carts_page, parse_users_page
 
 
 def test_parse_users_page_happy_path() -> None:
@@ -30,3 +35,31 @@ def test_parse_users_page_happy_path() -> None:
     assert page.users[0].firstName == "Ada"
     assert page.users[0].address is not None
     assert page.users[0].address.city == "London"
+
+
+def test_parse_page_from_raw_bytes_matches_dict_path() -> None:
+    """Raw JSON bytes validate to the same page as the decoded dict, bad JSON is rejected."""
+    payload = {
+        "carts": [
+            {
+                "id": 7,
+                "userId": 3,
+                "total": 19.98,
+                "discountedTotal": 17.98,
+                "totalProducts": 1,
+                "totalQuantity": 2,
+                "products": [
+                    {"id": 1, "title": "Mascara", "price": 9.99, "quantity": 2, "total": 19.98}
+                ],
+            }
+        ],
+        "total": 1,
+        "skip": 0,
+        "limit": 30,
+    }
+
+    from_bytes = parse_carts_page(json.dumps(payload).encode("utf-8"))
+
+    assert from_bytes == parse_carts_page(payload)
+    with pytest.raises(ValidationError, match="json_invalid"):
+        parse_carts_page(b"<html>not json</html>")
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+from warehouse_pipeline.extract.bundles import read_snapshot_bundle, write_snapshot_bundle
+from warehouse_pipeline.extract.snapshot_store import SnapshotStore
+from warehouse_pipeline.extract.synthetic import synthetic_payloads
+
+
+def test_chunked_daily_capture_writes_only_changed_chunks(tmp_path: Path) -> None:
+    """
+    Two captures of the same source share one object store, the second writes just
+    the chunk holding the edited user, and both read back exactly.
+    """
+    payloads = synthetic_payloads(users=2000, products=300, carts=200, seed=5)
+    for resource, payload in payloads.items():
+        SnapshotStore(tmp_path / "seed").write_json(resource, payload)
+    day1 = read_snapshot_bundle(snapshot_root=tmp_path / "seed")
+    write_snapshot_bundle(day1, snapshot_root=tmp_path / "day1", snapshot_format="chunked")
+    objects_after_day1 = set((tmp_path / "_objects").rglob("*.ndjson.gz"))
+
+    users = list(day1.users)
+    users[1500] = users[1500].model_copy(update={"lastName": "Renamed"})
+    day2 = replace(day1, users=tuple(users))
+    write_snapshot_bundle(day2, snapshot_root=tmp_path / "day2", snapshot_format="chunked")
+
+    store = SnapshotStore(tmp_path / "day2")
+    new_objects = set((tmp_path / "_objects").rglob("*.ndjson.gz")) - objects_after_day1
+    assert store.format_for("users") == "chunked"
+    assert len(store.read_chunk_manifest("users")["chunks"]) > 1
+    assert len(new_objects) == 1
+
+    replayed = read_snapshot_bundle(snapshot_root=tmp_path / "day2")
+    assert replayed.users == day2.users
+    assert replayed.carts == day1.carts
+    assert read_snapshot_bundle(snapshot_root=tmp_path / "day1").users == day1.users
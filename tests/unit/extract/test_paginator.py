@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import time
+
+import pytest
+
 from warehouse_pipeline.extract.models import UsersPage
-from warehouse_pipeline.extract.paginator import fetch_all_pages
+from warehouse_pipeline.extract.paginator import fetch_all_pages, iter_items, iter_prefetched
 
 
 def test_fetch_all_pages_happy_path() -> None:
@@ -61,3 +65,99 @@ def test_fetch_all_pages_happy_path() -> None:
     assert result.total == 2
     assert result.pages_fetched == 2
     assert [user.id for user in result.items] == [1, 2]
+
+
+def test_fetch_all_pages_concurrent_keeps_offset_order() -> None:
+    """Concurrent fan-out returns items in offset order and times every page."""
+    total = 7
+
+    def fetch_page(limit: int, skip: int) -> UsersPage:
+        """Serve `limit` users starting at `skip`, late pages finish first."""
+        time.sleep(0.01 * (total - skip) / total)
+        return UsersPage.model_validate(
+            {
+                "users": [
+                    {"id": i + 1, "firstName": "User", "lastName": str(i + 1)}
+                    for i in range(skip, min(skip + limit, total))
+                ],
+                "total": total,
+                "skip": skip,
+                "limit": limit,
+            }
+        )
+
+    result = fetch_all_pages(
+        fetch_page=fetch_page,
+        get_items=lambda page: page.users,
+        get_total=lambda page: page.total,
+        get_skip=lambda page: page.skip,
+        get_limit=lambda page: page.limit,
+        page_size=2,
+        concurrency=3,
+    )
+
+    assert result.total == 7
+    assert result.pages_fetched == 4
+    assert [user.id for user in result.items] == [1, 2, 3, 4, 5, 6, 7]
+    assert list(result.page_timings_s) == [0, 2, 4, 6]
+
+
+def test_fetch_all_pages_concurrent_refuses_a_short_middle_page() -> None:
+    """A fan-out page that comes back short would leave a gap, so the fetch fails loudly."""
+    total = 6
+
+    def fetch_page(limit: int, skip: int) -> UsersPage:
+        """Serve `limit` users from `skip`, except one short page at `skip=2`."""
+        served = 1 if skip == 2 else limit
+        return UsersPage.model_validate(
+            {
+                "users": [
+                    {"id": i + 1, "firstName": "User", "lastName": str(i + 1)}
+                    for i in range(skip, min(skip + served, total))
+                ],
+                "total": total,
+                "skip": skip,
+                "limit": limit,
+            }
+        )
+
+    with pytest.raises(RuntimeError, match="got 5 of total=6"):
+        fetch_all_pages(
+            fetch_page=fetch_page,
+            get_items=lambda page: page.users,
+            get_total=lambda page: page.total,
+            get_skip=lambda page: page.skip,
+            get_limit=lambda page: page.limit,
+            page_size=2,
+            concurrency=3,
+        )
+
+
+def test_iter_items_prefetched_streams_pages_in_order() -> None:
+    """Items come out page by page in offset order, read one page ahead."""
+    users = [
+        {"id": i, "firstName": f"U{i}", "lastName": "Test", "email": f"u{i}@example.com"}
+        for i in range(1, 6)
+    ]
+    fetched: list[int] = []
+
+    def fetch_page(limit: int, skip: int) -> UsersPage:
+        fetched.append(skip)
+        return UsersPage.model_validate(
+            {"users": users[skip : skip + limit], "total": 5, "skip": skip, "limit": limit}
+        )
+
+    pages = iter_prefetched(
+        iter_items(
+            fetch_page=fetch_page,
+            get_items=lambda page: page.users,
+            get_total=lambda page: page.total,
+            get_skip=lambda page: page.skip,
+            get_limit=lambda page: page.limit,
+            page_size=2,
+        ),
+        depth=1,
+    )
+
+    assert [u.id for u in pages] == [1, 2, 3, 4, 5]
+    assert fetched == [0, 2, 4]
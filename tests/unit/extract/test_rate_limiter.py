@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from warehouse_pipeline.extract.rate_limiter import TokenBucketRateLimiter
+
+
+def test_token_bucket_bursts_tightens_and_relaxes() -> None:
+    """Burst is free, a `429` halves the rate and pauses, a success streak steps it back up."""
+    now = {"t": 0.0}
+    sleeps: list[float] = []
+
+    def fake_sleep(seconds: float) -> None:
+        """Advance the fake clock instead of sleeping."""
+        sleeps.append(seconds)
+        now["t"] += seconds
+
+    limiter = TokenBucketRateLimiter(
+        rate_per_s=10.0,
+        burst=2,
+        increase_step_per_s=5.0,
+        success_streak=2,
+        clock=lambda: now["t"],
+        sleeper=fake_sleep,
+    )
+
+    # two banked tokens, then the third request waits one refill (0.1s at 10/s)
+    assert limiter.acquire() == 0.0
+    assert limiter.acquire() == 0.0
+    assert round(limiter.acquire(), 6) == 0.1
+
+    # throttled: rate halves and every caller waits out `Retry-After`
+    limiter.on_throttle(retry_after_s=2.0)
+    assert limiter.stats()["rate_per_s"] == 5.0
+    assert round(limiter.acquire(), 6) == 2.0
+
+    # a streak of successes relaxes back toward the starting rate, never past it
+    for _ in range(4):
+        limiter.on_success()
+    stats = limiter.stats()
+    assert stats["rate_per_s"] == 10.0
+    assert stats["rate_decreases"] == 1
+    assert stats["rate_increases"] == 1
+    assert stats["throttled_responses"] == 1
+    assert stats["throttle_waits"] == 2
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import httpx
+import pytest
+
+from warehouse_pipeline.extract.dummyjson_client import CircuitOpenError, DummyJsonClient
+from warehouse_pipeline.extract.rate_limiter import TokenBucketRateLimiter
+from warehouse_pipeline.extract.resilience import CircuitBreaker, HedgePolicy
+
+
+def _users_page(request: httpx.Request) -> httpx.Response:
+    """One-user `/users` page."""
+    return httpx.Response(
+        200,
+        json={
+            "users": [
+                {"id": 1, "firstName": "Ada", "lastName": "Lovelace", "email": "ada@example.com"}
+            ],
+            "total": 1,
+            "skip": 0,
+            "limit": 1,
+        },
+        request=request,
+    )
+
+
+def test_hedged_duplicate_wins_over_a_stalled_request() -> None:
+    """A request stuck past the latency percentile gets a duplicate, which answers first."""
+    calls = {"count": 0}
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            calls["count"] += 1
+            call = calls["count"]
+        if call == 3:
+            time.sleep(1.0)  # the tail
+        return _users_page(request)
+
+    hedge = HedgePolicy(percentile=50, min_samples=2, max_hedge_ratio=1.0)
+    with DummyJsonClient(
+        client=httpx.Client(
+            base_url="https://dummyjson.com", transport=httpx.MockTransport(handler)
+        ),
+        min_interval_s=0.0,
+        hedge=hedge,
+    ) as client:
+        for _ in range(2):  # warm the latency window
+            client.get_users_page(limit=1, skip=0)
+
+        started = time.perf_counter()
+        page = client.get_users_page(limit=1, skip=0)
+        elapsed = time.perf_counter() - started
+
+        stats = client.stats()
+
+    assert page.users[0].id == 1
+    assert elapsed < 0.5
+    assert stats["hedge"]["hedges_fired"] == 1
+    assert stats["hedge"]["hedges_won"] == 1
+    assert stats["requests"] == 4
+
+
+def test_hedge_is_skipped_when_the_rate_limiter_has_no_token() -> None:
+    """An exhausted limiter skips the duplicate instead of blocking on a token."""
+    calls = {"count": 0}
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            calls["count"] += 1
+            call = calls["count"]
+        if call == 3:
+            time.sleep(0.3)  # the tail
+        return _users_page(request)
+
+    hedge = HedgePolicy(percentile=50, min_samples=2, max_hedge_ratio=1.0)
+    limiter = TokenBucketRateLimiter(rate_per_s=0.1, burst=3)  # exactly three requests' worth
+    with DummyJsonClient(
+        client=httpx.Client(
+            base_url="https://dummyjson.com", transport=httpx.MockTransport(handler)
+        ),
+        rate_limiter=limiter,
+        hedge=hedge,
+    ) as client:
+        for _ in range(3):
+            client.get_users_page(limit=1, skip=0)
+        stats = client.stats()
+
+    assert calls["count"] == 3
+    assert stats["requests"] == 3
+    assert stats["hedge"]["hedges_fired"] == 0
+    assert stats["hedge"]["hedges_skipped"] == 1
+
+
+def test_circuit_breaker_fails_fast_then_probes_after_cooldown() -> None:
+    """An error spike trips the breaker, retries stop, a later probe closes it again."""
+    calls = {"count": 0}
+    now = {"t": 0.0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        if calls["count"] <= 2:
+            return httpx.Response(503, request=request)
+        return _users_page(request)
+
+    breaker = CircuitBreaker(
+        failure_threshold=0.5, window=4, min_requests=2, open_for_s=30.0, clock=lambda: now["t"]
+    )
+    client = DummyJsonClient(
+        client=httpx.Client(
+            base_url="https://dummyjson.com", transport=httpx.MockTransport(handler)
+        ),
+        min_interval_s=0.0,
+        max_attempts=5,
+        sleeper=lambda _s: None,
+        circuit_breaker=breaker,
+    )
+
+    with pytest.raises(CircuitOpenError):
+        client.get_users_page(limit=1, skip=0)
+    assert calls["count"] == 2  # the third attempt never went out
+    assert breaker.state == "open"
+
+    now["t"] = 31.0
+    page = client.get_users_page(limit=1, skip=0)
+
+    assert page.users[0].id == 1
+    assert breaker.state == "closed"
+    assert client.stats()["circuit_breaker"] == {"state": "closed", "trips": 1, "rejected": 1}
+
+
+def _half_open_client(handler) -> tuple[DummyJsonClient, CircuitBreaker]:
+    """A client whose breaker has tripped and cooled down, so its next request probes."""
+    now = {"t": 0.0}
+    breaker = CircuitBreaker(
+        failure_threshold=0.5, window=2, min_requests=1, open_for_s=30.0, clock=lambda: now["t"]
+    )
+    breaker.record_failure()
+    now["t"] = 31.0
+    client = DummyJsonClient(
+        client=httpx.Client(
+            base_url="https://dummyjson.com", transport=httpx.MockTransport(handler)
+        ),
+        min_interval_s=0.0,
+        max_attempts=1,
+        sleeper=lambda _s: None,
+        circuit_breaker=breaker,
+    )
+    return client, breaker
+
+
+@pytest.mark.parametrize("probe", ["429", "raises"])
+def test_circuit_breaker_probe_without_a_verdict_lets_the_next_request_probe(probe) -> None:
+    """A throttled probe, or one that raises, doesn't leave the breaker refusing forever."""
+    calls = {"count": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        if calls["count"] == 1:
+            if probe == "raises":
+                raise RuntimeError("not an httpx error")
+            return httpx.Response(429, request=request)
+        return _users_page(request)
+
+    client, breaker = _half_open_client(handler)
+    with pytest.raises(Exception):  # noqa: B017 - `DummyJsonClientError` or the `RuntimeError`
+        client.get_users_page(limit=1, skip=0)
+    assert breaker.state == "half_open"
+
+    page = client.get_users_page(limit=1, skip=0)
+
+    assert page.users[0].id == 1
+    assert breaker.state == "closed"
+    assert breaker.stats()["rejected"] == 0
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from warehouse_pipeline.extract.bundles import (
+    read_compact_snapshot_bundle,
+    read_snapshot_bundle,
+    snapshot_root_for_key,
+    write_snapshot_bundle,
+)
+from warehouse_pipeline.extract.compact import compact_bundle
+from warehouse_pipeline.extract.snapshot_store import SnapshotStore
+
+
+def test_sharded_snapshot_reads_back_in_order_across_processes(tmp_path: Path) -> None:
+    """
+    One record per shard, two worker processes, records still come back in order, and
+    as columns when validated in the pool.
+    """
+    original = read_snapshot_bundle(snapshot_root=snapshot_root_for_key("v1"))
+    write_snapshot_bundle(original, snapshot_root=tmp_path, snapshot_format="sharded", shard_size=1)
+
+    store = SnapshotStore(tmp_path)
+    assert store.format_for("carts") == "sharded"
+    assert len(store.shard_paths("carts")) == len(original.carts)
+
+    replayed = read_snapshot_bundle(snapshot_root=tmp_path)
+    assert replayed.users == original.users
+    assert replayed.carts == original.carts
+    assert replayed.totals == original.totals
+    assert replayed.source_paths["carts"].endswith("carts/manifest.json")
+
+    columns = read_compact_snapshot_bundle(snapshot_root=tmp_path, workers=2)
+    expected = compact_bundle(original)
+    assert columns.users.columns == expected.users.columns
+    assert columns.carts.columns == expected.carts.columns
+    assert columns.totals == original.totals
+
+    fused = read_snapshot_bundle(snapshot_root=tmp_path, fused_carts=True, workers=2)
+    assert list(fused.raw_carts) == [c.model_dump(mode="json") for c in original.carts]
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import json
+import shutil
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from warehouse_pipeline.extract import bundles
+from warehouse_pipeline.extract.bundles import read_snapshot_bundle, snapshot_root_for_key
+from warehouse_pipeline.extract.snapshot_cache import CACHE_DIR_NAME
+from warehouse_pipeline.extract.snapshot_generator import GeneratorConfig, generate_snapshot
+from warehouse_pipeline.stage.derive_fields import derive_order_ts
+
+
+def test_snapshot_cache_hits_without_validating_and_invalidates_on_edit(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Same bytes load from the pickle, an edited file is a miss that replaces it."""
+    root = tmp_path / "v1"
+    shutil.copytree(snapshot_root_for_key("v1"), root)
+
+    first = read_snapshot_bundle(snapshot_root=root, snapshot_key="v1", use_cache=True)
+    assert first.snapshot_cache["hit"] is False
+
+    def _no_validation(_payload: object) -> None:
+        raise AssertionError("cache hit should not validate")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(bundles, "parse_users_page", _no_validation)
+        patch.setattr(bundles, "parse_carts_page", _no_validation)
+        second = read_snapshot_bundle(snapshot_root=root, snapshot_key="v1", use_cache=True)
+
+    assert second.snapshot_cache == {"hit": True, "key": first.snapshot_cache["key"]}
+    assert second.users == first.users
+    assert second.carts == first.carts
+
+    carts_path = root / "carts.json"
+    carts = json.loads(carts_path.read_text(encoding="utf-8"))
+    carts["carts"] = carts["carts"][:1]
+    carts_path.write_text(json.dumps(carts), encoding="utf-8")
+
+    third = read_snapshot_bundle(snapshot_root=root, snapshot_key="v1", use_cache=True)
+    assert third.snapshot_cache["hit"] is False
+    assert third.snapshot_cache["key"] != first.snapshot_cache["key"]
+    assert len(third.carts) == 1
+    # older entries are kept up to the bound, switching variants doesn't thrash
+    assert len(list((root / CACHE_DIR_NAME).glob("*.pickle"))) == 2
+
+
+def test_snapshot_cache_serves_every_replay_window_and_never_fails_the_read(
+    tmp_path: Path,
+) -> None:
+    """
+    The unfiltered bundle is what gets cached, so two windows share one entry and
+    match the uncached reads. An unwritable cache only means the entry isn't stored.
+    """
+    root = tmp_path / "generated"
+    generate_snapshot(root, GeneratorConfig(users=20, products=10, carts=30, seed=5))
+    everything = read_snapshot_bundle(snapshot_root=root)
+    order_ts = sorted(derive_order_ts(cart_id=c.id, user_id=c.userId) for c in everything.carts)
+    windows = [(order_ts[0], order_ts[10]), (order_ts[10], order_ts[-1] + timedelta(seconds=1))]
+
+    reads = [
+        read_snapshot_bundle(snapshot_root=root, use_cache=True, carts_between=window)
+        for window in windows
+    ]
+    assert [r.snapshot_cache["hit"] for r in reads] == [False, True]
+    assert reads[0].snapshot_cache["key"] == reads[1].snapshot_cache["key"]
+    for window, cached in zip(windows, reads, strict=True):
+        uncached = read_snapshot_bundle(snapshot_root=root, carts_between=window)
+        assert cached.carts == uncached.carts
+        assert cached.totals == uncached.totals
+
+    shutil.rmtree(root / CACHE_DIR_NAME)
+    (root / CACHE_DIR_NAME).write_text("not a directory", encoding="utf-8")
+    unstored = read_snapshot_bundle(snapshot_root=root, use_cache=True)
+    assert unstored.snapshot_cache["stored"] is False
+    assert unstored.carts == everything.carts
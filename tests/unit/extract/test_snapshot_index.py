@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import os
+from datetime import UTC, datetime
+from pathlib import Path
+
+from warehouse_pipeline.extract.bundles import read_snapshot_bundle, write_snapshot_bundle
+from warehouse_pipeline.extract.snapshot_store import SnapshotStore
+from warehouse_pipeline.extract.synthetic import synthetic_payloads
+
+
+def test_window_read_seeks_through_the_index_and_matches_a_scan(tmp_path: Path) -> None:
+    """
+    The indexed window read returns the carts a full scan keeps, in the same order,
+    and a data file touched after its index is written falls back to the scan.
+    """
+    payloads = synthetic_payloads(users=50, products=50, carts=3000, seed=3)
+    json_root, ndjson_root = tmp_path / "json", tmp_path / "ndjson"
+    for resource, payload in payloads.items():
+        SnapshotStore(json_root).write_json(resource, payload)
+    full = read_snapshot_bundle(snapshot_root=json_root)
+    write_snapshot_bundle(full, snapshot_root=ndjson_root, snapshot_format="ndjson")
+
+    week = (datetime(2024, 3, 1, tzinfo=UTC), datetime(2024, 3, 8, tzinfo=UTC))
+    scanned = read_snapshot_bundle(snapshot_root=json_root, carts_between=week)
+    indexed = read_snapshot_bundle(snapshot_root=ndjson_root, carts_between=week)
+
+    assert scanned.window_read == {"strategy": "scan"}
+    assert indexed.window_read["strategy"] == "index"
+    assert 0 < len(indexed.carts) < len(full.carts)
+    assert indexed.carts == scanned.carts
+    assert indexed.totals == scanned.totals
+    assert scanned.totals["carts_pre_filter"] == 3000
+
+    carts_path = ndjson_root / "carts.ndjson.gz"
+    stat = carts_path.stat()
+    os.utime(carts_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    stale = read_snapshot_bundle(snapshot_root=ndjson_root, carts_between=week)
+    assert stale.window_read == {"strategy": "scan"}
+    assert stale.carts == scanned.carts
@@ -1,7 +1,15 @@
 from __future__ import annotations
 
+import gzip
 from pathlib import Path
 
+import pytest
+
+from warehouse_pipeline.extract.bundles import (
+    read_snapshot_bundle,
+    snapshot_root_for_key,
+    write_snapshot_bundle,
+)
 from warehouse_pipeline.extract.snapshot_store import SnapshotStore
 
 
@@ -28,3 +36,30 @@ def test_snapshot_store_roundtrip(tmp_path: Path) -> None:
     assert path.name == "users.json"  # saved where expected.
     assert loaded["total"] == 1
     assert loaded["users"][0]["id"] == 1
+
+
+def test_ndjson_snapshot_roundtrips_through_read_snapshot_bundle(tmp_path: Path) -> None:
+    """
+    A bundle written as `.ndjson.gz` reads back the same as its `.json` original,
+    and a file cut before its trailer is refused.
+    """
+    original = read_snapshot_bundle(snapshot_root=snapshot_root_for_key("v1"))
+    out = write_snapshot_bundle(original, snapshot_root=tmp_path, snapshot_format="ndjson")
+
+    store = SnapshotStore(tmp_path)
+    assert out["carts"].name == "carts.ndjson.gz"
+    assert store.format_for("carts") == "ndjson"
+    assert store.read_ndjson_header("carts")["total"] == len(original.carts)
+
+    replayed = read_snapshot_bundle(snapshot_root=tmp_path)
+    assert replayed.users == original.users
+    assert replayed.products == original.products
+    assert replayed.carts == original.carts
+
+    fused = read_snapshot_bundle(snapshot_root=tmp_path, fused_carts=True)
+    assert list(fused.raw_carts) == [c.model_dump(mode="json") for c in original.carts]
+
+    lines = gzip.decompress(out["carts"].read_bytes()).splitlines(keepends=True)
+    out["carts"].write_bytes(gzip.compress(b"".join(lines[:-1])))
+    with pytest.raises(ValueError, match="truncated"):
+        list(store.iter_ndjson("carts"))
@@ -1,6 +1,12 @@
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
+from typing import cast
 
+import httpx
+
+import warehouse_pipeline.extract.sources.square_orders_source as square_mod
 from warehouse_pipeline.extract.sources.square_orders_source import SquareOrdersSource
+from warehouse_pipeline.extract.transport import SharedTransport
+from warehouse_pipeline.orchestration.extraction_window import ExtractionWindow
 
 
 def test_square_search_orders_payload_uses_updated_at_and_asc_sort() -> None:
@@ -25,3 +31,40 @@ def test_square_search_orders_payload_uses_updated_at_and_asc_sort() -> None:
         "sort_field": "UPDATED_AT",
         "sort_order": "ASC",
     }
+
+
+def test_square_pull_reports_transport_counters(monkeypatch) -> None:
+    """Wire bytes and connection reuse land in the bundle's `client_stats`, like DummyJSON's."""
+    pages = [
+        {"orders": [{"id": "o1"}], "cursor": "next"},
+        {"orders": [{"id": "o2"}]},
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=pages.pop(0), request=request)
+
+    monkeypatch.setattr(
+        square_mod,
+        "shared_transport",
+        lambda *, pool_size: SharedTransport(
+            cast(httpx.HTTPTransport, httpx.MockTransport(handler))
+        ),
+    )
+    src = SquareOrdersSource(access_token="x", location_ids=("L1",))
+    window = ExtractionWindow(
+        watermark_column="updated_at",
+        low=datetime(2026, 3, 1, tzinfo=UTC),
+        high=datetime(2026, 3, 8, tzinfo=UTC),
+        prior_watermark=None,
+        overlap=timedelta(0),
+        is_first_run=True,
+    )
+
+    pull = src.pull_incremental(page_size=100, window=window)
+    stats = pull.bundle.client_stats
+
+    assert pull.meta["orders_pulled"] == 2
+    assert stats["requests"] == 2
+    assert stats["transport"]["requests"] == 2
+    assert stats["transport"]["bytes_on_wire"] == stats["bytes_received"] > 0
+    assert stats["transport"]["connections_reused"] == 2  # the mock never opens a connection
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from warehouse_pipeline.bench import FakeDummyJsonServer
+from warehouse_pipeline.extract.dummyjson_client import DummyJsonClient
+from warehouse_pipeline.extract.transport import close_shared_transports
+
+
+def test_clients_reuse_pooled_connections_across_instances() -> None:
+    """A second client on the same pool sends over the first one's kept-alive connection."""
+    with FakeDummyJsonServer.synthetic(users=20, products=5, carts=5) as server:
+        try:
+            with DummyJsonClient(base_url=server.url, min_interval_s=0.0, pool_size=3) as first:
+                first.get_users_page(limit=10, skip=0)
+                first.get_users_page(limit=10, skip=10)
+                first_stats = first.stats()["transport"]
+
+            with DummyJsonClient(base_url=server.url, min_interval_s=0.0, pool_size=3) as second:
+                second.get_products_page(limit=5, skip=0)
+                second_stats = second.stats()["transport"]
+        finally:
+            close_shared_transports()
+
+    assert first_stats["requests"] == 2
+    assert first_stats["connections_opened"] == 1
+    assert first_stats["connections_reused"] == 1
+    assert first_stats["bytes_on_wire"] > 0
+    assert second_stats["connections_opened"] == 0
+    assert second_stats["connections_reused"] == 1
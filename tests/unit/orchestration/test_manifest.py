@@ -5,7 +5,7 @@ from datetime import UTC, datetime
 from uuid import UUID
 
 from warehouse_pipeline.orchestration.contract import RunManifest
-from warehouse_pipeline.orchestration.manifest import write_manifest
+from warehouse_pipeline.orchestration.manifest import latest_autotune_seeds, write_manifest
 
 
 def test_write_manifest_happy_path(tmp_path) -> None:
@@ -41,3 +41,32 @@ def test_write_manifest_happy_path(tmp_path) -> None:
     assert payload["run_id"] == str(run_id)
     assert payload["status"] == "succeeded"
     assert payload["extract"]["counts"]["users"] == 1  # specific nested example
+
+
+def test_latest_autotune_seeds_picks_newest_succeeded_run(tmp_path) -> None:
+    """Seeds come from the most recent succeeded run that recorded autotune choices."""
+
+    def write(run: str, *, finished_at: str, status: str, page_size: int) -> None:
+        run_dir = tmp_path / run
+        run_dir.mkdir()
+        (run_dir / "manifest.json").write_text(
+            json.dumps(
+                {
+                    "run_id": run,
+                    "status": status,
+                    "source_system": "dummyjson",
+                    "finished_at": finished_at,
+                    "extract": {"autotune": {"users": {"page_size": page_size, "concurrency": 2}}},
+                }
+            ),
+            encoding="utf-8",
+        )
+
+    write("old", finished_at="2026-03-09T12:00:00+00:00", status="succeeded", page_size=50)
+    write("new", finished_at="2026-03-10T12:00:00+00:00", status="succeeded", page_size=200)
+    write("bad", finished_at="2026-03-11T12:00:00+00:00", status="failed", page_size=999)
+
+    run_id, seeds = latest_autotune_seeds(tmp_path, source_system="dummyjson")
+
+    assert run_id == "new"
+    assert seeds == {"users": {"page_size": 200, "concurrency": 2}}
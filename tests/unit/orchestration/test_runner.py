@@ -2,14 +2,19 @@ from __future__ import annotations
 
 from uuid import UUID
 
+import pytest
+
 import warehouse_pipeline.orchestration.runner as runner_mod
 from tests.unit.db.mocks import FakeConnection
 from warehouse_pipeline.dq.gates import GateDecision
 from warehouse_pipeline.dq.runner import DQRunSummary
 from warehouse_pipeline.extract.bundles import ExtractBundle
+from warehouse_pipeline.extract.source_contract import StreamingSourceAdapter
+from warehouse_pipeline.extract.source_registry import get_source_adapter
 from warehouse_pipeline.orchestration.contract import RunSpec
 from warehouse_pipeline.publish.views import PublishResult
 from warehouse_pipeline.stage import MappedCarts, MappedProducts, MappedUsers, StageTableLoadResult
+from warehouse_pipeline.stage.load import PreparedLoadRecovery
 from warehouse_pipeline.transform.warehouse_build import WarehouseBuildResult
 
 
@@ -34,6 +39,13 @@ def test_run_pipeline_happy_path(tmp_path, monkeypatch) -> None:
 
     monkeypatch.setattr(runner_mod, "create_run", lambda got_conn, entry: run_id)
 
+    # prepared-load recovery runs for every run, serial ones included
+    def fake_recover(got_conn):
+        seen["recovered"] = True
+        return PreparedLoadRecovery()
+
+    monkeypatch.setattr(runner_mod, "recover_prepared_loads", fake_recover)
+
     # markers
     monkeypatch.setattr(
         runner_mod,
@@ -51,7 +63,7 @@ def test_run_pipeline_happy_path(tmp_path, monkeypatch) -> None:
     monkeypatch.setattr(
         runner_mod,
         "read_snapshot_bundle",
-        lambda *, snapshot_root, snapshot_key=None: ExtractBundle(
+        lambda *, snapshot_root, snapshot_key=None, **kwargs: ExtractBundle(
             mode="snapshot",
             snapshot_key=snapshot_key,
             users=(),
@@ -76,7 +88,7 @@ def test_run_pipeline_happy_path(tmp_path, monkeypatch) -> None:
     monkeypatch.setattr(
         runner_mod,
         "load_mapped_batches",
-        lambda conn, *, run_id, users, products, carts: {
+        lambda conn, *, run_id, users, products, carts, **kwargs: {
             "stg_customers": StageTableLoadResult(
                 table_name="stg_customers",
                 inserted_count=1,
@@ -147,8 +159,47 @@ def test_run_pipeline_happy_path(tmp_path, monkeypatch) -> None:
 
     assert manifest.status == "succeeded"
     assert seen["dq_called"] is True
+    assert seen["recovered"] is True
     assert seen["marked_succeeded"] == run_id
     assert manifest.dq["stg_customers"]["metrics_written"] == 3
     assert manifest.publish["files_ran"] == ["900_views.sql"]
     assert (tmp_path / "runs" / str(run_id) / "manifest.json").exists()
     assert conn.commit_calls == 5
+
+
+def test_stream_is_refused_for_sources_without_streamed_pulls(monkeypatch) -> None:
+    """`--stream` with a source that can't stream fails before any run is recorded."""
+
+    def no_connect(database_url=None):
+        raise AssertionError("no run should be created")
+
+    monkeypatch.setattr(runner_mod, "connect", no_connect)
+    spec = RunSpec(mode="live", source_system="square_orders", stream_extract=True)
+    with pytest.raises(ValueError, match="does not support `--stream`"):
+        runner_mod.run_pipeline(spec, database_url="postgresql://unit-test")
+
+    adapter = get_source_adapter(RunSpec(mode="live").source_system)
+    assert isinstance(adapter, StreamingSourceAdapter)
+
+
+def test_resume_from_a_missing_run_fails_with_a_manifest(tmp_path, monkeypatch) -> None:
+    """A typo'd `--resume` id fails the run cleanly, still writing its manifest."""
+    conn = FakeConnection()
+    run_id = UUID("00000000-0000-0000-0000-000000000445")
+    failed: list[str] = []
+
+    monkeypatch.setattr(runner_mod, "connect", lambda database_url=None: conn)
+    monkeypatch.setattr(runner_mod, "create_run", lambda got_conn, entry: run_id)
+    monkeypatch.setattr(
+        runner_mod,
+        "mark_run_failed",
+        lambda got_conn, *, run_id, error_message: failed.append(error_message),
+    )
+
+    spec = RunSpec(mode="live", resume_run_id="does-not-exist", runs_root=tmp_path / "runs")
+    manifest = runner_mod.run_pipeline(spec, database_url="postgresql://unit-test")
+
+    assert manifest.status == "failed"
+    assert manifest.extraction_window == {}
+    assert "No extract checkpoint to resume" in failed[0]
+    assert (tmp_path / "runs" / str(run_id) / "manifest.json").exists()
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
 from typing import cast
 from uuid import uuid4
 
 import psycopg
+import pytest
 
 import warehouse_pipeline.stage.load as load_mod
 from warehouse_pipeline.stage import StageReject, StageRow
@@ -13,21 +16,21 @@ def test_load_happy_path(monkeypatch) -> None:
     """Load groups rows by table, writes rejects, and returns summaries per table."""
     calls: list[tuple[str, str, int]] = []
 
-    def fake_prepare_work_table(conn, *, table_name: str) -> None:
+    def fake_prepare_work_table(conn, *, table_name: str, work_table=None) -> None:
         """Append prepared `table_name`s."""
         calls.append(("prepare", table_name, 0))
 
-    def fake_insert_work_rows(conn, *, table_name: str, run_id, rows) -> int:
+    def fake_insert_work_rows(conn, *, table_name: str, run_id, rows, work_table=None) -> int:
         """Append inserted rows."""
         calls.append(("insert", table_name, len(rows)))
         return len(rows)
 
-    def fake_flush_work_table(conn, *, table_name: str, run_id):
+    def fake_flush_work_table(conn, *, table_name: str, run_id, work_table=None):
         """Append flushes."""
         calls.append(("flush", table_name, 0))
         return (len([c for c in calls if c[0] == "insert" and c[1] == table_name]), 0)
 
-    def fake_insert_reject_rows(conn, *, run_id, rejects) -> int:
+    def fake_insert_reject_rows(conn, *, run_id, rejects, copy_threshold) -> int:
         """Append inserted rows."""
         calls.append(("rejects", "reject_rows", len(rejects)))
         return len(rejects)
@@ -73,6 +76,7 @@ def test_load_happy_path(monkeypatch) -> None:
         run_id=uuid4(),
         rows=rows,
         rejects=rejects,
+        direct_load_max_rows=0,  # the work table path
     )
 
     assert ("rejects", "reject_rows", 1) in calls
@@ -82,3 +86,168 @@ def test_load_happy_path(monkeypatch) -> None:
     assert results["stg_customers"].inserted_count == 1
     assert results["stg_orders"].inserted_count == 1
     assert results["stg_order_items"].explicit_reject_count == 1
+
+
+class _TpcConnection:
+    """Just enough of a two-phase psycopg connection to record what happened to it."""
+
+    def __init__(self, events: list[tuple[str, int, str]]) -> None:
+        self.id = len({event[1] for event in events if event[0] == "connect"})
+        self.events = events
+        self.events.append(("connect", self.id, ""))
+
+    def execute(self, query, params=None):
+        """Answer `SHOW max_prepared_transactions`."""
+        return SimpleNamespace(fetchone=lambda: ("10",))
+
+    def xid(self, format_id, gtrid, bqual):
+        return (format_id, gtrid, bqual)
+
+    def tpc_begin(self, xid) -> None:
+        self.events.append(("begin", self.id, xid[2]))
+
+    def tpc_prepare(self) -> None:
+        self.events.append(("prepare", self.id, ""))
+
+    def tpc_commit(self) -> None:
+        self.events.append(("commit", self.id, ""))
+
+    def tpc_rollback(self) -> None:
+        self.events.append(("rollback", self.id, ""))
+
+    def rollback(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def test_parallel_load_prepares_every_table_before_committing_any(monkeypatch) -> None:
+    """
+    Each independent table loads on its own connection, all commit only after all have
+    prepared, and one failing table rolls every connection back.
+    """
+    events: list[tuple[str, int, str]] = []
+    loaded_on: dict[str, int] = {}
+    fail_on: set[str] = set()
+    work_tables: dict[str, str | None] = {}
+    dropped: list[str] = []
+
+    def fake_prepare_work_table(conn, *, table_name: str, work_table=None) -> None:
+        """Note which work table each staging table loads through."""
+        work_tables[table_name] = work_table
+
+    def fake_flush_work_table(conn, *, table_name: str, run_id, work_table=None):
+        """Note the connection, or fail for tables in `fail_on`."""
+        if table_name in fail_on:
+            raise RuntimeError(f"{table_name} failed")
+        loaded_on[table_name] = conn.id
+        return (1, 0)
+
+    monkeypatch.setattr(load_mod, "connect", lambda database_url: _TpcConnection(events))
+    monkeypatch.setattr(load_mod, "prepare_work_table", fake_prepare_work_table)
+    monkeypatch.setattr(load_mod, "insert_work_rows", lambda conn, **kwargs: 1)
+    monkeypatch.setattr(load_mod, "flush_work_table", fake_flush_work_table)
+    monkeypatch.setattr(
+        load_mod, "drop_work_table", lambda conn, *, work_table: dropped.append(work_table)
+    )
+
+    rows = [
+        StageRow(table_name=table_name, source_ref=1, raw_payload={}, values={})
+        for table_name in ("stg_customers", "stg_products", "stg_orders", "stg_order_items")
+    ]
+    run_id = uuid4()
+    results = load_mod.load_stage_rows_parallel(
+        None, run_id=run_id, rows=rows, workers=4, direct_load_max_rows=0
+    )
+
+    assert list(results) == [row.table_name for row in rows]
+    assert sorted(loaded_on.values()) == [0, 1, 2, 3]
+    kinds = [event[0] for event in events]
+    assert kinds.count("prepare") == kinds.count("commit") == 4
+    assert max(i for i, kind in enumerate(kinds) if kind == "prepare") < kinds.index("commit")
+    # connection 0 holds the decision branch, it prepares and commits after the others
+    assert ("begin", 0, "decision:stg_customers") in events
+    prepared = [event[1] for event in events if event[0] == "prepare"]
+    committed = [event[1] for event in events if event[0] == "commit"]
+    assert prepared[-1] == committed[-1] == 0
+    # no temp tables under 2PC, each lane loads through its own run-scoped work table
+    assert work_tables["stg_orders"] == f"_work_stg_orders_r{run_id.hex}"
+    assert sorted(dropped) == sorted(w for w in work_tables.values() if w)
+
+    events.clear()
+    fail_on.add("stg_orders")
+    with pytest.raises(RuntimeError, match="stg_orders failed"):
+        load_mod.load_stage_rows_parallel(
+            None, run_id=uuid4(), rows=rows, workers=2, direct_load_max_rows=0
+        )
+
+    kinds = [event[0] for event in events]
+    assert "commit" not in kinds
+    assert kinds.count("rollback") == 2
+
+
+class _RecoveringConnection:
+    """`tpc_recover` serving fixed prepared branches, ledger statuses by run id."""
+
+    def __init__(self, xids: list[psycopg.Xid], statuses: dict[str, str]) -> None:
+        self.info = SimpleNamespace(dbname="warehouse")
+        self.xids = xids
+        self.statuses = statuses
+        self.finished: list[tuple[str, str, str | None]] = []
+
+    def tpc_recover(self) -> list[psycopg.Xid]:
+        return self.xids
+
+    def execute(self, query, params):
+        """Answer the `run_ledger` status lookup."""
+        (run_ids,) = params
+        rows = [(run_id, self.statuses[run_id]) for run_id in run_ids if run_id in self.statuses]
+        return SimpleNamespace(fetchall=lambda: rows)
+
+    def commit(self) -> None:
+        pass
+
+    def tpc_commit(self, xid: psycopg.Xid) -> None:
+        self.finished.append(("commit", xid.gtrid, xid.bqual))
+
+    def tpc_rollback(self, xid: psycopg.Xid) -> None:
+        self.finished.append(("rollback", xid.gtrid, xid.bqual))
+
+
+def test_recover_prepared_loads_follows_the_decision_branch() -> None:
+    """
+    A load with its decision branch prepared is committed, parts first. One without it
+    is rolled back. A running run that prepared just now is left alone, as is
+    anything that isn't a stage load in this database.
+    """
+    now = datetime.now(UTC)
+    long_ago = now - timedelta(hours=1)
+    decided, undecided, in_flight, stale = (str(uuid4()) for _ in range(4))
+
+    def xid(run_id: str, bqual: str, prepared: datetime, database: str = "warehouse"):
+        return psycopg.Xid(0, f"stage_load:{run_id}", bqual, prepared, "etl", database)
+
+    conn = _RecoveringConnection(
+        xids=[
+            xid(decided, "decision:stg_customers", long_ago),
+            xid(decided, "part:stg_orders", long_ago),
+            xid(undecided, "part:stg_orders", long_ago),
+            xid(in_flight, "part:stg_orders", now),
+            xid(stale, "part:stg_products", long_ago),
+            xid(decided, "part:stg_products", long_ago, database="other"),
+            psycopg.Xid(0, "someone_else", "x", long_ago, "etl", "warehouse"),
+        ],
+        statuses={decided: "failed", undecided: "failed", in_flight: "running", stale: "running"},
+    )
+
+    result = load_mod.recover_prepared_loads(cast(psycopg.Connection, conn))
+
+    assert result.committed == [f"stage_load:{decided}"]
+    assert sorted(result.rolled_back) == sorted([f"stage_load:{undecided}", f"stage_load:{stale}"])
+    assert result.in_flight == [f"stage_load:{in_flight}"]
+    assert [e for e in conn.finished if e[0] == "commit"] == [
+        ("commit", f"stage_load:{decided}", "part:stg_orders"),
+        ("commit", f"stage_load:{decided}", "decision:stg_customers"),
+    ]
+    assert len(conn.finished) == 4
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import pytest
+from pydantic import ValidationError
+
+from warehouse_pipeline.extract.bundles import read_snapshot_bundle, snapshot_root_for_key
+from warehouse_pipeline.extract.models import DummyCart, DummyProduct, DummyUser
+from warehouse_pipeline.extract.snapshot_store import SnapshotStore
+from warehouse_pipeline.extract.synthetic import synthetic_payloads
+from warehouse_pipeline.stage.map_carts import map_carts
+from warehouse_pipeline.stage.map_carts_fused import map_raw_carts
+from warehouse_pipeline.stage.map_products import map_products
+from warehouse_pipeline.stage.map_users import map_users
+
+
+@pytest.mark.parametrize("snapshot_key", ["v1", "smoke"])
+def test_fused_carts_match_map_carts_on_pinned_snapshots(snapshot_key: str) -> None:
+    """Raw cart JSON through the fused mapper stages exactly what validated carts do."""
+    root = snapshot_root_for_key(snapshot_key)
+    bundle = read_snapshot_bundle(snapshot_root=root)
+    users = map_users(bundle.users)
+    products = map_products(bundle.products)
+    lookups = {"product_lookup": products.product_lookup, "user_lookup": users.user_lookup}
+
+    raw_carts = SnapshotStore(root).read_json("carts")["carts"]
+
+    assert map_raw_carts(raw_carts, **lookups) == map_carts(bundle.carts, **lookups)
+
+
+def test_fused_carts_match_on_synthetic_data_and_reject_like_the_models() -> None:
+    """Rejected lines and coercions line up too, and invalid carts still fail validation."""
+    payloads = synthetic_payloads(users=30, products=10, carts=40, seed=5)
+    raw_carts = payloads["carts"]["carts"]
+    raw_carts[0]["products"][0]["quantity"] = 0  # `invalid_quantity`
+    raw_carts[1]["products"][0]["id"] = 999  # `unknown_product`
+    raw_carts[2]["totalProducts"] = float(raw_carts[2]["totalProducts"])  # lax int coercion
+
+    users = map_users(DummyUser.model_validate(u) for u in payloads["users"]["users"])
+    products = map_products(
+        DummyProduct.model_validate(p) for p in payloads["products"]["products"]
+    )
+    lookups = {"product_lookup": products.product_lookup, "user_lookup": users.user_lookup}
+
+    fused = map_raw_carts(raw_carts, **lookups)
+
+    assert fused == map_carts((DummyCart.model_validate(c) for c in raw_carts), **lookups)
+    assert {r.reason_code for r in fused.rejects} >= {"invalid_quantity", "unknown_product"}
+    with pytest.raises(ValidationError):
+        map_raw_carts([{**raw_carts[3], "userId": 0}], **lookups)